@@ -1,18 +1,50 @@
-"""Parse Loki JSON log data (webapp + dispatcher)."""
+"""Parse Loki JSON log data (webapp + dispatcher).
+
+Besides the per-category totals, ``AppLogsResult`` keeps every classified
+webapp line as three parallel columns (timestamp, category code, reported
+latency), sorted by time, so lines can later be joined to the tests that
+were running when they were logged (``analyzers.log_attribution``). Only
+classified lines are kept, typically a fraction of a percent of the log.
+"""
 from __future__ import annotations
 
-import json
 import re
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+from .. import jsonio
 
-@dataclass
+ANALYZER_VERSION = 4
+
+# Line categories, stored as indexes into LINE_KINDS
+EFFECT, DIALECT, MISSING, ERROR, VALIDATION = range(5)
+LINE_KINDS = ("effect", "dialect", "missing", "error", "validation")
+WARNING_KINDS = (EFFECT, DIALECT, MISSING)
+
+# "Handled in 0.234 seconds" (webapp) or "Handled in 0.234s"
+_LATENCY_RE = re.compile(r"(\d+\.\d+) ?s(?:econds?)?\b")
+_JOB_RE = re.compile(r"Running job (\d+)")
+
+
+@dataclass(slots=True)
 class LogWarning:
     category: str
     count: int
     description: str
     worst_case: str = ""
+    first_ns: int = 0  # first/last occurrence (Loki epoch ns)
+    last_ns: int = 0
+
+
+@dataclass(slots=True)
+class DispatcherJob:
+    job_id: str
+    pod_name: str
+    first_log_ns: int = 0
+    last_log_ns: int = 0
+    compute_start_ns: int = 0
+    compute_end_ns: int = 0
 
 
 @dataclass
@@ -23,6 +55,7 @@ class DispatcherTimeline:
     last_log_ns: int = 0
     compute_start_ns: int = 0
     compute_end_ns: int = 0
+    jobs: list[DispatcherJob] = field(default_factory=list)  # one per pod, by compute start
 
     @property
     def total_duration_s(self) -> float:
@@ -44,12 +77,46 @@ class AppLogsResult:
     validation_error_count: int = 0
     total_log_entries: int = 0
     dispatcher: DispatcherTimeline = field(default_factory=DispatcherTimeline)
+    first_log_ns: int = 0
+    last_log_ns: int = 0
+    # Classified lines, one row per (line, category), sorted by timestamp
+    line_ns: array = field(default_factory=lambda: array("q"))
+    line_kind: array = field(default_factory=lambda: array("B"))
+    line_latency_s: array = field(default_factory=lambda: array("d"))
+
+
+def classify(line: str) -> list[tuple[int, float]]:
+    """Categories of one webapp log line, each with the latency it reports (0.0 if none)."""
+    kinds: list[tuple[int, float]] = []
+    if "WARN" in line:
+        lower = line.lower()
+        if "EffectConsumer" in line:
+            m = _LATENCY_RE.search(line)
+            kinds.append((EFFECT, float(m.group(1)) if m else 0.0))
+        if "dialect" in lower and ("mariadb" in lower or "hibernate" in lower or "mysql" in lower):
+            kinds.append((DIALECT, 0.0))
+        if "missing" in lower and ("dataset" in lower or "attribute" in lower):
+            kinds.append((MISSING, 0.0))
+    if "ERROR" in line:
+        kinds.append((ERROR, 0.0))
+        if "valid" in line.lower():
+            kinds.append((VALIDATION, 0.0))
+    return kinds
+
+
+def _seen(spans: dict[str, list[int]], key: str, ts: int) -> None:
+    span = spans.get(key)
+    if span is None:
+        spans[key] = [ts, ts]
+    elif ts < span[0]:
+        span[0] = ts
+    elif ts > span[1]:
+        span[1] = ts
 
 
 def analyze_webapp_logs(log_path: str) -> AppLogsResult:
     """Analyze webapp Loki JSON logs."""
-    with open(log_path) as f:
-        data = json.load(f)
+    data = jsonio.load(log_path)
 
     result = AppLogsResult()
 
@@ -63,65 +130,90 @@ def analyze_webapp_logs(log_path: str) -> AppLogsResult:
             all_entries.append((int(ts_str), line))
 
     result.total_log_entries = len(all_entries)
+    if all_entries:
+        result.first_log_ns = min(ts for ts, _ in all_entries)
+        result.last_log_ns = max(ts for ts, _ in all_entries)
 
-    # Count categories
-    effect_consumer_count = 0
-    effect_consumer_worst = ""
-    hibernate_dialect = 0
-    missing_dataset_attrs = 0
-    error_count = 0
-    validation_errors = 0
-
-    effect_time_re = re.compile(r"(\d+\.\d+)s")
-
+    classified: list[tuple[int, int, float]] = []
     for ts, line in all_entries:
-        if "WARN" in line:
-            if "EffectConsumer" in line:
-                effect_consumer_count += 1
-                m = effect_time_re.search(line)
-                if m:
-                    t = m.group(0)
-                    if not effect_consumer_worst or float(m.group(1)) > float(effect_consumer_worst.rstrip("s")):
-                        effect_consumer_worst = t
-            if "dialect" in line.lower() and ("mariadb" in line.lower() or "hibernate" in line.lower() or "mysql" in line.lower()):
-                hibernate_dialect += 1
-            if "missing" in line.lower() and ("dataset" in line.lower() or "attribute" in line.lower()):
-                missing_dataset_attrs += 1
-        if "ERROR" in line:
-            error_count += 1
-            if "valid" in line.lower():
-                validation_errors += 1
-
-    result.error_count = error_count
-    result.validation_error_count = validation_errors
+        for kind, latency in classify(line):
+            classified.append((ts, kind, latency))
+    classified.sort()
+    result.line_ns = array("q", [c[0] for c in classified])
+    result.line_kind = array("B", [c[1] for c in classified])
+    result.line_latency_s = array("d", [c[2] for c in classified])
+
+    counts = [0] * len(LINE_KINDS)
+    spans: dict[str, list[int]] = {}
+    effect_consumer_worst = 0.0
+    for ts, kind, latency in classified:
+        counts[kind] += 1
+        _seen(spans, LINE_KINDS[kind], ts)
+        if kind == EFFECT and latency > effect_consumer_worst:
+            effect_consumer_worst = latency
+    effect_consumer_count, hibernate_dialect, missing_dataset_attrs = (counts[k] for k in WARNING_KINDS)
+    result.error_count = counts[ERROR]
+    result.validation_error_count = counts[VALIDATION]
 
     if effect_consumer_count > 0:
         result.warnings.append(LogWarning(
             category="EffectConsumer queue blocking",
             count=effect_consumer_count,
             description="Messages that 'should have been an actuator' blocked the EffectConsumer queue",
-            worst_case=effect_consumer_worst,
+            worst_case=f"{effect_consumer_worst:g}s" if effect_consumer_worst else "",
+            first_ns=spans["effect"][0],
+            last_ns=spans["effect"][1],
         ))
     if hibernate_dialect > 0:
         result.warnings.append(LogWarning(
             category="Hibernate dialect mismatch",
             count=hibernate_dialect,
             description="MariaDB dialect configured but database is MySQL 8.0",
+            first_ns=spans["dialect"][0],
+            last_ns=spans["dialect"][1],
         ))
     if missing_dataset_attrs > 0:
         result.warnings.append(LogWarning(
             category="Missing dataset attribute mappings",
             count=missing_dataset_attrs,
             description="Dataset attribute mapping warnings",
+            first_ns=spans["missing"][0],
+            last_ns=spans["missing"][1],
         ))
 
     return result
 
 
+def _compute_span(entries: list[tuple[int, str, str]]) -> tuple[str, int, int]:
+    """Job id and compute start/end in time-sorted ``(ts_ns, line, stream_type)`` entries."""
+    job_id, start_ns, end_ns = "", 0, 0
+    for ts, line, stype in entries:
+        if "Running job" in line:
+            m = _JOB_RE.search(line)
+            if m:
+                job_id, start_ns = m.group(1), ts
+            break
+
+    # Compute ends with the last meaningful stdout before S3 upload
+    for ts, line, stype in reversed(entries):
+        if stype == "stdout" and "Finished" in line and "S3" in line:
+            end_ns = ts
+            break
+    if not end_ns:
+        for ts, line, stype in reversed(entries):
+            if stype == "stdout":
+                end_ns = ts
+                break
+    return job_id, start_ns, end_ns
+
+
 def analyze_dispatcher_logs(log_path: str) -> DispatcherTimeline:
-    """Analyze dispatcher Loki JSON logs for pod startup and compute timeline."""
-    with open(log_path) as f:
-        data = json.load(f)
+    """Analyze dispatcher Loki JSON logs for pod startup and compute timeline.
+
+    Every pod runs one job; ``jobs`` has each pod's own timeline, while the
+    top-level fields describe the first job and the log as a whole.
+    """
+    data = jsonio.load(log_path)
 
     timeline = DispatcherTimeline()
 
@@ -130,13 +222,15 @@ def analyze_dispatcher_logs(log_path: str) -> DispatcherTimeline:
 
     streams = data.get("data", {}).get("result", [])
     all_entries: list[tuple[int, str, str]] = []  # (ts_ns, line, stream_type)
+    by_pod: dict[str, list[tuple[int, str, str]]] = {}
     for stream in streams:
         stream_type = stream.get("stream", {}).get("stream", "unknown")
         pod_name = stream.get("stream", {}).get("pod", "")
         if pod_name:
             timeline.pod_name = pod_name
-        for ts_str, line in stream.get("values", []):
-            all_entries.append((int(ts_str), line, stream_type))
+        values = [(int(ts_str), line, stream_type) for ts_str, line in stream.get("values", [])]
+        by_pod.setdefault(pod_name, []).extend(values)
+        all_entries.extend(values)
 
     if not all_entries:
         return timeline
@@ -144,24 +238,48 @@ def analyze_dispatcher_logs(log_path: str) -> DispatcherTimeline:
     all_entries.sort(key=lambda x: x[0])
     timeline.first_log_ns = all_entries[0][0]
     timeline.last_log_ns = all_entries[-1][0]
+    timeline.job_id, timeline.compute_start_ns, timeline.compute_end_ns = _compute_span(all_entries)
 
-    # Extract job ID
-    for ts, line, stype in all_entries:
-        if "Running job" in line:
-            m = re.search(r"Running job (\d+)", line)
-            if m:
-                timeline.job_id = m.group(1)
-                timeline.compute_start_ns = ts
-            break
-
-    # Find compute end (last meaningful stdout before S3 upload)
-    for ts, line, stype in reversed(all_entries):
-        if stype == "stdout" and "Finished" in line and "S3" in line:
-            timeline.compute_end_ns = ts
-            break
-    if not timeline.compute_end_ns:
-        stdout_entries = [(ts, line) for ts, line, st in all_entries if st == "stdout"]
-        if stdout_entries:
-            timeline.compute_end_ns = stdout_entries[-1][0]
+    for pod_name, entries in by_pod.items():
+        if not pod_name or not entries:
+            continue
+        entries.sort(key=lambda x: x[0])
+        job_id, start_ns, end_ns = _compute_span(entries)
+        if job_id:
+            timeline.jobs.append(DispatcherJob(
+                job_id, pod_name, entries[0][0], entries[-1][0], start_ns, end_ns,
+            ))
+    timeline.jobs.sort(key=lambda j: j.compute_start_ns)
 
     return timeline
+
+
+def emit_events(result: AppLogsResult, table) -> None:
+    """Emit the webapp log span and each warning category into an ``events.EventTable``."""
+    if result.first_log_ns:
+        table.add(
+            "webapp", "logs", "webapp", result.first_log_ns, result.last_log_ns,
+            entries=result.total_log_entries, errors=result.error_count,
+        )
+    for w in result.warnings:
+        if w.first_ns:
+            table.add("webapp", "warning", w.category, w.first_ns, w.last_ns, count=w.count)
+
+
+def emit_dispatcher_events(timeline: DispatcherTimeline, table) -> None:
+    """Emit each dispatcher pod's log and compute spans into an ``events.EventTable``."""
+    jobs = timeline.jobs or [DispatcherJob(
+        timeline.job_id, timeline.pod_name or "dispatcher", timeline.first_log_ns,
+        timeline.last_log_ns, timeline.compute_start_ns, timeline.compute_end_ns,
+    )]
+    for job in jobs:
+        if job.first_log_ns:
+            table.add(
+                "dispatcher", "pod", job.pod_name, job.first_log_ns, job.last_log_ns,
+                job_id=job.job_id,
+            )
+        if job.compute_start_ns and job.compute_end_ns:
+            table.add(
+                "dispatcher", "compute", job.job_id or "dispatcher",
+                job.compute_start_ns, job.compute_end_ns, pod=job.pod_name,
+            )
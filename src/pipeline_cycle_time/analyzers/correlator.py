@@ -1,11 +1,21 @@
-"""Cross-source correlator that produces ranked findings."""
+"""Cross-source correlator that produces ranked findings.
+
+Each finding is a rule (``rules.rule``) over the shared ``Facts`` of one
+run; ``correlate`` evaluates the registered rules and ranks them by the
+critical-path time their fix would save.
+"""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from ..events import from_analysis
+from . import critical_path, polling as polling_join, setup_chain
 from .orchestration import OrchestrationResult
+from .rules import FactsBase, Rule, evaluate, rule, shared
 from .test_reports import TestSuiteResult
 from .app_logs import AppLogsResult, DispatcherTimeline
 from .metrics import MetricsResult
+from .skew import ClockSkew, estimate as estimate_skew
 
 
 @dataclass
@@ -24,6 +34,84 @@ class CorrelationResult:
     findings: list[Finding]
     concord_start_epoch_s: float = 0.0
     concord_end_epoch_s: float = 0.0
+    clock_skew: ClockSkew | None = None
+    end_to_end_s: float = 0.0
+    critical_path: list[str] = field(default_factory=list)
+    # Distribution of measured polling overshoot (``polling.PollingResult``)
+    polling_overshoot_s: dict = field(default_factory=dict)
+
+
+class Facts(FactsBase):
+    """One run's analyzer results and the intermediates rules share."""
+
+    orchestration: OrchestrationResult
+    kono: TestSuiteResult
+    substantiate: TestSuiteResult
+    app_logs: AppLogsResult
+    dispatcher: DispatcherTimeline
+    metrics: MetricsResult
+
+    @shared
+    def _aligned(self):
+        events = from_analysis(
+            self.orchestration, self.kono, self.substantiate, self.app_logs,
+            self.dispatcher, self.metrics,
+        )
+        # Put every source on Concord's clock before comparing across sources
+        skew = estimate_skew(events, self.substantiate.polling_cutoff_s())
+        skew.apply(events)
+        return events, skew
+
+    @property
+    def events(self):
+        return self._aligned[0]
+
+    @property
+    def clock_skew(self) -> ClockSkew:
+        return self._aligned[1]
+
+    @shared
+    def test_end_ns(self) -> int:
+        tests = self.events.span(kind="test")
+        return tests[1] if tests else 0
+
+    @shared
+    def setup(self) -> dict:
+        return self.substantiate.setup_phase_analysis()
+
+    @shared
+    def graph(self) -> critical_path.DependencyGraph:
+        """The run's dependency graph; savings are what-if reschedules of it."""
+        setup = self.setup
+        return critical_path.build(
+            self.events, {"substantiate": setup["setup_duration_s"]} if setup else None
+        )
+
+    @shared
+    def schedule(self) -> critical_path.Schedule:
+        return self.graph.schedule()
+
+    @shared
+    def setup_chain(self) -> setup_chain.SetupChain:
+        return setup_chain.infer(self.substantiate, setup_s=self.setup["setup_duration_s"])
+
+    @shared
+    def polling(self) -> dict:
+        return self.substantiate.polling_analysis(self.substantiate.polling_cutoff_s())
+
+    @shared
+    def poll_waits(self) -> polling_join.PollingResult:
+        return polling_join.analyze(self.events)
+
+    @shared
+    def parent_wait(self):
+        """The resume after the last test ended, and how long the parent waited for it."""
+        if not self.test_end_ns:
+            return None
+        resume = self.events.first(source="concord", kind="resume", start_ns=self.test_end_ns)
+        if resume is None:
+            return None
+        return resume, (resume.start_ns - self.test_end_ns) / 1e9
 
 
 def correlate(
@@ -33,239 +121,424 @@ def correlate(
     app_logs: AppLogsResult,
     dispatcher: DispatcherTimeline,
     metrics_result: MetricsResult,
+    *,
+    rules: list[Rule] | None = None,
+    top: int | None = None,
+    jobs: int = 1,
 ) -> CorrelationResult:
-    findings: list[Finding] = []
-
-    # Determine end of all test suites for critical-path analysis
-    test_end_epoch_s = max(kono.end_epoch_s, substantiate.end_epoch_s)
-
-    # Mark which resume cycles are on the critical path
-    orchestration.mark_critical_path(test_end_epoch_s)
-
-    # Finding 1: Substantiate setup phase serialization (100-170s)
-    setup = substantiate.setup_phase_analysis(threshold_s=340.0)
-    if setup:
-        findings.append(Finding(
-            rank=1,
-            title="Parallelize Substantiate Setup Chain",
-            description=(
-                f"The first {setup['setup_duration_s']:.0f}s of Substantiate execution is a "
-                f"mostly-sequential setup chain. Only {setup['setup_tests']} tests run, "
-                f"while {setup['idle_workers']} workers sit idle."
-            ),
-            evidence=(
-                f"Only {setup['setup_tests']} tests in first {setup['setup_duration_s']:.0f}s. "
-                f"Workers {', '.join(setup['idle_worker_names'][:3])}... idle for 300+ seconds."
-            ),
-            estimated_savings_s="100-170s",
-            difficulty="Medium",
-            priority="P1",
-        ))
-
-    # Finding 2: K8s pod startup latency (60-120s)
-    if dispatcher.job_id:
-        compute_s = dispatcher.total_duration_s
-        findings.append(Finding(
-            rank=2,
-            title="Reduce K8s Pod Startup Latency",
-            description=(
-                f"Dispatcher job {dispatcher.job_id} pod took significant time from scheduling "
-                f"to first log, but only {compute_s:.0f}s of actual compute. "
-                f"This overhead suggests opportunity in pod pre-warming or smaller container images."
-            ),
-            evidence=f"Job {dispatcher.job_id} pod: {compute_s:.0f}s compute time.",
-            estimated_savings_s="60-120s",
-            difficulty="Medium",
-            priority="P1",
-        ))
-
-    # Finding 3: Kono sequential ForkJoinPools (~44-58s)
-    if len(kono.pools) >= 2:
-        sorted_pools = sorted(kono.pools.values(), key=lambda p: p.start_ms)
-        later_pool = sorted_pools[-1]
-        if later_pool.start_ms > sorted_pools[0].stop_ms:
-            waste = later_pool.wall_clock_s
-            findings.append(Finding(
-                rank=3,
-                title="Run Kono ForkJoinPools Concurrently",
-                description=(
-                    f"{sorted_pools[0].name} ({sorted_pools[0].count} tests, "
-                    f"{sorted_pools[0].wall_clock_s:.1f}s) and "
-                    f"{later_pool.name} ({later_pool.count} tests, {later_pool.wall_clock_s:.1f}s) "
-                    f"execute sequentially. Running them concurrently would save ~{waste:.0f}s."
-                ),
-                evidence=(
-                    f"{later_pool.name} starts after {sorted_pools[0].name} ends. "
-                    f"{later_pool.name} parallelism: {later_pool.parallelism:.2f}x."
-                ),
-                estimated_savings_s=f"~{waste:.0f}s",
-                difficulty="Low",
-                priority="P1",
-            ))
-
-    # Finding 4: Concord polling delay (51-56s)
-    if orchestration.resume_overheads and test_end_epoch_s > 0:
-        critical_resumes = [r for r in orchestration.resume_overheads if r.on_critical_path]
-        if critical_resumes:
-            last_resume = critical_resumes[0]
-            polling_gap_s = last_resume.resume_time.timestamp() - test_end_epoch_s
-            if polling_gap_s > 5:
-                findings.append(Finding(
-                    rank=4,
-                    title="Reduce Concord Suspend Polling Delay",
-                    description=(
-                        f"After all tests completed, the Concord parent remained suspended "
-                        f"for {polling_gap_s:.0f}s before resuming. This gap is Concord's "
-                        f"internal polling interval and is pure wall-clock waste."
-                    ),
-                    evidence=(
-                        f"Tests ended at {test_end_epoch_s:.0f} epoch, "
-                        f"parent resumed at {last_resume.resume_time.timestamp():.0f} epoch "
-                        f"({polling_gap_s:.0f}s gap)."
-                    ),
-                    estimated_savings_s=f"{polling_gap_s:.0f}s",
-                    difficulty="Medium",
-                    priority="P1",
-                ))
-
-    # Finding 5: Substantiate polling interval (30-60s)
-    polling = substantiate.polling_analysis()
-    if polling and polling["polling_pct"] > 50:
-        findings.append(Finding(
-            rank=5,
-            title="Reduce Substantiate Polling Interval",
-            description=(
-                f"Substantiate aggregate runtime is dominated by long-running compute waits; "
-                f"an inferred {polling['polling_pct']:.1f}% of aggregate time is in long-running (likely polling) tests. "
-                f"Precise polling-vs-non-polling attribution is not fully observable from fixtures alone. "
-                f"Reducing poll interval from 20s to 5s would cut average overshoot."
-            ),
-            evidence=(
-                f"{polling['polling_pct']:.1f}% of {polling['aggregate_min']:.1f} min aggregate time "
-                f"in long-running tests (inferred heuristic: tests >16s classified as polling-dominated)."
-            ),
-            estimated_savings_s="30-60s",
-            difficulty="Low",
-            priority="P1",
-        ))
-
-    # Finding 6: Concord resume overhead (8-9s on critical path)
-    if orchestration.resume_overheads:
-        total_overhead = orchestration.total_resume_overhead_s
-        critical_overhead = orchestration.critical_path_resume_overhead_s
-        cycle_details = []
-        for i, r in enumerate(orchestration.resume_overheads, 1):
-            path_label = "on critical path" if r.on_critical_path else "overlaps with running tests"
-            cycle_details.append(f"resume {i}: {r.total_s:.0f}s ({path_label})")
-
-        findings.append(Finding(
-            rank=6,
-            title="Reduce Concord Resume Overhead",
-            description=(
-                f"Each Concord resume redundantly re-exports the repository and "
-                f"re-resolves dependencies. Per-cycle overhead: {'; '.join(cycle_details)}. "
-                f"Total overhead: {total_overhead:.0f}s, but only {critical_overhead:.0f}s "
-                f"is on the critical path (resumes overlapping with test execution are free)."
-            ),
-            evidence=(
-                f"Concord logs show {len(orchestration.resume_overheads)} resume cycles. "
-                f"Only cycles after test completion (epoch {test_end_epoch_s:.0f}) extend wall-clock."
-            ),
-            estimated_savings_s=f"{critical_overhead:.0f}s",
-            difficulty="Low",
-            priority="P2",
-        ))
-
-    # Finding 7: Sequential child checking (0-9s)
-    if len(orchestration.children) > 1 and orchestration.resume_count > 1:
-        non_critical = [r for r in orchestration.resume_overheads if not r.on_critical_path]
-        findings.append(Finding(
-            rank=7,
-            title="Parallelize Concord Child Checking",
-            description=(
-                f"The Concord parent checks {len(orchestration.children)} children in "
-                f"separate suspend/resume cycles. {len(non_critical)} of "
-                f"{orchestration.resume_count} resumes overlap with test execution and "
-                f"do not affect wall-clock. Checking all children in a single resume "
-                f"would eliminate redundant cycles."
-            ),
-            evidence=(
-                f"{orchestration.resume_count} suspend/resume cycles, "
-                f"{len(non_critical)} overlapping with tests."
-            ),
-            estimated_savings_s="0-9s",
-            difficulty="Medium",
-            priority="P2",
-        ))
-
-    # Finding 8: Application has massive headroom (informational)
-    if metrics_result.cpu and metrics_result.hikaricp_pending:
-        findings.append(Finding(
-            rank=8,
-            title="Application Has Massive Resource Headroom",
-            description=(
-                f"CPU peaked at {metrics_result.cpu.max_val:.2f} cores during warmup, "
-                f"averaged {metrics_result.cpu.avg_val:.1f} during tests. "
-                f"HikariCP max {int(metrics_result.hikaricp_active.max_val) if metrics_result.hikaricp_active else 0} "
-                f"active connections, zero pending. The application is NOT the bottleneck."
-            ),
-            evidence=(
-                f"CPU avg {metrics_result.cpu.avg_val:.2f} cores, "
-                f"memory stable at ~{metrics_result.memory.avg_val / 1e9:.1f}GB, "
-                f"zero HikariCP pending connections."
-            ),
-            estimated_savings_s="N/A",
-            difficulty="N/A",
-            priority="Informational",
-        ))
-
-    # Additional findings from app logs
-    for warning in app_logs.warnings:
-        if warning.category == "EffectConsumer queue blocking":
-            findings.append(Finding(
-                rank=9,
-                title="Fix EffectConsumer Queue Blocking",
-                description=(
-                    f"{warning.count} warnings where messages blocked the EffectConsumer queue"
-                    f"{f', worst case {warning.worst_case}' if warning.worst_case else ''}."
-                ),
-                evidence=f"{warning.count} queue-blocking warnings in application logs.",
-                estimated_savings_s="<2s",
-                difficulty="Low",
-                priority="P3",
-            ))
-        elif warning.category == "Hibernate dialect mismatch":
-            findings.append(Finding(
-                rank=10,
-                title="Fix Hibernate Dialect Mismatch",
-                description="MariaDB dialect is configured but the database is MySQL 8.0.",
-                evidence="Hibernate dialect mismatch warning in application logs.",
-                estimated_savings_s="None directly",
-                difficulty="Low",
-                priority="P3",
-            ))
-
-    # Finding 11: Flaky test
-    failed = substantiate.failed_tests
-    if failed:
-        t = failed[0]
-        findings.append(Finding(
-            rank=11,
-            title=f'Investigate Flaky Substantiate "{t.name[:30]}..." Test',
-            description=(
-                f"One test fails on its first attempt, wasting {t.duration / 1000:.1f}s."
-            ),
-            evidence=f"1 failure out of {substantiate.total_tests} tests.",
-            estimated_savings_s=f"~{t.duration // 1000}s when it flakes",
-            difficulty="Medium",
-            priority="P3",
-        ))
-
-    # Sort by rank for deterministic output
-    findings.sort(key=lambda f: f.rank)
+    """Findings of ``rules`` (default: all registered), ranked by saving.
 
+    ``top`` keeps only the best findings and skips rescheduling rules that
+    cannot reach them; ``jobs`` evaluates rules on that many threads.
+    """
+    facts = Facts(
+        orchestration=orchestration, kono=kono, substantiate=substantiate,
+        app_logs=app_logs, dispatcher=dispatcher, metrics=metrics_result,
+    )
+    graph, schedule = facts.graph, facts.schedule
+    for i, r in enumerate(orchestration.resume_overheads, 1):
+        node = graph.node(f"resume:#{i}")
+        r.on_critical_path = node is not None and schedule.slack[node] == 0
+
+    findings = evaluate(facts, rules, top=top, jobs=jobs)
+    measured = facts.poll_waits
     return CorrelationResult(
         findings=findings,
         concord_start_epoch_s=orchestration.total_start.timestamp() if orchestration.total_start else 0,
         concord_end_epoch_s=orchestration.total_end.timestamp() if orchestration.total_end else 0,
+        clock_skew=facts.clock_skew,
+        end_to_end_s=schedule.makespan_s,
+        critical_path=[
+            graph.names[i] for i in schedule.path if graph.kinds[i] not in ("milestone", "child")
+        ],
+        polling_overshoot_s=measured.distribution() if measured.waits else {},
+    )
+
+
+# Rules, in tie-breaking order
+
+MIN_SAVING_NS = 500_000_000  # what-if savings below this round to "off the critical path"
+
+
+def _setup_what_if(facts: Facts) -> dict | None:
+    setup = facts.setup
+    if not setup:
+        return None
+    # Idle workers joining in would shrink the chain proportionally
+    graph = facts.graph
+    node = graph.node("substantiate:setup")
+    if node is None:
+        return {}
+    return {"durations": {
+        node: graph.duration_ns(node) * setup["setup_workers"] // setup["all_workers"]
+    }}
+
+
+@rule(
+    "setup-chain", needs=("substantiate", "setup", "setup_chain", "graph"),
+    what_if=_setup_what_if, facts=Facts,
+)
+def _setup_chain(facts: Facts, saved_ns: int) -> Finding:
+    setup, chain = facts.setup, facts.setup_chain
+    return Finding(
+        rank=0,
+        title="Parallelize Substantiate Setup Chain",
+        description=(
+            f"The first {setup['setup_duration_s']:.0f}s of Substantiate execution is a "
+            f"mostly-sequential setup chain. Only {setup['setup_tests']} tests run, "
+            f"while {setup['idle_workers']} workers sit idle."
+        ),
+        evidence=(
+            f"Only {setup['setup_tests']} tests in first {setup['setup_duration_s']:.0f}s. "
+            f"Workers {', '.join(setup['idle_worker_names'][:3])}... idle for 300+ seconds. "
+            f"Inferred chain: {len(chain.critical_path)} tests back to back; "
+            f"{len(chain.serial_links)} of {len(chain.links)} start/stop adjacencies are "
+            f"serial dependencies, the rest scheduling artifacts."
+        ),
+        estimated_savings_s=_savings_s(saved_ns),
+        difficulty="Medium",
+        priority=_priority(saved_ns, "P1"),
+    )
+
+
+def _pods_what_if(facts: Facts) -> dict | None:
+    if not facts.dispatcher.job_id:
+        return None
+    return {"durations": {i: 0 for i in facts.graph.of_kind("pod")}}
+
+
+@rule("pod-startup", needs=("dispatcher", "graph"), what_if=_pods_what_if, facts=Facts)
+def _pod_startup(facts: Facts, saved_ns: int) -> Finding:
+    dispatcher = facts.dispatcher
+    compute_s = dispatcher.total_duration_s
+    graph = facts.graph
+    pods = graph.of_kind("pod")
+    if pods:
+        startup_s = sum(graph.duration_ns(i) for i in pods) / 1e9
+        observed = (
+            f"Dispatcher job {dispatcher.job_id} pod logged for {startup_s:.0f}s before its job "
+            f"started, against {compute_s:.0f}s of actual compute. "
+        )
+    else:
+        observed = (
+            f"Dispatcher job {dispatcher.job_id} ran {compute_s:.0f}s of actual compute; "
+            f"its pod startup could not be placed on the run's timeline. "
+        )
+    if saved_ns >= MIN_SAVING_NS:
+        outcome = (
+            f"Pod pre-warming or smaller container images would shorten the run by "
+            f"~{saved_ns / 1e9:.0f}s."
+        )
+    else:
+        outcome = "The startup overlaps work off the critical path, so cutting it would not shorten the run."
+    return Finding(
+        rank=0,
+        title="Reduce K8s Pod Startup Latency",
+        description=observed + outcome,
+        evidence=f"Job {dispatcher.job_id} pod: {compute_s:.0f}s compute time.",
+        estimated_savings_s=_savings_s(saved_ns),
+        difficulty="Medium",
+        priority=_priority(saved_ns, "P1"),
+    )
+
+
+def _kono_pools(facts: Facts) -> list | None:
+    """Kono's pools in start order, if a later one only starts after the first ends."""
+    pools = sorted(facts.kono.pools.values(), key=lambda p: p.start_ms)
+    if len(pools) < 2 or pools[-1].start_ms <= pools[0].stop_ms:
+        return None
+    return pools
+
+
+def _kono_what_if(facts: Facts) -> dict | None:
+    pools = _kono_pools(facts)
+    if pools is None:
+        return None
+    # Each pool starts together with the pool it used to wait for
+    graph = facts.graph
+    concurrent = {}
+    for p in pools:
+        node = graph.node(f"kono:{p.name}")
+        for e in graph.edges(dst=node) if node is not None else ():
+            src = graph.edge_ends(e)[0]
+            if graph.kinds[src] == "pool":
+                concurrent[e] = -graph.duration_ns(src)
+    return {"lags": concurrent}
+
+
+@rule("kono-pools", needs=("kono", "graph"), what_if=_kono_what_if, facts=Facts)
+def _kono_sequential_pools(facts: Facts, saved_ns: int) -> Finding:
+    pools = _kono_pools(facts)
+    first, later = pools[0], pools[-1]
+    if saved_ns >= MIN_SAVING_NS:
+        outcome = f"Running them concurrently would shorten the run by ~{saved_ns / 1e9:.0f}s."
+    else:
+        outcome = (
+            f"Running them concurrently would finish Kono up to ~{later.wall_clock_s:.0f}s "
+            f"sooner, but Kono is off the critical path, so the run would not end earlier."
+        )
+    return Finding(
+        rank=0,
+        title="Run Kono ForkJoinPools Concurrently",
+        description=(
+            f"{first.name} ({first.count} tests, {first.wall_clock_s:.1f}s) and "
+            f"{later.name} ({later.count} tests, {later.wall_clock_s:.1f}s) "
+            f"execute sequentially. {outcome}"
+        ),
+        evidence=(
+            f"{later.name} starts after {first.name} ends. "
+            f"{later.name} parallelism: {later.parallelism:.2f}x."
+        ),
+        estimated_savings_s=_savings_s(saved_ns),
+        difficulty="Low",
+        priority=_priority(saved_ns, "P1"),
     )
+
+
+def _parent_wait_what_if(facts: Facts) -> dict | None:
+    wait = facts.parent_wait
+    if wait is None or wait[1] <= 5:
+        return None
+    # Resume the moment a child finishes
+    graph = facts.graph
+    return {"lags": {
+        e: 0 for r in graph.of_kind("resume") for e in graph.edges(dst=r)
+        if graph.kinds[graph.edge_ends(e)[0]] == "child"
+    }}
+
+
+@rule(
+    "concord-polling", needs=("orchestration", "parent_wait", "test_end_ns", "graph"),
+    what_if=_parent_wait_what_if, facts=Facts,
+)
+def _concord_polling_delay(facts: Facts, saved_ns: int) -> Finding:
+    resume, gap_s = facts.parent_wait
+    return Finding(
+        rank=0,
+        title="Reduce Concord Suspend Polling Delay",
+        description=(
+            f"After all tests completed, the Concord parent remained suspended "
+            f"for {gap_s:.0f}s before resuming. This gap is Concord's "
+            f"internal polling interval and is pure wall-clock waste."
+        ),
+        evidence=(
+            f"Tests ended at {facts.test_end_ns / 1e9:.0f} epoch, "
+            f"parent resumed at {resume.start_ns / 1e9:.0f} epoch "
+            f"({gap_s:.0f}s gap)."
+        ),
+        estimated_savings_s=_savings_s(saved_ns),
+        difficulty="Medium",
+        priority=_priority(saved_ns, "P1"),
+    )
+
+
+def _poll_interval_what_if(facts: Facts) -> dict | None:
+    if not facts.polling or facts.polling["polling_pct"] <= 50:
+        return None
+    # Overshoot past a job's end scales with the poll interval (20s -> 5s)
+    graph = facts.graph
+    return {"durations": {i: graph.duration_ns(i) // 4 for i in graph.of_kind("poll")}}
+
+
+@rule(
+    "substantiate-polling", needs=("substantiate", "polling", "poll_waits", "graph"),
+    what_if=_poll_interval_what_if, facts=Facts,
+)
+def _substantiate_polling(facts: Facts, saved_ns: int) -> Finding:
+    polling, measured = facts.polling, facts.poll_waits
+    if measured.waits:
+        overshoot = measured.distribution()
+        n = overshoot["count"]
+        tests_waiting = f"{n} test{'s' if n != 1 else ''}"
+        observed = (
+            f"Joined to the dispatcher jobs they waited on, {tests_waiting} noticed finished "
+            f"compute {overshoot['p50']:.0f}s late at the median (p90 {overshoot['p90']:.0f}s, "
+            f"max {overshoot['max']:.0f}s). "
+        )
+        measured_evidence = (
+            f" Measured overshoot: {measured.total_overshoot_s:.0f}s total over {tests_waiting}."
+        )
+    else:
+        observed = "Precise polling-vs-non-polling attribution is not fully observable from fixtures alone. "
+        measured_evidence = ""
+    return Finding(
+        rank=0,
+        title="Reduce Substantiate Polling Interval",
+        description=(
+            f"Substantiate aggregate runtime is dominated by long-running compute waits; "
+            f"an inferred {polling['polling_pct']:.1f}% of aggregate time is in long-running (likely polling) tests. "
+            f"{observed}"
+            f"Reducing poll interval from 20s to 5s would cut average overshoot."
+        ),
+        evidence=(
+            f"{polling['polling_pct']:.1f}% of {polling['aggregate_min']:.1f} min aggregate time "
+            f"in long-running tests (tests over {polling['cutoff_s']:.0f}s, where the suite's "
+            f"durations split into a short and a long population)."
+            f"{measured_evidence}"
+        ),
+        estimated_savings_s=_savings_s(saved_ns),
+        difficulty="Low",
+        priority=_priority(saved_ns, "P1"),
+    )
+
+
+def _resume_what_if(facts: Facts) -> dict | None:
+    if not facts.orchestration.resume_overheads:
+        return None
+    return {"durations": {i: 0 for i in facts.graph.of_kind("resume")}}
+
+
+@rule("resume-overhead", needs=("orchestration", "graph"), what_if=_resume_what_if, facts=Facts)
+def _resume_overhead(facts: Facts, saved_ns: int) -> Finding:
+    orchestration = facts.orchestration
+    cycle_details = []
+    for i, r in enumerate(orchestration.resume_overheads, 1):
+        path_label = "on critical path" if r.on_critical_path else "overlaps with running tests"
+        cycle_details.append(f"resume {i}: {r.total_s:.0f}s ({path_label})")
+    return Finding(
+        rank=0,
+        title="Reduce Concord Resume Overhead",
+        description=(
+            f"Each Concord resume redundantly re-exports the repository and "
+            f"re-resolves dependencies. Per-cycle overhead: {'; '.join(cycle_details)}. "
+            f"Total overhead: {orchestration.total_resume_overhead_s:.0f}s, but only "
+            f"{orchestration.critical_path_resume_overhead_s:.0f}s "
+            f"is on the critical path (resumes overlapping with test execution are free)."
+        ),
+        evidence=(
+            f"Concord logs show {len(orchestration.resume_overheads)} resume cycles. "
+            f"Only cycles after test completion (epoch {facts.test_end_ns / 1e9:.0f}) extend wall-clock."
+        ),
+        estimated_savings_s=_savings_s(saved_ns),
+        difficulty="Low",
+        priority=_priority(saved_ns, "P2"),
+    )
+
+
+def _child_checks_what_if(facts: Facts) -> dict | None:
+    orchestration = facts.orchestration
+    if len(orchestration.children) <= 1 or orchestration.resume_count <= 1:
+        return None
+    # A single resume after the last child: every earlier cycle disappears
+    return {"durations": {i: 0 for i in facts.graph.of_kind("resume")[:-1]}}
+
+
+@rule(
+    "child-checking", needs=("orchestration", "graph"), what_if=_child_checks_what_if,
+    facts=Facts,
+)
+def _child_checking(facts: Facts, saved_ns: int) -> Finding:
+    orchestration = facts.orchestration
+    non_critical = [r for r in orchestration.resume_overheads if not r.on_critical_path]
+    return Finding(
+        rank=0,
+        title="Parallelize Concord Child Checking",
+        description=(
+            f"The Concord parent checks {len(orchestration.children)} children in "
+            f"separate suspend/resume cycles. {len(non_critical)} of "
+            f"{orchestration.resume_count} resumes overlap with test execution and "
+            f"do not affect wall-clock. Checking all children in a single resume "
+            f"would eliminate redundant cycles."
+        ),
+        evidence=(
+            f"{orchestration.resume_count} suspend/resume cycles, "
+            f"{len(non_critical)} overlapping with tests."
+        ),
+        estimated_savings_s=_savings_s(saved_ns),
+        difficulty="Medium",
+        priority=_priority(saved_ns, "P2"),
+    )
+
+
+@rule("headroom", needs=("metrics",), facts=Facts)
+def _headroom(facts: Facts, saved_ns: int) -> Finding | None:
+    m = facts.metrics
+    if not (m.cpu and m.hikaricp_pending):
+        return None
+    return Finding(
+        rank=0,
+        title="Application Has Massive Resource Headroom",
+        description=(
+            f"CPU peaked at {m.cpu.max_val:.2f} cores during warmup, "
+            f"averaged {m.cpu.avg_val:.1f} during tests. "
+            f"HikariCP max {int(m.hikaricp_active.max_val) if m.hikaricp_active else 0} "
+            f"active connections, zero pending. The application is NOT the bottleneck."
+        ),
+        evidence=(
+            f"CPU avg {m.cpu.avg_val:.2f} cores, "
+            f"memory stable at ~{m.memory.avg_val / 1e9:.1f}GB, "
+            f"zero HikariCP pending connections."
+        ),
+        estimated_savings_s="N/A",
+        difficulty="N/A",
+        priority="Informational",
+    )
+
+
+def _log_warning(facts: Facts, category: str):
+    return next((w for w in facts.app_logs.warnings if w.category == category), None)
+
+
+@rule("effect-consumer", needs=("app_logs",), facts=Facts)
+def _effect_consumer(facts: Facts, saved_ns: int) -> Finding | None:
+    warning = _log_warning(facts, "EffectConsumer queue blocking")
+    if warning is None:
+        return None
+    return Finding(
+        rank=0,
+        title="Fix EffectConsumer Queue Blocking",
+        description=(
+            f"{warning.count} warnings where messages blocked the EffectConsumer queue"
+            f"{f', worst case {warning.worst_case}' if warning.worst_case else ''}."
+        ),
+        evidence=f"{warning.count} queue-blocking warnings in application logs.",
+        estimated_savings_s="<2s",
+        difficulty="Low",
+        priority="P3",
+    )
+
+
+@rule("hibernate-dialect", needs=("app_logs",), facts=Facts)
+def _hibernate_dialect(facts: Facts, saved_ns: int) -> Finding | None:
+    if _log_warning(facts, "Hibernate dialect mismatch") is None:
+        return None
+    return Finding(
+        rank=0,
+        title="Fix Hibernate Dialect Mismatch",
+        description="MariaDB dialect is configured but the database is MySQL 8.0.",
+        evidence="Hibernate dialect mismatch warning in application logs.",
+        estimated_savings_s="None directly",
+        difficulty="Low",
+        priority="P3",
+    )
+
+
+@rule("flaky-test", needs=("substantiate",), facts=Facts)
+def _flaky_test(facts: Facts, saved_ns: int) -> Finding | None:
+    substantiate = facts.substantiate
+    failed = substantiate.failed_tests
+    if not failed:
+        return None
+    t = failed[0]
+    return Finding(
+        rank=0,
+        title=f'Investigate Flaky Substantiate "{t.name[:30]}..." Test',
+        description=(
+            f"One test fails on its first attempt, wasting {t.duration / 1000:.1f}s."
+        ),
+        evidence=f"1 failure out of {substantiate.total_tests} tests.",
+        estimated_savings_s=f"~{t.duration // 1000}s when it flakes",
+        difficulty="Medium",
+        priority="P3",
+    )
+
+
+def _savings_s(saved_ns: int) -> str:
+    if saved_ns < MIN_SAVING_NS:
+        return "0s (off the critical path)"
+    return f"{saved_ns / 1e9:.0f}s"
+
+
+def _priority(saved_ns: int, on_path: str) -> str:
+    """``on_path`` if the fix shortens the run, else backlog (P3)."""
+    return on_path if saved_ns >= MIN_SAVING_NS else "P3"
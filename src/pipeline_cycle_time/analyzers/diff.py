@@ -0,0 +1,223 @@
+"""Run-to-run diff: what got slower between two analyzed runs.
+
+Compares orchestration phases, resume cycles, pool wall-clock/parallelism and
+per-test durations. Tests are matched with a hash join: the baseline run is
+indexed by key, then the candidate run probes it, so the whole diff is linear
+in the number of tests. The key is the Allure historyId when the runs'
+test-cases are available (stable across runs, unlike uids; Kono parametrized
+names embed object hashes that change every run), else the test name, or the
+uid when both sides come from the same report. Retries and same-keyed
+parametrizations are summed under one key, and the attempt count is kept so a
+retry storm shows up as a regression rather than as added tests. Ranking uses
+``heapq.nlargest``, never a full sort.
+"""
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+
+from .orchestration import OrchestrationResult
+from .test_reports import TestSuiteResult
+
+# Relative regressions on very short tests/phases are mostly noise; below
+# this baseline duration they're excluded from the relative ranking.
+MIN_RELATIVE_BASE_S = 1.0
+
+
+@dataclass
+class Delta:
+    """A before/after pair of durations in seconds."""
+    name: str
+    before_s: float
+    after_s: float
+
+    @property
+    def delta_s(self) -> float:
+        return self.after_s - self.before_s
+
+    @property
+    def ratio(self) -> float:
+        return self.after_s / self.before_s if self.before_s else float("inf")
+
+
+@dataclass
+class PhaseDelta(Delta):
+    pass
+
+
+@dataclass
+class ResumeDelta(Delta):
+    """Resume cycle ``name`` ("#1", "#2", ...) matched by position."""
+    before_critical: bool = False
+    after_critical: bool = False
+
+
+@dataclass
+class PoolDelta(Delta):
+    suite: str = ""
+    before_parallelism: float = 0.0
+    after_parallelism: float = 0.0
+
+
+@dataclass
+class TestDelta(Delta):
+    suite: str = ""
+    before_attempts: int = 0
+    after_attempts: int = 0
+
+
+@dataclass
+class RunDiff:
+    before_run: str
+    after_run: str
+    key: str
+    concord: Delta
+    end_to_end: Delta
+    phases: list[PhaseDelta] = field(default_factory=list)
+    resumes: list[ResumeDelta] = field(default_factory=list)
+    pools: list[PoolDelta] = field(default_factory=list)
+    tests: list[TestDelta] = field(default_factory=list)
+    added: list[TestDelta] = field(default_factory=list)
+    removed: list[TestDelta] = field(default_factory=list)
+
+    def slowest_tests(self, n: int = 20) -> list[TestDelta]:
+        """Matched tests with the largest absolute slowdown."""
+        return [t for t in heapq.nlargest(n, self.tests, key=lambda t: t.delta_s) if t.delta_s > 0]
+
+    def relative_tests(self, n: int = 20, min_base_s: float = MIN_RELATIVE_BASE_S) -> list[TestDelta]:
+        """Matched tests with the largest after/before ratio (ignoring tiny baselines)."""
+        eligible = (t for t in self.tests if t.before_s >= min_base_s)
+        return [t for t in heapq.nlargest(n, eligible, key=lambda t: t.ratio) if t.ratio > 1]
+
+    def fastest_tests(self, n: int = 20) -> list[TestDelta]:
+        return [t for t in heapq.nsmallest(n, self.tests, key=lambda t: t.delta_s) if t.delta_s < 0]
+
+    def phase_regressions(self) -> list[PhaseDelta]:
+        return sorted((p for p in self.phases if p.delta_s > 0), key=lambda p: -p.delta_s)
+
+
+def _phase_totals(orch: OrchestrationResult) -> dict[str, float]:
+    totals: dict[str, float] = {}
+    for p in orch.phases:
+        totals[p.name] = totals.get(p.name, 0.0) + p.duration_s
+    return totals
+
+
+def diff_phases(before: OrchestrationResult, after: OrchestrationResult) -> list[PhaseDelta]:
+    a, b = _phase_totals(before), _phase_totals(after)
+    names = list(a) + [n for n in b if n not in a]
+    return [PhaseDelta(n, a.get(n, 0.0), b.get(n, 0.0)) for n in names]
+
+
+def diff_resumes(before: OrchestrationResult, after: OrchestrationResult) -> list[ResumeDelta]:
+    out = []
+    for i in range(max(len(before.resume_overheads), len(after.resume_overheads))):
+        a = before.resume_overheads[i] if i < len(before.resume_overheads) else None
+        b = after.resume_overheads[i] if i < len(after.resume_overheads) else None
+        out.append(ResumeDelta(
+            f"#{i + 1}",
+            a.total_s if a else 0.0,
+            b.total_s if b else 0.0,
+            before_critical=bool(a and a.on_critical_path),
+            after_critical=bool(b and b.on_critical_path),
+        ))
+    return out
+
+
+def diff_pools(before: TestSuiteResult, after: TestSuiteResult) -> list[PoolDelta]:
+    names = list(before.pools) + [n for n in after.pools if n not in before.pools]
+    out = []
+    for n in names:
+        a, b = before.pools.get(n), after.pools.get(n)
+        out.append(PoolDelta(
+            n,
+            a.wall_clock_s if a else 0.0,
+            b.wall_clock_s if b else 0.0,
+            suite=before.name,
+            before_parallelism=a.parallelism if a else 0.0,
+            after_parallelism=b.parallelism if b else 0.0,
+        ))
+    return out
+
+
+def _index(
+    suite: TestSuiteResult, key: str, history: dict[str, str] | None
+) -> dict[str, list]:
+    """key -> [total duration ms, attempts, display name]."""
+    index: dict[str, list] = {}
+    for t in suite.tests:
+        if key == "history":
+            k = (history.get(t.uid) or t.name) if history else t.name
+        else:
+            k = getattr(t, key)
+        entry = index.get(k)
+        if entry is None:
+            index[k] = [t.duration, 1, t.name]
+        else:
+            entry[0] += t.duration
+            entry[1] += 1
+    return index
+
+
+def diff_tests(
+    before: TestSuiteResult,
+    after: TestSuiteResult,
+    key: str = "name",
+    history_before: dict[str, str] | None = None,
+    history_after: dict[str, str] | None = None,
+) -> tuple[list[TestDelta], list[TestDelta], list[TestDelta]]:
+    """Hash-join two suites on ``key``; returns (matched, added, removed).
+
+    ``key`` is "history" (uid -> historyId maps, falling back to the name),
+    "name" or "uid".
+    """
+    if key not in ("history", "name", "uid"):
+        raise ValueError(f"Unsupported test key {key!r}")
+    build = _index(before, key, history_before)
+    probe = _index(after, key, history_after)
+    matched, added = [], []
+    for k, (after_ms, after_n, name) in probe.items():
+        hit = build.get(k)
+        if hit is None:
+            added.append(TestDelta(name, 0.0, after_ms / 1000, suite=after.name, after_attempts=after_n))
+        else:
+            matched.append(TestDelta(
+                name, hit[0] / 1000, after_ms / 1000, suite=after.name,
+                before_attempts=hit[1], after_attempts=after_n,
+            ))
+    removed = [
+        TestDelta(name, ms / 1000, 0.0, suite=before.name, before_attempts=n)
+        for k, (ms, n, name) in build.items() if k not in probe
+    ]
+    return matched, added, removed
+
+
+def diff_runs(
+    before,
+    after,
+    key: str = "name",
+    history_before: dict[str, str] | None = None,
+    history_after: dict[str, str] | None = None,
+) -> RunDiff:
+    """Diff two ``pipeline.RunAnalysis`` results (``before`` is the baseline).
+
+    For ``key="history"`` pass each run's ``pipeline.history_ids``.
+    """
+    result = RunDiff(
+        before_run=str(before.run_dir),
+        after_run=str(after.run_dir),
+        key=key,
+        concord=Delta(
+            "Concord", before.orchestration.total_duration_s, after.orchestration.total_duration_s
+        ),
+        end_to_end=Delta("End-to-end", before.end_to_end_s, after.end_to_end_s),
+        phases=diff_phases(before.orchestration, after.orchestration),
+        resumes=diff_resumes(before.orchestration, after.orchestration),
+    )
+    for a, b in ((before.kono, after.kono), (before.substantiate, after.substantiate)):
+        result.pools.extend(diff_pools(a, b))
+        matched, added, removed = diff_tests(a, b, key, history_before, history_after)
+        result.tests.extend(matched)
+        result.added.extend(added)
+        result.removed.extend(removed)
+    return result
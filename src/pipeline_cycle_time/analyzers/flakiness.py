@@ -0,0 +1,175 @@
+"""Cross-run flaky-test and retry-waste accounting.
+
+Reads the Allure ``test-cases/*.json`` of many runs (one worker process per
+run when ``jobs > 1``), keyed by ``historyId`` so the same test lines up
+across runs. Per run, a test's final result carries ``retriesCount``,
+``retriesStatusChange`` and the earlier attempts in ``extra.retries``;
+attempts marked ``retry: true`` are those earlier attempts and are skipped.
+
+A run *flaked* for a test when it was retried and finally passed. Waste is
+measured two ways: worker-seconds burned by the discarded attempts, and the
+delay between the first attempt starting and the final one starting (how
+much later the result arrived). Tests are ranked by expected worker-seconds
+wasted per pipeline, i.e. total retry cost over all analyzed pipelines.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+
+from .. import jsonio
+from ..stats import wilson_interval
+
+SUITE_REPORTS = (("Kono", "kono-report"), ("Substantiate", "substantiate-report"))
+
+
+@dataclass
+class TestOutcome:
+    """One test's final result in one run."""
+    suite: str
+    history_id: str
+    name: str
+    status: str
+    retries: int
+    status_change: bool
+    retry_s: float  # duration of the discarded attempts
+    delay_s: float  # first attempt start -> final attempt start
+
+
+@dataclass
+class FlakeStats:
+    suite: str
+    history_id: str
+    name: str
+    runs: int = 0
+    retried_runs: int = 0
+    flaky_runs: int = 0
+    failed_runs: int = 0
+    attempts: int = 0
+    retry_s: float = 0.0
+    delay_s: float = 0.0
+
+    @property
+    def flake_rate(self) -> float:
+        return self.flaky_runs / self.runs if self.runs else 0.0
+
+    @property
+    def flake_rate_ci(self) -> tuple[float, float]:
+        return wilson_interval(self.flaky_runs, self.runs)
+
+    @property
+    def retry_s_per_retried_run(self) -> float:
+        return self.retry_s / self.retried_runs if self.retried_runs else 0.0
+
+
+@dataclass
+class FlakinessResult:
+    runs: list[str] = field(default_factory=list)
+    failed_runs: dict[str, str] = field(default_factory=dict)
+    tests: list[FlakeStats] = field(default_factory=list)
+
+    @property
+    def pipelines(self) -> int:
+        return len(self.runs)
+
+    def expected_waste_s(self, t: FlakeStats) -> float:
+        """Expected worker-seconds this test wastes per pipeline."""
+        return t.retry_s / self.pipelines if self.pipelines else 0.0
+
+    def expected_waste_upper_s(self, t: FlakeStats) -> float:
+        """Pessimistic waste: Wilson upper flake rate x cost per retried run."""
+        return t.flake_rate_ci[1] * t.retry_s_per_retried_run * t.runs / max(self.pipelines, 1)
+
+    @property
+    def total_retry_s(self) -> float:
+        return sum(t.retry_s for t in self.tests)
+
+    @property
+    def total_delay_s(self) -> float:
+        return sum(t.delay_s for t in self.tests)
+
+    def ranked(self) -> list[FlakeStats]:
+        """Tests that were ever retried, most expected waste first."""
+        return sorted(
+            (t for t in self.tests if t.retried_runs),
+            key=lambda t: (-t.retry_s, -t.flake_rate, t.name),
+        )
+
+
+def _outcome(suite: str, case: dict, attempt_times: dict[str, dict]) -> TestOutcome:
+    retries = case.get("extra", {}).get("retries", [])
+    # Retry entries usually carry their own time; fall back to the attempt's test-case
+    times = [r.get("time") or attempt_times.get(r.get("uid"), {}) for r in retries]
+    final_start = case.get("time", {}).get("start", 0)
+    retry_ms = sum(t.get("duration", 0) for t in times)
+    first_start = min((t["start"] for t in times if t.get("start")), default=final_start)
+    return TestOutcome(
+        suite=suite,
+        history_id=case.get("historyId") or case.get("name", ""),
+        name=case.get("name", ""),
+        status=case.get("status", "unknown"),
+        retries=case.get("retriesCount", len(retries)),
+        status_change=case.get("retriesStatusChange", False),
+        retry_s=retry_ms / 1000,
+        delay_s=max(0, final_start - first_start) / 1000,
+    )
+
+
+def run_outcomes(run_dir: str) -> list[TestOutcome]:
+    """Final per-test outcomes of one run, from both suites' test-cases."""
+    outcomes = []
+    for suite, report in SUITE_REPORTS:
+        finals, attempt_times = [], {}
+        paths = sorted((Path(run_dir) / report / "data" / "test-cases").glob("*.json"))
+        for _, case in jsonio.iter_load(paths):
+            if case.get("retry"):
+                attempt_times[case.get("uid")] = case.get("time", {})
+            else:
+                finals.append(case)
+        outcomes.extend(_outcome(suite, case, attempt_times) for case in finals)
+    return outcomes
+
+
+def _accumulate(stats: dict[tuple[str, str], FlakeStats], outcomes: list[TestOutcome]) -> None:
+    for o in outcomes:
+        s = stats.get((o.suite, o.history_id))
+        if s is None:
+            s = stats[(o.suite, o.history_id)] = FlakeStats(o.suite, o.history_id, o.name)
+        s.runs += 1
+        s.attempts += 1 + o.retries
+        if o.retries:
+            s.retried_runs += 1
+            s.retry_s += o.retry_s
+            s.delay_s += o.delay_s
+            if o.status == "passed":
+                s.flaky_runs += 1
+        if o.status in ("failed", "broken"):
+            s.failed_runs += 1
+
+
+def analyze_runs(run_dirs: list[str], jobs: int = 1) -> FlakinessResult:
+    """Flakiness across ``run_dirs``; ``jobs > 1`` parses runs in parallel."""
+    result = FlakinessResult()
+    stats: dict[tuple[str, str], FlakeStats] = {}
+    pool = None
+    if jobs > 1 and len(run_dirs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=min(jobs, len(run_dirs)))
+        pending = [(d, pool.submit(run_outcomes, d).result) for d in run_dirs]
+    else:
+        pending = [(d, partial(run_outcomes, d)) for d in run_dirs]
+    try:
+        for run_dir, outcomes in pending:
+            try:
+                _accumulate(stats, outcomes())
+            except Exception as e:  # one unreadable run must not sink the rollup
+                result.failed_runs[run_dir] = f"{type(e).__name__}: {e}"
+            else:
+                result.runs.append(run_dir)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    result.tests = list(stats.values())
+    return result
@@ -0,0 +1,145 @@
+"""Attribute classified webapp log lines to the tests running when they were logged.
+
+A line is charged to every test (of either suite) whose interval contains
+its timestamp, so a line logged while twelve Kono workers were busy counts
+once for each of the twelve tests; per package it counts once, however many
+of the package's tests overlapped it. Lines logged while no test was running
+are reported separately.
+
+Test times come from Allure and line times from Loki; with a ``ClockSkew``
+(``correlation.clock_skew``) both are put on the reference clock first.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+
+from ..intervals import IntervalIndex, RangeMax, merge
+from .app_logs import ERROR, LINE_KINDS, WARNING_KINDS
+
+
+@dataclass(slots=True)
+class LogCounts:
+    name: str
+    suite: str = ""
+    by_kind: dict[str, int] = field(default_factory=dict)
+    worst_latency_s: float = 0.0
+
+    @property
+    def errors(self) -> int:
+        return self.by_kind.get(LINE_KINDS[ERROR], 0)
+
+    @property
+    def warnings(self) -> int:
+        return sum(self.by_kind.get(LINE_KINDS[k], 0) for k in WARNING_KINDS)
+
+    @property
+    def lines(self) -> int:
+        return self.errors + self.warnings
+
+
+@dataclass
+class LogAttribution:
+    tests: dict[str, LogCounts] = field(default_factory=dict)  # uid -> counts
+    packages: dict[str, LogCounts] = field(default_factory=dict)
+    outside: LogCounts = field(default_factory=lambda: LogCounts("(no test running)"))
+    total: LogCounts = field(default_factory=lambda: LogCounts("(all)"))
+
+    def ranked(self, by: str = "tests") -> list[LogCounts]:
+        """Tests (or packages) with any attributed line, most errors and warnings first."""
+        counts = self.tests if by == "tests" else self.packages
+        return sorted(
+            counts.values(), key=lambda c: (-c.lines, -c.errors, -c.worst_latency_s, c.name),
+        )
+
+
+def _aggregate(index: IntervalIndex, owners: list, points: dict[int, array],
+               line_ns: array, latency: RangeMax) -> dict[object, tuple[dict[str, int], float]]:
+    """Per-owner line counts and worst latency over ``index``'s intervals."""
+    out: dict[object, tuple[dict[str, int], float]] = {}
+    lo, hi = index.slices(line_ns)
+    worst = [latency.query(i, j) for i, j in zip(lo, hi)]
+    for kind, ns in points.items():
+        for i, n in enumerate(index.count(ns)):
+            if n:
+                by_kind = out.setdefault(owners[i], ({}, 0.0))[0]
+                by_kind[LINE_KINDS[kind]] = by_kind.get(LINE_KINDS[kind], 0) + n
+    for i, w in enumerate(worst):
+        if owners[i] in out and w > out[owners[i]][1]:
+            out[owners[i]] = (out[owners[i]][0], w)
+    return out
+
+
+def attribute(app_logs, suites, packages: dict[str, str] | None = None,
+              skew=None) -> LogAttribution:
+    """Join ``app_logs``' classified lines to the tests of ``suites``.
+
+    ``packages`` maps test uids to their package (``pipeline.packages``);
+    tests without one are grouped by suite.
+    """
+    from ..events import ns_from_ms
+
+    packages = packages or {}
+    result = LogAttribution()
+    line_ns, line_kind = app_logs.line_ns, app_logs.line_kind
+    if not line_ns:
+        return result
+    points: dict[int, array] = {}
+    for t, k in zip(line_ns, line_kind):
+        ns = points.get(k)
+        if ns is None:
+            ns = points[k] = array("q")
+        ns.append(t)
+    latency = RangeMax(app_logs.line_latency_s)
+    result.total.by_kind = {LINE_KINDS[k]: len(ns) for k, ns in points.items()}
+    result.total.worst_latency_s = latency.query(0, len(line_ns))
+
+    # Test intervals, moved onto the Loki clock so the lines need no copy
+    log_off = skew.offset_ns("webapp") if skew is not None else 0
+    tests, starts, ends = [], array("q"), array("q")
+    for suite in suites:
+        if suite is None:
+            continue
+        shift = log_off - (skew.offset_ns(suite.name.lower()) if skew is not None else 0)
+        for t in suite.tests:
+            tests.append((suite.name, t))
+            starts.append(ns_from_ms(t.start) + shift)
+            ends.append(ns_from_ms(t.stop) + shift)
+
+    for i, (by_kind, worst) in _aggregate(
+        IntervalIndex(starts, ends), list(range(len(tests))), points, line_ns, latency,
+    ).items():
+        suite, t = tests[i]
+        result.tests[t.uid] = LogCounts(t.name, suite, by_kind, worst)
+
+    # Each package's tests merged into disjoint spans, so a line counts once
+    groups: dict[tuple[str, str], tuple[list[int], list[int]]] = {}
+    for (suite, t), s, e in zip(tests, starts, ends):
+        span = groups.setdefault((suite, packages.get(t.uid) or suite), ([], []))
+        span[0].append(s)
+        span[1].append(e)
+    owners, g_starts, g_ends = [], array("q"), array("q")
+    for key, (s, e) in groups.items():
+        ms, me = merge(s, e)
+        owners.extend([key] * len(ms))
+        g_starts.extend(ms)
+        g_ends.extend(me)
+    for (suite, package), (by_kind, worst) in _aggregate(
+        IntervalIndex(g_starts, g_ends), owners, points, line_ns, latency,
+    ).items():
+        result.packages[package] = LogCounts(package, suite, by_kind, worst)
+
+    # The gaps around the union of all tests (closed, so shrunk by 1ns)
+    union_starts, union_ends = merge(starts, ends)
+    gaps = [
+        (s, e) for s, e in zip(
+            [line_ns[0]] + [e + 1 for e in union_ends], [s - 1 for s in union_starts] + [line_ns[-1]],
+        ) if s <= e
+    ]
+    gap_starts, gap_ends = array("q", [s for s, _ in gaps]), array("q", [e for _, e in gaps])
+    outside = _aggregate(
+        IntervalIndex(gap_starts, gap_ends), [None] * len(gap_ends), points, line_ns, latency,
+    )
+    if outside:
+        result.outside.by_kind, result.outside.worst_latency_s = outside[None]
+    return result
@@ -1,11 +1,14 @@
 """Parse Prometheus JSON metrics data."""
 from __future__ import annotations
 
-import json
 import math
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .. import jsonio
+
+ANALYZER_VERSION = 2
+
 
 @dataclass
 class MetricSummary:
@@ -14,6 +17,9 @@ class MetricSummary:
     max_val: float = 0.0
     avg_val: float = 0.0
     unit: str = ""
+    start_s: float = 0.0  # first/last sample and time of the max (Prometheus epoch s)
+    end_s: float = 0.0
+    peak_s: float = 0.0
 
 
 @dataclass
@@ -37,23 +43,50 @@ class MetricsResult:
         return False
 
 
-def _summarize(path: str, name: str, unit: str = "") -> MetricSummary | None:
-    """Load a Prometheus JSON file and summarize the first result."""
+# MetricsResult field -> (file glob in the metrics directory, label, unit)
+SERIES = {
+    "cpu": ("webapp-cpu.json", "CPU", "cores"),
+    "memory": ("webapp-memory.json", "Memory", "bytes"),
+    "dispatcher_cpu": ("dispatcher-cpu.json", "Dispatcher CPU", "cores"),
+    "dispatcher_memory": ("dispatcher-memory.json", "Dispatcher Memory", "bytes"),
+    "hikaricp_active": ("hikaricp_connections_active*.json", "HikariCP Active", "connections"),
+    "hikaricp_pending": ("hikaricp_connections_pending*.json", "HikariCP Pending", "connections"),
+    "jetty_threads": ("jetty_threads_busy*.json", "Jetty Threads", "threads"),
+    "jvm_heap": ("jvm_memory_used_bytes*.json", "JVM Heap", "bytes"),
+    "jvm_threads": ("jvm_threads_current*.json", "JVM Threads", "threads"),
+    "gc": ("rate_jvm_gc*.json", "GC Rate", "s/s"),
+}
+
+
+def series_paths(metrics_dir: str) -> dict[str, Path]:
+    """The file backing each ``MetricsResult`` field that has one."""
+    d = Path(metrics_dir)
+    paths = {}
+    for field_name, (pattern, _, _) in SERIES.items():
+        found = sorted(d.glob(pattern))
+        if found:
+            paths[field_name] = found[0]
+    return paths
+
+
+def load_samples(path: str) -> list[tuple[float, float]]:
+    """``(epoch s, value)`` samples of a Prometheus JSON file's first matching series.
+
+    That is the first result labelled with the webapp or dispatcher
+    container, else the first result; NaN and unparsable values are dropped.
+    """
     try:
-        with open(path) as f:
-            data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return None
+        data = jsonio.load(path)
+    except (FileNotFoundError, jsonio.JSONDecodeError):
+        return []
 
     if data.get("status") != "success":
-        return None
+        return []
 
     results = data.get("data", {}).get("result", [])
     if not results:
-        return None
+        return []
 
-    # Use the first result that has the 'container' label matching 'webapp'
-    # or the first result with actual data
     target = results[0]
     for r in results:
         container = r.get("metric", {}).get("container", "")
@@ -61,61 +94,55 @@ def _summarize(path: str, name: str, unit: str = "") -> MetricSummary | None:
             target = r
             break
 
-    values = target.get("values", [])
-    nums = []
-    for _, v in values:
+    samples = []
+    for ts, v in target.get("values", []):
         try:
             n = float(v)
             if not math.isnan(n):
-                nums.append(n)
+                samples.append((float(ts), n))
         except (ValueError, TypeError):
             continue
+    return samples
 
-    if not nums:
+
+def _summarize(path: str, name: str, unit: str = "") -> MetricSummary | None:
+    """Load a Prometheus JSON file and summarize the first result."""
+    samples = load_samples(path)
+    if not samples:
         return None
 
+    nums = [n for _, n in samples]
+    peak_s, max_val = max(samples, key=lambda s: s[1])
     return MetricSummary(
         name=name,
         min_val=min(nums),
-        max_val=max(nums),
+        max_val=max_val,
         avg_val=sum(nums) / len(nums),
         unit=unit,
+        start_s=samples[0][0],
+        end_s=samples[-1][0],
+        peak_s=peak_s,
     )
 
 
 def analyze(metrics_dir: str) -> MetricsResult:
     """Analyze all metric files in the directory."""
-    d = Path(metrics_dir)
     result = MetricsResult()
+    for field_name, path in series_paths(metrics_dir).items():
+        _, name, unit = SERIES[field_name]
+        setattr(result, field_name, _summarize(str(path), name, unit))
+    return result
 
-    result.cpu = _summarize(str(d / "webapp-cpu.json"), "CPU", "cores")
-    result.memory = _summarize(str(d / "webapp-memory.json"), "Memory", "bytes")
-    result.dispatcher_cpu = _summarize(str(d / "dispatcher-cpu.json"), "Dispatcher CPU", "cores")
-    result.dispatcher_memory = _summarize(str(d / "dispatcher-memory.json"), "Dispatcher Memory", "bytes")
-
-    # HikariCP
-    hikari_active = sorted(d.glob("hikaricp_connections_active*.json"))
-    if hikari_active:
-        result.hikaricp_active = _summarize(str(hikari_active[0]), "HikariCP Active", "connections")
-
-    hikari_pending = sorted(d.glob("hikaricp_connections_pending*.json"))
-    if hikari_pending:
-        result.hikaricp_pending = _summarize(str(hikari_pending[0]), "HikariCP Pending", "connections")
-
-    jetty = sorted(d.glob("jetty_threads_busy*.json"))
-    if jetty:
-        result.jetty_threads = _summarize(str(jetty[0]), "Jetty Threads", "threads")
-
-    jvm_heap = sorted(d.glob("jvm_memory_used_bytes*.json"))
-    if jvm_heap:
-        result.jvm_heap = _summarize(str(jvm_heap[0]), "JVM Heap", "bytes")
-
-    jvm_threads = sorted(d.glob("jvm_threads_current*.json"))
-    if jvm_threads:
-        result.jvm_threads = _summarize(str(jvm_threads[0]), "JVM Threads", "threads")
 
-    gc = sorted(d.glob("rate_jvm_gc*.json"))
-    if gc:
-        result.gc = _summarize(str(gc[0]), "GC Rate", "s/s")
+def emit_events(result: MetricsResult, table) -> None:
+    """Emit each series' sample span and its peak into an ``events.EventTable``."""
+    from ..events import ns_from_s
 
-    return result
+    for field_name, m in vars(result).items():
+        if m is None or not m.end_s:
+            continue
+        table.add(
+            "prometheus", "series", field_name, ns_from_s(m.start_s), ns_from_s(m.end_s),
+            min=m.min_val, max=m.max_val, avg=m.avg_val, unit=m.unit,
+        )
+        table.add("prometheus", "peak", field_name, ns_from_s(m.peak_s), value=m.max_val)
@@ -6,12 +6,14 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 
+ANALYZER_VERSION = 1
+
 TIMESTAMP_RE = re.compile(
     r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}\+\d{4})\s+\[(\w+)\s*\]\s+(.*)"
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Phase:
     name: str
     start: datetime
@@ -22,7 +24,7 @@ class Phase:
         return (self.end - self.start).total_seconds()
 
 
-@dataclass
+@dataclass(slots=True)
 class ResumeOverhead:
     """Overhead from one suspend/resume cycle."""
     resume_time: datetime
@@ -78,16 +80,6 @@ class OrchestrationResult:
     def resume_count(self) -> int:
         return len(self.resume_overheads)
 
-    def mark_critical_path(self, test_end_epoch_s: float) -> None:
-        """Mark which resume cycles are on the critical path.
-
-        A resume cycle is on the critical path only if it starts after all
-        test suites have finished. Resumes that overlap with running tests
-        do not extend end-to-end wall-clock time.
-        """
-        for r in self.resume_overheads:
-            r.on_critical_path = r.resume_time.timestamp() >= test_end_epoch_s
-
 
 def _parse_ts(s: str) -> datetime:
     # Format: 2026-02-24T18:21:04.907+0000
@@ -227,3 +219,24 @@ def analyze(log_path: str) -> OrchestrationResult:
         result.phases.append(Phase("Suspended", first_suspend, result.total_end))
 
     return result
+
+
+def emit_events(result: OrchestrationResult, table) -> None:
+    """Emit phases, suspends and resume cycles into an ``events.EventTable``."""
+    from ..events import ns_from_datetime, ns_from_s
+
+    if result.total_start and result.total_end:
+        table.add(
+            "concord", "run", "concord",
+            ns_from_datetime(result.total_start), ns_from_datetime(result.total_end),
+        )
+    for p in result.phases:
+        table.add("concord", "phase", p.name, ns_from_datetime(p.start), ns_from_datetime(p.end))
+    for t in result.suspend_times:
+        table.add("concord", "suspend", "concord", ns_from_datetime(t))
+    for i, r in enumerate(result.resume_overheads, 1):
+        start = ns_from_datetime(r.resume_time)
+        table.add(
+            "concord", "resume", f"#{i}", start, start + ns_from_s(r.total_s),
+            repo_export_s=r.repo_export_s, dep_resolution_s=r.dep_resolution_s,
+        )
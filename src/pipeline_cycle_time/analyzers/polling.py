@@ -0,0 +1,85 @@
+"""Measured polling overshoot of Substantiate tests waiting on dispatcher jobs.
+
+A Substantiate test that submits an analysis polls until the dispatcher job
+computing it is done. Joining each job's compute span to the test that was
+running around it gives the moment compute finished and the moment the test
+noticed (its end); the gap between them is the polling overshoot, observed
+rather than inferred from test durations.
+
+A job is held by the latest-starting Substantiate test whose span contains
+it (``intervals.containing``). A test holding several jobs waited on the
+last of them to finish.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from ..intervals import containing
+from ..stats import distribution
+
+
+@dataclass(slots=True)
+class PollWait:
+    uid: str
+    name: str
+    job_id: str  # the last job the test waited on
+    jobs: int
+    compute_end_ns: int
+    noticed_ns: int
+
+    @property
+    def overshoot_s(self) -> float:
+        return (self.noticed_ns - self.compute_end_ns) / 1e9
+
+
+@dataclass
+class PollingResult:
+    waits: list[PollWait] = field(default_factory=list)
+    unmatched_jobs: list[str] = field(default_factory=list)
+
+    def overshoot_s(self) -> list[float]:
+        return sorted(w.overshoot_s for w in self.waits)
+
+    def distribution(self) -> dict:
+        """count/min/p50/p90/p95/max/mean of the per-test overshoot in seconds."""
+        return distribution(self.overshoot_s())
+
+    @property
+    def total_overshoot_s(self) -> float:
+        return sum(w.overshoot_s for w in self.waits)
+
+
+def _join(events):
+    jobs = events.filter(source="dispatcher", kind="compute")
+    tests = events.filter(source="substantiate", kind="test")
+    held = containing(
+        [j.start_ns for j in jobs], [j.end_ns for j in jobs],
+        [t.start_ns for t in tests], [t.end_ns for t in tests],
+    )
+    return jobs, tests, held
+
+
+def holders(events) -> list[tuple[object, object | None]]:
+    """Each dispatcher compute event with the Substantiate test waiting on it (or None)."""
+    jobs, tests, held = _join(events)
+    return [(job, tests[i] if i >= 0 else None) for job, i in zip(jobs, held)]
+
+
+def analyze(events) -> PollingResult:
+    """Polling overshoot per test from a (clock-corrected) ``events.EventTable``."""
+    jobs, tests, held = _join(events)
+    result = PollingResult()
+    by_test: dict[int, list] = {}
+    for job, i in zip(jobs, held):
+        if i < 0:
+            result.unmatched_jobs.append(job.entity)
+        else:
+            by_test.setdefault(i, []).append(job)
+    for i, waited in by_test.items():
+        test = tests[i]
+        last = max(waited, key=lambda j: j.end_ns)
+        result.waits.append(PollWait(
+            test.get("uid", ""), test.entity, last.entity, len(waited), last.end_ns, test.end_ns,
+        ))
+    result.waits.sort(key=lambda w: w.compute_end_ns)
+    return result
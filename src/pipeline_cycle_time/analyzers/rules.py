@@ -0,0 +1,211 @@
+"""Registered finding rules, evaluated lazily and ranked by computed savings.
+
+A rule is a function from shared facts (a ``FactsBase``) to a finding,
+registered with ``@rule``. It declares the facts it ``needs``: analyzer results
+(``orchestration``, ``kono``, ...) or derived intermediates (``graph``,
+``setup``, ``polling``, ...); registration rejects any other name. A rule
+runs only if the analyzer results it needs are present. Intermediates are
+``shared`` properties, computed on first use and memoized for every other
+rule, so a fact no selected rule needs is never computed.
+
+A rule with a ``what_if`` names the dependency-graph overrides (shorter
+durations or lags) its fix would bring; its saving is the what-if
+reschedule (``DependencyGraph.saving_ns``). The total shortening of the
+overridden durations and lags bounds that saving from above without a
+reschedule, so asking ``evaluate`` for the ``top`` findings reschedules
+rules in bound order and stops once no remaining rule can outrank them.
+Rules without a ``what_if`` save nothing measurable and rank last; only
+findings that make the ``top`` are written out.
+
+Findings rank by saving, then registration order. Rules only read the
+facts, so with ``jobs > 1`` they run on a thread pool.
+"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+
+
+class shared:
+    """Memoized, thread-safe property: computed once however many rules ask."""
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        memo = obj._memo
+        if self.name not in memo:
+            with obj._locks.setdefault(self.name, threading.RLock()):
+                if self.name not in memo:
+                    memo[self.name] = self.func(obj)
+        return memo[self.name]
+
+
+class FactsBase:
+    """Analyzer results plus ``shared`` intermediates.
+
+    Subclasses annotate the inputs (analyzer results) and add the
+    intermediates.
+    """
+
+    def __init__(self, **inputs):
+        self.__dict__.update(inputs)
+        self._memo: dict[str, object] = {}
+        self._locks: dict[str, threading.RLock] = {}
+
+    @classmethod
+    def inputs(cls) -> set[str]:
+        return {name for c in cls.__mro__ for name in getattr(c, "__annotations__", {})}
+
+    @classmethod
+    def is_shared(cls, name: str) -> bool:
+        return isinstance(getattr(cls, name, None), shared)
+
+    def has(self, name: str) -> bool:
+        """Whether fact ``name`` is available: a given input, or any ``shared`` fact."""
+        if type(self).is_shared(name):
+            return True
+        if name in self.__dict__ or name in type(self).inputs():
+            return self.__dict__.get(name) is not None
+        raise ValueError(f"Unknown fact {name!r}")
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    needs: tuple[str, ...]
+    finding: Callable  # (facts, saved_ns) -> Finding | None
+    what_if: Callable | None = None  # facts -> {"durations": ..., "lags": ...} | None
+
+
+RULES: list[Rule] = []
+
+
+def rule(
+    name: str,
+    needs: tuple[str, ...] = (),
+    what_if: Callable | None = None,
+    facts: type[FactsBase] = FactsBase,
+):
+    """Register the decorated ``(facts, saved_ns) -> Finding | None`` as a rule.
+
+    Every name in ``needs`` must be an input or a ``shared`` fact of the
+    ``facts`` class. ``what_if(facts)`` returns ``None`` when the rule does
+    not apply; a rule with a ``what_if`` must then always produce a finding.
+    """
+    inputs = facts.inputs()
+    unknown = [n for n in needs if n not in inputs and not facts.is_shared(n)]
+    if unknown:
+        raise ValueError(f"Rule {name!r} needs unknown facts: {', '.join(unknown)}")
+
+    def register(func):
+        if any(r.name == name for r in RULES):
+            raise ValueError(f"Duplicate rule {name!r}")
+        RULES.append(Rule(name, tuple(needs), func, what_if))
+        return func
+    return register
+
+
+def _bound(graph, overrides: dict) -> int:
+    """Upper bound on the saving: total shortening of every overridden item."""
+    total = 0
+    for i, d in overrides.get("durations", {}).items():
+        total += max(0, graph.duration_ns(i) - d)
+    for e, lag in overrides.get("lags", {}).items():
+        total += max(0, graph.lag_ns(e) - lag)
+    return total
+
+
+@dataclass
+class _Candidate:
+    order: int
+    rule: Rule
+    overrides: dict | None = None
+    bound: int = 0
+    saved_ns: int | None = None
+
+    def key(self, saved_ns: int) -> tuple[int, int]:
+        return -saved_ns, self.order
+
+
+def evaluate(
+    facts: FactsBase,
+    rules: list[Rule] | None = None,
+    top: int | None = None,
+    jobs: int = 1,
+) -> list:
+    """Findings of ``rules`` (default: every registered rule), best first, ranked 1..n."""
+    rules = RULES if rules is None else rules
+    candidates = [
+        _Candidate(i, r) for i, r in enumerate(rules) if all(facts.has(n) for n in r.needs)
+    ]
+
+    def run(func, tasks):
+        if jobs > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                return list(pool.map(func, tasks))
+        return [func(t) for t in tasks]
+
+    # Which rules apply; rules with nothing to reschedule save nothing
+    def prepare(c: _Candidate) -> _Candidate | None:
+        if c.rule.what_if is None:
+            c.saved_ns = 0
+            return c
+        c.overrides = c.rule.what_if(facts)
+        if c.overrides is None:
+            return None
+        c.bound = _bound(facts.graph, c.overrides)
+        return c
+
+    candidates = [c for c in run(prepare, candidates) if c is not None]
+
+    def reschedule(c: _Candidate) -> None:
+        if c.saved_ns is None:
+            c.saved_ns = facts.graph.saving_ns(**c.overrides) if len(facts.graph) else 0
+
+    if top is None:
+        run(reschedule, candidates)
+    else:
+        # Branch and bound: a pending rule can at best save its bound. Rules
+        # without a what-if may still find nothing, so only the others,
+        # which always produce a finding, can settle the top.
+        fixed = [c for c in candidates if c.saved_ns is not None]
+        pending = sorted(
+            (c for c in candidates if c.saved_ns is None), key=lambda c: c.key(c.bound)
+        )
+        done: list[_Candidate] = []
+        step = max(jobs, 1)
+        while pending:
+            batch, pending = pending[:step], pending[step:]
+            run(reschedule, batch)
+            done.extend(batch)
+            done.sort(key=lambda c: c.key(c.saved_ns))
+            if pending and len(done) >= top:
+                kth = done[top - 1]
+                if kth.key(kth.saved_ns) < pending[0].key(pending[0].bound):
+                    break
+        candidates = done + fixed
+    candidates.sort(key=lambda c: c.key(c.saved_ns))
+
+    def write(c: _Candidate):
+        return c.rule.finding(facts, c.saved_ns)
+
+    # Written in rank order until there are ``top``; rules without a what-if
+    # that find nothing drop out
+    if top is None:
+        findings = [f for f in run(write, candidates) if f is not None]
+    else:
+        findings = []
+        while candidates and len(findings) < top:
+            step = min(top - len(findings), max(jobs, 1))
+            batch, candidates = candidates[:step], candidates[step:]
+            findings.extend(f for f in run(write, batch) if f is not None)
+    for rank, f in enumerate(findings, 1):
+        f.rank = rank
+    return findings
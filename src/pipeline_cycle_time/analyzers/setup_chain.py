@@ -0,0 +1,174 @@
+"""Inferred happens-before chain of a suite's setup phase.
+
+During setup most workers sit idle while a few tests run one after another.
+A test that starts within ``window_s`` of another test's end (on any
+worker) is a candidate successor of it: the *link* ``a -> b``. Candidates
+come from a sorted neighbour search, i.e. one binary search over the
+setup tests' end times per test, not an all-pairs comparison.
+
+A link is a serial dependency when ``b`` could have started earlier but
+did not: ``a`` is the last of ``b``'s candidates to end, some worker was
+already idle while ``a`` was still running, and in every historical run where both tests
+appear ``b`` again started after ``a`` ended. Otherwise it is a scheduling
+artifact: ``b`` was held back by a later-ending test, or waited for a
+worker slot rather than for ``a``, or another run ordered the two tests
+differently.
+
+The serial links form a DAG over the setup tests; its longest path
+(``critical_path.DependencyGraph``) is the chain that sets the setup
+phase's length.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+
+from .test_reports import TestInfo, TestSuiteResult
+
+# Start overhead between a test's end and the next test it unblocks
+# (Playwright spends ~2s per test start on the reference runs)
+WINDOW_S = 3.0
+
+
+@dataclass(slots=True)
+class ChainLink:
+    before: str
+    after: str
+    gap_s: float
+    idle_workers: int  # just before ``before`` ended
+    binding: bool = True  # ``before`` is the last candidate to end before ``after``
+    runs_seen: int = 1  # runs with both tests, this one included
+    runs_ordered: int = 1  # of those, runs where ``after`` started after ``before`` ended
+
+    @property
+    def serial(self) -> bool:
+        return self.binding and self.idle_workers > 0 and self.runs_ordered == self.runs_seen
+
+    @property
+    def reason(self) -> str:
+        if self.runs_ordered < self.runs_seen:
+            return f"order differs in {self.runs_seen - self.runs_ordered} of {self.runs_seen} runs"
+        if not self.binding:
+            return "a later-ending test held it back"
+        if self.idle_workers <= 0:
+            return "no idle worker: waited for a slot"
+        runs = f", ordered in all {self.runs_seen} runs" if self.runs_seen > 1 else ""
+        return f"waited with {self.idle_workers} idle workers{runs}"
+
+
+@dataclass
+class SetupChain:
+    setup_s: float = 0.0
+    tests: list[TestInfo] = field(default_factory=list)
+    links: list[ChainLink] = field(default_factory=list)
+    critical_path: list[str] = field(default_factory=list)  # test names, in order
+    critical_path_s: float = 0.0
+    history_runs: int = 0
+
+    @property
+    def serial_links(self) -> list[ChainLink]:
+        return [link for link in self.links if link.serial]
+
+    @property
+    def artifacts(self) -> list[ChainLink]:
+        return [link for link in self.links if not link.serial]
+
+    def path_links(self) -> list[ChainLink]:
+        """The links along the critical path."""
+        by_pair = {(link.before, link.after): link for link in self.links}
+        return [
+            by_pair[pair] for pair in zip(self.critical_path, self.critical_path[1:])
+            if pair in by_pair
+        ]
+
+
+def _first_by_name(suite: TestSuiteResult) -> dict[str, TestInfo]:
+    first: dict[str, TestInfo] = {}
+    for t in suite.tests:
+        seen = first.get(t.name)
+        if seen is None or t.start < seen.start:
+            first[t.name] = t
+    return first
+
+
+def candidate_links(tests: list[TestInfo], window_s: float = WINDOW_S) -> list[tuple[int, int]]:
+    """``(a, b)`` index pairs where ``b`` started within ``window_s`` after ``a`` ended."""
+    order = sorted(range(len(tests)), key=lambda i: tests[i].stop)
+    ends = array("q", [tests[i].stop for i in order])
+    window_ms = window_s * 1000
+    pairs = []
+    for b, t in enumerate(tests):
+        lo = bisect_left(ends, t.start - window_ms)
+        hi = bisect_right(ends, t.start)
+        pairs.extend((order[k], b) for k in range(lo, hi) if order[k] != b)
+    return pairs
+
+
+def infer(
+    suite: TestSuiteResult,
+    history: list[TestSuiteResult] | None = None,
+    setup_s: float | None = None,
+    window_s: float = WINDOW_S,
+) -> SetupChain:
+    """Setup chain of ``suite``, checked against the same suite in ``history`` runs.
+
+    ``setup_s`` defaults to the detected setup phase (``setup_phase_analysis``).
+    Tests are matched across runs by name.
+    """
+    from .critical_path import DependencyGraph
+
+    history = history or []
+    if setup_s is None:
+        setup_s = suite.setup_phase_analysis().get("setup_duration_s")
+    if not suite.tests or not setup_s:
+        return SetupChain(history_runs=len(history))
+    t0 = min(t.start for t in suite.tests)
+    cutoff = t0 + setup_s * 1000
+    tests = sorted(
+        (t for t in _first_by_name(suite).values() if t.start < cutoff), key=lambda t: t.start,
+    )
+    chain = SetupChain(setup_s=setup_s, tests=tests, history_runs=len(history))
+
+    # Busy workers at any instant, from the whole suite's sorted starts/stops
+    starts = sorted(t.start for t in suite.tests)
+    stops = sorted(t.stop for t in suite.tests)
+    workers = len({t.worker for t in suite.tests})
+    past = [_first_by_name(run) for run in history]
+
+    pairs = candidate_links(tests, window_s)
+    last_end: dict[int, int] = {}
+    for a, b in pairs:
+        last_end[b] = max(last_end.get(b, 0), tests[a].stop)
+    for a, b in pairs:
+        before, after = tests[a], tests[b]
+        # Running just before ``before`` ended, ``before`` included
+        busy = bisect_left(starts, before.stop) - bisect_left(stops, before.stop)
+        link = ChainLink(
+            before.name, after.name, (after.start - before.stop) / 1000, workers - busy,
+            before.stop == last_end[b],
+        )
+        for run in past:
+            x, y = run.get(before.name), run.get(after.name)
+            if x is not None and y is not None:
+                link.runs_seen += 1
+                link.runs_ordered += y.start >= x.stop
+        chain.links.append(link)
+
+    graph = DependencyGraph()
+    origin = graph.add_node("start", "milestone", t0 * 1_000_000)
+    index = {
+        t.name: graph.add_node(f"test:{i}", "test", t.start * 1_000_000, t.stop * 1_000_000)
+        for i, t in enumerate(tests)
+    }
+    has_pred = set()
+    for link in chain.serial_links:
+        graph.add_edge(index[link.before], index[link.after])
+        has_pred.add(link.after)
+    for t in tests:
+        if t.name not in has_pred:
+            graph.add_edge(origin, index[t.name])
+    schedule = graph.schedule()
+    chain.critical_path = [tests[int(graph.names[i][5:])].name for i in schedule.path if i != origin]
+    chain.critical_path_s = schedule.makespan_s
+    return chain
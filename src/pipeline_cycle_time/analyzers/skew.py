@@ -0,0 +1,212 @@
+"""Clock-skew estimation between the pipeline's data sources.
+
+Concord, the two Allure reports, Loki and Prometheus each stamp events with
+their own host's clock. Nothing in the data states how those clocks relate,
+but some events are causally ordered across sources: the Helm deploy
+finishes before either suite's first test, the Concord parent resumes only
+after the last test of each child finished, and the dispatcher job a
+Substantiate test waits for runs inside that test. Each ordering "a (clock
+A) happens before b (clock B)" bounds the clocks' offsets:
+
+    true = observed - offset  =>  offset_B - offset_A <= b_obs - a_obs
+
+Concord is the reference (offset 0). The constraints form a difference
+system on a handful of variables, solved exactly by closing the
+shortest-path matrix (Floyd-Warshall): the feasible offset of clock X lies
+in ``[-dist(X, ref), dist(ref, X)]``, and a negative cycle means the anchors
+contradict each other. The point estimate is the value nearest zero inside
+those bounds (assume no skew unless the data forces one), fixed one clock at
+a time so the estimates stay jointly feasible.
+
+The "dispatcher job inside a polling test" anchor is a disjunction: any
+Substantiate test longer than the suite's polling cutoff (its
+``polling_cutoff_s``) may be the one waiting for the job. Each candidate
+gives one interval for the Loki-Substantiate offset; the interval nearest
+zero that is still feasible is taken.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+REFERENCE = "concord"
+CLOCKS = {"webapp": "loki", "dispatcher": "loki"}
+
+_INF = float("inf")
+
+
+def clock(source: str) -> str:
+    """Clock an event-table source is stamped with (webapp and dispatcher share Loki's)."""
+    return CLOCKS.get(source, source)
+
+
+@dataclass(slots=True)
+class Anchor:
+    """``before`` (on one clock) is known to happen no later than ``after`` (on another)."""
+    label: str
+    before: str
+    after: str
+    slack_ns: int  # observed after - before; negative means the clocks disagree
+
+
+@dataclass(slots=True)
+class ClockOffset:
+    clock: str
+    offset_ns: int
+    lower_ns: int | None  # None: unbounded on that side
+    upper_ns: int | None
+    anchors: int
+
+    @property
+    def offset_s(self) -> float:
+        return self.offset_ns / 1e9
+
+
+@dataclass
+class ClockSkew:
+    offsets: dict[str, ClockOffset] = field(default_factory=dict)
+    anchors: list[Anchor] = field(default_factory=list)
+    consistent: bool = True
+
+    def offset_ns(self, source: str) -> int:
+        o = self.offsets.get(clock(source))
+        return o.offset_ns if o is not None else 0
+
+    def apply(self, table) -> None:
+        """Shift every source in an ``events.EventTable`` onto the reference clock."""
+        for source in table.sources():
+            off = self.offset_ns(source)
+            if off:
+                table.shift(source, -off)
+
+
+def _close(dist: list[list[float]]) -> None:
+    n = len(dist)
+    for k in range(n):
+        dk = dist[k]
+        for i in range(n):
+            dik = dist[i][k]
+            if dik == _INF:
+                continue
+            di = dist[i]
+            for j in range(n):
+                if dik + dk[j] < di[j]:
+                    di[j] = dik + dk[j]
+
+
+def _nearest_zero(lo: float, hi: float) -> float:
+    return min(max(0, lo), hi)
+
+
+def solve(
+    anchors: list[Anchor],
+    choices: list[tuple[str, str, str, list[tuple[int, int]]]] = (),
+    clocks: list[str] = (),
+) -> ClockSkew:
+    """Offsets and bounds from anchors.
+
+    ``choices`` are ``(label, a, b, intervals)``: ``offset_b - offset_a``
+    lies in at least one of the ``(lo, hi)`` intervals.
+    """
+    names = [REFERENCE]
+    for c in [*clocks, *(x for a in anchors for x in (a.before, a.after)),
+              *(x for _, a, b, _ in choices for x in (a, b))]:
+        if c not in names:
+            names.append(c)
+    pos = {c: i for i, c in enumerate(names)}
+    n = len(names)
+    dist = [[0 if i == j else _INF for j in range(n)] for i in range(n)]
+    for a in anchors:
+        i, j = pos[a.before], pos[a.after]
+        dist[i][j] = min(dist[i][j], a.slack_ns)
+    _close(dist)
+    anchors = list(anchors)
+
+    def used(c: str) -> int:
+        return sum(c in (a.before, a.after) for a in anchors)
+
+    if any(dist[i][i] < 0 for i in range(n)):
+        return ClockSkew({c: ClockOffset(c, 0, None, None, used(c)) for c in names}, anchors, False)
+
+    for label, a, b, intervals in choices:
+        i, j = pos[a], pos[b]
+        lo, hi = -dist[j][i], dist[i][j]
+        feasible = [(max(lo, x), min(hi, y)) for x, y in intervals if x <= hi and y >= lo]
+        if not feasible:
+            continue
+        x, y = min(feasible, key=lambda iv: abs(_nearest_zero(*iv)))
+        dist[i][j], dist[j][i] = min(dist[i][j], y), min(dist[j][i], -x)
+        _close(dist)
+        # Record the chosen interval as the two anchors it stands for
+        anchors.append(Anchor(f"{label} (start)", a, b, int(y)))
+        anchors.append(Anchor(f"{label} (end)", b, a, int(-x)))
+
+    bounds = {c: (-dist[pos[c]][0], dist[0][pos[c]]) for c in names}
+    offsets = {}
+    for c in names:
+        k = pos[c]
+        value = int(_nearest_zero(-dist[k][0], dist[0][k]))
+        dist[0][k], dist[k][0] = value, -value
+        _close(dist)
+        lo, hi = bounds[c]
+        offsets[c] = ClockOffset(
+            c, value,
+            None if lo == -_INF else int(lo), None if hi == _INF else int(hi),
+            used(c),
+        )
+    return ClockSkew(offsets, anchors)
+
+
+def estimate(events, polling_cutoff_s: float | None = None) -> ClockSkew:
+    """Solve for per-clock offsets from the causal anchors in an ``EventTable``.
+
+    ``polling_cutoff_s`` is the Substantiate duration above which a test is a
+    polling candidate for the dispatcher-job anchor; without it that anchor
+    is left out.
+    """
+    anchors: list[Anchor] = []
+    choices = []
+    helm = events.first(source=REFERENCE, kind="phase", entity="Helm")
+    last_resume = events.last(source=REFERENCE, kind="resume")
+    for suite in ("kono", "substantiate"):
+        span = events.span(source=suite, kind="test")
+        if span is None:
+            continue
+        if helm is not None:
+            anchors.append(Anchor(
+                f"Helm deploy done before first {suite} test", REFERENCE, suite,
+                span[0] - helm.end_ns,
+            ))
+        if last_resume is not None:
+            anchors.append(Anchor(
+                f"last {suite} test done before final Concord resume", suite, REFERENCE,
+                last_resume.start_ns - span[1],
+            ))
+
+    compute = events.first(source="dispatcher", kind="compute")
+    sub = events.span(source="substantiate", kind="test")
+    if compute is not None and sub is not None:
+        loki = clock("dispatcher")
+        anchors.append(Anchor(
+            "dispatcher job starts after first substantiate test", "substantiate", loki,
+            compute.start_ns - sub[0],
+        ))
+        anchors.append(Anchor(
+            "dispatcher job done before last substantiate test", loki, "substantiate",
+            sub[1] - events.span(source="dispatcher", kind="compute")[1],
+        ))
+        if polling_cutoff_s is not None:
+            cutoff_ns = polling_cutoff_s * 1e9
+            length = compute.end_ns - compute.start_ns
+            start, end = events.start, events.end
+            intervals = [
+                (compute.end_ns - end[i], compute.start_ns - start[i])
+                for i in events.indexes(source="substantiate", kind="test")
+                if end[i] - start[i] > cutoff_ns and end[i] - start[i] >= length
+            ]
+            if intervals:
+                choices.append((
+                    "dispatcher job inside a polling substantiate test", "substantiate", loki,
+                    intervals,
+                ))
+
+    return solve(anchors, choices, sorted({clock(s) for s in events.sources()}))
@@ -1,13 +1,48 @@
-"""Parse Allure v2 JSON test reports (Kono + Substantiate)."""
+"""Parse Allure v2 JSON test reports (Kono + Substantiate).
+
+Suites hold up to hundreds of thousands of tests, so a suite keeps them in
+columns (``TestColumns``) rather than one object per test: times in int64
+arrays, worker, pool and status as codes into a table of interned
+(``sys.intern``) strings. ``suite.tests`` yields ``TestRow`` views with
+``TestInfo``'s attributes. A ``PoolStats`` holds the indexes of its tests
+in the owning suite's columns.
+
+Neither ``suite.tests`` nor ``PoolStats.tests`` (a tuple) is a list of
+``TestInfo``: tests are added with ``TestSuiteResult.add`` (or
+``add_row``), not appended, and each access builds fresh ``TestRow``
+views, so a row is never the same object twice and is not a ``TestInfo``
+instance. Rows compare equal to the ``TestInfo`` with the same fields,
+write through to the columns, and ``row.info()`` gives a detached copy.
+"""
 from __future__ import annotations
 
-import json
+import copy
+import math
 import os
+import sys
+from array import array
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator
 
+from .. import jsonio
 
-@dataclass
+ANALYZER_VERSION = 1
+
+# Timeline phases: a split must beat PHASE_PENALTY times the BIC price of a
+# segment and leave phases of at least MIN_PHASE_FRACTION of the wall-clock
+PHASE_PENALTY = 3.0
+MIN_PHASE_FRACTION = 0.02
+# The first phase is a setup phase if it runs under this share of the
+# concurrency the suite later reaches
+SETUP_CONCURRENCY_RATIO = 0.5
+# Smallest share of tests on either side of the short/long duration split
+MIN_DURATION_CLASS = 0.1
+# Default polling cutoff (``polling_analysis``)
+POLLING_CUTOFF_S = 16.0
+
+
+@dataclass(slots=True)
 class TestInfo:
     name: str
     uid: str
@@ -21,26 +56,215 @@ class TestInfo:
     retries: int = 0
 
 
-@dataclass
+FIELDS = tuple(TestInfo.__dataclass_fields__)
+TEXT_COLUMNS = ("status", "worker", "pool")  # coded into ``TestColumns.strings``
+
+
+class _Column:
+    """``TestRow`` attribute reading and writing one column."""
+
+    __slots__ = ("column",)
+
+    def __init__(self, column: str):
+        self.column = column
+
+    def __get__(self, row, owner=None):
+        if row is None:
+            return self
+        return getattr(row._cols, self.column)[row._i]
+
+    def __set__(self, row, value) -> None:
+        getattr(row._cols, self.column)[row._i] = value
+
+
+class _TextColumn(_Column):
+    __slots__ = ()
+
+    def __get__(self, row, owner=None):
+        if row is None:
+            return self
+        cols = row._cols
+        return cols.strings[getattr(cols, self.column)[row._i]]
+
+    def __set__(self, row, value: str) -> None:
+        cols = row._cols
+        getattr(cols, self.column)[row._i] = cols.code(value)
+
+
+class _FlagColumn(_Column):
+    __slots__ = ()
+
+    def __get__(self, row, owner=None):
+        if row is None:
+            return self
+        return bool(row._cols.flaky[row._i])
+
+
+class TestRow:
+    """Test ``i`` of a ``TestColumns``: ``TestInfo``'s attributes, read and written in place."""
+
+    __slots__ = ("_cols", "_i")
+    __test__ = False  # not a pytest test class, despite the name
+
+    name = _Column("name")
+    uid = _Column("uid")
+    status = _TextColumn("status")
+    start = _Column("start")
+    stop = _Column("stop")
+    duration = _Column("duration")
+    worker = _TextColumn("worker")
+    pool = _TextColumn("pool")
+    flaky = _FlagColumn("flaky")
+    retries = _Column("retries")
+
+    def __init__(self, cols: TestColumns, i: int):
+        self._cols = cols
+        self._i = i
+
+    def info(self) -> TestInfo:
+        """A detached copy."""
+        return TestInfo(*(getattr(self, f) for f in FIELDS))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (TestRow, TestInfo)):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.info())
+
+
+class TestColumns:
+    """A suite's tests, stored column by column.
+
+    Times are int64 arrays and worker, pool and status are codes into one
+    table of interned ``strings``, so a test costs about 60 bytes besides its
+    unique name and uid. Indexing and iteration yield ``TestRow`` views;
+    ``TestSuiteResult.add`` is the way in.
+    """
+
+    __slots__ = (
+        "name", "uid", "status", "start", "stop", "duration", "worker", "pool", "flaky",
+        "retries", "strings", "_codes",
+    )
+    __test__ = False
+
+    # Array typecode per column; name and uid are lists of strings
+    TYPECODES = {
+        "status": "I", "start": "q", "stop": "q", "duration": "q", "worker": "I", "pool": "I",
+        "flaky": "B", "retries": "I",
+    }
+
+    def __init__(self) -> None:
+        self.name: list[str] = []
+        self.uid: list[str] = []
+        for column, typecode in self.TYPECODES.items():
+            setattr(self, column, array(typecode))
+        self.strings: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    @classmethod
+    def of(cls, strings, **columns) -> TestColumns:
+        """Columns as given (``FIELDS``, text ones coded into ``strings``)."""
+        cols = cls()
+        cols.strings = [sys.intern(t) for t in strings]
+        cols._codes = {t: i for i, t in enumerate(cols.strings)}
+        cols.name.extend(columns["name"])
+        cols.uid.extend(columns["uid"])
+        for column, typecode in cls.TYPECODES.items():
+            values = columns[column]
+            getattr(cols, column).extend(
+                values if isinstance(values, array) else array(typecode, values)
+            )
+        return cols
+
+    def code(self, text: str) -> int:
+        code = self._codes.get(text)
+        if code is None:
+            code = self._codes[text] = len(self.strings)
+            self.strings.append(sys.intern(text))
+        return code
+
+    def text(self, column: str) -> list[str]:
+        """A text column decoded."""
+        strings = self.strings
+        return [strings[c] for c in getattr(self, column)]
+
+    def count(self, column: str, text: str) -> int:
+        """How many tests have ``text`` in a text column."""
+        code = self._codes.get(text)
+        return 0 if code is None else getattr(self, column).count(code)
+
+    def _append(self, name, uid, status, start, stop, duration, worker, pool, flaky, retries):
+        self.name.append(name)
+        self.uid.append(uid)
+        self.status.append(self.code(status))
+        self.start.append(start)
+        self.stop.append(stop)
+        self.duration.append(duration)
+        self.worker.append(self.code(worker))
+        self.pool.append(self.code(pool))
+        self.flaky.append(bool(flaky))
+        self.retries.append(retries)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def __getitem__(self, i):
+        n = len(self.start)
+        if isinstance(i, slice):
+            return [TestRow(self, j) for j in range(*i.indices(n))]
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("test index out of range")
+        return TestRow(self, i)
+
+    def __iter__(self) -> Iterator[TestRow]:
+        for i in range(len(self.start)):
+            yield TestRow(self, i)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TestColumns):
+            return NotImplemented
+        return all(
+            (self.text(c) == other.text(c)) if c in TEXT_COLUMNS
+            else getattr(self, c) == getattr(other, c)
+            for c in FIELDS
+        )
+
+    def __repr__(self) -> str:
+        return f"TestColumns({len(self)} tests)"
+
+
+@dataclass(slots=True)
 class PoolStats:
     name: str
-    tests: list[TestInfo] = field(default_factory=list)
+    suite_tests: TestColumns = field(default_factory=TestColumns, repr=False, compare=False)
+    indexes: array = field(default_factory=lambda: array("I"))
+
+    @property
+    def tests(self) -> tuple[TestRow, ...]:
+        """This pool's tests, in suite order (read-only: ``TestSuiteResult.add`` adds tests)."""
+        cols = self.suite_tests
+        return tuple(TestRow(cols, i) for i in self.indexes)
 
     @property
     def count(self) -> int:
-        return len(self.tests)
+        return len(self.indexes)
 
     @property
     def wall_clock_s(self) -> float:
-        if not self.tests:
+        if not self.indexes:
             return 0.0
-        start = min(t.start for t in self.tests)
-        stop = max(t.stop for t in self.tests)
-        return (stop - start) / 1000.0
+        return (self.stop_ms - self.start_ms) / 1000.0
 
     @property
     def aggregate_s(self) -> float:
-        return sum(t.duration for t in self.tests) / 1000.0
+        duration = self.suite_tests.duration
+        return sum(duration[i] for i in self.indexes) / 1000.0
 
     @property
     def parallelism(self) -> float:
@@ -51,25 +275,33 @@ class PoolStats:
 
     @property
     def start_ms(self) -> int:
-        return min(t.start for t in self.tests) if self.tests else 0
+        start = self.suite_tests.start
+        return min(start[i] for i in self.indexes) if self.indexes else 0
 
     @property
     def stop_ms(self) -> int:
-        return max(t.stop for t in self.tests) if self.tests else 0
+        stop = self.suite_tests.stop
+        return max(stop[i] for i in self.indexes) if self.indexes else 0
 
     def worker_stats(self) -> dict[str, dict]:
-        workers: dict[str, list[TestInfo]] = {}
-        for t in self.tests:
-            workers.setdefault(t.worker, []).append(t)
+        cols = self.suite_tests
+        start, stop, duration, worker = cols.start, cols.stop, cols.duration, cols.worker
+        spans: dict[int, list[int]] = {}  # worker code -> [tests, start, stop, aggregate]
+        for i in self.indexes:
+            span = spans.get(worker[i])
+            if span is None:
+                spans[worker[i]] = [1, start[i], stop[i], duration[i]]
+            else:
+                span[0] += 1
+                span[1] = min(span[1], start[i])
+                span[2] = max(span[2], stop[i])
+                span[3] += duration[i]
         result = {}
-        for w, tests in workers.items():
-            start = min(t.start for t in tests)
-            stop = max(t.stop for t in tests)
-            agg = sum(t.duration for t in tests)
-            wall = stop - start
+        for code, (tests, first, last, agg) in spans.items():
+            wall = last - first
             idle = wall - agg if wall > agg else 0
-            result[w] = {
-                "tests": len(tests),
+            result[cols.strings[code]] = {
+                "tests": tests,
                 "wall_ms": wall,
                 "aggregate_ms": agg,
                 "idle_ms": idle,
@@ -81,8 +313,50 @@ class PoolStats:
 @dataclass
 class TestSuiteResult:
     name: str
-    tests: list[TestInfo] = field(default_factory=list)
+    tests: TestColumns = field(default_factory=TestColumns)
     pools: dict[str, PoolStats] = field(default_factory=dict)
+    # ``setup_phase_analysis()`` without a threshold; reset by ``add_row``
+    _setup: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.tests, TestColumns):  # a sequence of TestInfo records
+            records, self.tests = self.tests, TestColumns()
+            for t in records:
+                self.add(t)
+
+    @classmethod
+    def from_columns(cls, name: str, tests: TestColumns, pool_order=()) -> TestSuiteResult:
+        """A suite over ready-made columns; pools are indexed, in ``pool_order`` first."""
+        result = cls(name=name, tests=tests)
+        result.pools = {p: PoolStats(p, tests) for p in pool_order}
+        strings = tests.strings
+        by_code: dict[int, PoolStats] = {}
+        for i, code in enumerate(tests.pool):
+            pool = by_code.get(code)
+            if pool is None:
+                pool_name = strings[code]
+                pool = result.pools.get(pool_name)
+                if pool is None:
+                    pool = result.pools[pool_name] = PoolStats(pool_name, tests)
+                by_code[code] = pool
+            pool.indexes.append(i)
+        return result
+
+    def add(self, test: TestInfo | TestRow) -> None:
+        """Append ``test`` and index it under its pool."""
+        self.add_row(*(getattr(test, f) for f in FIELDS))
+
+    def add_row(
+        self, name: str, uid: str, status: str, start: int, stop: int, duration: int,
+        worker: str, pool: str = "", flaky: bool = False, retries: int = 0,
+    ) -> None:
+        """``add`` without building a ``TestInfo`` first."""
+        stats = self.pools.get(pool)
+        if stats is None:
+            stats = self.pools[pool] = PoolStats(pool, self.tests)
+        stats.indexes.append(len(self.tests))
+        self._setup = None
+        self.tests._append(name, uid, status, start, stop, duration, worker, pool, flaky, retries)
 
     @property
     def total_tests(self) -> int:
@@ -92,13 +366,13 @@ class TestSuiteResult:
     def start_epoch_s(self) -> float:
         if not self.tests:
             return 0.0
-        return min(t.start for t in self.tests) / 1000.0
+        return min(self.tests.start) / 1000.0
 
     @property
     def end_epoch_s(self) -> float:
         if not self.tests:
             return 0.0
-        return max(t.stop for t in self.tests) / 1000.0
+        return max(self.tests.stop) / 1000.0
 
     @property
     def wall_clock_s(self) -> float:
@@ -108,27 +382,30 @@ class TestSuiteResult:
 
     @property
     def aggregate_s(self) -> float:
-        return sum(t.duration for t in self.tests) / 1000.0
+        return sum(self.tests.duration) / 1000.0
 
     @property
     def pass_count(self) -> int:
-        return sum(1 for t in self.tests if t.status == "passed")
+        return self.tests.count("status", "passed")
 
     @property
     def fail_count(self) -> int:
-        return sum(1 for t in self.tests if t.status == "failed")
+        return self.tests.count("status", "failed")
 
     @property
     def skip_count(self) -> int:
-        return sum(1 for t in self.tests if t.status == "skipped")
+        return self.tests.count("status", "skipped")
 
     @property
-    def flaky_tests(self) -> list[TestInfo]:
-        return [t for t in self.tests if t.flaky]
+    def flaky_tests(self) -> list[TestRow]:
+        tests = self.tests
+        return [TestRow(tests, i) for i, flaky in enumerate(tests.flaky) if flaky]
 
     @property
-    def failed_tests(self) -> list[TestInfo]:
-        return [t for t in self.tests if t.status == "failed"]
+    def failed_tests(self) -> list[TestRow]:
+        tests = self.tests
+        code = tests._codes.get("failed")
+        return [TestRow(tests, i) for i, c in enumerate(tests.status) if c == code]
 
     @property
     def sequential_pool_waste_s(self) -> float:
@@ -148,20 +425,90 @@ class TestSuiteResult:
             waste += curr.wall_clock_s
         return waste
 
-    def setup_phase_analysis(self, threshold_s: float = 340.0) -> dict:
-        """Analyze the setup phase (first threshold_s seconds)."""
+    def timeline_phases(
+        self, penalty: float = PHASE_PENALTY, min_fraction: float = MIN_PHASE_FRACTION,
+    ) -> list[dict]:
+        """Phases of the suite's timeline, found by change-point detection.
+
+        The timeline is cut at every test start and stop. Within a phase the
+        number of running tests (Gaussian cost) and the rate at which tests
+        start (Poisson cost) are taken as constant, and both are segmented
+        jointly by binary segmentation. Phase bounds are seconds from the
+        first test start.
+        """
+        from ..changepoint import (
+            NormalMeanCost, PoissonRateCost, bic_penalty, binary_segmentation, sum_costs,
+        )
+
+        if not self.tests:
+            return []
+        steps: dict[int, list[int]] = {}  # ms -> [change in running tests, starts]
+        for start, stop in zip(self.tests.start, self.tests.stop):
+            step = steps.setdefault(start, [0, 0])
+            step[0] += 1
+            step[1] += 1
+            steps.setdefault(stop, [0, 0])[0] -= 1
+        times = sorted(steps)
+        n = len(times) - 1
+        t0 = times[0]
+        if n < 1:
+            return [{"start_s": 0.0, "end_s": 0.0, "tests": len(self.tests),
+                     "concurrency": float(len(self.tests)), "starts_per_min": 0.0}]
+
+        # Interval lengths in units of the mean interval, so the costs do not
+        # depend on the suite's time scale
+        unit = (times[-1] - t0) / n
+        running, weights, starts = [], [], []
+        level = 0
+        for k in range(n):
+            level += steps[times[k]][0]
+            running.append(level)
+            weights.append((times[k + 1] - times[k]) / unit)
+            starts.append(steps[times[k]][1])
+        concurrency = NormalMeanCost(running, weights)
+        arrivals = PoissonRateCost(starts, weights)
+        min_ms = min_fraction * (times[-1] - t0)
+        bounds = binary_segmentation(
+            sum_costs(concurrency, arrivals), n, bic_penalty(n, 3, penalty),
+            lambda i, k, j: times[k] - times[i] >= min_ms and times[j] - times[k] >= min_ms,
+        )
+        cuts = [0] + bounds + [n]
+        phases = []
+        for a, b in zip(cuts, cuts[1:]):
+            started = sum(starts[a:b]) + (steps[times[n]][1] if b == n else 0)
+            phases.append({
+                "start_s": (times[a] - t0) / 1000,
+                "end_s": (times[b] - t0) / 1000,
+                "tests": started,
+                "concurrency": concurrency.mean(a, b),
+                "starts_per_min": started / ((times[b] - times[a]) / 60000) if times[b] > times[a] else 0.0,
+            })
+        return phases
+
+    def setup_phase_analysis(self, threshold_s: float | None = None) -> dict:
+        """Analyze the setup phase (the first ``threshold_s`` seconds).
+
+        Without a threshold the setup phase is the first of ``timeline_phases``,
+        provided it runs well below the concurrency the suite reaches later;
+        otherwise the suite has no setup phase and the result is empty. That
+        detection is the costly part, so its result is kept until the next
+        ``add``; each call returns a copy.
+        """
         if not self.tests:
             return {}
-        all_start = min(t.start for t in self.tests)
-        cutoff = all_start + threshold_s * 1000
-        setup_tests = [t for t in self.tests if t.start < cutoff]
-        main_tests = [t for t in self.tests if t.start >= cutoff]
-        all_workers = set(t.worker for t in self.tests)
-        setup_workers = set(t.worker for t in setup_tests)
-        idle_workers = all_workers - setup_workers
+        if threshold_s is None:
+            if self._setup is None:
+                self._setup = self._detected_setup()
+            return copy.deepcopy(self._setup)
+        tests = self.tests
+        cutoff = min(tests.start) + threshold_s * 1000
+        setup_tests = sum(1 for start in tests.start if start < cutoff)
+        all_workers = set(tests.worker)
+        setup_workers = {w for start, w in zip(tests.start, tests.worker) if start < cutoff}
+        idle_workers = {tests.strings[w] for w in all_workers - setup_workers}
         return {
-            "setup_tests": len(setup_tests),
-            "main_tests": len(main_tests),
+            "setup_tests": setup_tests,
+            "main_tests": len(tests) - setup_tests,
             "setup_duration_s": threshold_s,
             "all_workers": len(all_workers),
             "setup_workers": len(setup_workers),
@@ -169,24 +516,72 @@ class TestSuiteResult:
             "idle_worker_names": sorted(idle_workers),
         }
 
-    def polling_analysis(self) -> dict:
+    def _detected_setup(self) -> dict:
+        phases = self.timeline_phases()
+        if len(phases) < 2 or phases[0]["concurrency"] >= SETUP_CONCURRENCY_RATIO * max(
+            p["concurrency"] for p in phases[1:]
+        ):
+            return {}
+        return self.setup_phase_analysis(phases[1]["start_s"])
+
+    def duration_cutoff_s(self) -> float | None:
+        """Where test durations split into a short and a long population.
+
+        The single change point of the sorted log-durations (tests under a
+        second, i.e. skipped or trivial ones, are left out), kept only if
+        two normal populations split there fit the log-durations better than
+        one by more than the BIC price (``changepoint.two_normal_gain``).
+        ``None`` when the suite is one population or has too few tests.
+        """
+        from collections import Counter
+
+        from ..changepoint import NormalMeanCost, bic_penalty, binary_segmentation, two_normal_gain
+
+        durations = sorted(d for d in self.tests.duration if d >= 1000)
+        smallest = max(1, int(len(durations) * MIN_DURATION_CLASS))
+        if len(durations) < 2 * smallest:
+            return None
+        logs = [math.log(d) for d in durations]
+        split = binary_segmentation(
+            NormalMeanCost(logs, [1.0] * len(logs)), len(logs), 0.0,
+            lambda i, k, j: k - i >= smallest and j - k >= smallest, max_changes=1,
+        )
+        if not split:
+            return None
+        k = split[0]
+        # Fit the mixture on log-durations rounded to 1%, which bounds its cost
+        bins = sorted(Counter(round(x, 2) for x in logs).items())
+        gain = two_normal_gain(
+            [x for x, _ in bins], [float(n) for _, n in bins], (logs[k - 1] + logs[k]) / 2,
+        )
+        if gain <= bic_penalty(len(logs), 3):
+            return None
+        return (durations[k - 1] + durations[k]) / 2000
+
+    def polling_cutoff_s(self) -> float:
+        """``duration_cutoff_s``, or ``POLLING_CUTOFF_S`` without a separate long population."""
+        return self.duration_cutoff_s() or POLLING_CUTOFF_S
+
+    def polling_analysis(self, threshold_s: float = POLLING_CUTOFF_S) -> dict:
         """Analyze polling overhead from test durations.
 
-        Tests with duration > 16s are likely dominated by polling/waiting for
-        backend compute at 20s intervals. This threshold empirically separates
-        interactive UI tests from compute-wait tests.
+        Tests longer than ``threshold_s`` are likely dominated by polling/waiting
+        for backend compute. The default separates interactive UI tests from
+        compute-wait tests on the reference runs; ``polling_cutoff_s`` gives a
+        cutoff detected from the suite itself, or that default.
         """
         if not self.tests:
             return {}
-        aggregate_ms = sum(t.duration for t in self.tests)
-        # Tests > 16s are likely polling-dominated (waiting for backend compute)
-        polling_tests = [t for t in self.tests if t.duration > 16000]
-        polling_aggregate = sum(t.duration for t in polling_tests)
+        aggregate_ms = sum(self.tests.duration)
+        # Tests over the cutoff are likely polling-dominated (waiting for backend compute)
+        polling_tests = [d for d in self.tests.duration if d > threshold_s * 1000]
+        polling_aggregate = sum(polling_tests)
         polling_pct = (polling_aggregate / aggregate_ms * 100) if aggregate_ms > 0 else 0
         return {
             "aggregate_min": aggregate_ms / 60000,
             "polling_test_count": len(polling_tests),
             "polling_pct": polling_pct,
+            "cutoff_s": threshold_s,
         }
 
 
@@ -203,8 +598,7 @@ def _extract_pool(worker_name: str) -> str:
 
 def analyze_timeline(timeline_path: str, suite_name: str) -> TestSuiteResult:
     """Analyze an Allure timeline.json file."""
-    with open(timeline_path) as f:
-        data = json.load(f)
+    data = jsonio.load(timeline_path)
 
     result = TestSuiteResult(name=suite_name)
 
@@ -215,39 +609,45 @@ def analyze_timeline(timeline_path: str, suite_name: str) -> TestSuiteResult:
 
             for test in worker.get("children", []):
                 t = test["time"]
-                info = TestInfo(
-                    name=test["name"],
-                    uid=test.get("uid", ""),
-                    status=test.get("status", "unknown"),
-                    start=t["start"],
-                    stop=t["stop"],
-                    duration=t["duration"],
-                    worker=worker_name,
-                    pool=pool,
-                    flaky=test.get("flaky", False),
-                    retries=test.get("retriesCount", 0),
+                result.add_row(
+                    test["name"], test.get("uid", ""), test.get("status", "unknown"),
+                    t["start"], t["stop"], t["duration"], worker_name, pool,
+                    test.get("flaky", False), test.get("retriesCount", 0),
                 )
-                result.tests.append(info)
-
-                if pool not in result.pools:
-                    result.pools[pool] = PoolStats(name=pool)
-                result.pools[pool].tests.append(info)
 
     return result
 
 
+def emit_events(result: TestSuiteResult, table) -> None:
+    """Emit one span per test (source = lowercased suite name) into an ``events.EventTable``."""
+    from ..events import ns_from_ms
+
+    tests = result.tests
+    table.extend(
+        result.name.lower(), "test",
+        tests.name,
+        [ns_from_ms(ms) for ms in tests.start],
+        [ns_from_ms(ms) for ms in tests.stop],
+        [
+            {"uid": uid, "worker": worker, "pool": pool, "status": status}
+            for uid, worker, pool, status in zip(
+                tests.uid, tests.text("worker"), tests.text("pool"), tests.text("status"),
+            )
+        ],
+    )
+
+
 def analyze_test_cases(test_cases_dir: str) -> list[dict]:
     """Load individual test case JSONs for detailed analysis."""
     cases = []
     p = Path(test_cases_dir)
     if not p.exists():
         return cases
-    for f in sorted(p.glob("*.json")):
-        with open(f) as fh:
-            data = json.load(fh)
+    for _, data in jsonio.iter_load(sorted(p.glob("*.json"))):
         labels = {l["name"]: l["value"] for l in data.get("labels", [])}
         cases.append({
             "uid": data.get("uid"),
+            "historyId": data.get("historyId"),
             "name": data.get("name"),
             "status": data.get("status"),
             "time": data.get("time"),
@@ -258,3 +658,24 @@ def analyze_test_cases(test_cases_dir: str) -> list[dict]:
             "suite": labels.get("suite", ""),
         })
     return cases
+
+
+def history_ids(test_cases_dir: str) -> dict[str, str]:
+    """uid -> Allure historyId from a test-cases directory.
+
+    Unlike uids, historyIds are stable across runs of the same test.
+    """
+    return {
+        c["uid"]: c["historyId"]
+        for c in analyze_test_cases(test_cases_dir)
+        if c.get("uid") and c.get("historyId")
+    }
+
+
+def packages(test_cases_dir: str) -> dict[str, str]:
+    """uid -> Allure ``package`` label from a test-cases directory."""
+    return {
+        c["uid"]: c["package"]
+        for c in analyze_test_cases(test_cases_dir)
+        if c.get("uid") and c.get("package")
+    }
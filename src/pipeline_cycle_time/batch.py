@@ -0,0 +1,253 @@
+"""Fleet batch mode: analyze many run directories and roll them up.
+
+Each run directory (laid out like ``fixtures/2026-02-24-aep``) is analyzed in
+its own worker process. Per-run output goes to ``<output>/<run>/``:
+``ANALYSIS-REPORT.md`` plus a small ``summary.json``. The summary is written
+last and atomically, so it doubles as the completion marker: re-running the
+batch skips any run that already has one, which makes interrupted batches
+resumable. The rollup (``AGGREGATE-REPORT.md`` / ``aggregate.json``) is
+always rebuilt from every summary on disk.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .stats import distribution
+
+SUMMARY_FILE = "summary.json"
+REPORT_FILE = "ANALYSIS-REPORT.md"
+CONCORD_LOG = Path("logs") / "concord-log.txt"
+
+
+@dataclass
+class BatchResult:
+    analyzed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    aggregate: dict = field(default_factory=dict)
+
+
+def discover_runs(root: str) -> list[Path]:
+    """Find run directories (anything with ``logs/concord-log.txt``) under root."""
+    base = Path(root)
+    if (base / CONCORD_LOG).is_file():
+        return [base]
+    return sorted(p.parent.parent for p in base.rglob(str(CONCORD_LOG)))
+
+
+def run_key(run_dir: Path, root: Path) -> str:
+    """A run's name, unique under ``root``: its relative path with ``__`` separators."""
+    try:
+        rel = run_dir.relative_to(root)
+    except ValueError:
+        rel = Path(run_dir.name)
+    if rel == Path("."):
+        return run_dir.resolve().name
+    return str(rel).replace(os.sep, "__")
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def summarize(analysis) -> dict:
+    """Reduce a ``RunAnalysis`` to the numbers the cross-run rollup needs."""
+    orch = analysis.orchestration
+    kono, sub = analysis.kono, analysis.substantiate
+    return {
+        "run_dir": str(analysis.run_dir),
+        "start_epoch_s": orch.total_start.timestamp() if orch.total_start else 0.0,
+        "concord_s": orch.total_duration_s,
+        "end_to_end_s": analysis.end_to_end_s,
+        "phases": {p.name: p.duration_s for p in orch.phases},
+        "resume_overheads_s": [r.total_s for r in orch.resume_overheads],
+        "critical_resume_overhead_s": orch.critical_path_resume_overhead_s,
+        "suites": {
+            s.name: {
+                "tests": s.total_tests,
+                "failed": s.fail_count,
+                "wall_clock_s": s.wall_clock_s,
+                "pools": {p.name: p.wall_clock_s for p in s.pools.values()},
+            }
+            for s in (kono, sub)
+        },
+        "findings": [
+            {"rank": f.rank, "title": f.title, "priority": f.priority,
+             "estimated_savings_s": f.estimated_savings_s}
+            for f in analysis.correlation.findings
+        ],
+    }
+
+
+def analyze_run(run_dir: str, out_dir: str, cache_dir: str | None = None) -> dict:
+    """Worker entry point: analyze one run, write its report and summary."""
+    from . import pipeline
+
+    cache = None
+    if cache_dir:
+        from .cache import AnalysisCache
+        cache = AnalysisCache(cache_dir)
+    analysis = pipeline.run(run_dir, cache=cache)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    _write_atomic(out / REPORT_FILE, analysis.generate_report())
+    summary = summarize(analysis)
+    _write_atomic(out / SUMMARY_FILE, json.dumps(summary, indent=2, sort_keys=True))
+    return summary
+
+
+def _limit_worker_memory(max_mb: int | None) -> None:
+    if not max_mb:
+        return
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return
+    limit = max_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def aggregate(summaries: list[dict]) -> dict:
+    """Cross-run rollup: phase/suite distributions and finding recurrence."""
+    phases: dict[str, list[float]] = {}
+    suites: dict[str, list[float]] = {}
+    pools: dict[str, list[float]] = {}
+    recurrence: Counter[str] = Counter()
+    for s in summaries:
+        for name, dur in s["phases"].items():
+            phases.setdefault(name, []).append(dur)
+        for name, suite in s["suites"].items():
+            suites.setdefault(name, []).append(suite["wall_clock_s"])
+            for pool, wc in suite["pools"].items():
+                pools.setdefault(f"{name}/{pool}", []).append(wc)
+        # Count each finding once per run, however many times it appears
+        recurrence.update({f["title"] for f in s["findings"]})
+    n = len(summaries)
+    return {
+        "runs": n,
+        "end_to_end_s": distribution([s["end_to_end_s"] for s in summaries]),
+        "concord_s": distribution([s["concord_s"] for s in summaries]),
+        "critical_resume_overhead_s": distribution(
+            [s["critical_resume_overhead_s"] for s in summaries]
+        ),
+        "phases": {k: distribution(v) for k, v in sorted(phases.items())},
+        "suites": {k: distribution(v) for k, v in sorted(suites.items())},
+        "pools": {k: distribution(v) for k, v in sorted(pools.items())},
+        "finding_recurrence": [
+            {"title": title, "runs": count, "pct": count / n * 100 if n else 0.0}
+            for title, count in sorted(recurrence.items(), key=lambda kv: (-kv[1], kv[0]))
+        ],
+    }
+
+
+def _dist_row(label: str, d: dict) -> str:
+    if not d.get("count"):
+        return f"| {label} | 0 | - | - | - | - | - |"
+    return (
+        f"| {label} | {d['count']} | {d['min']:.1f}s | {d['p50']:.1f}s | "
+        f"{d['p90']:.1f}s | {d['max']:.1f}s | {d['mean']:.1f}s |"
+    )
+
+
+def render_aggregate(agg: dict) -> str:
+    lines: list[str] = []
+    lines.append("# CI Pipeline Fleet Analysis")
+    lines.append("")
+    lines.append(f"**Runs analyzed:** {agg['runs']}")
+    lines.append("")
+    header = ["| Series | Runs | Min | p50 | p90 | Max | Mean |", "|---|---|---|---|---|---|---|"]
+
+    lines.append("## End-to-End")
+    lines.append("")
+    lines.extend(header)
+    lines.append(_dist_row("End-to-end", agg["end_to_end_s"]))
+    lines.append(_dist_row("Concord", agg["concord_s"]))
+    lines.append(_dist_row("Critical-path resume overhead", agg["critical_resume_overhead_s"]))
+    lines.append("")
+
+    lines.append("## Concord Phases")
+    lines.append("")
+    lines.extend(header)
+    for name, d in agg["phases"].items():
+        lines.append(_dist_row(name, d))
+    lines.append("")
+
+    lines.append("## Test Suites and Pools")
+    lines.append("")
+    lines.extend(header)
+    for name, d in agg["suites"].items():
+        lines.append(_dist_row(name, d))
+    for name, d in agg["pools"].items():
+        lines.append(_dist_row(name, d))
+    lines.append("")
+
+    lines.append("## Finding Recurrence")
+    lines.append("")
+    lines.append("| Finding | Runs | % of Runs |")
+    lines.append("|---|---|---|")
+    for f in agg["finding_recurrence"]:
+        lines.append(f"| {f['title']} | {f['runs']} | {f['pct']:.0f}% |")
+    return "\n".join(lines) + "\n"
+
+
+def run_batch(
+    runs_root: str,
+    output_dir: str,
+    jobs: int = 1,
+    max_tasks_per_worker: int = 8,
+    max_worker_memory_mb: int | None = None,
+    force: bool = False,
+    cache_dir: str | None = None,
+) -> BatchResult:
+    """Analyze every run under ``runs_root`` into ``output_dir``."""
+    root = Path(runs_root)
+    out_root = Path(output_dir)
+    out_root.mkdir(parents=True, exist_ok=True)
+    result = BatchResult()
+
+    todo: list[tuple[str, Path]] = []
+    for run_dir in discover_runs(runs_root):
+        key = run_key(run_dir, root)
+        if not force and (out_root / key / SUMMARY_FILE).is_file():
+            result.skipped.append(key)
+        else:
+            todo.append((key, run_dir))
+
+    if todo:
+        # Recycling workers caps how much heap a long batch can accumulate
+        with ProcessPoolExecutor(
+            max_workers=max(1, jobs),
+            max_tasks_per_child=max_tasks_per_worker,
+            initializer=_limit_worker_memory,
+            initargs=(max_worker_memory_mb,),
+        ) as pool:
+            futures = {
+                pool.submit(analyze_run, str(run_dir), str(out_root / key), cache_dir): key
+                for key, run_dir in todo
+            }
+            for fut in as_completed(futures):
+                key = futures[fut]
+                try:
+                    fut.result()
+                except Exception as e:  # one bad run must not sink the batch
+                    result.failed[key] = f"{type(e).__name__}: {e}"
+                    print(f"[batch] {key}: FAILED ({e})", file=sys.stderr)
+                else:
+                    result.analyzed.append(key)
+                    print(f"[batch] {key}: done", file=sys.stderr)
+
+    summaries = []
+    for path in sorted(out_root.glob(f"*/{SUMMARY_FILE}")):
+        summaries.append(json.loads(path.read_text()))
+    result.aggregate = aggregate(summaries)
+    _write_atomic(out_root / "aggregate.json", json.dumps(result.aggregate, indent=2))
+    _write_atomic(out_root / "AGGREGATE-REPORT.md", render_aggregate(result.aggregate))
+    return result
@@ -0,0 +1,276 @@
+"""Benchmark harness with per-stage throughput and regression gates.
+
+Times every analyzer stage, ``correlate`` and ``generate`` on real fixture
+directories and on scaled synthetic runs, recording best-of-N wall time,
+peak traced memory (a separate ``tracemalloc`` pass, so it doesn't skew
+timings) and throughput in the stage's natural unit (lines/s, tests/s) as
+well as MB/s of input. JSON decoding is also timed on its own, per input
+type and per available ``jsonio`` backend, over bytes already in memory so
+the numbers isolate the decoder. Results are a JSON document that can be stored as a
+baseline; ``compare`` flags stages that got slower or hungrier than the
+baseline beyond a tolerance.
+"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+RESULT_VERSION = 1
+
+
+@dataclass
+class StageResult:
+    seconds: float
+    median_seconds: float
+    peak_bytes: int
+    input_bytes: int
+    records: int
+    unit: str
+
+    @property
+    def records_per_s(self) -> float:
+        return self.records / self.seconds if self.seconds else 0.0
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.input_bytes / 1e6 / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        d["records_per_s"] = self.records_per_s
+        d["mb_per_s"] = self.mb_per_s
+        return d
+
+
+@dataclass
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return (f"{self.key}: {self.metric} {self.baseline:.4g} -> {self.current:.4g} "
+                f"({(self.ratio - 1) * 100:+.0f}%)")
+
+
+def _size(path: Path) -> int:
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size if path.exists() else 0
+
+
+def _count_lines(path: Path) -> int:
+    with open(path, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def _count_loki_values(path: Path) -> int:
+    from . import jsonio
+
+    data = jsonio.load(path)
+    return sum(len(s.get("values", [])) for s in data.get("data", {}).get("result", []))
+
+
+def _measure(fn: Callable[[], object], repeat: int) -> tuple[float, float, int]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(times), statistics.median(times), peak
+
+
+def bench_run(run_dir: str, repeat: int = 3) -> dict[str, StageResult]:
+    """Benchmark every stage on one run directory."""
+    from .analyzers import app_logs, correlator, metrics, orchestration, skew, test_reports
+    from .events import from_analysis
+    from .report import generator
+
+    d = Path(run_dir)
+    concord = d / "logs" / "concord-log.txt"
+    kono_tl = d / "kono-report" / "data" / "timeline.json"
+    sub_tl = d / "substantiate-report" / "data" / "timeline.json"
+    sub_cases = d / "substantiate-report" / "data" / "test-cases"
+    webapp = d / "logs" / "webapp-logs.json"
+    dispatcher_log = d / "logs" / "dispatcher-logs.json"
+    metrics_dir = d / "metrics"
+
+    # Inputs for the downstream stages (correlate/generate)
+    orch = orchestration.analyze(str(concord))
+    kono = test_reports.analyze_timeline(str(kono_tl), "Kono")
+    sub = test_reports.analyze_timeline(str(sub_tl), "Substantiate")
+    app = app_logs.analyze_webapp_logs(str(webapp))
+    disp = app_logs.analyze_dispatcher_logs(str(dispatcher_log))
+    met = metrics.analyze(str(metrics_dir))
+    corr = correlator.correlate(orch, kono, sub, app, disp, met)
+    events = from_analysis(orch, kono, sub, app, disp, met)
+    cutoff_s = sub.polling_cutoff_s()
+    all_tests = kono.total_tests + sub.total_tests
+    all_input = sum(_size(p) for p in (concord, kono_tl, sub_tl, webapp, dispatcher_log, metrics_dir))
+
+    stages: list[tuple[str, Callable[[], object], int, int, str]] = [
+        ("orchestration.analyze", lambda: orchestration.analyze(str(concord)),
+         _size(concord), _count_lines(concord), "lines"),
+        ("analyze_timeline.kono", lambda: test_reports.analyze_timeline(str(kono_tl), "Kono"),
+         _size(kono_tl), kono.total_tests, "tests"),
+        ("analyze_timeline.substantiate",
+         lambda: test_reports.analyze_timeline(str(sub_tl), "Substantiate"),
+         _size(sub_tl), sub.total_tests, "tests"),
+        ("analyze_test_cases", lambda: test_reports.analyze_test_cases(str(sub_cases)),
+         _size(sub_cases), len(list(sub_cases.glob("*.json"))) if sub_cases.exists() else 0,
+         "tests"),
+        ("analyze_webapp_logs", lambda: app_logs.analyze_webapp_logs(str(webapp)),
+         _size(webapp), _count_loki_values(webapp), "lines"),
+        ("analyze_dispatcher_logs", lambda: app_logs.analyze_dispatcher_logs(str(dispatcher_log)),
+         _size(dispatcher_log), _count_loki_values(dispatcher_log), "lines"),
+        ("metrics.analyze", lambda: metrics.analyze(str(metrics_dir)),
+         _size(metrics_dir), len(list(metrics_dir.glob("*.json"))), "series"),
+        ("skew.estimate", lambda: skew.estimate(events, cutoff_s), all_input, len(events), "events"),
+        ("correlate", lambda: correlator.correlate(orch, kono, sub, app, disp, met),
+         all_input, all_tests, "tests"),
+        ("generate",
+         lambda: generator.generate(orch, kono, sub, app, disp, met, corr, report_date="bench"),
+         all_input, all_tests, "tests"),
+    ]
+    results = {}
+    for name, fn, input_bytes, records, unit in stages:
+        best, median, peak = _measure(fn, repeat)
+        results[name] = StageResult(best, median, peak, input_bytes, records, unit)
+    results.update(bench_json(run_dir, repeat))
+    return results
+
+
+def _json_inputs(run_dir: str) -> dict[str, list[Path]]:
+    d = Path(run_dir)
+    inputs = {
+        "timeline.kono": [d / "kono-report" / "data" / "timeline.json"],
+        "timeline.substantiate": [d / "substantiate-report" / "data" / "timeline.json"],
+        "test_cases": sorted((d / "substantiate-report" / "data" / "test-cases").glob("*.json")),
+        "loki.webapp": [d / "logs" / "webapp-logs.json"],
+        "loki.dispatcher": [d / "logs" / "dispatcher-logs.json"],
+        "prometheus": sorted((d / "metrics").glob("*.json")),
+    }
+    return {k: [p for p in paths if p.exists()] for k, paths in inputs.items()}
+
+
+def bench_json(run_dir: str, repeat: int = 3) -> dict[str, StageResult]:
+    """Decode time per input type for every available JSON backend."""
+    from . import jsonio
+
+    results = {}
+    for kind, paths in _json_inputs(run_dir).items():
+        if not paths:
+            continue
+        blobs = [p.read_bytes() for p in paths]
+        size = sum(len(b) for b in blobs)
+        for backend in jsonio.available():
+            def decode(backend=backend):
+                for b in blobs:
+                    jsonio.loads(b, backend)
+            best, median, peak = _measure(decode, repeat)
+            results[f"json.{kind}.{backend}"] = StageResult(
+                best, median, peak, size, len(blobs), "docs"
+            )
+    return results
+
+
+def json_speedups(doc: dict) -> dict[str, float]:
+    """``label/json.<input>`` -> stdlib time / orjson time, where both ran."""
+    out = {}
+    for key, r in doc["results"].items():
+        if not key.endswith(".orjson"):
+            continue
+        base = key[: -len(".orjson")]
+        stdlib = doc["results"].get(f"{base}.stdlib")
+        if stdlib and r["seconds"]:
+            out[base] = stdlib["seconds"] / r["seconds"]
+    return out
+
+
+def synthetic_dataset(scale: float, cache_root: str, seed: int = 0) -> str:
+    """Generate (once) a scaled synthetic run under ``cache_root``."""
+    from . import synthetic
+
+    run_dir = Path(cache_root) / f"synthetic-x{scale:g}-seed{seed}"
+    if not (run_dir / ".complete").exists():
+        synthetic.generate(synthetic.scaled(scale, seed=seed), str(run_dir))
+        (run_dir / ".complete").write_text("")
+    return str(run_dir)
+
+
+def run_benchmarks(datasets: dict[str, str], repeat: int = 3) -> dict:
+    """Benchmark every dataset (``label -> run dir``) into a JSON-ready dict."""
+    results = {}
+    for label, run_dir in datasets.items():
+        for stage, r in bench_run(run_dir, repeat).items():
+            results[f"{label}/{stage}"] = r.to_dict()
+    return {
+        "version": RESULT_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    tolerance: float = 0.25,
+    memory_tolerance: float | None = None,
+    min_delta_s: float = 0.005,
+) -> list[Regression]:
+    """Stages whose best time (or peak memory) exceeds baseline by > tolerance.
+
+    Slowdowns smaller than ``min_delta_s`` in absolute terms are ignored so
+    that sub-millisecond stages don't fail the gate on timer noise.
+    """
+    if memory_tolerance is None:
+        memory_tolerance = tolerance
+    regressions = []
+    for key, cur in current["results"].items():
+        base = baseline.get("results", {}).get(key)
+        if base is None:
+            continue
+        slower = cur["seconds"] - base["seconds"]
+        if cur["seconds"] > base["seconds"] * (1 + tolerance) and slower > min_delta_s:
+            regressions.append(Regression(key, "seconds", base["seconds"], cur["seconds"]))
+        if cur["peak_bytes"] > base["peak_bytes"] * (1 + memory_tolerance):
+            regressions.append(Regression(key, "peak_bytes", base["peak_bytes"], cur["peak_bytes"]))
+    return regressions
+
+
+def format_results(doc: dict) -> str:
+    lines = [f"{'stage':<48} {'best':>9} {'records/s':>12} {'MB/s':>8} {'peak MB':>8}"]
+    for key, r in doc["results"].items():
+        lines.append(
+            f"{key:<48} {r['seconds'] * 1000:>7.1f}ms "
+            f"{r['records_per_s']:>8.0f} {r['unit'][:3]:<3} {r['mb_per_s']:>8.1f} "
+            f"{r['peak_bytes'] / 1e6:>8.1f}"
+        )
+    speedups = json_speedups(doc)
+    if speedups:
+        lines.append("")
+        lines.append("JSON decode speedup (orjson vs stdlib):")
+        for key, ratio in speedups.items():
+            lines.append(f"  {key:<46} {ratio:>5.1f}x")
+    return "\n".join(lines)
@@ -0,0 +1,110 @@
+"""Persistent per-analyzer result cache keyed by input fingerprints.
+
+A cache entry's key hashes the analyzer function, its extra arguments, the
+analyzer module's ``ANALYZER_VERSION``, the packing format version and a
+fingerprint of every input file: ``(path, size, mtime_ns)`` by default, or
+a BLAKE2 content digest with ``content_hash=True`` (robust to touch/copy,
+slower). Entries hold the packed result serialized with ``marshal``, which
+loads far faster than re-parsing the source JSON or logs.
+
+Changing the report generator or correlator never invalidates anything;
+only analyzers whose inputs or version changed re-run.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib
+import marshal
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .packing import FORMAT_VERSION, unpack
+
+
+@dataclass
+class CacheStats:
+    hits: list[str] = field(default_factory=list)
+    misses: list[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        text = f"cache: {len(self.hits)} hit, {len(self.misses)} miss"
+        if self.misses:
+            text += f" ({', '.join(self.misses)})"
+        return text
+
+
+def _input_files(path: Path) -> list[Path]:
+    if path.is_dir():
+        return sorted(p for p in path.rglob("*") if p.is_file())
+    return [path]
+
+
+def _digest(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def fingerprint(path: str | Path, content_hash: bool = False) -> list[tuple]:
+    """Fingerprint a file or every file under a directory."""
+    out: list[tuple] = []
+    for p in _input_files(Path(path)):
+        if content_hash:
+            out.append((str(p.resolve()), _digest(p)))
+        else:
+            st = p.stat()
+            out.append((str(p.resolve()), st.st_size, st.st_mtime_ns))
+    if not out:
+        out.append((str(Path(path).resolve()), "missing"))
+    return out
+
+
+def analyzer_version(func: str) -> int:
+    module = func.split(":")[0]
+    mod = importlib.import_module(f"{__package__}.{module}")
+    return getattr(mod, "ANALYZER_VERSION", 0)
+
+
+class AnalysisCache:
+    def __init__(self, cache_dir: str, content_hash: bool = False):
+        self.cache_dir = Path(cache_dir)
+        self.content_hash = content_hash
+        self.stats = CacheStats()
+        self._keys: dict[tuple[str, str], str] = {}
+
+    def key(self, stage, run_dir: str) -> str:
+        memo = (str(run_dir), stage.name)
+        if memo not in self._keys:
+            h = hashlib.sha256()
+            h.update(repr((
+                stage.func, stage.extra_args, analyzer_version(stage.func), FORMAT_VERSION,
+            )).encode())
+            for rel in stage.inputs:
+                h.update(repr(fingerprint(Path(run_dir) / rel, self.content_hash)).encode())
+            self._keys[memo] = h.hexdigest()
+        return self._keys[memo]
+
+    def _path(self, stage, run_dir: str) -> Path:
+        return self.cache_dir / stage.name / f"{self.key(stage, run_dir)}.bin"
+
+    def load(self, stage, run_dir: str):
+        """Return the cached result for ``stage``, or None (and record a miss)."""
+        path = self._path(stage, run_dir)
+        try:
+            packed = marshal.loads(path.read_bytes())
+            result = unpack(packed)
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            self.stats.misses.append(stage.name)
+            return None
+        self.stats.hits.append(stage.name)
+        return result
+
+    def store(self, stage, run_dir: str, packed: tuple) -> None:
+        path = self._path(stage, run_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(marshal.dumps(packed))
+        os.replace(tmp, path)
@@ -0,0 +1,171 @@
+"""Change-point detection on piecewise-constant signals.
+
+A signal is cut into ``n`` elementary intervals; a *cost* gives the
+negative log-likelihood of intervals ``[i, j)`` under one constant
+parameter, in O(1) from prefix sums. ``binary_segmentation`` splits the
+whole range where the cost drops most, then keeps splitting the pieces
+(best gain first) while a split lowers the total cost by more than the
+penalty. Scanning a piece is linear in its length and each level of
+splits scans every interval at most once, so ``k`` change points cost
+``O(n log k)`` when the splits are roughly balanced (``O(n k)`` at worst),
+on top of the ``O(n log n)`` sort that produces the intervals.
+
+Costs add, so several signals over the same intervals (e.g. how many tests
+run at once and how fast new ones start) are segmented jointly with
+``sum_costs``.
+
+Splitting a *sorted* sample always lowers the cost, since the two halves of
+one population have different means. Whether such a split separates two
+populations is a different question: ``two_normal_gain`` answers it by
+comparing a two-component normal mixture with a single normal.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from itertools import accumulate
+from typing import Callable, Sequence
+
+Cost = Callable[[int, int], float]
+
+
+def _prefix(values) -> array:
+    return array("d", accumulate(values, initial=0.0))
+
+
+class NormalMeanCost:
+    """Weighted squared error around a segment's mean, scaled by the noise variance."""
+
+    __slots__ = ("_w", "_wx", "_wxx", "_scale")
+
+    def __init__(self, values: Sequence[float], weights: Sequence[float], sigma: float = 1.0):
+        self._w = _prefix(weights)
+        self._wx = _prefix(w * x for w, x in zip(weights, values))
+        self._wxx = _prefix(w * x * x for w, x in zip(weights, values))
+        self._scale = 1.0 / (2.0 * sigma * sigma)
+
+    def __call__(self, i: int, j: int) -> float:
+        w = self._w[j] - self._w[i]
+        if w <= 0:
+            return 0.0
+        wx = self._wx[j] - self._wx[i]
+        return (self._wxx[j] - self._wxx[i] - wx * wx / w) * self._scale
+
+    def mean(self, i: int, j: int) -> float:
+        w = self._w[j] - self._w[i]
+        return (self._wx[j] - self._wx[i]) / w if w > 0 else 0.0
+
+
+class PoissonRateCost:
+    """Events (e.g. test starts) arriving at a constant rate within a segment."""
+
+    __slots__ = ("_n", "_t")
+
+    def __init__(self, counts: Sequence[int], exposure: Sequence[float]):
+        self._n = _prefix(counts)
+        self._t = _prefix(exposure)
+
+    def __call__(self, i: int, j: int) -> float:
+        n = self._n[j] - self._n[i]
+        t = self._t[j] - self._t[i]
+        if n <= 0 or t <= 0:
+            return 0.0
+        return n - n * math.log(n / t)
+
+
+def sum_costs(*costs: Cost) -> Cost:
+    return lambda i, j: sum(c(i, j) for c in costs)
+
+
+def bic_penalty(n: int, params: int, factor: float = 1.0) -> float:
+    """``factor`` times the BIC price of one more segment with ``params`` parameters."""
+    return factor * params * math.log(max(n, 2))
+
+
+def binary_segmentation(
+    cost: Cost,
+    n: int,
+    penalty: float,
+    admissible: Callable[[int, int, int], bool] | None = None,
+    max_changes: int | None = None,
+) -> list[int]:
+    """Sorted change points (interval indexes in ``1..n-1``) of ``[0, n)``.
+
+    ``admissible(i, k, j)`` can veto splitting ``[i, j)`` at ``k`` (e.g. to
+    enforce a minimum segment length).
+    """
+    def best(i: int, j: int) -> tuple[float, int] | None:
+        whole = cost(i, j)
+        found = None
+        for k in range(i + 1, j):
+            if admissible is not None and not admissible(i, k, j):
+                continue
+            gain = whole - cost(i, k) - cost(k, j)
+            if found is None or gain > found[0]:
+                found = (gain, k)
+        return found
+
+    heap: list[tuple[float, int, int, int]] = []
+
+    def push(i: int, j: int) -> None:
+        found = best(i, j)
+        if found is not None and found[0] > penalty:
+            heapq.heappush(heap, (-found[0], found[1], i, j))
+
+    changes: list[int] = []
+    push(0, n)
+    while heap and (max_changes is None or len(changes) < max_changes):
+        _, k, i, j = heapq.heappop(heap)
+        changes.append(k)
+        push(i, k)
+        push(k, j)
+    return sorted(changes)
+
+
+def two_normal_gain(
+    values: Sequence[float], weights: Sequence[float], threshold: float, iterations: int = 100,
+) -> float:
+    """Log-likelihood gain of two normal populations over one.
+
+    The mixture is fitted by EM, starting from the split of ``values`` at
+    ``threshold``; ``weights`` count repeated values, so a histogram will do.
+    It has three more parameters than a single normal (a weight, a mean and
+    a variance), so compare the gain with ``bic_penalty(n, 3)``.
+    """
+    total = sum(weights)
+
+    def normal(ws) -> tuple[float, float]:
+        w = sum(ws)
+        mean = sum(r * x for r, x in zip(ws, values)) / w
+        var = sum(r * (x - mean) ** 2 for r, x in zip(ws, values)) / w
+        return mean, max(var, 1e-9)
+
+    def log_pdf(x: float, mean: float, var: float) -> float:
+        return -0.5 * (math.log(2 * math.pi * var) + (x - mean) ** 2 / var)
+
+    mean, var = normal(weights)
+    single = sum(w * log_pdf(x, mean, var) for w, x in zip(weights, values))
+
+    low = [w if x < threshold else 0.0 for w, x in zip(weights, values)]
+    high = [w - lw for w, lw in zip(weights, low)]
+    if not sum(low) or not sum(high):
+        return 0.0
+    mixture = single
+    for _ in range(iterations):
+        share = sum(low) / total
+        (m1, v1), (m2, v2) = normal(low), normal(high)
+        likelihood = 0.0
+        for k, (w, x) in enumerate(zip(weights, values)):
+            a = math.log(share) + log_pdf(x, m1, v1)
+            b = math.log(1 - share) + log_pdf(x, m2, v2)
+            top = max(a, b)
+            both = top + math.log(math.exp(a - top) + math.exp(b - top))
+            likelihood += w * both
+            low[k] = w * math.exp(a - both)
+            high[k] = w - low[k]
+        converged = abs(likelihood - mixture) < 1e-6
+        mixture = likelihood
+        if converged or not sum(low) or not sum(high):
+            break
+    return mixture - single
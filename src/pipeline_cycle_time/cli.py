@@ -1,46 +1,43 @@
-"""CLI entry point for pipeline cycle time analysis."""
+"""CLI entry point for pipeline cycle time analysis.
+
+Only argparse and sys are imported at module load. Every subsystem
+(analyzers, report generator, process pools, fetchers) is imported inside
+the command that needs it, so ``--help``, argument errors and quick
+subcommands stay cheap when invoked thousands of times from batch jobs.
+``tests/test_cli.py`` enforces an import-time budget for this module.
+"""
 from __future__ import annotations
 
 import argparse
 import sys
-from pathlib import Path
-
-from .analyzers import orchestration, test_reports, app_logs, metrics, correlator
-from .report import generator
-
 
-def analyze_fixtures(fixtures_dir: str, output: str | None = None) -> str:
-    """Run analysis against local fixture data."""
-    d = Path(fixtures_dir)
 
-    # Analyze orchestration
-    orch_result = orchestration.analyze(str(d / "logs" / "concord-log.txt"))
+def analyze_fixtures(
+    fixtures_dir: str,
+    output: str | None = None,
+    jobs: int = 1,
+    cache_dir: str | None = None,
+    profiler=None,
+) -> str:
+    """Run analysis against local fixture data.
 
-    # Analyze test reports
-    kono = test_reports.analyze_timeline(
-        str(d / "kono-report" / "data" / "timeline.json"), "Kono"
-    )
-    substantiate = test_reports.analyze_timeline(
-        str(d / "substantiate-report" / "data" / "timeline.json"), "Substantiate"
-    )
+    With ``jobs > 1`` the independent analyzers run on a process pool; the
+    default keeps everything in-process and sequential for debugging.
+    ``cache_dir`` enables the per-analyzer result cache. ``profiler`` (a
+    ``profiling.Profiler``) records every stage including report rendering.
+    """
+    from pathlib import Path
 
-    # Analyze app logs
-    app_logs_result = app_logs.analyze_webapp_logs(str(d / "logs" / "webapp-logs.json"))
-    dispatcher_result = app_logs.analyze_dispatcher_logs(str(d / "logs" / "dispatcher-logs.json"))
+    from . import pipeline
 
-    # Analyze metrics
-    metrics_result = metrics.analyze(str(d / "metrics"))
-
-    # Correlate findings (includes critical-path analysis)
-    correlation = correlator.correlate(
-        orch_result, kono, substantiate, app_logs_result, dispatcher_result, metrics_result
-    )
-
-    # Generate report
-    report = generator.generate(
-        orch_result, kono, substantiate, app_logs_result, dispatcher_result,
-        metrics_result, correlation
-    )
+    cache = _analysis_cache(cache_dir)
+    analysis = pipeline.run(fixtures_dir, jobs=jobs, cache=cache, profiler=profiler)
+    if cache is not None:
+        print(cache.stats.summary(), file=sys.stderr)
+    if profiler is None:
+        report = analysis.generate_report()
+    else:
+        report = profiler.measure("report", [], analysis.generate_report)
 
     if output:
         Path(output).write_text(report)
@@ -62,6 +59,11 @@ def main() -> None:
         "--fixtures-dir",
         help="Path to local fixtures directory (offline mode)",
     )
+    analyze_cmd.add_argument(
+        "--snapshot",
+        metavar="PATH",
+        help="Render the report from a snapshot written by the snapshot command",
+    )
     analyze_cmd.add_argument(
         "--process-id",
         help="Concord process ID (live mode)",
@@ -78,22 +80,561 @@ def main() -> None:
         "--output", "-o",
         help="Output file path (default: stdout)",
     )
+    analyze_cmd.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Run analyzers on N worker processes (0 = one per CPU, default: 1, sequential)",
+    )
+    analyze_cmd.add_argument(
+        "--cache-dir",
+        help="Reuse analyzer results for unchanged inputs from this directory",
+    )
+    analyze_cmd.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Write a per-stage profile (wall/CPU time, input size) as JSON",
+    )
+    analyze_cmd.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Also re-run each stage under tracemalloc to profile its peak memory",
+    )
+    analyze_cmd.add_argument(
+        "--profile-trace",
+        metavar="PATH",
+        help="Write stage boundaries as Chrome/Perfetto trace events",
+    )
+    analyze_cmd.add_argument(
+        "--profile-pstats-dir",
+        metavar="DIR",
+        help="Also run each stage under cProfile and dump <stage>.pstats here",
+    )
+
+    batch_cmd = sub.add_parser("batch", help="Analyze many run directories and roll them up")
+    batch_cmd.add_argument(
+        "--runs-root", required=True,
+        help="Directory containing one subdirectory per pipeline run",
+    )
+    batch_cmd.add_argument(
+        "--output-dir", required=True,
+        help="Where per-run reports and the aggregate report are written",
+    )
+    batch_cmd.add_argument(
+        "--jobs", "-j", type=int, default=0,
+        help="Worker processes (default: one per CPU)",
+    )
+    batch_cmd.add_argument(
+        "--max-tasks-per-worker", type=int, default=8,
+        help="Recycle each worker after this many runs to bound memory growth",
+    )
+    batch_cmd.add_argument(
+        "--max-worker-memory-mb", type=int,
+        help="Hard address-space limit per worker (Unix only)",
+    )
+    batch_cmd.add_argument(
+        "--force", action="store_true",
+        help="Re-analyze runs that already have a summary",
+    )
+    batch_cmd.add_argument(
+        "--cache-dir",
+        help="Share per-analyzer results across batches (e.g. after --force)",
+    )
+
+    synth_cmd = sub.add_parser("synth", help="Generate a synthetic run directory for scale testing")
+    synth_cmd.add_argument("--output-dir", required=True, help="Run directory to create")
+    synth_cmd.add_argument("--seed", type=int, default=0)
+    synth_cmd.add_argument(
+        "--scale", type=float, default=1.0,
+        help="Multiply fixture-sized test counts and log volumes (e.g. 10, 1000)",
+    )
+    synth_cmd.add_argument("--kono-tests", type=int, help="Override Kono test count")
+    synth_cmd.add_argument("--substantiate-tests", type=int, help="Override Substantiate test count")
+    synth_cmd.add_argument("--hosts", type=int, help="Hosts per suite")
+    synth_cmd.add_argument("--workers-per-host", type=int, help="Workers per host")
+    synth_cmd.add_argument("--kono-pools", type=int, help="Sequential Kono ForkJoinPools")
+    synth_cmd.add_argument("--resume-cycles", type=int, help="Concord suspend/resume cycles")
+    synth_cmd.add_argument("--webapp-log-lines", type=int, help="Webapp Loki lines")
+    synth_cmd.add_argument("--dispatcher-jobs", type=int, help="Dispatcher batch jobs")
+    synth_cmd.add_argument(
+        "--no-test-cases", action="store_true",
+        help="Skip per-test test-cases/*.json (timeline only)",
+    )
+
+    bench_cmd = sub.add_parser("bench", help="Benchmark every analyzer stage")
+    bench_cmd.add_argument(
+        "--fixtures-dir", action="append", default=[],
+        help="Real run directory to benchmark (repeatable)",
+    )
+    bench_cmd.add_argument(
+        "--scale", type=float, action="append", default=[],
+        help="Also benchmark a synthetic run at this scale (repeatable, e.g. 10)",
+    )
+    bench_cmd.add_argument(
+        "--synthetic-dir", default=".bench-data",
+        help="Where generated synthetic runs are kept between invocations",
+    )
+    bench_cmd.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (best is kept)")
+    bench_cmd.add_argument("-o", "--output", help="Write results JSON here (e.g. a new baseline)")
+    bench_cmd.add_argument("--compare", help="Baseline JSON to gate against")
+    bench_cmd.add_argument(
+        "--tolerance", type=float, default=0.25,
+        help="Allowed fractional slowdown / memory growth before failing (default 0.25)",
+    )
+
+    diff_cmd = sub.add_parser("diff", help="Compare two run directories: what got slower")
+    diff_cmd.add_argument("before", help="Baseline run directory or snapshot file")
+    diff_cmd.add_argument("after", help="Candidate run directory or snapshot file")
+    diff_cmd.add_argument("--output", "-o", help="Output file path (default: stdout)")
+    diff_cmd.add_argument(
+        "--key", choices=("history", "name", "uid"), default="history",
+        help="Match tests by Allure historyId from test-cases (default; falls back to the "
+             "name), by name, or by uid (same report re-analyzed)",
+    )
+    diff_cmd.add_argument("--top", type=int, default=20, help="Tests listed per ranking")
+    diff_cmd.add_argument("--cache-dir", help="Reuse analyzer results from this directory")
+    diff_cmd.add_argument(
+        "--fail-over", type=float, metavar="SECONDS",
+        help="Exit 1 if end-to-end time regressed by more than this many seconds",
+    )
+
+    snapshot_cmd = sub.add_parser(
+        "snapshot", help="Analyze a run and save it as a memory-mappable binary snapshot",
+    )
+    snapshot_cmd.add_argument("run_dir", help="Run directory to analyze")
+    snapshot_cmd.add_argument("--output", "-o", required=True, help="Snapshot file to write")
+    snapshot_cmd.add_argument("--cache-dir", help="Reuse analyzer results from this directory")
+    snapshot_cmd.add_argument(
+        "--no-history-ids", action="store_true",
+        help="Skip reading test-cases/*.json for Allure historyIds",
+    )
+
+    flaky_cmd = sub.add_parser("flaky", help="Flake rates and retry waste across many runs")
+    flaky_cmd.add_argument(
+        "run_dirs", nargs="+",
+        help="Run directories, or roots searched for them (anything with logs/concord-log.txt)",
+    )
+    flaky_cmd.add_argument("--output", "-o", help="Output file path (default: stdout)")
+    flaky_cmd.add_argument(
+        "--jobs", "-j", type=int, default=1, help="Parse runs on N processes (0 = one per CPU)",
+    )
+    flaky_cmd.add_argument("--top", type=int, default=30, help="Tests listed")
+
+    logs_cmd = sub.add_parser(
+        "logs", help="Webapp log errors and warnings per test and package running at the time",
+    )
+    logs_cmd.add_argument("run_dir", help="Run directory to analyze")
+    logs_cmd.add_argument("--output", "-o", help="Output file path (default: stdout)")
+    logs_cmd.add_argument("--top", type=int, default=20, help="Tests and packages listed")
+    logs_cmd.add_argument("--cache-dir", help="Reuse analyzer results from this directory")
+
+    chain_cmd = sub.add_parser(
+        "setup-chain", help="Infer the serial dependency chain of Substantiate's setup phase",
+    )
+    chain_cmd.add_argument("run_dir", help="Run directory to analyze")
+    chain_cmd.add_argument(
+        "--history", nargs="*", default=[],
+        help="Other run directories, or roots searched for them, to confirm links against",
+    )
+    chain_cmd.add_argument("--output", "-o", help="Output file path (default: stdout)")
+    chain_cmd.add_argument("--top", type=int, default=50, help="Links listed")
+    chain_cmd.add_argument("--cache-dir", help="Reuse analyzer results from this directory")
+
+    trace_cmd = sub.add_parser(
+        "trace", help="Export a run as a Chrome/Perfetto trace (Trace Event JSON)",
+    )
+    trace_cmd.add_argument("run_dir", help="Run directory to analyze")
+    trace_cmd.add_argument("--output", "-o", required=True, help="Trace file to write")
+    trace_cmd.add_argument("--no-metrics", action="store_true", help="Leave out metric counters")
+    trace_cmd.add_argument("--cache-dir", help="Reuse analyzer results from this directory")
+
+    timeline_cmd = sub.add_parser(
+        "timeline", help="Print a run's proportional timeline; optionally write an SVG Gantt",
+    )
+    timeline_cmd.add_argument("run_dir", help="Run directory to analyze")
+    timeline_cmd.add_argument("--width", type=int, default=64, help="Timeline columns (default: 64)")
+    timeline_cmd.add_argument("--svg", help="Also write an SVG Gantt (one row per worker) here")
+    timeline_cmd.add_argument(
+        "--svg-width", type=int, default=1600, help="SVG width in pixels (default: 1600)",
+    )
+    timeline_cmd.add_argument("--cache-dir", help="Reuse analyzer results from this directory")
+
+    store_cmd = sub.add_parser("store", help="Historical run store (SQLite) and trend queries")
+    store_sub = store_cmd.add_subparsers(dest="store_command")
+    ingest_cmd = store_sub.add_parser("ingest", help="Analyze runs and add them to the store")
+    ingest_cmd.add_argument("--db", required=True, help="SQLite database path")
+    ingest_cmd.add_argument(
+        "run_dirs", nargs="+",
+        help="Run directories, or roots searched for them (anything with logs/concord-log.txt)",
+    )
+    ingest_cmd.add_argument("--cache-dir", help="Reuse analyzer results from this directory")
+    ingest_cmd.add_argument(
+        "--no-history-ids", action="store_true",
+        help="Skip reading test-cases/*.json for Allure historyIds (faster on huge runs)",
+    )
+    check_cmd = store_sub.add_parser(
+        "check", help="Flag tests/phases of a run slower than their historical quantile",
+    )
+    check_cmd.add_argument("--db", required=True, help="SQLite database path")
+    check_cmd.add_argument("run_dir", help="Run directory to check (not yet ingested)")
+    check_cmd.add_argument("--quantile", type=float, default=0.95, help="Historical quantile (0-1)")
+    check_cmd.add_argument(
+        "--min-history", type=int, default=10, help="Skip tests with fewer prior runs",
+    )
+    check_cmd.add_argument(
+        "--fail", action="store_true", help="Exit 1 if anything lands above the quantile",
+    )
+    trend_cmd = store_sub.add_parser("trend", help="Percentile trend of a metric across runs")
+    trend_cmd.add_argument("--db", required=True, help="SQLite database path")
+    trend_cmd.add_argument(
+        "--metric", required=True,
+        help="concord | end_to_end | critical_resume | phase:NAME | suite:NAME | "
+             "pool:SUITE/POOL | test:HISTORYID_OR_UID",
+    )
+    trend_cmd.add_argument("--last", type=int, help="Only the newest N runs")
+    trend_cmd.add_argument("--window", type=int, default=50, help="Runs per percentile bucket")
+    trend_cmd.add_argument("--json", action="store_true", help="Print JSON instead of a table")
 
     args = parser.parse_args()
 
-    if args.command != "analyze":
+    if args.command == "analyze":
+        _cmd_analyze(args)
+    elif args.command == "batch":
+        _cmd_batch(args)
+    elif args.command == "synth":
+        _cmd_synth(args)
+    elif args.command == "bench":
+        _cmd_bench(args)
+    elif args.command == "diff":
+        _cmd_diff(args)
+    elif args.command == "snapshot":
+        _cmd_snapshot(args)
+    elif args.command == "flaky":
+        _cmd_flaky(args)
+    elif args.command == "logs":
+        _cmd_logs(args)
+    elif args.command == "setup-chain":
+        _cmd_setup_chain(args)
+    elif args.command == "trace":
+        _cmd_trace(args)
+    elif args.command == "timeline":
+        _cmd_timeline(args)
+    elif args.command == "store" and args.store_command:
+        _cmd_store(args)
+    else:
         parser.print_help()
         sys.exit(1)
 
+
+def _analysis_cache(cache_dir: str | None):
+    """The ``AnalysisCache`` in ``cache_dir``, or None without one."""
+    if not cache_dir:
+        return None
+    from .cache import AnalysisCache
+
+    return AnalysisCache(cache_dir)
+
+
+def _cmd_analyze(args: argparse.Namespace) -> None:
+    from . import pipeline
+
     if args.fixtures_dir:
-        analyze_fixtures(args.fixtures_dir, args.output)
+        jobs = args.jobs or pipeline.default_jobs()
+        profiler = None
+        if args.profile or args.profile_trace or args.profile_memory or args.profile_pstats_dir:
+            from .profiling import Profiler
+            profiler = Profiler(
+                trace_memory=args.profile_memory, pstats_dir=args.profile_pstats_dir
+            )
+        analyze_fixtures(
+            args.fixtures_dir, args.output, jobs=jobs, cache_dir=args.cache_dir, profiler=profiler
+        )
+        if profiler is not None:
+            print(profiler.summary(), file=sys.stderr)
+            if args.profile:
+                profiler.write(args.profile)
+            if args.profile_trace:
+                profiler.write_trace(args.profile_trace)
+    elif args.snapshot:
+        from pathlib import Path
+
+        from . import snapshot
+
+        report = snapshot.load(args.snapshot).generate_report()
+        if args.output:
+            Path(args.output).write_text(report)
+            print(f"Report written to {args.output}")
+        else:
+            print(report)
     elif args.process_id:
         print("Live mode not yet implemented in v0.1", file=sys.stderr)
         sys.exit(1)
     else:
-        print("Either --fixtures-dir or --process-id is required", file=sys.stderr)
+        print("One of --fixtures-dir, --snapshot or --process-id is required", file=sys.stderr)
         sys.exit(1)
 
 
+def _cmd_batch(args: argparse.Namespace) -> None:
+    from . import batch, pipeline
+
+    result = batch.run_batch(
+        args.runs_root,
+        args.output_dir,
+        jobs=args.jobs or pipeline.default_jobs(),
+        max_tasks_per_worker=args.max_tasks_per_worker,
+        max_worker_memory_mb=args.max_worker_memory_mb,
+        force=args.force,
+        cache_dir=args.cache_dir,
+    )
+    print(
+        f"{len(result.analyzed)} analyzed, {len(result.skipped)} already done, "
+        f"{len(result.failed)} failed; aggregate report in {args.output_dir}"
+    )
+    if result.failed:
+        sys.exit(1)
+
+
+def _cmd_synth(args: argparse.Namespace) -> None:
+    from . import synthetic
+
+    config = synthetic.scaled(args.scale, seed=args.seed)
+    suites = (config.kono, config.substantiate)
+    if args.kono_tests is not None:
+        config.kono.tests = args.kono_tests
+    if args.substantiate_tests is not None:
+        config.substantiate.tests = args.substantiate_tests
+    if args.kono_pools is not None:
+        config.kono.pools = args.kono_pools
+    for spec in suites:
+        if args.hosts is not None:
+            spec.hosts = args.hosts
+        if args.workers_per_host is not None:
+            spec.workers_per_host = args.workers_per_host
+    if args.resume_cycles is not None:
+        config.resume_cycles = args.resume_cycles
+    if args.webapp_log_lines is not None:
+        config.webapp_log_lines = args.webapp_log_lines
+    if args.dispatcher_jobs is not None:
+        config.dispatcher_jobs = args.dispatcher_jobs
+    config.write_test_cases = not args.no_test_cases
+    out = synthetic.generate(config, args.output_dir)
+    print(f"Synthetic run written to {out}")
+
+
+def _cmd_bench(args: argparse.Namespace) -> None:
+    import json
+    from pathlib import Path
+
+    from . import bench
+
+    datasets = {Path(d).name: d for d in args.fixtures_dir}
+    for scale in args.scale:
+        datasets[f"synthetic-x{scale:g}"] = bench.synthetic_dataset(scale, args.synthetic_dir)
+    if not datasets:
+        print("Nothing to benchmark: pass --fixtures-dir and/or --scale", file=sys.stderr)
+        sys.exit(1)
+
+    doc = bench.run_benchmarks(datasets, repeat=args.repeat)
+    print(bench.format_results(doc))
+    if args.output:
+        Path(args.output).write_text(json.dumps(doc, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = bench.compare(baseline, doc, tolerance=args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} of {args.compare}")
+
+
+def _cmd_diff(args: argparse.Namespace) -> None:
+    from pathlib import Path
+
+    from . import pipeline, snapshot
+    from .analyzers.diff import diff_runs
+    from .report.diff import render
+
+    cache = _analysis_cache(args.cache_dir)
+
+    def load(path: str):
+        if snapshot.is_snapshot(path):
+            return snapshot.load_with_history(path)
+        history = pipeline.history_ids(path) if args.key == "history" else {}
+        return pipeline.run(path, cache=cache), history
+
+    before, history_before = load(args.before)
+    after, history_after = load(args.after)
+    histories = {}
+    if args.key == "history":
+        histories = {"history_before": history_before, "history_after": history_after}
+    diff = diff_runs(before, after, key=args.key, **histories)
+    report = render(diff, top=args.top)
+    if args.output:
+        Path(args.output).write_text(report)
+        print(f"Diff written to {args.output}")
+    else:
+        print(report)
+    if args.fail_over is not None and diff.end_to_end.delta_s > args.fail_over:
+        print(
+            f"End-to-end regressed by {diff.end_to_end.delta_s:.0f}s "
+            f"(limit {args.fail_over:.0f}s)",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+def _cmd_snapshot(args: argparse.Namespace) -> None:
+    from . import pipeline, snapshot
+
+    cache = _analysis_cache(args.cache_dir)
+    analysis = pipeline.run(args.run_dir, cache=cache)
+    history = None if args.no_history_ids else pipeline.history_ids(args.run_dir)
+    snapshot.write(analysis, args.output, history=history)
+    print(f"Snapshot written to {args.output}")
+
+
+def _cmd_flaky(args: argparse.Namespace) -> None:
+    from pathlib import Path
+
+    from . import batch, pipeline
+    from .analyzers.flakiness import analyze_runs
+    from .report.flakiness import render
+
+    run_dirs = [str(d) for root in args.run_dirs for d in batch.discover_runs(root)]
+    result = analyze_runs(run_dirs, jobs=args.jobs or pipeline.default_jobs())
+    for run_dir, err in result.failed_runs.items():
+        print(f"[flaky] {run_dir}: FAILED ({err})", file=sys.stderr)
+    report = render(result, top=args.top)
+    if args.output:
+        Path(args.output).write_text(report)
+        print(f"Flakiness report written to {args.output}")
+    else:
+        print(report)
+
+
+def _cmd_logs(args: argparse.Namespace) -> None:
+    from pathlib import Path
+
+    from . import pipeline
+    from .report.logs import render
+
+    cache = _analysis_cache(args.cache_dir)
+    analysis = pipeline.run(args.run_dir, cache=cache)
+    result = analysis.log_attribution(pipeline.packages(args.run_dir))
+    report = render(result, args.run_dir, top=args.top)
+    if args.output:
+        Path(args.output).write_text(report)
+        print(f"Log attribution written to {args.output}")
+    else:
+        print(report)
+
+
+def _cmd_setup_chain(args: argparse.Namespace) -> None:
+    from pathlib import Path
+
+    from . import batch, pipeline
+    from .analyzers import setup_chain
+    from .analyzers.test_reports import analyze_timeline
+    from .report.setup_chain import render
+
+    cache = _analysis_cache(args.cache_dir)
+    analysis = pipeline.run(args.run_dir, cache=cache)
+    history = []
+    this = Path(args.run_dir).resolve()
+    for root in args.history:
+        for run_dir in batch.discover_runs(root):
+            timeline = run_dir / "substantiate-report" / "data" / "timeline.json"
+            if run_dir.resolve() == this:
+                continue
+            if not timeline.is_file():
+                print(f"[setup-chain] {run_dir}: no Substantiate timeline", file=sys.stderr)
+                continue
+            history.append(analyze_timeline(str(timeline), "Substantiate"))
+    chain = setup_chain.infer(analysis.substantiate, history)
+    report = render(chain, args.run_dir, top=args.top)
+    if args.output:
+        Path(args.output).write_text(report)
+        print(f"Setup chain written to {args.output}")
+    else:
+        print(report)
+
+
+def _cmd_trace(args: argparse.Namespace) -> None:
+    from pathlib import Path
+
+    from . import pipeline, trace
+
+    cache = _analysis_cache(args.cache_dir)
+    analysis = pipeline.run(args.run_dir, cache=cache)
+    events = analysis.aligned_events()
+    metrics_dir = None if args.no_metrics else str(Path(args.run_dir) / "metrics")
+    count = trace.write(events, args.output, metrics_dir, analysis.correlation.clock_skew)
+    print(f"Trace written to {args.output} ({count:,} events)")
+
+
+def _cmd_timeline(args: argparse.Namespace) -> None:
+    from pathlib import Path
+
+    from . import pipeline
+    from .report import timeline
+
+    cache = _analysis_cache(args.cache_dir)
+    analysis = pipeline.run(args.run_dir, cache=cache)
+    events = analysis.aligned_events()
+    setup = analysis.substantiate.setup_phase_analysis() if analysis.substantiate else None
+    t0, t1 = timeline.bounds(events)
+    tracks = timeline.report_tracks(events, setup["setup_duration_s"] if setup else None)
+    print("\n".join(timeline.render_ascii(tracks, t0, t1, args.width)))
+    if args.svg:
+        Path(args.svg).write_text(
+            timeline.render_svg(timeline.gantt_rows(events), t0, t1, width=args.svg_width)
+        )
+        print(f"SVG Gantt written to {args.svg}")
+
+
+def _cmd_store(args: argparse.Namespace) -> None:
+    from . import store
+
+    with store.RunStore(args.db) as db:
+        if args.store_command == "ingest":
+            from pathlib import Path
+
+            from . import batch
+
+            cache = _analysis_cache(args.cache_dir)
+            count = 0
+            for root in args.run_dirs:
+                for run_dir in batch.discover_runs(root):
+                    key = batch.run_key(run_dir, Path(root))
+                    store.ingest_run(
+                        db, str(run_dir), key, cache=cache, with_history=not args.no_history_ids
+                    )
+                    count += 1
+            print(f"Ingested {count} run(s); {db.run_count()} in {args.db}")
+        elif args.store_command == "check":
+            from . import pipeline
+
+            outliers = db.check(
+                pipeline.run(args.run_dir),
+                pipeline.history_ids(args.run_dir),
+                quantile=args.quantile,
+                min_history=args.min_history,
+            )
+            print(store.render_outliers(outliers, args.quantile))
+            if outliers and args.fail:
+                sys.exit(1)
+        elif args.store_command == "trend":
+            try:
+                rows = db.trend(args.metric, last=args.last, window=args.window)
+            except ValueError as e:
+                print(str(e), file=sys.stderr)
+                sys.exit(1)
+            if args.json:
+                import json
+                print(json.dumps(rows, indent=2))
+            else:
+                print(store.render_trend(args.metric, rows))
+
+
 if __name__ == "__main__":
     main()
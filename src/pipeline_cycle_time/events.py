@@ -0,0 +1,318 @@
+"""Cross-source event table on one int64 nanosecond time axis.
+
+Every source keeps its own clock format: Concord ``datetime`` (ms), Allure
+epoch ms, Loki epoch ns and Prometheus float seconds. Analyzers emit their
+results here (each analyzer module has an ``emit_events(result, table)``)
+converted with the ``ns_from_*`` helpers, so cross-source questions become
+queries instead of per-source loops with hand-written unit conversions.
+
+Events are stored in columns: ``start``/``end`` (int64 ns), ``source``,
+``kind`` and ``entity`` (indexes into one string table) and an optional
+attribute dict. The table is sorted by start time once, lazily, on the
+first query after new events were added. Time-range queries bisect the start
+column; overlap queries also use the longest span seen so far to bound the
+search from below. Filtering on a source, kind or entity goes through a
+posting list (the time-ordered rows holding that value, built on first use)
+which is bisected the same way, so e.g. "the first resume after the last
+test" touches a handful of rows rather than every test.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterator
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_KEYS = ("source", "kind", "entity")
+
+
+def ns_from_datetime(dt: datetime) -> int:
+    """Exact ns of a timezone-aware ``datetime`` (no float round trip)."""
+    delta = dt - _EPOCH
+    return ((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds) * 1000
+
+
+def ns_from_ms(ms: int) -> int:
+    return int(ms) * 1_000_000
+
+
+def ns_from_s(seconds: float) -> int:
+    """Float epoch seconds, rounded to whole microseconds (below float64 precision)."""
+    return round(seconds * 1_000_000) * 1000
+
+
+@dataclass(slots=True)
+class Event:
+    start_ns: int
+    end_ns: int
+    source: str
+    kind: str
+    entity: str
+    attrs: dict | None = None
+
+    @property
+    def duration_s(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def get(self, key: str, default=None):
+        """A column ("source", "kind", "entity") or an attribute."""
+        if key in _KEYS:
+            return getattr(self, key)
+        return self.attrs.get(key, default) if self.attrs else default
+
+
+class EventTable:
+    def __init__(self) -> None:
+        self._start = array("q")
+        self._end = array("q")
+        self._source = array("I")
+        self._kind = array("I")
+        self._entity = array("I")
+        self._attrs: list[dict | None] = []
+        self._strings: list[str] = []
+        self._index: dict[str, int] = {}
+        self._sorted = True
+        self._max_span = 0
+        self._postings: dict[tuple[int, int], array] = {}
+
+    def _intern(self, s: str) -> int:
+        i = self._index.get(s)
+        if i is None:
+            i = self._index[s] = len(self._strings)
+            self._strings.append(s)
+        return i
+
+    def add(
+        self,
+        source: str,
+        kind: str,
+        entity: str,
+        start_ns: int,
+        end_ns: int | None = None,
+        **attrs,
+    ) -> None:
+        """Append an event; point events leave ``end_ns`` unset."""
+        if end_ns is None:
+            end_ns = start_ns
+        if self._start and start_ns < self._start[-1]:
+            self._sorted = False
+        self._postings.clear()
+        self._start.append(start_ns)
+        self._end.append(end_ns)
+        self._source.append(self._intern(source))
+        self._kind.append(self._intern(kind))
+        self._entity.append(self._intern(entity))
+        self._attrs.append(attrs or None)
+        if end_ns - start_ns > self._max_span:
+            self._max_span = end_ns - start_ns
+
+    def extend(
+        self,
+        source: str,
+        kind: str,
+        entities: list[str],
+        starts: list[int],
+        ends: list[int],
+        attrs: list[dict | None] | None = None,
+    ) -> None:
+        """Append many events of one source and kind (columnar bulk ``add``)."""
+        if not starts:
+            return
+        if (self._start and starts[0] < self._start[-1]) or any(
+            b < a for a, b in zip(starts, starts[1:])
+        ):
+            self._sorted = False
+        self._postings.clear()
+        n = len(starts)
+        self._start.extend(starts)
+        self._end.extend(ends)
+        self._source.extend([self._intern(source)] * n)
+        self._kind.extend([self._intern(kind)] * n)
+        self._entity.extend([self._intern(e) for e in entities])
+        self._attrs.extend(attrs if attrs is not None else [None] * n)
+        self._max_span = max(self._max_span, max(b - a for a, b in zip(starts, ends)))
+
+    def sort(self) -> None:
+        """Order every column by (start, end); a no-op when already sorted."""
+        if self._sorted:
+            return
+        start, end = self._start, self._end
+        order = sorted(range(len(start)), key=lambda i: (start[i], end[i]))
+        for name in ("_start", "_end", "_source", "_kind", "_entity"):
+            col = getattr(self, name)
+            setattr(self, name, array(col.typecode, (col[i] for i in order)))
+        self._attrs = [self._attrs[i] for i in order]
+        self._postings.clear()
+        self._sorted = True
+
+    def shift(self, source: str, delta_ns: int) -> None:
+        """Move every event of ``source`` by ``delta_ns`` (clock-skew correction)."""
+        idx = self._index.get(source)
+        if idx is None or not delta_ns:
+            return
+        start, end = self._start, self._end
+        for i, v in enumerate(self._source):
+            if v == idx:
+                start[i] += delta_ns
+                end[i] += delta_ns
+        self._sorted = False
+        self._postings.clear()
+
+    @property
+    def start(self) -> array:
+        """Start column (int64 ns), in table order."""
+        self.sort()
+        return self._start
+
+    @property
+    def end(self) -> array:
+        self.sort()
+        return self._end
+
+    def __len__(self) -> int:
+        return len(self._start)
+
+    def __getitem__(self, i: int) -> Event:
+        self.sort()
+        s = self._strings
+        return Event(
+            self._start[i], self._end[i], s[self._source[i]], s[self._kind[i]],
+            s[self._entity[i]], self._attrs[i],
+        )
+
+    def __iter__(self) -> Iterator[Event]:
+        return (self[i] for i in range(len(self)))
+
+    # -- queries ------------------------------------------------------------
+
+    def range(self, start_ns: int | None = None, end_ns: int | None = None) -> range:
+        """Indexes of events starting in ``[start_ns, end_ns)``."""
+        self.sort()
+        lo = 0 if start_ns is None else bisect_left(self._start, start_ns)
+        hi = len(self._start) if end_ns is None else bisect_left(self._start, end_ns)
+        return range(lo, hi)
+
+    def _matcher(self, source, kind, entity):
+        """(column number, column, wanted index) triples; ``None`` when a value never occurs."""
+        checks = []
+        columns = (self._source, self._kind, self._entity)
+        for n, value in enumerate((source, kind, entity)):
+            if value is None:
+                continue
+            idx = self._index.get(value)
+            if idx is None:
+                return None
+            checks.append((n, columns[n], idx))
+        return checks
+
+    def _posting(self, n: int, col: array, idx: int) -> array:
+        rows = self._postings.get((n, idx))
+        if rows is None:
+            rows = self._postings[(n, idx)] = array(
+                "I", (i for i, v in enumerate(col) if v == idx)
+            )
+        return rows
+
+    def _scan(
+        self,
+        source: str | None = None,
+        kind: str | None = None,
+        entity: str | None = None,
+        start_ns: int | None = None,
+        end_ns: int | None = None,
+        overlapping: bool = False,
+        reverse: bool = False,
+    ) -> Iterator[int]:
+        self.sort()
+        checks = self._matcher(source, kind, entity)
+        if checks is None:
+            return
+        lo = start_ns
+        if overlapping and start_ns is not None:
+            lo = start_ns - self._max_span
+        if checks:
+            # Walk the shortest posting list, checking the other columns per row
+            rows = min((self._posting(*c) for c in checks), key=len)
+            key = self._start.__getitem__
+            a = 0 if lo is None else bisect_left(rows, lo, key=key)
+            b = len(rows) if end_ns is None else bisect_left(rows, end_ns, key=key)
+            candidates = rows[a:b]
+        else:
+            candidates = self.range(lo, end_ns)
+        end = self._end
+        for i in reversed(candidates) if reverse else candidates:
+            if overlapping and start_ns is not None and end[i] < start_ns:
+                continue
+            if len(checks) < 2 or all(col[i] == want for _, col, want in checks):
+                yield i
+
+    def indexes(self, **query) -> list[int]:
+        """Indexes of matching events, in time order.
+
+        Filters on ``source``, ``kind`` and ``entity``. Without
+        ``overlapping`` the ``start_ns``/``end_ns`` window selects events
+        that *start* in ``[start_ns, end_ns)``; with it, events whose span
+        intersects the window (points on its start boundary included).
+        """
+        return list(self._scan(**query))
+
+    def filter(self, **query) -> list[Event]:
+        """Matching events; takes the same arguments as ``indexes``."""
+        return [self[i] for i in self._scan(**query)]
+
+    def first(self, **query) -> Event | None:
+        i = next(self._scan(**query), None)
+        return None if i is None else self[i]
+
+    def last(self, **query) -> Event | None:
+        i = next(self._scan(**query, reverse=True), None)
+        return None if i is None else self[i]
+
+    def span(self, **query) -> tuple[int, int] | None:
+        """(earliest start, latest end) in ns over the matching events."""
+        idx = self.indexes(**query)
+        if not idx:
+            return None
+        end = self._end
+        return self._start[idx[0]], max(end[i] for i in idx)
+
+    def group(self, by: str, **query) -> dict[str, list[Event]]:
+        """Matching events keyed by a column ("source", "kind", "entity") or attribute."""
+        groups: dict[str, list[Event]] = {}
+        for i in self.indexes(**query):
+            event = self[i]
+            groups.setdefault(event.get(by), []).append(event)
+        return groups
+
+    def sources(self) -> list[str]:
+        return sorted({self._strings[i] for i in self._source})
+
+
+def from_analysis(
+    orchestration=None,
+    kono=None,
+    substantiate=None,
+    app_logs=None,
+    dispatcher=None,
+    metrics_result=None,
+) -> EventTable:
+    """Event table of everything the analyzers produced for one run."""
+    from .analyzers import app_logs as app_logs_mod
+    from .analyzers import metrics, orchestration as orchestration_mod, test_reports
+
+    table = EventTable()
+    if orchestration is not None:
+        orchestration_mod.emit_events(orchestration, table)
+    for suite in (kono, substantiate):
+        if suite is not None:
+            test_reports.emit_events(suite, table)
+    if app_logs is not None:
+        app_logs_mod.emit_events(app_logs, table)
+    if dispatcher is not None:
+        app_logs_mod.emit_dispatcher_events(dispatcher, table)
+    if metrics_result is not None:
+        metrics.emit_events(metrics_result, table)
+    table.sort()
+    return table
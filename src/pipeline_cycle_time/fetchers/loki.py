@@ -12,5 +12,7 @@ def fetch_logs(
     """Fetch logs from Loki via Grafana API proxy.
 
     Uses: GET /api/datasources/proxy/uid/loki_logs/loki/api/v1/query_range
+    Requests must go through ``scheduler.shared_scheduler()`` so bulk
+    backfills share one rate limit and retry budget per Grafana host.
     """
     raise NotImplementedError("Live fetching not implemented in v0.1")
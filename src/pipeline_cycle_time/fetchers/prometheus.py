@@ -12,5 +12,7 @@ def fetch_metric(
     """Fetch metrics from Prometheus via Grafana API proxy.
 
     Uses: GET /api/datasources/proxy/uid/metrics/api/v1/query_range
+    Send through ``scheduler.shared_scheduler()``; backfills issue one
+    query per series and window, which is what trips proxy throttling.
     """
     raise NotImplementedError("Live fetching not implemented in v0.1")
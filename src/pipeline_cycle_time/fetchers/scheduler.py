@@ -0,0 +1,335 @@
+"""Shared request scheduler for Grafana datasource proxy calls.
+
+Every live fetcher talks to the same Grafana instance through
+``/api/datasources/proxy/uid/...``, which throttles hard during bulk
+backfills. Routing all requests through one ``RequestScheduler`` gives us:
+
+- per-host token-bucket rate limiting,
+- bounded concurrency across all callers,
+- jittered exponential backoff that honors ``Retry-After``,
+- request hedging for slow shards,
+- per-endpoint latency histograms.
+"""
+from __future__ import annotations
+
+import bisect
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable
+from urllib.parse import urlsplit
+
+from .. import jsonio
+
+
+# Upper bounds (seconds) of latency histogram buckets; the last bucket is +Inf.
+LATENCY_BUCKETS_S = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass
+class Response:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def json(self) -> dict:
+        return jsonio.loads(self.body)
+
+
+class RequestError(Exception):
+    """A request failed permanently (non-retryable status or retries exhausted)."""
+
+    def __init__(self, url: str, status: int | None, message: str):
+        super().__init__(f"{url}: {message}")
+        self.url = url
+        self.status = status
+
+
+Transport = Callable[[str, dict[str, str], float], Response]
+
+
+def urllib_transport(url: str, headers: dict[str, str], timeout_s: float) -> Response:
+    """Default transport: a plain GET via urllib. HTTP errors become responses."""
+    req = urllib.request.Request(url, headers=headers, method="GET")
+    try:
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            return Response(resp.status, dict(resp.headers.items()), resp.read())
+    except urllib.error.HTTPError as e:
+        return Response(e.code, dict(e.headers.items()) if e.headers else {}, e.read() or b"")
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens/s up to ``burst``."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns time waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(self._clock())
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def penalize(self, seconds: float) -> None:
+        """Drain the bucket so the next token is ``seconds`` away (server pushback)."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, 1.0 - seconds * self.rate)
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 6
+    base_delay_s: float = 0.5
+    max_delay_s: float = 30.0
+    retry_statuses: tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    def backoff_s(self, attempt: int, rng: random.Random) -> float:
+        """Full-jitter exponential backoff for the given 1-based attempt."""
+        cap = min(self.max_delay_s, self.base_delay_s * (2 ** (attempt - 1)))
+        return rng.uniform(0, cap)
+
+
+def parse_retry_after(value: str | None, now_epoch_s: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if now_epoch_s is None:
+        now_epoch_s = time.time()
+    return max(0.0, when.timestamp() - now_epoch_s)
+
+
+@dataclass
+class LatencyHistogram:
+    bounds: tuple[float, ...] = LATENCY_BUCKETS_S
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_S) + 1))
+    total_s: float = 0.0
+    max_s: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def mean_s(self) -> float:
+        n = self.count
+        return self.total_s / n if n else 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.total_s += seconds
+        self.max_s = max(self.max_s, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Upper bucket bound containing the q-quantile (max for the +Inf bucket)."""
+        n = self.count
+        if n == 0:
+            return 0.0
+        target = q * n
+        running = 0
+        for i, c in enumerate(self.counts):
+            running += c
+            if running >= target and c:
+                return self.bounds[i] if i < len(self.bounds) else self.max_s
+        return self.max_s
+
+
+def _endpoint(url: str) -> str:
+    return urlsplit(url).path or "/"
+
+
+class RequestScheduler:
+    """Rate-limited, retrying, hedging GET scheduler shared by the fetchers."""
+
+    def __init__(
+        self,
+        rate_per_s: float = 5.0,
+        burst: float = 10.0,
+        max_concurrency: int = 4,
+        retry: RetryPolicy | None = None,
+        hedge_after_s: float | None = None,
+        timeout_s: float = 60.0,
+        transport: Transport | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        seed: int | None = None,
+    ):
+        self.rate_per_s = rate_per_s
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.retry = retry or RetryPolicy()
+        self.hedge_after_s = hedge_after_s
+        self.timeout_s = timeout_s
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.hedges_issued = 0
+        self.retries = 0
+        self._transport = transport or urllib_transport
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+        self._buckets: dict[str, TokenBucket] = {}
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        # Hedged attempts need their own threads so a slow shard can be raced.
+        self._hedge_pool = (
+            ThreadPoolExecutor(max_workers=max(2, max_concurrency * 2)) if hedge_after_s else None
+        )
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(
+                    self.rate_per_s, self.burst, clock=self._clock, sleep=self._sleep
+                )
+            return self._buckets[host]
+
+    def _attempt(self, url: str, headers: dict[str, str]) -> Response:
+        self._bucket(urlsplit(url).netloc).acquire()
+        with self._slots:
+            start = self._clock()
+            try:
+                resp = self._transport(url, headers, self.timeout_s)
+            finally:
+                elapsed = self._clock() - start
+                with self._lock:
+                    self.histograms.setdefault(_endpoint(url), LatencyHistogram()).record(elapsed)
+        return resp
+
+    def _hedged_attempt(self, url: str, headers: dict[str, str]) -> Response:
+        if self._hedge_pool is None:
+            return self._attempt(url, headers)
+        first = self._hedge_pool.submit(self._attempt, url, headers)
+        done, _ = wait([first], timeout=self.hedge_after_s)
+        if done:
+            return first.result()
+        with self._lock:
+            self.hedges_issued += 1
+        second = self._hedge_pool.submit(self._attempt, url, headers)
+        pending: set[Future] = {first, second}
+        error: BaseException | None = None
+        retryable: Response | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut.exception() is not None:
+                    error = fut.exception()
+                elif fut.result().status in self.retry.retry_statuses:
+                    # Transient, like an exception: the other attempt may still succeed
+                    retryable = fut.result()
+                else:
+                    return fut.result()
+        if retryable is not None:
+            return retryable
+        assert error is not None
+        raise error
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> Response:
+        """GET ``url`` honoring rate limits, retrying transient failures."""
+        headers = headers or {}
+        last_status: int | None = None
+        last_message = ""
+        for attempt in range(1, self.retry.max_attempts + 1):
+            try:
+                resp = self._hedged_attempt(url, headers)
+            except OSError as e:
+                last_status, last_message = None, str(e)
+                delay = self.retry.backoff_s(attempt, self._rng)
+            else:
+                if resp.status < 400:
+                    return resp
+                last_status, last_message = resp.status, f"HTTP {resp.status}"
+                if resp.status not in self.retry.retry_statuses:
+                    raise RequestError(url, resp.status, last_message)
+                delay = self.retry.backoff_s(attempt, self._rng)
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                    # Everyone talking to this host should back off, not just us.
+                    self._bucket(urlsplit(url).netloc).penalize(retry_after)
+            if attempt == self.retry.max_attempts:
+                break
+            with self._lock:
+                self.retries += 1
+            self._sleep(delay)
+        raise RequestError(
+            url, last_status,
+            f"{last_message} after {self.retry.max_attempts} attempts",
+        )
+
+    def get_json(self, url: str, headers: dict[str, str] | None = None) -> dict:
+        return self.get(url, headers).json()
+
+    def map(
+        self, urls: Iterable[str], headers: dict[str, str] | None = None
+    ) -> list[Response]:
+        """Fetch many URLs concurrently (bounded by ``max_concurrency``), in order."""
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            return list(pool.map(lambda u: self.get(u, headers), urls))
+
+    def latency_summary(self) -> dict[str, dict]:
+        """Per-endpoint latency stats, suitable for logging after a backfill."""
+        with self._lock:
+            return {
+                endpoint: {
+                    "count": h.count,
+                    "mean_s": h.mean_s,
+                    "p50_s": h.quantile(0.5),
+                    "p95_s": h.quantile(0.95),
+                    "max_s": h.max_s,
+                }
+                for endpoint, h in sorted(self.histograms.items())
+            }
+
+    def close(self) -> None:
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+
+
+_shared: RequestScheduler | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_scheduler() -> RequestScheduler:
+    """Process-wide scheduler used by the live fetchers."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RequestScheduler(hedge_after_s=20.0)
+        return _shared
@@ -0,0 +1,142 @@
+"""Join sorted timestamped points (log lines) to the intervals covering them.
+
+``IntervalIndex`` answers, for every interval at once, how many points fall
+inside it and the largest value carried by one of them. Points are a sorted
+``array`` of ns timestamps, so an interval's points are one contiguous
+slice found with two binary searches: a join of ``P`` points against ``N``
+intervals costs ``O(N log P)`` plus one ``O(P)`` pass to build a range-max
+table, independent of how many intervals overlap each point (a nested loop
+would be ``O(N * P)``). Intervals are closed: a point at an interval's end
+counts.
+
+``containing`` is the interval-interval counterpart (which outer interval,
+e.g. a test, holds each inner one, e.g. a dispatcher job), a sort-merge
+sweep over both sides in start order.
+
+Counting each point once per *group* of intervals (e.g. all tests of a
+package, which overlap each other) goes through ``merge``: the union of the
+group's intervals is disjoint, so its slices add up without double counting.
+"""
+from __future__ import annotations
+
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class RangeMax:
+    """``max(values[i:j])`` queries over a fixed array.
+
+    A sparse table over blocks of ``BLOCK`` values: each query scans at most
+    two partial blocks and looks up two precomputed block ranges. Memory is
+    ``n / BLOCK * log(n / BLOCK)`` entries.
+    """
+
+    BLOCK = 32
+
+    __slots__ = ("values", "_table")
+
+    def __init__(self, values: array):
+        self.values = values
+        b = self.BLOCK
+        level = array("d", (max(values[i:i + b]) for i in range(0, len(values), b)))
+        self._table = [level]
+        span = 1
+        while 2 * span <= len(level):
+            level = array("d", map(max, level[:len(level) - span], level[span:]))
+            self._table.append(level)
+            span *= 2
+
+    def query(self, i: int, j: int, default: float = 0.0) -> float:
+        if i >= j:
+            return default
+        b = self.BLOCK
+        first, last = -(-i // b), j // b  # full blocks [first, last)
+        values = self.values
+        if first >= last:
+            return max(values[i:j])
+        best = max(values[i:first * b], default=default)
+        best = max(best, max(values[last * b:j], default=default))
+        k = (last - first).bit_length() - 1
+        table = self._table[k]
+        return max(best, table[first], table[last - (1 << k)])
+
+
+def merge(starts, ends) -> tuple[array, array]:
+    """Union of closed intervals as sorted, disjoint ``(starts, ends)`` columns."""
+    out_start, out_end = array("q"), array("q")
+    for s, e in sorted(zip(starts, ends)):
+        if out_end and s <= out_end[-1]:
+            if e > out_end[-1]:
+                out_end[-1] = e
+        else:
+            out_start.append(s)
+            out_end.append(e)
+    return out_start, out_end
+
+
+class IntervalIndex:
+    """Closed ``[start, end]`` ns intervals, queried with sorted point columns."""
+
+    __slots__ = ("start", "end")
+
+    def __init__(self, starts, ends):
+        if len(starts) != len(ends):
+            raise ValueError("starts and ends differ in length")
+        self.start = array("q", starts)
+        self.end = array("q", ends)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def slices(self, points: array) -> tuple[array, array]:
+        """Per interval, the ``[lo, hi)`` range of ``points`` (sorted) inside it."""
+        lo = array("q", [bisect_left(points, s) for s in self.start])
+        hi = array("q", [bisect_right(points, e) for e in self.end])
+        return lo, hi
+
+    def count(self, points: array) -> array:
+        """Number of ``points`` (sorted) inside each interval."""
+        lo, hi = self.slices(points)
+        return array("q", [max(0, j - i) for i, j in zip(lo, hi)])
+
+    def max(self, points: array, values: array, default: float = 0.0) -> array:
+        """Largest of ``values`` (parallel to sorted ``points``) inside each interval."""
+        lo, hi = self.slices(points)
+        query = RangeMax(values).query
+        return array("d", [query(i, j, default) for i, j in zip(lo, hi)])
+
+
+def containing(inner_starts, inner_ends, outer_starts, outer_ends) -> array:
+    """Per inner interval, the latest-starting outer interval containing it, or -1.
+
+    Both sides are swept in start order: outer intervals join an active list
+    (kept in start order) as the sweep passes their start, and drop out once
+    they end before the current inner start, which no later inner interval
+    can precede. Each inner interval scans the active list from its latest
+    start down, so the cost is the sort plus, per inner interval, the number
+    of active outer intervals that end too early for it.
+    """
+    inner = sorted(range(len(inner_starts)), key=inner_starts.__getitem__)
+    outer = sorted(range(len(outer_starts)), key=outer_starts.__getitem__)
+    result = array("q", [-1]) * len(inner_starts)
+    active: list[int] = []
+    ends: list[tuple[int, int]] = []  # heap of (end, outer index) of active intervals
+    dead: set[int] = set()
+    k = 0
+    for i in inner:
+        start, end = inner_starts[i], inner_ends[i]
+        while k < len(outer) and outer_starts[outer[k]] <= start:
+            active.append(outer[k])
+            heapq.heappush(ends, (outer_ends[outer[k]], outer[k]))
+            k += 1
+        while ends and ends[0][0] < start:
+            dead.add(heapq.heappop(ends)[1])
+        if len(dead) > len(active) // 2:
+            active = [j for j in active if j not in dead]
+            dead.clear()
+        for j in reversed(active):
+            if j not in dead and outer_ends[j] >= end:
+                result[i] = j
+                break
+    return result
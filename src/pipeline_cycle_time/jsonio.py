@@ -0,0 +1,75 @@
+"""JSON decoding shared by every analyzer.
+
+Decodes with ``orjson`` when it is installed and with the stdlib otherwise;
+``PIPELINE_CYCLE_TIME_JSON=stdlib`` forces the fallback. Files are read as
+bytes and handed to the decoder whole, skipping the text-mode decode pass.
+
+Both backends must produce identical objects. orjson is stricter than the
+stdlib (it rejects ``NaN``/``Infinity`` literals, out-of-range floats and
+lone surrogates), so a document it refuses is decoded again with the stdlib,
+and malformed input always raises ``json.JSONDecodeError``. The one
+divergence left is that orjson decodes integers outside the 64-bit range as
+floats. None of our inputs carry such numbers (Allure times are epoch
+milliseconds, Loki and Prometheus send timestamps and samples as strings),
+and guarding against them costs a full regex scan, more than orjson saves.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+BACKENDS = ("orjson", "stdlib")
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def available() -> list[str]:
+    """Backends usable in this interpreter, fastest first."""
+    return [b for b in BACKENDS if b != "orjson" or orjson is not None]
+
+
+def _select(requested: str | None) -> str:
+    if requested in (None, "", "auto"):
+        return available()[0]
+    if requested not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend {requested!r}; expected one of {BACKENDS}")
+    if requested == "orjson" and orjson is None:
+        raise ValueError("JSON backend 'orjson' requested but orjson is not installed")
+    return requested
+
+
+default_backend = _select(os.environ.get("PIPELINE_CYCLE_TIME_JSON"))
+
+
+def loads(data: bytes | str, backend: str | None = None) -> Any:
+    """Decode one JSON document (``backend`` overrides the module default)."""
+    if (backend or default_backend) == "orjson":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # let the stdlib decide; it accepts a superset or raises the usual error
+    return json.loads(data)
+
+
+def load(path: str | os.PathLike, backend: str | None = None) -> Any:
+    """Decode the JSON file at ``path``."""
+    with open(path, "rb") as f:
+        return loads(f.read(), backend)
+
+
+def iter_load(
+    paths: Iterable[str | os.PathLike], backend: str | None = None
+) -> Iterator[tuple[Path, Any]]:
+    """Decode files one at a time, yielding ``(path, document)``.
+
+    Only one document is alive at a time, so directories of thousands of
+    Allure test-cases stream through in constant memory.
+    """
+    for path in paths:
+        yield Path(path), load(path, backend)
@@ -0,0 +1,208 @@
+"""Compact, primitive-only encoding of analyzer results.
+
+Analyzer results are shipped between processes and written to disk. Pickling
+the dataclasses directly repeats every field name per record; instead each
+result is flattened into tuples of ints, floats and strings (a suite's
+columns go as raw array bytes plus its string table), which ``pickle`` and
+``marshal`` both handle quickly and compactly.
+
+``unpack(pack(x))`` reconstructs an equal object.
+"""
+from __future__ import annotations
+
+from array import array
+from datetime import datetime, timedelta, timezone
+
+from .analyzers.app_logs import AppLogsResult, DispatcherJob, DispatcherTimeline, LogWarning
+from .analyzers.metrics import MetricSummary, MetricsResult
+from .analyzers.orchestration import OrchestrationResult, Phase, ResumeOverhead
+from .analyzers.test_reports import TestColumns, TestSuiteResult
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Bump when the packed layout changes; cached payloads with another version are ignored.
+FORMAT_VERSION = 5
+
+
+def pack_datetime(dt: datetime | None) -> tuple[int, int] | None:
+    """``(epoch microseconds, UTC offset in seconds)``, or None."""
+    if dt is None:
+        return None
+    offset = dt.utcoffset() or timedelta(0)
+    delta = dt - _EPOCH
+    us = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return (us, int(offset.total_seconds()))
+
+
+def unpack_datetime(packed: tuple[int, int] | None) -> datetime | None:
+    """The aware datetime ``pack_datetime`` encoded, in its original UTC offset."""
+    if packed is None:
+        return None
+    us, offset_s = packed
+    tz = timezone.utc if offset_s == 0 else timezone(timedelta(seconds=offset_s))
+    return (_EPOCH + timedelta(microseconds=us)).astimezone(tz)
+
+
+def _pack_orchestration(r: OrchestrationResult) -> tuple:
+    return (
+        tuple((p.name, pack_datetime(p.start), pack_datetime(p.end)) for p in r.phases),
+        tuple(r.children),
+        tuple(pack_datetime(t) for t in r.suspend_times),
+        tuple(
+            (pack_datetime(o.resume_time), o.repo_export_s, o.dep_resolution_s, o.on_critical_path)
+            for o in r.resume_overheads
+        ),
+        pack_datetime(r.total_start),
+        pack_datetime(r.total_end),
+    )
+
+
+def _unpack_orchestration(p: tuple) -> OrchestrationResult:
+    phases, children, suspends, overheads, start, end = p
+    return OrchestrationResult(
+        phases=[Phase(n, unpack_datetime(s), unpack_datetime(e)) for n, s, e in phases],
+        children=list(children),
+        suspend_times=[unpack_datetime(t) for t in suspends],
+        resume_overheads=[
+            ResumeOverhead(unpack_datetime(t), export_s, dep_s, critical)
+            for t, export_s, dep_s, critical in overheads
+        ],
+        total_start=unpack_datetime(start),
+        total_end=unpack_datetime(end),
+    )
+
+
+def _pack_suite(r: TestSuiteResult) -> tuple:
+    tests = r.tests
+    return (
+        r.name,
+        tuple(tests.strings),
+        tuple(tests.name),
+        tuple(tests.uid),
+        *(getattr(tests, c).tobytes() for c in TestColumns.TYPECODES),
+        tuple(r.pools),
+    )
+
+
+def _unpack_suite(p: tuple) -> TestSuiteResult:
+    name, strings, names, uids, *arrays, pool_order = p
+    columns = {}
+    for (column, typecode), raw in zip(TestColumns.TYPECODES.items(), arrays):
+        columns[column] = array(typecode)
+        columns[column].frombytes(raw)
+    tests = TestColumns.of(strings, name=names, uid=uids, **columns)
+    return TestSuiteResult.from_columns(name, tests, pool_order)
+
+
+def _pack_dispatcher(d: DispatcherTimeline) -> tuple:
+    return (d.job_id, d.pod_name, d.first_log_ns, d.last_log_ns,
+            d.compute_start_ns, d.compute_end_ns, pack_jobs(d.jobs))
+
+
+def _unpack_dispatcher(p: tuple) -> DispatcherTimeline:
+    *fields, jobs = p
+    return DispatcherTimeline(*fields, jobs=unpack_jobs(jobs))
+
+
+def pack_jobs(jobs: list[DispatcherJob]) -> tuple:
+    """Dispatcher jobs as one tuple of fields per job."""
+    return tuple(
+        (j.job_id, j.pod_name, j.first_log_ns, j.last_log_ns, j.compute_start_ns, j.compute_end_ns)
+        for j in jobs
+    )
+
+
+def unpack_jobs(p: tuple) -> list[DispatcherJob]:
+    """The inverse of ``pack_jobs``."""
+    return [DispatcherJob(*j) for j in p]
+
+
+def _pack_app_logs(r: AppLogsResult) -> tuple:
+    return (
+        tuple(
+            (w.category, w.count, w.description, w.worst_case, w.first_ns, w.last_ns)
+            for w in r.warnings
+        ),
+        r.error_count,
+        r.validation_error_count,
+        r.total_log_entries,
+        _pack_dispatcher(r.dispatcher),
+        r.first_log_ns,
+        r.last_log_ns,
+        r.line_ns.tobytes(),
+        r.line_kind.tobytes(),
+        r.line_latency_s.tobytes(),
+    )
+
+
+def _unpack_app_logs(p: tuple) -> AppLogsResult:
+    warnings, errors, validation, total, dispatcher, first_ns, last_ns, ns, kind, latency = p
+    line_ns, line_kind, line_latency_s = array("q"), array("B"), array("d")
+    line_ns.frombytes(ns)
+    line_kind.frombytes(kind)
+    line_latency_s.frombytes(latency)
+    return AppLogsResult(
+        warnings=[LogWarning(*w) for w in warnings],
+        error_count=errors,
+        validation_error_count=validation,
+        total_log_entries=total,
+        dispatcher=_unpack_dispatcher(dispatcher),
+        first_log_ns=first_ns,
+        last_log_ns=last_ns,
+        line_ns=line_ns,
+        line_kind=line_kind,
+        line_latency_s=line_latency_s,
+    )
+
+
+_METRIC_FIELDS = (
+    "cpu", "memory", "hikaricp_active", "hikaricp_pending", "jetty_threads",
+    "jvm_heap", "jvm_threads", "gc", "dispatcher_cpu", "dispatcher_memory",
+)
+
+
+def _pack_metrics(r: MetricsResult) -> tuple:
+    out = []
+    for f in _METRIC_FIELDS:
+        m = getattr(r, f)
+        out.append(None if m is None else (
+            m.name, m.min_val, m.max_val, m.avg_val, m.unit, m.start_s, m.end_s, m.peak_s,
+        ))
+    return tuple(out)
+
+
+def _unpack_metrics(p: tuple) -> MetricsResult:
+    return MetricsResult(**{
+        f: None if m is None else MetricSummary(*m) for f, m in zip(_METRIC_FIELDS, p)
+    })
+
+
+_PACKERS = {
+    OrchestrationResult: ("orchestration", _pack_orchestration),
+    TestSuiteResult: ("suite", _pack_suite),
+    AppLogsResult: ("app_logs", _pack_app_logs),
+    DispatcherTimeline: ("dispatcher", _pack_dispatcher),
+    MetricsResult: ("metrics", _pack_metrics),
+}
+
+_UNPACKERS = {
+    "orchestration": _unpack_orchestration,
+    "suite": _unpack_suite,
+    "app_logs": _unpack_app_logs,
+    "dispatcher": _unpack_dispatcher,
+    "metrics": _unpack_metrics,
+}
+
+
+def pack(result) -> tuple:
+    """Flatten an analyzer result into a ``(kind, payload)`` tuple of primitives."""
+    try:
+        kind, packer = _PACKERS[type(result)]
+    except KeyError:
+        raise TypeError(f"Cannot pack {type(result).__name__}") from None
+    return (kind, packer(result))
+
+
+def unpack(packed: tuple):
+    kind, payload = packed
+    return _UNPACKERS[kind](payload)
@@ -0,0 +1,280 @@
+"""Analyzer stage graph for a single pipeline run directory.
+
+The six source analyzers read independent files and only meet in
+``correlator.correlate``. ``run`` executes them either in-process, one after
+another (``jobs=1``, the debugging path), or as a dependency graph on a
+process pool: leaf stages run in workers and ship their results back in the
+compact form from ``packing``; stages marked ``local`` (correlation mutates
+the orchestration result) run in the parent once their dependencies land.
+"""
+from __future__ import annotations
+
+import importlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    func: str  # "module:attr" relative to the package, resolved lazily
+    inputs: tuple[str, ...]  # paths relative to the run directory
+    extra_args: tuple = ()
+    deps: tuple[str, ...] = ()
+    local: bool = False
+
+
+ANALYZER_STAGES: tuple[Stage, ...] = (
+    Stage("orchestration", "analyzers.orchestration:analyze", ("logs/concord-log.txt",)),
+    Stage(
+        "kono", "analyzers.test_reports:analyze_timeline",
+        ("kono-report/data/timeline.json",), ("Kono",),
+    ),
+    Stage(
+        "substantiate", "analyzers.test_reports:analyze_timeline",
+        ("substantiate-report/data/timeline.json",), ("Substantiate",),
+    ),
+    Stage("app_logs", "analyzers.app_logs:analyze_webapp_logs", ("logs/webapp-logs.json",)),
+    Stage("dispatcher", "analyzers.app_logs:analyze_dispatcher_logs", ("logs/dispatcher-logs.json",)),
+    Stage("metrics", "analyzers.metrics:analyze", ("metrics",)),
+)
+
+CORRELATION_STAGE = Stage(
+    "correlation", "analyzers.correlator:correlate", (),
+    deps=("orchestration", "kono", "substantiate", "app_logs", "dispatcher", "metrics"),
+    local=True,
+)
+
+STAGES: tuple[Stage, ...] = ANALYZER_STAGES + (CORRELATION_STAGE,)
+
+
+@dataclass
+class RunAnalysis:
+    """Everything the report generator needs for one run."""
+    run_dir: str
+    orchestration: object = None
+    kono: object = None
+    substantiate: object = None
+    app_logs: object = None
+    dispatcher: object = None
+    metrics: object = None
+    correlation: object = None
+
+    @property
+    def end_to_end_s(self) -> float:
+        """The longest dependency path (the correlator's makespan), as the report gives it.
+
+        Falls back to Concord's duration without a correlation or a graph.
+        """
+        makespan = self.correlation.end_to_end_s if self.correlation is not None else 0.0
+        return makespan or self.orchestration.total_duration_s
+
+    def events(self):
+        """All results on one ns time axis (``events.EventTable``)."""
+        from .events import from_analysis
+        return from_analysis(
+            self.orchestration, self.kono, self.substantiate, self.app_logs,
+            self.dispatcher, self.metrics,
+        )
+
+    def aligned_events(self):
+        """``events()`` moved onto Concord's clock by the correlator's clock skew, if any."""
+        events = self.events()
+        skew = self.correlation.clock_skew if self.correlation is not None else None
+        if skew is not None:
+            skew.apply(events)
+        return events
+
+    def log_attribution(self, packages: dict[str, str] | None = None):
+        """Webapp log lines joined to the tests running when they were logged."""
+        from .analyzers.log_attribution import attribute
+        skew = self.correlation.clock_skew if self.correlation is not None else None
+        return attribute(self.app_logs, (self.kono, self.substantiate), packages, skew)
+
+    def generate_report(self) -> str:
+        from .report import generator
+        return generator.generate(
+            self.orchestration, self.kono, self.substantiate, self.app_logs,
+            self.dispatcher, self.metrics, self.correlation,
+        )
+
+
+def _resolve(func: str):
+    module, attr = func.split(":")
+    return getattr(importlib.import_module(f"{__package__}.{module}"), attr)
+
+
+def _inputs(stage: Stage, run_dir: str) -> list[str]:
+    return [str(Path(run_dir) / p) for p in stage.inputs]
+
+
+def _call(stage: Stage, run_dir: str, dep_results: dict[str, object], profiler=None):
+    inputs = _inputs(stage, run_dir)
+    args = [*inputs, *stage.extra_args, *(dep_results[d] for d in stage.deps)]
+    if profiler is None:
+        return _resolve(stage.func)(*args)
+    return profiler.measure(stage.name, inputs, _resolve(stage.func), *args)
+
+
+def _run_packed(stage: Stage, run_dir: str):
+    """Worker entry point: run a leaf stage and return its packed result."""
+    from .packing import pack
+    return pack(_call(stage, run_dir, {}))
+
+
+def _run_packed_profiled(stage: Stage, run_dir: str, trace_memory: bool, pstats_dir: str | None):
+    """Like ``_run_packed`` but also returns the worker-side stage profile."""
+    from .packing import pack
+    from .profiling import Profiler
+    profiler = Profiler(trace_memory=trace_memory, pstats_dir=pstats_dir)
+    return pack(_call(stage, run_dir, {}, profiler)), profiler.stages[0]
+
+
+def _topological(stages: tuple[Stage, ...]) -> list[Stage]:
+    by_name = {s.name: s for s in stages}
+    ordered: list[Stage] = []
+    state: dict[str, int] = {}
+
+    def visit(s: Stage) -> None:
+        if state.get(s.name) == 2:
+            return
+        if state.get(s.name) == 1:
+            raise ValueError(f"Stage cycle through {s.name!r}")
+        state[s.name] = 1
+        for d in s.deps:
+            visit(by_name[d])
+        state[s.name] = 2
+        ordered.append(s)
+
+    for s in stages:
+        visit(s)
+    return ordered
+
+
+def _cacheable(stage: Stage) -> bool:
+    return not stage.local and not stage.deps
+
+
+def _run_sequential(
+    run_dir: str, stages: tuple[Stage, ...], results: dict[str, object], cache=None, profiler=None
+) -> dict[str, object]:
+    for stage in _topological(stages):
+        if stage.name in results:
+            continue
+        results[stage.name] = _call(stage, run_dir, results, profiler)
+        if cache is not None and _cacheable(stage):
+            from .packing import pack
+            cache.store(stage, run_dir, pack(results[stage.name]))
+    return results
+
+
+def _run_parallel(
+    run_dir: str,
+    stages: tuple[Stage, ...],
+    results: dict[str, object],
+    jobs: int,
+    cache=None,
+    profiler=None,
+) -> dict[str, object]:
+    from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+    from .packing import unpack
+
+    remaining = {s.name: s for s in _topological(stages) if s.name not in results}
+    remote_count = sum(1 for s in remaining.values() if _cacheable(s))
+    with ProcessPoolExecutor(max_workers=max(1, min(jobs, remote_count))) as pool:
+        running: dict[Future, Stage] = {}
+        while remaining or running:
+            ready = [s for s in remaining.values() if all(d in results for d in s.deps)]
+            for stage in ready:
+                del remaining[stage.name]
+                if not _cacheable(stage):
+                    results[stage.name] = _call(stage, run_dir, results, profiler)
+                elif profiler is None:
+                    running[pool.submit(_run_packed, stage, run_dir)] = stage
+                else:
+                    running[pool.submit(
+                        _run_packed_profiled, stage, run_dir,
+                        profiler.trace_memory, profiler.pstats_dir,
+                    )] = stage
+            if any(all(d in results for d in s.deps) for s in remaining.values()):
+                continue
+            if not running:
+                if remaining:
+                    raise ValueError(f"Unsatisfiable stages: {sorted(remaining)}")
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                stage = running.pop(fut)
+                packed = fut.result()
+                if profiler is not None:
+                    packed, prof = packed
+                    profiler.record(prof)
+                if cache is not None:
+                    cache.store(stage, run_dir, packed)
+                results[stage.name] = unpack(packed)
+    return results
+
+
+def history_ids(run_dir: str) -> dict[str, str]:
+    """uid -> historyId for both suites of a run (empty without test-cases)."""
+    from .analyzers.test_reports import history_ids as suite_history_ids
+    ids: dict[str, str] = {}
+    for report in ("kono-report", "substantiate-report"):
+        ids.update(suite_history_ids(str(Path(run_dir) / report / "data" / "test-cases")))
+    return ids
+
+
+def packages(run_dir: str) -> dict[str, str]:
+    """uid -> package for both suites of a run (empty without test-cases)."""
+    from .analyzers.test_reports import packages as suite_packages
+    out: dict[str, str] = {}
+    for report in ("kono-report", "substantiate-report"):
+        out.update(suite_packages(str(Path(run_dir) / report / "data" / "test-cases")))
+    return out
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def _load_cached(
+    run_dir: str, stages: tuple[Stage, ...], results: dict[str, object], cache
+) -> None:
+    for stage in stages:
+        if _cacheable(stage):
+            hit = cache.load(stage, run_dir)
+            if hit is not None:
+                results[stage.name] = hit
+
+
+def run(
+    run_dir: str,
+    jobs: int = 1,
+    stages: tuple[Stage, ...] = STAGES,
+    cache=None,
+    profiler=None,
+) -> RunAnalysis:
+    """Analyze one run directory.
+
+    ``jobs > 1`` fans leaf stages out to processes. ``cache`` (an
+    ``AnalysisCache``) serves unchanged analyzer results from disk and only
+    re-runs the stages whose inputs changed. ``profiler`` (a
+    ``profiling.Profiler``) records a profile per executed stage; cache
+    lookups are profiled together as one ``cache`` stage.
+    """
+    results: dict[str, object] = {}
+    if cache is not None:
+        if profiler is None:
+            _load_cached(run_dir, stages, results, cache)
+        else:
+            with profiler.stage("cache") as prof:
+                _load_cached(run_dir, stages, results, cache)
+            prof.records, prof.unit = len(results), "hits"
+    pending = sum(1 for s in stages if _cacheable(s) and s.name not in results)
+    if jobs > 1 and pending > 1:
+        _run_parallel(run_dir, stages, results, jobs, cache, profiler)
+    else:
+        _run_sequential(run_dir, stages, results, cache, profiler)
+    return RunAnalysis(run_dir=run_dir, **results)
@@ -0,0 +1,162 @@
+"""Per-stage profiling for a single analysis.
+
+A ``Profiler`` is threaded through ``pipeline.run`` and ``analyze_fixtures``;
+when none is passed the pipeline takes a plain call path and nothing here is
+imported. Each stage runs once and records wall and CPU time, input bytes
+and a record count derived from its result. The tracemalloc peak and a
+cProfile ``.pstats`` file are opt-in: each costs an extra, untimed run of
+every stage. Stage boundaries double as Chrome trace events (``"ph": "X"``)
+so a profile can be opened in Perfetto or chrome://tracing.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+PROFILE_VERSION = 1
+
+
+@dataclass
+class StageProfile:
+    name: str
+    start_ns: int  # wall-clock epoch, comparable across worker processes
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_bytes: int | None = None
+    input_bytes: int = 0
+    records: int | None = None
+    unit: str = ""
+    pid: int = field(default_factory=os.getpid)
+
+
+def input_bytes(paths: list[str]) -> int:
+    total = 0
+    for p in map(Path, paths):
+        if p.is_dir():
+            total += sum(f.stat().st_size for f in p.rglob("*") if f.is_file())
+        elif p.exists():
+            total += p.stat().st_size
+    return total
+
+
+def record_count(result: object) -> tuple[int | None, str]:
+    """Best-effort size of a stage result in its natural unit."""
+    if isinstance(result, str):
+        return result.count("\n") + 1, "lines"
+    if hasattr(result, "total_tests"):
+        return result.total_tests, "tests"
+    if hasattr(result, "total_log_entries"):
+        return result.total_log_entries, "lines"
+    if hasattr(result, "findings"):
+        return len(result.findings), "findings"
+    if hasattr(result, "phases"):
+        return len(result.phases), "phases"
+    if hasattr(result, "jvm_heap"):
+        return sum(v is not None for v in vars(result).values()), "series"
+    return None, ""
+
+
+class Profiler:
+    """Collects ``StageProfile`` records for one analysis.
+
+    Stage times always come from a plain run. ``trace_memory`` runs each
+    stage a second time under tracemalloc for its peak, and ``pstats_dir``
+    once more under cProfile, writing ``<stage>.pstats`` there; neither
+    tracer's overhead shows in the wall and CPU times, but each doubles the
+    time the profiled analysis takes, so both are off by default.
+    """
+
+    def __init__(self, trace_memory: bool = False, pstats_dir: str | None = None):
+        self.trace_memory = trace_memory
+        self.pstats_dir = pstats_dir
+        self.stages: list[StageProfile] = []
+
+    @contextmanager
+    def stage(self, name: str, inputs: list[str] = ()) -> Iterator[StageProfile]:
+        """Time the ``with`` body as stage ``name`` (wall and CPU only)."""
+        prof = StageProfile(name, time.time_ns(), input_bytes=input_bytes(list(inputs)))
+        cpu0, wall0 = time.process_time(), time.perf_counter()
+        try:
+            yield prof
+        finally:
+            prof.wall_s = time.perf_counter() - wall0
+            prof.cpu_s = time.process_time() - cpu0
+            self.stages.append(prof)
+
+    def measure(self, name: str, inputs: list[str], func, *args):
+        """Run ``func(*args)`` as stage ``name`` and record its result size.
+
+        The timed run's result is returned; the tracemalloc and cProfile
+        re-runs only observe ``func``, so it must not depend on side effects.
+        """
+        with self.stage(name, inputs) as prof:
+            result = func(*args)
+        prof.records, prof.unit = record_count(result)
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            try:
+                func(*args)
+                prof.peak_bytes = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        if self.pstats_dir:
+            import cProfile
+            profile = cProfile.Profile()
+            profile.runcall(func, *args)
+            Path(self.pstats_dir).mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(str(Path(self.pstats_dir) / f"{name}.pstats"))
+        return result
+
+    def record(self, prof: StageProfile) -> None:
+        """Add a stage profiled elsewhere (e.g. in a worker process)."""
+        self.stages.append(prof)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": PROFILE_VERSION,
+            "stages": [asdict(s) for s in self.stages],
+        }
+
+    def trace_events(self) -> list[dict]:
+        """Chrome trace-event "complete" events, one per stage."""
+        return [
+            {
+                "name": s.name,
+                "cat": "stage",
+                "ph": "X",
+                "ts": s.start_ns / 1000,
+                "dur": s.wall_s * 1e6,
+                "pid": s.pid,
+                "tid": 0,
+                "args": {
+                    "cpu_s": s.cpu_s,
+                    "peak_bytes": s.peak_bytes,
+                    "input_bytes": s.input_bytes,
+                    "records": s.records,
+                },
+            }
+            for s in self.stages
+        ]
+
+    def write(self, path: str) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+
+    def write_trace(self, path: str) -> None:
+        Path(path).write_text(json.dumps({"traceEvents": self.trace_events()}))
+
+    def summary(self) -> str:
+        lines = [f"{'stage':<16} {'wall':>9} {'cpu':>9} {'peak MB':>8} {'input MB':>9}  records"]
+        for s in self.stages:
+            peak = f"{s.peak_bytes / 1e6:.1f}" if s.peak_bytes is not None else "-"
+            records = f"{s.records} {s.unit}" if s.records is not None else "-"
+            lines.append(
+                f"{s.name:<16} {s.wall_s * 1000:>7.1f}ms {s.cpu_s * 1000:>7.1f}ms "
+                f"{peak:>8} {s.input_bytes / 1e6:>9.2f}  {records}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,103 @@
+"""Render a ``RunDiff`` as a markdown comparison report."""
+from __future__ import annotations
+
+from ..analyzers.diff import Delta, RunDiff
+from .generator import _fmt_duration
+
+
+def _signed(seconds: float) -> str:
+    sign = "+" if seconds > 0 else "-" if seconds < 0 else "±"
+    return f"{sign}{_fmt_duration(abs(seconds))}"
+
+
+def _pct(d: Delta) -> str:
+    if not d.before_s:
+        return "new"
+    return f"{(d.ratio - 1) * 100:+.0f}%"
+
+
+def _row(label: str, d: Delta) -> str:
+    return (
+        f"| {label} | {_fmt_duration(d.before_s)} | {_fmt_duration(d.after_s)} | "
+        f"{_signed(d.delta_s)} | {_pct(d)} |"
+    )
+
+
+def render(diff: RunDiff, top: int = 20) -> str:
+    lines: list[str] = []
+    lines.append("# CI Pipeline Run Comparison")
+    lines.append("")
+    lines.append(f"**Baseline:** {diff.before_run}")
+    lines.append(f"**Candidate:** {diff.after_run}")
+    lines.append(f"**Tests matched by:** {diff.key}")
+    lines.append("")
+    header = ["| | Baseline | Candidate | Change | % |", "|---|---|---|---|---|"]
+
+    lines.append("## Overall")
+    lines.append("")
+    lines.extend(header)
+    lines.append(_row("End-to-end", diff.end_to_end))
+    lines.append(_row("Concord", diff.concord))
+    lines.append("")
+
+    lines.append("## Concord Phases")
+    lines.append("")
+    lines.extend(header)
+    for p in diff.phases:
+        lines.append(_row(p.name, p))
+    lines.append("")
+
+    if diff.resumes:
+        lines.append("## Resume Cycles")
+        lines.append("")
+        lines.extend(header)
+        for r in diff.resumes:
+            crit = " (critical)" if r.after_critical else ""
+            lines.append(_row(f"Resume {r.name}{crit}", r))
+        lines.append("")
+
+    lines.append("## Pools")
+    lines.append("")
+    lines.append("| Pool | Baseline | Candidate | Change | % | Parallelism |")
+    lines.append("|---|---|---|---|---|---|")
+    for p in diff.pools:
+        lines.append(
+            f"{_row(f'{p.suite} {p.name}', p)} "
+            f"{p.before_parallelism:.1f}x → {p.after_parallelism:.1f}x |"
+        )
+    lines.append("")
+
+    lines.append(f"## Top {top} Test Regressions (absolute)")
+    lines.append("")
+    lines.append("| Suite | Test | Baseline | Candidate | Change | % | Attempts |")
+    lines.append("|---|---|---|---|---|---|---|")
+    for t in diff.slowest_tests(top):
+        lines.append(
+            f"| {t.suite} | {t.name} | {t.before_s:.1f}s | {t.after_s:.1f}s | "
+            f"+{t.delta_s:.1f}s | {_pct(t)} | {t.before_attempts} → {t.after_attempts} |"
+        )
+    lines.append("")
+
+    lines.append(f"## Top {top} Test Regressions (relative)")
+    lines.append("")
+    lines.append("| Suite | Test | Baseline | Candidate | Ratio |")
+    lines.append("|---|---|---|---|---|")
+    for t in diff.relative_tests(top):
+        lines.append(
+            f"| {t.suite} | {t.name} | {t.before_s:.1f}s | {t.after_s:.1f}s | {t.ratio:.2f}x |"
+        )
+    lines.append("")
+
+    lines.append("## Added and Removed Tests")
+    lines.append("")
+    lines.append(f"{len(diff.added)} added, {len(diff.removed)} removed.")
+    lines.append("")
+    for label, tests, attr in (("Added", diff.added, "after_s"), ("Removed", diff.removed, "before_s")):
+        if not tests:
+            continue
+        lines.append(f"### {label}")
+        lines.append("")
+        for t in sorted(tests, key=lambda t: (t.suite, t.name)):
+            lines.append(f"- {t.suite}: {t.name} ({getattr(t, attr):.1f}s)")
+        lines.append("")
+    return "\n".join(lines)
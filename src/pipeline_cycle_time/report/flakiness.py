@@ -0,0 +1,41 @@
+"""Render a ``FlakinessResult`` as a markdown report."""
+from __future__ import annotations
+
+from ..analyzers.flakiness import FlakinessResult
+from .generator import _fmt_duration
+
+
+def render(result: FlakinessResult, top: int = 30) -> str:
+    ranked = result.ranked()
+    lines: list[str] = []
+    lines.append("# Flaky Test and Retry Waste Report")
+    lines.append("")
+    lines.append(f"**Pipelines analyzed:** {result.pipelines}")
+    lines.append(f"**Tests ever retried:** {len(ranked)} of {len(result.tests):,}")
+    per_pipeline = result.total_retry_s / result.pipelines if result.pipelines else 0.0
+    lines.append(
+        f"**Worker time lost to retries:** {_fmt_duration(result.total_retry_s)} total, "
+        f"{_fmt_duration(per_pipeline)} per pipeline"
+    )
+    lines.append(f"**Result delay from retries:** {_fmt_duration(result.total_delay_s)} total")
+    if result.failed_runs:
+        lines.append(f"**Unreadable runs:** {len(result.failed_runs)}")
+    lines.append("")
+
+    lines.append(f"## Top {top} by Expected Waste per Pipeline")
+    lines.append("")
+    lines.append(
+        "| Suite | Test | Runs | Flaky | Flake rate (95% CI) | Failed | "
+        "Waste/pipeline | Pessimistic | Cost per retry | Delay |"
+    )
+    lines.append("|---|---|---|---|---|---|---|---|---|---|")
+    for t in ranked[:top]:
+        lo, hi = t.flake_rate_ci
+        lines.append(
+            f"| {t.suite} | {t.name} | {t.runs} | {t.flaky_runs} | "
+            f"{t.flake_rate:.0%} ({lo:.0%}–{hi:.0%}) | {t.failed_runs} | "
+            f"{result.expected_waste_s(t):.1f}s | {result.expected_waste_upper_s(t):.1f}s | "
+            f"{t.retry_s_per_retried_run:.1f}s | {_fmt_duration(t.delay_s)} |"
+        )
+    lines.append("")
+    return "\n".join(lines)
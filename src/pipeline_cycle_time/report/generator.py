@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from ..analyzers.orchestration import OrchestrationResult
-from ..analyzers.test_reports import TestSuiteResult
+from ..analyzers.test_reports import POLLING_CUTOFF_S, TestSuiteResult
 from ..analyzers.app_logs import AppLogsResult, DispatcherTimeline
 from ..analyzers.metrics import MetricsResult
 from ..analyzers.correlator import CorrelationResult
@@ -26,6 +26,7 @@ def generate(
     metrics_result: MetricsResult,
     correlation: CorrelationResult,
     report_date: str | None = None,
+    timeline_width: int = 64,
 ) -> str:
     lines: list[str] = []
 
@@ -48,15 +49,16 @@ def generate(
     # 1. Executive Summary
     lines.append("## 1. Executive Summary")
     lines.append("")
-    concord_dur = _fmt_duration(orchestration.total_duration_s)
+    active_dur = _fmt_duration(orchestration.total_duration_s - orchestration.suspended_duration_s)
     kono_dur = _fmt_duration(kono.wall_clock_s)
     sub_dur = _fmt_duration(substantiate.wall_clock_s)
     total_tests = kono.total_tests + substantiate.total_tests
+    end_to_end_s = correlation.end_to_end_s or orchestration.total_duration_s
     lines.append(
-        f"The full CI pipeline completed in approximately **"
-        f"{_fmt_duration(orchestration.total_duration_s + max(kono.wall_clock_s, substantiate.wall_clock_s))} "
-        f"end-to-end**: {concord_dur} for orchestration/deployment (Concord) followed by "
-        f"overlapping test execution (Kono: {kono_dur}, Substantiate: {sub_dur})."
+        f"The full CI pipeline completed in approximately **{_fmt_duration(end_to_end_s)} "
+        f"end-to-end** (longest dependency path): {active_dur} of orchestration/deployment "
+        f"(Concord) followed by overlapping test execution (Kono: {kono_dur}, "
+        f"Substantiate: {sub_dur})."
     )
     lines.append("")
     total_pass = kono.pass_count + substantiate.pass_count
@@ -79,17 +81,28 @@ def generate(
     # Top findings summary
     lines.append("### Top Findings")
     lines.append("")
-    for f in correlation.findings[:5]:
+    top = [f for f in correlation.findings if f.priority in ("P1", "P2")]
+    for f in top[:5]:
         lines.append(f"{f.rank}. **{f.title}.** {f.description}")
         lines.append("")
 
     lines.append("---")
     lines.append("")
 
-    # 2. End-to-End Timeline (ASCII art)
+    # 2. End-to-End Timeline (proportional ASCII)
     lines.append("## 2. End-to-End Timeline")
     lines.append("")
-    _write_timeline(lines, orchestration, kono, substantiate, dispatcher, metrics_result)
+    _write_timeline(
+        lines, orchestration, kono, substantiate, app_logs, dispatcher, metrics_result, correlation,
+        timeline_width,
+    )
+    if correlation.critical_path:
+        lines.append("")
+        lines.append(
+            "**Critical path:** "
+            + " -> ".join(name.split(":", 1)[-1] if name.startswith("phase:") else name
+                         for name in correlation.critical_path)
+        )
     lines.append("")
     lines.append("---")
     lines.append("")
@@ -169,9 +182,21 @@ def generate(
     lines.append(f"| Pass rate | {pass_rate:.1f}% ({substantiate.fail_count} failure, {substantiate.skip_count} skipped) |")
     lines.append(f"| Wall-clock | {substantiate.wall_clock_s:.1f}s ({_fmt_duration(substantiate.wall_clock_s)}) |")
     lines.append(f"| Aggregate time | {substantiate.aggregate_s / 60:.1f} min |")
-    polling = substantiate.polling_analysis()
+    detected_s = substantiate.duration_cutoff_s()
+    polling = substantiate.polling_analysis(detected_s or POLLING_CUTOFF_S)
     if polling:
-        lines.append(f"| Compute wait % | {polling['polling_pct']:.1f}% (inferred from aggregate durations) |")
+        source = "inferred from the duration distribution" if detected_s else "default cutoff"
+        lines.append(
+            f"| Compute wait % | {polling['polling_pct']:.1f}% "
+            f"(tests over {polling['cutoff_s']:.0f}s, {source}) |"
+        )
+    overshoot = correlation.polling_overshoot_s
+    if overshoot:
+        n = overshoot["count"]
+        lines.append(
+            f"| Polling overshoot | {overshoot['p50']:.1f}s median, {overshoot['max']:.1f}s max "
+            f"(measured on {n} dispatcher job wait{'s' if n != 1 else ''}) |"
+        )
     lines.append("")
 
     setup = substantiate.setup_phase_analysis()
@@ -206,6 +231,33 @@ def generate(
         lines.append(f"**{w.category}:** {w.count} warnings. {w.description}")
         lines.append("")
 
+    # 4.5 Clock Alignment
+    skew = correlation.clock_skew
+    if skew is not None:
+        lines.append("### 4.5 Clock Alignment")
+        lines.append("")
+        if skew.consistent:
+            lines.append(
+                f"Per-source clock offsets relative to Concord, solved from {len(skew.anchors)} "
+                f"causal orderings between events (anchors). Timestamps are corrected before correlation."
+            )
+        else:
+            lines.append(
+                "**The anchor events contradict each other** (no single set of clock offsets "
+                "satisfies them); timestamps were left uncorrected."
+            )
+        lines.append("")
+        lines.append("| Clock | Offset | Feasible range | Anchors |")
+        lines.append("|---|---|---|---|")
+        for o in skew.offsets.values():
+            if o.clock == "concord":
+                continue
+            lo = "-inf" if o.lower_ns is None else f"{o.lower_ns / 1e9:+.1f}s"
+            hi = "+inf" if o.upper_ns is None else f"{o.upper_ns / 1e9:+.1f}s"
+            bounds = "unconstrained" if o.lower_ns is None and o.upper_ns is None else f"{lo} .. {hi}"
+            lines.append(f"| {o.clock} | {o.offset_s:+.1f}s | {bounds} | {o.anchors} |")
+        lines.append("")
+
     lines.append("---")
     lines.append("")
 
@@ -254,66 +306,28 @@ def _write_timeline(
     orchestration: OrchestrationResult,
     kono: TestSuiteResult,
     substantiate: TestSuiteResult,
+    app_logs: AppLogsResult,
     dispatcher: DispatcherTimeline,
     metrics_result: MetricsResult,
+    correlation: CorrelationResult,
+    width: int,
 ) -> None:
-    """Write ASCII timeline art."""
-    lines.append("```")
-    if orchestration.total_start:
-        h = orchestration.total_start.strftime("%H:%M")
-        lines.append(f"Time (UTC)  {h}    +5m      +10m     +15m     +20m     +25m     +30m     +35m")
-    lines.append("            |--------|--------|--------|--------|--------|--------|--------|")
-    lines.append("")
-
-    # Concord phases
-    concord_dur = _fmt_duration(orchestration.total_duration_s)
-    active_s = orchestration.total_duration_s - orchestration.suspended_duration_s
-    active_dur = _fmt_duration(active_s)
-    suspended_dur = _fmt_duration(orchestration.suspended_duration_s)
-    phase_strs = []
-    for p in orchestration.phases:
-        if p.name != "Suspended":
-            phase_strs.append(f"{_fmt_duration(p.duration_s)}")
-    lines.append(f"CONCORD     [Init|Bootstrap|AWS|Config|Helm][====== SUSPENDED {suspended_dur} ======]")
-    lines.append(f"  ({concord_dur})  |{'|'.join(phase_strs)}|")
-    lines.append(f"             active {active_dur}                    waiting for children")
-    if orchestration.children:
-        child_strs = "   ".join(f"wait {c[:8]}" for c in orchestration.children[:2])
-        lines.append(f"                                              {child_strs}")
-    lines.append("")
-
-    # K8s deploy
-    if dispatcher.job_id:
-        lines.append(f"K8S DEPLOY                               [--- pod startup ---][{dispatcher.total_duration_s:.0f}s]")
-        lines.append(f"  Job {dispatcher.job_id}                              scheduled              running")
-        lines.append("")
+    """Write the proportional ASCII timeline (``report.timeline``)."""
+    from ..pipeline import RunAnalysis
+    from . import timeline
 
-    # Kono
-    lines.append(f"KONO TESTS                                         [=== {_fmt_duration(kono.wall_clock_s)} =========]")
-    for pool_name in sorted(kono.pools.keys()):
-        pool = kono.pools[pool_name]
-        lines.append(f"  {pool_name}                                            [{pool_name} {pool.wall_clock_s:.0f}s {'=' * 8}]")
-    lines.append("")
-
-    # Substantiate
-    lines.append(f"SUBSTANTIATE                                        [====== {_fmt_duration(substantiate.wall_clock_s)} =======>")
+    events = RunAnalysis(
+        "", orchestration, kono, substantiate, app_logs, dispatcher, metrics_result, correlation,
+    ).aligned_events()
     setup = substantiate.setup_phase_analysis()
-    if setup:
-        lines.append(f"  Setup                                             [--- {setup['setup_duration_s']:.0f}s setup --]")
-        main_dur = substantiate.wall_clock_s - setup['setup_duration_s']
-        lines.append(f"  Main tests                                                    [~{main_dur:.0f}s ===>")
-    lines.append("")
-
-    # Webapp
-    if metrics_result.cpu:
-        lines.append(
-            f"WEBAPP      [startup ~warmup~][--- stable {metrics_result.cpu.avg_val:.1f}-{metrics_result.cpu.avg_val+0.2:.1f} CPU, "
-            f"{metrics_result.memory.avg_val / 1e9 if metrics_result.memory else 0:.1f}GB mem -------->")
-        lines.append(
-            f"            CPU peak {metrics_result.cpu.max_val:.2f}c    "
-            f"HikariCP max {int(metrics_result.hikaricp_active.max_val) if metrics_result.hikaricp_active else 0} conn, zero pending"
-        )
-
+    t0, t1 = timeline.bounds(events)
+    tracks = timeline.report_tracks(events, setup["setup_duration_s"] if setup else None)
+    lines.append("```")
+    lines.extend(timeline.render_ascii(tracks, t0, t1, width))
     lines.append("```")
     lines.append("")
-    lines.append("**Legend:** `[===]` active work, `[~~~]` idle/suspended, `[-->` continues, `|` phase boundary")
+    lines.append(
+        f"**Legend:** one column = {(t1 - t0) / 1e9 / width:.0f}s; `=` active work, `~` suspended, "
+        f"`#` Concord resume, `-` pod/log span; test rows shade `.` `:` `=` `#` by the share of "
+        f"the suite's workers busy (under 25%, 50%, 75%, above)"
+    )
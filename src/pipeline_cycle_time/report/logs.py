@@ -0,0 +1,49 @@
+"""Render a ``LogAttribution`` as a markdown report."""
+from __future__ import annotations
+
+from ..analyzers.log_attribution import LogAttribution, LogCounts
+
+
+def _latency(c: LogCounts) -> str:
+    return f"{c.worst_latency_s:g}s" if c.worst_latency_s else "-"
+
+
+def _table(lines: list[str], label: str, ranked: list[LogCounts], top: int) -> None:
+    lines.append(f"| Suite | {label} | Errors | Validation | Warnings | Worst latency |")
+    lines.append("|---|---|---|---|---|---|")
+    for c in ranked[:top]:
+        lines.append(
+            f"| {c.suite} | {c.name} | {c.errors} | {c.by_kind.get('validation', 0)} | "
+            f"{c.warnings} | {_latency(c)} |"
+        )
+    lines.append("")
+
+
+def render(result: LogAttribution, run_dir: str = "", top: int = 20) -> str:
+    lines: list[str] = []
+    lines.append("# Webapp Log Lines by Running Test")
+    lines.append("")
+    if run_dir:
+        lines.append(f"**Run:** {run_dir}")
+    total, outside = result.total, result.outside
+    lines.append(
+        f"**Classified lines:** {total.errors} errors, {total.warnings} warnings "
+        f"(worst latency {_latency(total)})"
+    )
+    lines.append(
+        f"**Logged while no test was running:** {outside.errors} errors, "
+        f"{outside.warnings} warnings"
+    )
+    lines.append("")
+    lines.append(
+        "A line counts for every test running when it was logged, and once per package."
+    )
+    lines.append("")
+
+    lines.append(f"## Top {top} Packages")
+    lines.append("")
+    _table(lines, "Package", result.ranked("packages"), top)
+    lines.append(f"## Top {top} Tests")
+    lines.append("")
+    _table(lines, "Test", result.ranked("tests"), top)
+    return "\n".join(lines)
@@ -0,0 +1,56 @@
+"""Render a ``SetupChain`` as a markdown report."""
+from __future__ import annotations
+
+from ..analyzers.setup_chain import SetupChain
+
+
+def _short(name: str, width: int = 70) -> str:
+    return name if len(name) <= width else name[:width - 3] + "..."
+
+
+def render(chain: SetupChain, run_dir: str = "", top: int = 50) -> str:
+    lines: list[str] = []
+    lines.append("# Substantiate Setup Chain")
+    lines.append("")
+    if run_dir:
+        lines.append(f"**Run:** {run_dir}")
+    if not chain.tests:
+        lines.append("No setup phase detected.")
+        return "\n".join(lines)
+    lines.append(
+        f"**Setup phase:** {chain.setup_s:.0f}s, {len(chain.tests)} tests "
+        f"(checked against {chain.history_runs} other run{'' if chain.history_runs == 1 else 's'})"
+    )
+    lines.append(
+        f"**Links:** {len(chain.serial_links)} serial dependencies, "
+        f"{len(chain.artifacts)} scheduling artifacts"
+    )
+    lines.append("")
+
+    t0 = min(t.start for t in chain.tests)
+    by_name = {t.name: t for t in chain.tests}
+    reasons = {link.after: link.reason for link in chain.path_links()}
+    lines.append(f"## Critical Chain ({chain.critical_path_s:.0f}s)")
+    lines.append("")
+    lines.append("| # | Test | Start | Duration | Waited because |")
+    lines.append("|---|---|---|---|---|")
+    for i, name in enumerate(chain.critical_path, 1):
+        t = by_name[name]
+        lines.append(
+            f"| {i} | {_short(name)} | {(t.start - t0) / 1000:.1f}s | {t.duration / 1000:.1f}s | "
+            f"{reasons.get(name, '-')} |"
+        )
+    lines.append("")
+
+    lines.append(f"## Links (top {top} by gap)")
+    lines.append("")
+    lines.append("| Before | After | Gap | Kind | Reason |")
+    lines.append("|---|---|---|---|---|")
+    for link in sorted(chain.links, key=lambda l: -l.gap_s)[:top]:
+        kind = "serial" if link.serial else "artifact"
+        lines.append(
+            f"| {_short(link.before, 50)} | {_short(link.after, 50)} | {link.gap_s:.2f}s | "
+            f"{kind} | {link.reason} |"
+        )
+    lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,323 @@
+"""Proportional timeline of a run: ASCII rows for the report, an SVG Gantt for browsers.
+
+Both map ``events.EventTable`` intervals onto one shared time axis. An
+ASCII row is a stack of layers; each layer is bucketed once into a
+*coverage* array (how much of every column its intervals cover, overlaps
+adding up) with a difference array over column indexes, so building a
+layer is ``O(intervals + columns)`` and rendering is
+``O(columns x tracks)`` however many tests there are. Test rows are
+shaded by the share of the suite's workers busy in each column (``RAMP``).
+
+The SVG draws one bar per interval on its own row (a test on its
+worker's), except that a bar narrower than a pixel merges with the
+previous one on the row when less than a pixel separates them. A row
+thus holds about as many rectangles as the plot is pixels wide at most,
+and 100k test bars stay a small, fast document.
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from html import escape
+
+from ..intervals import merge
+
+RAMP = " .:=#"  # share of workers busy: none, <25%, <50%, <75%, more
+LABEL_WIDTH = 12
+TICK_STEPS_S = (1, 2, 5, 10, 15, 30, 60, 120, 300, 600, 900, 1800, 3600, 7200, 21600, 86400)
+S = 1_000_000_000
+
+
+@dataclass
+class Layer:
+    starts: array  # ns
+    ends: array
+    glyph: str = "="
+    capacity: int = 0  # > 0: shade by how many of this many slots are busy
+
+
+@dataclass
+class Track:
+    label: str
+    layers: list[Layer] = field(default_factory=list)
+    note: str = ""
+
+
+def coverage(starts, ends, t0: int, t1: int, columns: int) -> array:
+    """Per column of ``[t0, t1)``, the covered share of the column summed over intervals."""
+    cov = array("d", bytes(8 * (columns + 1)))
+    rate = array("d", bytes(8 * (columns + 1)))  # whole columns covered, as a difference array
+    width = (t1 - t0) / columns
+    if width <= 0:
+        return cov[:columns]
+    for s, e in zip(starts, ends):
+        a = max(0.0, (s - t0) / width)
+        b = min(float(columns), (e - t0) / width)
+        if b <= a:
+            continue
+        i, j = int(a), min(int(b), columns - 1)
+        if i == j:
+            cov[i] += b - a
+        else:
+            cov[i] += i + 1 - a
+            cov[j] += b - j
+            rate[i + 1] += 1
+            rate[j] -= 1
+    running = 0.0
+    for c in range(columns):
+        running += rate[c]
+        cov[c] += running
+    return cov[:columns]
+
+
+def _render_row(track: Track, t0: int, t1: int, columns: int) -> str:
+    cells = [" "] * columns
+    for layer in track.layers:
+        if layer.capacity:
+            cov = coverage(layer.starts, layer.ends, t0, t1, columns)
+            for c, busy in enumerate(cov):
+                if busy > 1e-9:
+                    share = busy / layer.capacity
+                    cells[c] = RAMP[min(len(RAMP) - 1, max(1, math.ceil(share * (len(RAMP) - 1))))]
+        else:
+            # Later layers are in front: any coverage paints, so short events never vanish
+            cov = coverage(*merge(layer.starts, layer.ends), t0, t1, columns)
+            for c, covered in enumerate(cov):
+                if covered > 1e-9:
+                    cells[c] = layer.glyph
+    row = f"{track.label:<{LABEL_WIDTH}}{''.join(cells)}"
+    return f"{row}  {track.note}".rstrip() if track.note else row.rstrip()
+
+
+def _tick_step_s(span_s: float, columns: int, min_gap: int = 8) -> int:
+    for step in TICK_STEPS_S:
+        if span_s / step <= columns / min_gap:
+            return step
+    return TICK_STEPS_S[-1]
+
+
+def _fmt_offset(s: int) -> str:
+    if s % 3600 == 0 and s:
+        return f"+{s // 3600}h"
+    if s % 60 == 0:
+        return f"+{s // 60}m"
+    return f"+{s}s"
+
+
+def _axis(t0: int, t1: int, columns: int) -> list[str]:
+    span_s = (t1 - t0) / S
+    step = _tick_step_s(span_s, columns)
+    labels = [" "] * (columns + 8)
+    rule = ["-"] * columns
+    start = datetime.fromtimestamp(t0 / S, tz=timezone.utc).strftime("%H:%M:%S" if step < 60 else "%H:%M")
+    k = 0
+    while k * step <= span_s:
+        c = min(columns - 1, round(k * step / span_s * columns))
+        rule[c] = "|"
+        text = start if k == 0 else _fmt_offset(k * step)
+        if all(ch == " " for ch in labels[max(0, c - 1):c + len(text)]):
+            labels[c:c + len(text)] = text
+        k += 1
+    return [
+        f"{'Time (UTC)':<{LABEL_WIDTH}}{''.join(labels)}".rstrip(),
+        f"{'':<{LABEL_WIDTH}}{''.join(rule)}",
+    ]
+
+
+def render_ascii(tracks: list[Track | None], t0: int, t1: int, columns: int = 64) -> list[str]:
+    """Axis plus one line per track; ``None`` leaves a blank line between groups."""
+    lines = _axis(t0, t1, columns)
+    lines.append("")
+    for track in tracks:
+        lines.append("" if track is None else _render_row(track, t0, t1, columns))
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _fmt_s(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    m = int(seconds) // 60
+    return f"{m}m{seconds - m * 60:02.0f}s"
+
+
+def _columns(events, **query) -> tuple[array, array]:
+    rows = events.indexes(**query)
+    start, end = events.start, events.end
+    return array("q", [start[i] for i in rows]), array("q", [end[i] for i in rows])
+
+
+def bounds(events) -> tuple[int, int]:
+    """The pipeline's time window; webapp logs and metrics outlive it, so they are clipped."""
+    lo, hi = None, None
+    for source in events.sources():
+        if source in ("webapp", "prometheus"):
+            continue
+        span = events.span(source=source)
+        lo = span[0] if lo is None else min(lo, span[0])
+        hi = span[1] if hi is None else max(hi, span[1])
+    return (lo or 0, hi or 0)
+
+
+def _suite_tracks(
+    events, source: str, label: str, split: dict[str, tuple[list[int], int, int]],
+) -> list[Track]:
+    """The suite's row plus one per ``split`` entry: ``(tests, phase start, phase end)``."""
+    rows = events.indexes(source=source, kind="test")
+    start, end = events.start, events.end
+    workers = len({events[i].get("worker") for i in rows}) or 1
+    wall_s = (max(end[i] for i in rows) - start[rows[0]]) / S
+    tracks = [Track(label, [Layer(*_columns(events, source=source, kind="test"), capacity=workers)],
+                    f"{_fmt_s(wall_s)}, {len(rows):,} tests on {workers} workers")]
+    for name, (part, lo, hi) in split.items():
+        if not part:
+            continue
+        layer = Layer(array("q", [start[i] for i in part]), array("q", [end[i] for i in part]),
+                      capacity=workers)
+        tracks.append(Track(f"  {name}", [layer], f"{_fmt_s((hi - lo) / S)}, {len(part):,} tests"))
+    return tracks
+
+
+def report_tracks(events, setup_s: float | None = None) -> list[Track | None]:
+    """The report's rows: Concord, dispatcher jobs, both suites and the webapp."""
+    tracks: list[Track | None] = []
+    run = events.first(source="concord", kind="run")
+    if run is not None:
+        active = [e for e in events.filter(source="concord", kind="phase") if e.entity != "Suspended"]
+        suspended = [e for e in events.filter(source="concord", kind="phase") if e.entity == "Suspended"]
+        resumes = events.filter(source="concord", kind="resume")
+        # As in the executive summary: everything but suspension counts as active
+        active_s = run.duration_s - sum(e.duration_s for e in suspended)
+        tracks.append(Track("CONCORD", [
+            Layer(array("q", [e.start_ns for e in suspended]),
+                  array("q", [e.end_ns for e in suspended]), "~"),
+            Layer(array("q", [e.start_ns for e in active]), array("q", [e.end_ns for e in active])),
+            Layer(array("q", [e.start_ns for e in resumes]),
+                  array("q", [e.end_ns for e in resumes]), "#"),
+        ], f"{_fmt_s(run.duration_s)} (active {_fmt_s(active_s)}, {len(resumes)} resumes)"))
+        tracks.append(None)
+
+    pods = events.filter(source="dispatcher", kind="pod")
+    if pods:
+        compute = events.filter(source="dispatcher", kind="compute")
+        jobs = ", ".join(e.entity for e in compute[:3]) + (", ..." if len(compute) > 3 else "")
+        tracks.append(Track("K8S DEPLOY", [
+            Layer(*_columns(events, source="dispatcher", kind="pod"), "-"),
+            Layer(*_columns(events, source="dispatcher", kind="compute")),
+        ], f"job {jobs}: {sum(e.duration_s for e in compute):.0f}s compute"))
+        tracks.append(None)
+
+    if events.first(source="kono", kind="test") is not None:
+        pools: dict[str, list[int]] = {}
+        for i in events.indexes(source="kono", kind="test"):
+            pools.setdefault(events[i].get("pool") or "tests", []).append(i)
+        start, end = events.start, events.end
+        split = {
+            name: (part, start[part[0]], max(end[i] for i in part))
+            for name, part in sorted(pools.items())
+        }
+        tracks.extend(_suite_tracks(events, "kono", "KONO TESTS", split))
+        tracks.append(None)
+
+    if events.first(source="substantiate", kind="test") is not None:
+        rows = events.indexes(source="substantiate", kind="test")
+        split: dict[str, tuple[list[int], int, int]] = {}
+        if setup_s:
+            start, end = events.start, events.end
+            first, last = start[rows[0]], max(end[i] for i in rows)
+            cutoff = first + int(setup_s * S)
+            # Rows are labelled with the phase, not the lifetime of the tests started in it
+            split["Setup"] = ([i for i in rows if start[i] < cutoff], first, cutoff)
+            split["Main tests"] = ([i for i in rows if start[i] >= cutoff], cutoff, last)
+        tracks.extend(_suite_tracks(events, "substantiate", "SUBSTANTIATE", split))
+        tracks.append(None)
+
+    logs = events.first(source="webapp", kind="logs")
+    if logs is not None:
+        cpu = events.first(source="prometheus", kind="series", entity="cpu")
+        note = f"CPU peak {cpu.get('max'):.2f}c, avg {cpu.get('avg'):.2f}c" if cpu is not None else ""
+        tracks.append(Track("WEBAPP", [Layer(*_columns(events, source="webapp", kind="logs"), "-")], note))
+    return tracks
+
+
+# -- SVG Gantt -------------------------------------------------------------
+
+COLORS = {
+    "concord": "#4e79a7", "dispatcher": "#f28e2b", "kono": "#59a14f",
+    "substantiate": "#e15759", "webapp": "#76b7b2",
+}
+
+
+def gantt_rows(events) -> list[tuple[str, str, list]]:
+    """``(label, source, events)`` rows: Concord phases and resumes, pods, then one per worker."""
+    rows: list[tuple[str, str, list]] = []
+    for kind, label in (("phase", "concord phases"), ("resume", "concord resumes")):
+        found = events.filter(source="concord", kind=kind)
+        if found:
+            rows.append((label, "concord", found))
+    for pod, found in events.group("entity", source="dispatcher", kind="pod").items():
+        compute = [e for e in events.filter(source="dispatcher", kind="compute") if e.get("pod") == pod]
+        rows.append((f"pod {pod}", "dispatcher", found + compute))
+    for source in ("kono", "substantiate"):
+        by_worker = events.group("worker", source=source, kind="test")
+        for worker in sorted(by_worker, key=str):
+            rows.append((f"{source} {worker}", source, by_worker[worker]))
+    return rows
+
+
+def _short(label: str, width: int = 36) -> str:
+    return label if len(label) <= width else "..." + label[-(width - 3):]
+
+
+def render_svg(
+    rows: list[tuple[str, str, list]],
+    t0: int,
+    t1: int,
+    width: int = 1600,
+    row_height: int = 12,
+    label_px: int = 240,
+) -> str:
+    """SVG Gantt of ``rows``; a sub-pixel bar merges into a neighbour under a pixel away."""
+    plot = width - label_px - 10
+    scale = plot / max(1, t1 - t0)
+    top = 24
+    height = top + row_height * len(rows) + 10
+    out = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="monospace" font-size="{row_height - 2}">',
+        "<style>" + "".join(f".{s}{{fill:{c}}}" for s, c in COLORS.items()) + "</style>",
+    ]
+    span_s = (t1 - t0) / S
+    step = _tick_step_s(span_s, plot // 10, 8)
+    start = datetime.fromtimestamp(t0 / S, tz=timezone.utc).strftime("%H:%M:%S UTC")
+    k = 0
+    while k * step <= span_s:
+        x = label_px + k * step * S * scale
+        out.append(f'<line x1="{x:.1f}" y1="{top - 4}" x2="{x:.1f}" y2="{height - 10}" stroke="#ddd"/>')
+        out.append(f'<text x="{x + 2:.1f}" y="{top - 8}">{start if k == 0 else _fmt_offset(k * step)}</text>')
+        k += 1
+    for r, (label, source, found) in enumerate(rows):
+        y = top + r * row_height
+        out.append(f'<text x="2" y="{y + row_height - 3}">{escape(_short(label))}</text>')
+        bar = None  # [x0, x1, count, title]
+        bars = []
+        for e in sorted(found, key=lambda e: e.start_ns):
+            x0 = label_px + (e.start_ns - t0) * scale
+            x1 = label_px + (e.end_ns - t0) * scale
+            if bar is not None and x0 <= bar[1] + 1 and (x1 - x0 < 1 or bar[1] - bar[0] < 1):
+                bar[1] = max(bar[1], x1)
+                bar[2] += 1
+            else:
+                bar = [x0, x1, 1, e.entity]
+                bars.append(bar)
+        for x0, x1, count, title in bars:
+            tip = escape(title) if count == 1 else f"{count} merged"
+            out.append(
+                f'<rect class="{source}" x="{x0:.1f}" y="{y + 1}" width="{max(x1 - x0, 1.0):.1f}" '
+                f'height="{row_height - 2}"><title>{tip}</title></rect>'
+            )
+    out.append("</svg>")
+    return "\n".join(out) + "\n"
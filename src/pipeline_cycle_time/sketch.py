@@ -0,0 +1,140 @@
+"""Mergeable quantile sketches for per-test and per-phase duration history.
+
+``KLLSketch`` is a KLL sketch (Karnin, Lang & Liberty): a stack of
+compactors where level ``h`` holds items of weight ``2**h``. When a level
+fills up it is sorted and every other item is promoted, so memory stays
+bounded (roughly ``3k`` items) however many samples are added, rank error is
+about ``1.7/k`` and two sketches merge by concatenating levels. Compaction
+offsets alternate deterministically instead of using a random coin, which
+keeps persisted sketches reproducible.
+
+Serialized form (``to_bytes``) is a small header plus float32 samples, about
+1.5 KB at the default ``k``.
+"""
+from __future__ import annotations
+
+import math
+import struct
+from array import array
+
+DEFAULT_K = 128
+_C = 2 / 3
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<BHBQddB")  # version, k, coin, count, min, max, levels
+
+
+class KLLSketch:
+    __slots__ = ("k", "count", "min", "max", "_levels", "_coin")
+
+    def __init__(self, k: int = DEFAULT_K):
+        self.k = k
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._levels: list[list[float]] = [[]]
+        self._coin = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self._levels) - h - 1
+        return max(2, math.ceil(self.k * _C ** depth))
+
+    def _retained(self) -> int:
+        return sum(len(level) for level in self._levels)
+
+    def _max_retained(self) -> int:
+        return sum(self._capacity(h) for h in range(len(self._levels)))
+
+    def _compress(self) -> None:
+        while self._retained() >= self._max_retained():
+            for h, level in enumerate(self._levels):
+                if len(level) >= self._capacity(h):
+                    if h + 1 == len(self._levels):
+                        self._levels.append([])
+                    level.sort()
+                    # Keep the odd one out at this level; promote half of the rest
+                    keep = [level.pop()] if len(level) % 2 else []
+                    self._levels[h + 1].extend(level[self._coin::2])
+                    self._coin ^= 1
+                    self._levels[h] = keep
+                    break
+
+    def update(self, value: float) -> None:
+        self._levels[0].append(value)
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self._levels[0]) >= self._capacity(0):
+            self._compress()
+
+    def merge(self, other: KLLSketch) -> None:
+        """Fold ``other`` into this sketch (``other`` is left unchanged)."""
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+        for h, level in enumerate(other._levels):
+            self._levels[h].extend(level)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def _weighted(self) -> list[tuple[float, int]]:
+        items = [(v, 1 << h) for h, level in enumerate(self._levels) for v in level]
+        items.sort()
+        return items
+
+    def quantile(self, q: float) -> float:
+        """Approximate ``q``-quantile (0..1); exact at 0 and 1."""
+        if not self.count:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        target = q * self.count
+        cumulative = 0
+        for value, weight in self._weighted():
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return self.max
+
+    def rank(self, value: float) -> float:
+        """Approximate fraction of samples <= ``value``."""
+        if not self.count:
+            return 0.0
+        below = sum(1 << h for h, level in enumerate(self._levels) for v in level if v <= value)
+        return min(1.0, below / self.count)
+
+    def to_bytes(self) -> bytes:
+        samples = array("f", (v for level in self._levels for v in level))
+        header = _HEADER.pack(
+            _FORMAT_VERSION, self.k, self._coin, self.count,
+            self.min if self.count else 0.0, self.max if self.count else 0.0, len(self._levels),
+        )
+        lengths = array("H", (len(level) for level in self._levels))
+        return header + lengths.tobytes() + samples.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> KLLSketch:
+        version, k, coin, count, lo, hi, n_levels = _HEADER.unpack_from(data)
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported sketch format {version}")
+        sketch = cls(k)
+        sketch.count, sketch._coin = count, coin
+        if count:
+            sketch.min, sketch.max = lo, hi
+        offset = _HEADER.size
+        lengths = array("H")
+        lengths.frombytes(data[offset:offset + 2 * n_levels])
+        samples = array("f")
+        samples.frombytes(data[offset + 2 * n_levels:])
+        sketch._levels, pos = [], 0
+        for n in lengths:
+            sketch._levels.append(samples[pos:pos + n].tolist())
+            pos += n
+        return sketch
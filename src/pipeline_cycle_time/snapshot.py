@@ -0,0 +1,429 @@
+"""Versioned binary snapshot of a fully analyzed run, reloaded via ``mmap``.
+
+Layout (little-endian, every section 8-byte aligned)::
+
+    header    magic "PCTSNAP\\0", version u16, section count u16, reserved u32
+    table     per section: name 32s, typecode c, 7 pad, offset u64, nbytes u64
+    sections  raw column / record data
+
+Per suite (``kono.*`` / ``substantiate.*``) the tests are stored as fixed-width
+columns: ``start``/``stop``/``duration`` (int64 epoch ms) and ``name``,
+``uid``, ``worker``, ``pool``, ``status`` (uint32 indexes into one interned
+string table), ``flaky`` (uint8) and ``retries`` (uint32), plus ``history`` (historyId string index) when the
+run's test-cases were available at write time. Strings live in
+``strings.dat`` (UTF-8) with ``strings.off`` (uint64 offsets). Phases, resume
+cycles and point-in-time events are packed ``struct`` records; the small,
+irregular remainder (log warnings, metric summaries, findings, clock skew,
+critical path) is one ``marshal`` blob reusing the ``packing`` encodings.
+
+``Snapshot`` maps the file read-only and hands out ``memoryview`` columns
+cast straight over the mapping, so opening a 100k-test snapshot is a header
+parse and processes reading the same file share its page-cache pages.
+``Snapshot.analysis()`` materializes a regular ``RunAnalysis`` when the
+dataclasses are needed (e.g. to render the report).
+"""
+from __future__ import annotations
+
+import marshal
+import mmap
+import os
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+MAGIC = b"PCTSNAP\0"
+SNAPSHOT_VERSION = 6
+SUFFIX = ".snap"
+
+_HEADER = struct.Struct("<8sHHI")
+_ENTRY = struct.Struct("<32sc7xQQ")
+_PHASE = struct.Struct("<Iiqq")  # name, utc offset s, start us, end us
+_RESUME = struct.Struct("<qiB3xdd")  # resume us, utc offset s, critical, export s, dep resolution s
+_EVENT = struct.Struct("<Iiqq")  # name, utc offset s, start ns, end ns (== start for points)
+
+_SUITES = ("kono", "substantiate")
+_SUITE_COLUMNS = (
+    ("start", "q"), ("stop", "q"), ("duration", "q"),
+    ("name", "I"), ("uid", "I"), ("worker", "I"), ("pool", "I"), ("status", "I"),
+    ("flaky", "B"), ("retries", "I"),
+)
+
+
+class _Strings:
+    """Interning table built while writing."""
+
+    def __init__(self) -> None:
+        self.index: dict[str, int] = {}
+
+    def __call__(self, s: str) -> int:
+        i = self.index.get(s)
+        if i is None:
+            i = self.index[s] = len(self.index)
+        return i
+
+    def sections(self) -> list[tuple[str, str, bytes]]:
+        offsets = array("Q", [0])
+        chunks = []
+        total = 0
+        for s in self.index:
+            b = s.encode()
+            chunks.append(b)
+            total += len(b)
+            offsets.append(total)
+        return [("strings.off", "Q", offsets.tobytes()), ("strings.dat", "B", b"".join(chunks))]
+
+
+class StringTable:
+    """Read side of the interned strings; decodes lazily from the mapping."""
+
+    def __init__(self, offsets: memoryview, data: memoryview):
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return str(self._data[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+
+    def release(self) -> None:
+        self._offsets.release()
+        self._data.release()
+
+
+@dataclass
+class SuiteColumns:
+    """Zero-copy columns of one suite; index columns resolve via ``strings``."""
+    suite: str
+    strings: StringTable
+    start: memoryview
+    stop: memoryview
+    duration: memoryview
+    name: memoryview
+    uid: memoryview
+    worker: memoryview
+    pool: memoryview
+    status: memoryview
+    flaky: memoryview
+    retries: memoryview
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def test_name(self, i: int) -> str:
+        return self.strings[self.name[i]]
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _pack_skew(skew):
+    if skew is None:
+        return None
+    return (
+        [(o.clock, o.offset_ns, o.lower_ns, o.upper_ns, o.anchors) for o in skew.offsets.values()],
+        [(a.label, a.before, a.after, a.slack_ns) for a in skew.anchors],
+        skew.consistent,
+    )
+
+
+def _unpack_skew(packed):
+    if packed is None:
+        return None
+    from .analyzers.skew import Anchor, ClockOffset, ClockSkew
+
+    offsets, anchors, consistent = packed
+    return ClockSkew(
+        {o[0]: ClockOffset(*o) for o in offsets}, [Anchor(*a) for a in anchors], consistent,
+    )
+
+
+def write(analysis, path: str, history: dict[str, str] | None = None) -> None:
+    """Write a ``pipeline.RunAnalysis`` (after correlation) to ``path``.
+
+    ``history`` is the run's uid -> historyId map (``pipeline.history_ids``);
+    it is kept so snapshots can be diffed by historyId without the report.
+    """
+    from .packing import pack, pack_datetime, pack_jobs
+
+    strings = _Strings()
+    sections: list[tuple[str, str, bytes]] = []
+
+    for attr in _SUITES:
+        tests = getattr(analysis, attr).tests
+        # The suite's own string codes, renumbered into the snapshot's table
+        recode = array("I", (strings(t) for t in tests.strings))
+        cols = {
+            "start": tests.start,
+            "stop": tests.stop,
+            "duration": tests.duration,
+            "name": array("I", (strings(n) for n in tests.name)),
+            "uid": array("I", (strings(u) for u in tests.uid)),
+            "worker": array("I", (recode[c] for c in tests.worker)),
+            "pool": array("I", (recode[c] for c in tests.pool)),
+            "status": array("I", (recode[c] for c in tests.status)),
+            "flaky": tests.flaky,
+            "retries": tests.retries,
+        }
+        for col, code in _SUITE_COLUMNS:
+            sections.append((f"{attr}.{col}", code, cols[col].tobytes()))
+        if history:
+            hids = array("I", (strings(history.get(u, "")) for u in tests.uid))
+            sections.append((f"{attr}.history", "I", hids.tobytes()))
+
+    orch = analysis.orchestration
+    phases = []
+    for p in orch.phases:
+        (start_us, offset), (end_us, _) = pack_datetime(p.start), pack_datetime(p.end)
+        phases.append(_PHASE.pack(strings(p.name), offset, start_us, end_us))
+    sections.append(("phases", "B", b"".join(phases)))
+    resumes = []
+    for r in orch.resume_overheads:
+        us, offset = pack_datetime(r.resume_time)
+        resumes.append(_RESUME.pack(
+            us, offset, r.on_critical_path, r.repo_export_s, r.dep_resolution_s
+        ))
+    sections.append(("resumes", "B", b"".join(resumes)))
+    d = analysis.dispatcher
+    events = []
+    for t in orch.suspend_times:
+        us, offset = pack_datetime(t)
+        events.append(_EVENT.pack(strings("suspend"), offset, us * 1000, us * 1000))
+    events.append(_EVENT.pack(strings("dispatcher.logs"), 0, d.first_log_ns, d.last_log_ns))
+    events.append(_EVENT.pack(
+        strings("dispatcher.compute"), 0, d.compute_start_ns, d.compute_end_ns
+    ))
+    sections.append(("events", "B", b"".join(events)))
+
+    corr = analysis.correlation
+    meta = {
+        "run_dir": str(analysis.run_dir),
+        "children": list(orch.children),
+        "total": (pack_datetime(orch.total_start), pack_datetime(orch.total_end)),
+        "suites": {attr: (getattr(analysis, attr).name, list(getattr(analysis, attr).pools))
+                   for attr in _SUITES},
+        "app_logs": pack(analysis.app_logs)[1],
+        "dispatcher": (d.job_id, d.pod_name, pack_jobs(d.jobs)),
+        "metrics": pack(analysis.metrics)[1],
+        "correlation": (
+            [(f.rank, f.title, f.description, f.evidence, f.estimated_savings_s, f.difficulty,
+              f.priority) for f in corr.findings],
+            corr.concord_start_epoch_s, corr.concord_end_epoch_s,
+            _pack_skew(corr.clock_skew), corr.end_to_end_s, list(corr.critical_path),
+            dict(corr.polling_overshoot_s),
+        ) if corr is not None else None,
+    }
+    sections.append(("meta", "B", marshal.dumps(meta)))
+    sections.extend(strings.sections())
+
+    offset = _align(_HEADER.size + _ENTRY.size * len(sections))
+    table, layout = [], []
+    for name, code, data in sections:
+        table.append(_ENTRY.pack(name.encode(), code.encode(), offset, len(data)))
+        layout.append((offset, data))
+        offset = _align(offset + len(data))
+
+    tmp = Path(str(path) + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, SNAPSHOT_VERSION, len(sections), 0))
+        f.write(b"".join(table))
+        for off, data in layout:
+            f.seek(off)
+            f.write(data)
+        f.truncate(offset)
+    os.replace(tmp, path)
+
+
+class Snapshot:
+    """A memory-mapped snapshot; use as a context manager.
+
+    Column views borrow the mapping: release them (or let them go out of
+    scope) before ``close``.
+    """
+
+    def __init__(self, path: str):
+        if sys.byteorder != "little":
+            raise ValueError("Snapshots are little-endian; this platform is not")
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._mm)
+        self._strings: StringTable | None = None
+        self._meta: dict | None = None
+        magic, version, count, _ = _HEADER.unpack_from(self._buf)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a pipeline snapshot")
+        if version != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported snapshot version {version} in {path}")
+        self._sections: dict[str, tuple[str, int, int]] = {}
+        for i in range(count):
+            name, code, off, nbytes = _ENTRY.unpack_from(self._buf, _HEADER.size + i * _ENTRY.size)
+            self._sections[name.rstrip(b"\0").decode()] = (code.decode(), off, nbytes)
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._strings is not None:
+            self._strings.release()
+            self._strings = None
+        self._buf.release()
+        self._mm.close()
+
+    def column(self, name: str) -> memoryview:
+        code, off, nbytes = self._sections[name]
+        return self._buf[off:off + nbytes].cast(code)
+
+    @property
+    def strings(self) -> StringTable:
+        if self._strings is None:
+            self._strings = StringTable(self.column("strings.off"), self.column("strings.dat"))
+        return self._strings
+
+    @property
+    def meta(self) -> dict:
+        if self._meta is None:
+            self._meta = marshal.loads(self.column("meta"))
+        return self._meta
+
+    def suite(self, attr: str) -> SuiteColumns:
+        """Columns for ``"kono"`` or ``"substantiate"``."""
+        name, _ = self.meta["suites"][attr]
+        return SuiteColumns(
+            name, self.strings, **{col: self.column(f"{attr}.{col}") for col, _ in _SUITE_COLUMNS}
+        )
+
+    def history_ids(self) -> dict[str, str]:
+        """uid -> historyId, empty when the snapshot was written without them."""
+        s = self.strings
+        out: dict[str, str] = {}
+        for attr in _SUITES:
+            if f"{attr}.history" not in self._sections:
+                continue
+            uids, hids = self.column(f"{attr}.uid"), self.column(f"{attr}.history")
+            for u, h in zip(uids, hids):
+                hid = s[h]
+                if hid:
+                    out[s[u]] = hid
+            uids.release()
+            hids.release()
+        return out
+
+    def _records(self, section: str, record: struct.Struct):
+        return record.iter_unpack(self.column(section))
+
+    # -- materialization ----------------------------------------------------
+
+    def suite_result(self, attr: str):
+        from .analyzers.test_reports import TestColumns, TestSuiteResult
+
+        cols = self.suite(attr)
+        s = self.strings
+        name, pool_order = self.meta["suites"][attr]
+        # Text columns keep their codes, renumbered into a table of their own
+        local: dict[int, int] = {}
+        for col in ("status", "worker", "pool"):
+            for code in set(getattr(cols, col).tolist()):
+                local.setdefault(code, len(local))
+        table = [s[code] for code in local]
+        columns = {
+            col: array("I", (local[c] for c in getattr(cols, col)))
+            for col in ("status", "worker", "pool")
+        }
+        tests = TestColumns.of(
+            table,
+            name=[s[i] for i in cols.name], uid=[s[i] for i in cols.uid],
+            start=array("q", cols.start), stop=array("q", cols.stop),
+            duration=array("q", cols.duration), flaky=array("B", cols.flaky),
+            retries=array("I", cols.retries), **columns,
+        )
+        return TestSuiteResult.from_columns(name, tests, pool_order)
+
+    def orchestration(self):
+        from .analyzers.orchestration import OrchestrationResult, Phase, ResumeOverhead
+        from .packing import unpack_datetime
+
+        s = self.strings
+        meta = self.meta
+        phases = [
+            Phase(s[name], unpack_datetime((start, offset)), unpack_datetime((end, offset)))
+            for name, offset, start, end in self._records("phases", _PHASE)
+        ]
+        resumes = [
+            ResumeOverhead(unpack_datetime((us, offset)), export_s, dep_s, bool(critical))
+            for us, offset, critical, export_s, dep_s in self._records("resumes", _RESUME)
+        ]
+        suspends = [
+            unpack_datetime((start // 1000, offset))
+            for name, offset, start, _ in self._records("events", _EVENT) if s[name] == "suspend"
+        ]
+        total_start, total_end = meta["total"]
+        return OrchestrationResult(
+            phases=phases,
+            children=list(meta["children"]),
+            suspend_times=suspends,
+            resume_overheads=resumes,
+            total_start=unpack_datetime(total_start),
+            total_end=unpack_datetime(total_end),
+        )
+
+    def analysis(self):
+        """Materialize the full ``pipeline.RunAnalysis``."""
+        from .analyzers.app_logs import DispatcherTimeline
+        from .analyzers.correlator import CorrelationResult, Finding
+        from .packing import unpack, unpack_jobs
+        from .pipeline import RunAnalysis
+
+        meta = self.meta
+        events = {
+            self.strings[name]: (start, end)
+            for name, _, start, end in self._records("events", _EVENT)
+        }
+        logs, compute = events["dispatcher.logs"], events["dispatcher.compute"]
+        job_id, pod_name, jobs = meta["dispatcher"]
+        dispatcher = DispatcherTimeline(job_id, pod_name, *logs, *compute, jobs=unpack_jobs(jobs))
+        correlation = None
+        if meta["correlation"] is not None:
+            findings, start_s, end_s, skew, end_to_end_s, path, overshoot = meta["correlation"]
+            correlation = CorrelationResult(
+                [Finding(*f) for f in findings], start_s, end_s, _unpack_skew(skew),
+                end_to_end_s, path, overshoot,
+            )
+        return RunAnalysis(
+            run_dir=meta["run_dir"],
+            orchestration=self.orchestration(),
+            kono=self.suite_result("kono"),
+            substantiate=self.suite_result("substantiate"),
+            app_logs=unpack(("app_logs", meta["app_logs"])),
+            dispatcher=dispatcher,
+            metrics=unpack(("metrics", meta["metrics"])),
+            correlation=correlation,
+        )
+
+
+def is_snapshot(path: str) -> bool:
+    p = Path(path)
+    if not p.is_file():
+        return False
+    with open(p, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load(path: str):
+    """Materialized ``RunAnalysis`` from a snapshot file."""
+    with Snapshot(path) as snap:
+        return snap.analysis()
+
+
+def load_with_history(path: str):
+    """``(RunAnalysis, uid -> historyId)`` from a snapshot file."""
+    with Snapshot(path) as snap:
+        return snap.analysis(), snap.history_ids()
@@ -0,0 +1,447 @@
+"""Historical run store: every analyzed run in one local SQLite database.
+
+``RunStore.ingest`` writes a run's phases, resume overheads, suites, pools,
+per-test durations and findings in a single transaction with ``executemany``
+bulk inserts; re-ingesting the same run key replaces it. The query side
+returns time-ordered metric series (``metric_series``) and windowed
+percentile trends (``trend``) over them, all served from indexes on run
+start time, phase name and test ``historyId``/uid.
+
+Alongside the raw rows, each test (keyed by historyId, else name) and each
+phase keeps a KLL duration sketch (``sketch.KLLSketch``) that is updated the
+first time a run is ingested. ``check`` compares a run against those
+sketches and reports durations above a historical quantile, so regression
+detection never has to scan the full history.
+
+Metric specs used by the query API and ``store trend`` CLI:
+
+    concord | end_to_end | critical_resume
+    phase:<name>                e.g. phase:Helm
+    suite:<name>                suite wall-clock, e.g. suite:Substantiate
+    pool:<suite>/<pool>         e.g. pool:Kono/Pool-1
+    test:<historyId or uid>     one test's duration across runs
+"""
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from .sketch import KLLSketch
+from .stats import distribution
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_key TEXT NOT NULL UNIQUE,
+    run_dir TEXT NOT NULL,
+    start_epoch_s REAL NOT NULL,
+    concord_s REAL NOT NULL,
+    end_to_end_s REAL NOT NULL,
+    critical_resume_s REAL NOT NULL,
+    ingested_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS phases (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    start_epoch_s REAL NOT NULL,
+    duration_s REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resume_overheads (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    resume_epoch_s REAL NOT NULL,
+    repo_export_s REAL NOT NULL,
+    dep_resolution_s REAL NOT NULL,
+    on_critical_path INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS suites (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    tests INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    wall_clock_s REAL NOT NULL,
+    aggregate_s REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pools (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    suite TEXT NOT NULL,
+    name TEXT NOT NULL,
+    tests INTEGER NOT NULL,
+    wall_clock_s REAL NOT NULL,
+    parallelism REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    suite TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    history_id TEXT,
+    name TEXT NOT NULL,
+    pool TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    status TEXT NOT NULL,
+    start_ms INTEGER NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    retries INTEGER NOT NULL,
+    flaky INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    estimated_savings TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sketches (
+    kind TEXT NOT NULL,   -- 'test' or 'phase'
+    scope TEXT NOT NULL,  -- suite name for tests, '' for phases
+    key TEXT NOT NULL,    -- historyId (or name) for tests, phase name
+    name TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    sketch BLOB NOT NULL,
+    PRIMARY KEY (kind, scope, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_start ON runs(start_epoch_s);
+CREATE INDEX IF NOT EXISTS phases_name ON phases(name, run_id);
+CREATE INDEX IF NOT EXISTS phases_run ON phases(run_id);
+CREATE INDEX IF NOT EXISTS resume_run ON resume_overheads(run_id);
+CREATE INDEX IF NOT EXISTS suites_name ON suites(name, run_id);
+CREATE INDEX IF NOT EXISTS pools_name ON pools(suite, name, run_id);
+CREATE INDEX IF NOT EXISTS tests_history ON tests(history_id);
+CREATE INDEX IF NOT EXISTS tests_uid ON tests(uid);
+CREATE INDEX IF NOT EXISTS tests_run ON tests(run_id);
+CREATE INDEX IF NOT EXISTS findings_run ON findings(run_id);
+"""
+
+_RUN_METRICS = {
+    "concord": "concord_s",
+    "end_to_end": "end_to_end_s",
+    "critical_resume": "critical_resume_s",
+}
+
+
+@dataclass
+class Point:
+    run_key: str
+    start_epoch_s: float
+    value: float
+
+
+@dataclass
+class Outlier:
+    kind: str
+    scope: str
+    name: str
+    value_s: float
+    threshold_s: float
+    rank: float  # historical fraction of runs at or below value_s
+    history: int
+
+    @property
+    def excess_s(self) -> float:
+        return self.value_s - self.threshold_s
+
+
+def _epoch(dt) -> float:
+    return dt.timestamp() if dt is not None else 0.0
+
+
+def observations(analysis, history: dict[str, str] | None = None) -> dict[tuple, list]:
+    """(kind, scope, key) -> [name, seconds] for every test and phase of a run.
+
+    Retried attempts are summed under their test's key, like ``analyzers.diff``.
+    """
+    history = history or {}
+    obs: dict[tuple, list] = {}
+    for p in analysis.orchestration.phases:
+        entry = obs.setdefault(("phase", "", p.name), [p.name, 0.0])
+        entry[1] += p.duration_s
+    for suite in (analysis.kono, analysis.substantiate):
+        for t in suite.tests:
+            entry = obs.setdefault(
+                ("test", suite.name, history.get(t.uid) or t.name), [t.name, 0.0]
+            )
+            entry[1] += t.duration / 1000
+    return obs
+
+
+def ingest_run(
+    store: RunStore, run_dir: str, run_key: str | None = None, cache=None, with_history: bool = True
+) -> int:
+    """Analyze ``run_dir`` and store it, attaching historyIds from test-cases."""
+    from . import pipeline
+
+    analysis = pipeline.run(run_dir, cache=cache)
+    history = pipeline.history_ids(run_dir) if with_history else None
+    return store.ingest(analysis, run_key, history)
+
+
+class RunStore:
+    """A SQLite database of analyzed runs."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> RunStore:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- ingest -----------------------------------------------------------
+
+    def ingest(
+        self, analysis, run_key: str | None = None, history: dict[str, str] | None = None
+    ) -> int:
+        """Store one ``RunAnalysis``; returns its run id.
+
+        ``history`` maps test uid -> Allure ``historyId`` (see
+        ``pipeline.history_ids``); tests without one can still be queried by uid.
+        """
+        orch = analysis.orchestration
+        kono, sub = analysis.kono, analysis.substantiate
+        run_key = run_key or Path(analysis.run_dir).resolve().name
+        history = history or {}
+        with self.conn:
+            seen = self.conn.execute(
+                "SELECT 1 FROM runs WHERE run_key = ?", (run_key,)
+            ).fetchone()
+            if seen:
+                self.conn.execute("DELETE FROM runs WHERE run_key = ?", (run_key,))
+            else:
+                # Sketches can't forget samples, so only a run's first ingest feeds them
+                self._update_sketches(observations(analysis, history))
+            cur = self.conn.execute(
+                "INSERT INTO runs (run_key, run_dir, start_epoch_s, concord_s, end_to_end_s,"
+                " critical_resume_s, ingested_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_key, str(analysis.run_dir), _epoch(orch.total_start),
+                    orch.total_duration_s, analysis.end_to_end_s,
+                    orch.critical_path_resume_overhead_s, time.time(),
+                ),
+            )
+            run_id = cur.lastrowid
+            self.conn.executemany(
+                "INSERT INTO phases VALUES (?, ?, ?, ?)",
+                [(run_id, p.name, _epoch(p.start), p.duration_s) for p in orch.phases],
+            )
+            self.conn.executemany(
+                "INSERT INTO resume_overheads VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, i, _epoch(r.resume_time), r.repo_export_s, r.dep_resolution_s,
+                     int(r.on_critical_path))
+                    for i, r in enumerate(orch.resume_overheads)
+                ],
+            )
+            suites = (kono, sub)
+            self.conn.executemany(
+                "INSERT INTO suites VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, s.name, s.total_tests, s.fail_count, s.wall_clock_s, s.aggregate_s)
+                    for s in suites
+                ],
+            )
+            self.conn.executemany(
+                "INSERT INTO pools VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, s.name, p.name, p.count, p.wall_clock_s, p.parallelism)
+                    for s in suites for p in s.pools.values()
+                ],
+            )
+            self.conn.executemany(
+                "INSERT INTO tests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (run_id, s.name, t.uid, history.get(t.uid), t.name, t.pool, t.worker,
+                     t.status, t.start, t.duration, t.retries, int(t.flaky))
+                    for s in suites for t in s.tests
+                ),
+            )
+            self.conn.executemany(
+                "INSERT INTO findings VALUES (?, ?, ?, ?, ?)",
+                [
+                    (run_id, f.rank, f.title, f.priority, f.estimated_savings_s)
+                    for f in analysis.correlation.findings
+                ],
+            )
+        return run_id
+
+    def _load_sketches(self, obs: dict[tuple, list]) -> dict[tuple, KLLSketch]:
+        sketches = {}
+        for kind, scope in {(kind, scope) for kind, scope, _ in obs}:
+            for key, blob in self.conn.execute(
+                "SELECT key, sketch FROM sketches WHERE kind = ? AND scope = ?", (kind, scope)
+            ):
+                if (kind, scope, key) in obs:
+                    sketches[(kind, scope, key)] = KLLSketch.from_bytes(blob)
+        return sketches
+
+    def _update_sketches(self, obs: dict[tuple, list]) -> None:
+        sketches = self._load_sketches(obs)
+        rows = []
+        for ident, (name, value) in obs.items():
+            sketch = sketches.get(ident) or KLLSketch()
+            sketch.update(value)
+            rows.append((*ident, name, sketch.count, sketch.to_bytes()))
+        self.conn.executemany("INSERT OR REPLACE INTO sketches VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    # -- queries ----------------------------------------------------------
+
+    def sketch(self, kind: str, scope: str, key: str) -> KLLSketch | None:
+        """Duration sketch for a test (scope = suite) or phase (scope = "")."""
+        row = self.conn.execute(
+            "SELECT sketch FROM sketches WHERE kind = ? AND scope = ? AND key = ?",
+            (kind, scope, key),
+        ).fetchone()
+        return KLLSketch.from_bytes(row[0]) if row else None
+
+    def check(
+        self,
+        analysis,
+        history: dict[str, str] | None = None,
+        quantile: float = 0.95,
+        min_history: int = 10,
+        min_excess_s: float = 1.0,
+    ) -> list[Outlier]:
+        """Tests/phases of ``analysis`` slower than their historical ``quantile``.
+
+        Only keys with at least ``min_history`` prior runs are judged, and
+        excesses under ``min_excess_s`` are ignored as noise. Run this before
+        ingesting the run so it isn't compared against itself.
+        """
+        obs = observations(analysis, history)
+        outliers = []
+        for ident, sketch in self._load_sketches(obs).items():
+            if sketch.count < min_history:
+                continue
+            name, value = obs[ident]
+            threshold = sketch.quantile(quantile)
+            if value - threshold >= min_excess_s:
+                outliers.append(Outlier(
+                    ident[0], ident[1], name, value, threshold, sketch.rank(value), sketch.count,
+                ))
+        outliers.sort(key=lambda o: -o.excess_s)
+        return outliers
+
+    def run_count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def runs(self, since: float | None = None, until: float | None = None) -> list[tuple]:
+        """(run_key, start_epoch_s, end_to_end_s) ordered by start time."""
+        return self.conn.execute(
+            "SELECT run_key, start_epoch_s, end_to_end_s FROM runs"
+            " WHERE start_epoch_s >= ? AND start_epoch_s <= ? ORDER BY start_epoch_s",
+            (since if since is not None else float("-inf"),
+             until if until is not None else float("inf")),
+        ).fetchall()
+
+    def _series_sql(self, metric: str) -> tuple[str, tuple]:
+        kind, _, arg = metric.partition(":")
+        if kind in _RUN_METRICS and not arg:
+            col = _RUN_METRICS[kind]
+            return f"SELECT r.run_key, r.start_epoch_s, r.{col} FROM runs r", ()
+        if kind == "phase" and arg:
+            return (
+                "SELECT r.run_key, r.start_epoch_s, SUM(p.duration_s) FROM phases p"
+                " JOIN runs r ON r.id = p.run_id WHERE p.name = ? GROUP BY r.id", (arg,),
+            )
+        if kind == "suite" and arg:
+            return (
+                "SELECT r.run_key, r.start_epoch_s, s.wall_clock_s FROM suites s"
+                " JOIN runs r ON r.id = s.run_id WHERE s.name = ?", (arg,),
+            )
+        if kind == "pool" and "/" in arg:
+            suite, pool = arg.split("/", 1)
+            return (
+                "SELECT r.run_key, r.start_epoch_s, p.wall_clock_s FROM pools p"
+                " JOIN runs r ON r.id = p.run_id WHERE p.suite = ? AND p.name = ?",
+                (suite, pool),
+            )
+        if kind == "test" and arg:
+            # Two indexed lookups beat an OR across history_id/uid
+            base = (
+                "SELECT r.run_key, r.start_epoch_s, t.duration_ms / 1000.0 FROM tests t"
+                " JOIN runs r ON r.id = t.run_id WHERE "
+            )
+            return (
+                f"{base}t.history_id = ? UNION ALL {base}t.uid = ? AND t.history_id IS NOT ?",
+                (arg, arg, arg),
+            )
+        raise ValueError(f"Unknown metric {metric!r}")
+
+    def metric_series(self, metric: str, last: int | None = None) -> list[Point]:
+        """Values of ``metric`` per run, oldest first (the newest ``last`` runs)."""
+        sql, params = self._series_sql(metric)
+        sql = f"SELECT * FROM ({sql}) ORDER BY 2 DESC"
+        if last is not None:
+            sql += f" LIMIT {int(last)}"
+        rows = self.conn.execute(sql, params).fetchall()
+        return [Point(*row) for row in reversed(rows)]
+
+    def trend(self, metric: str, last: int | None = None, window: int = 50) -> list[dict]:
+        """Percentile distribution of ``metric`` per window of ``window`` runs."""
+        points = self.metric_series(metric, last)
+        out = []
+        for i in range(0, len(points), window):
+            chunk = points[i:i + window]
+            d = distribution([p.value for p in chunk])
+            d["first_run"], d["last_run"] = chunk[0].run_key, chunk[-1].run_key
+            d["from_epoch_s"], d["to_epoch_s"] = chunk[0].start_epoch_s, chunk[-1].start_epoch_s
+            out.append(d)
+        return out
+
+    def test_history(self, key: str) -> list[tuple]:
+        """(run_key, status, duration_ms, retries) for a historyId or uid."""
+        return self.conn.execute(
+            "SELECT r.run_key, t.status, t.duration_ms, t.retries FROM tests t"
+            " JOIN runs r ON r.id = t.run_id WHERE t.history_id = ?"
+            " UNION ALL SELECT r.run_key, t.status, t.duration_ms, t.retries FROM tests t"
+            " JOIN runs r ON r.id = t.run_id WHERE t.uid = ? AND t.history_id IS NOT ?",
+            (key, key, key),
+        ).fetchall()
+
+
+def render_trend(metric: str, rows: list[dict]) -> str:
+    from datetime import datetime, timezone
+
+    lines = [
+        f"Trend for {metric}",
+        "",
+        f"{'from':<17} {'to':<17} {'runs':>5} {'p50':>9} {'p90':>9} {'p95':>9} {'max':>9}",
+    ]
+    for d in rows:
+        frm = datetime.fromtimestamp(d["from_epoch_s"], timezone.utc).strftime("%Y-%m-%d %H:%M")
+        to = datetime.fromtimestamp(d["to_epoch_s"], timezone.utc).strftime("%Y-%m-%d %H:%M")
+        lines.append(
+            f"{frm:<17} {to:<17} {d['count']:>5} {d['p50']:>9.1f} {d['p90']:>9.1f} "
+            f"{d['p95']:>9.1f} {d['max']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def render_outliers(outliers: list[Outlier], quantile: float) -> str:
+    if not outliers:
+        return f"No tests or phases above their historical p{quantile * 100:g}."
+    lines = [
+        f"{len(outliers)} above historical p{quantile * 100:g}:",
+        "",
+        f"{'kind':<6} {'scope':<13} {'value':>9} {'p' + format(quantile * 100, 'g'):>9} "
+        f"{'rank':>6} {'runs':>5}  name",
+    ]
+    for o in outliers:
+        lines.append(
+            f"{o.kind:<6} {o.scope or '-':<13} {o.value_s:>8.1f}s {o.threshold_s:>8.1f}s "
+            f"{o.rank:>6.3f} {o.history:>5}  {o.name}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,501 @@
+"""Seeded generator for synthetic pipeline-run directories.
+
+Writes a run directory with the same layout and record shapes as the real
+fixtures (``fixtures/2026-02-24-aep``), so every analyzer can be exercised
+at 10x-1000x the size we have real data for:
+
+- ``logs/concord-log.txt``: init/bootstrap/AWS/Mica/Helm phases, child
+  processes and N suspend/resume cycles, plus configurable filler output.
+- ``{kono,substantiate}-report/data/timeline.json`` and ``test-cases/``:
+  Allure v2 records across configurable hosts, workers and pools, including
+  retried (flaky) tests.
+- ``logs/webapp-logs.json`` / ``logs/dispatcher-logs.json``: Loki
+  ``query_range`` dumps of configurable size and job count.
+- ``metrics/*.json``: Prometheus ``query_range`` matrices.
+
+Output is fully determined by the config (including ``seed``). Large files
+are streamed record by record; memory use is O(workers), not O(tests).
+"""
+from __future__ import annotations
+
+import json
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Iterator
+
+
+@dataclass
+class SuiteSpec:
+    name: str
+    report_dir: str
+    tests: int
+    hosts: int = 1
+    workers_per_host: int = 8
+    pools: int = 1
+    # "forkjoin" gives Kono-style JVM worker names, "playwright" Substantiate-style
+    worker_style: str = "forkjoin"
+    median_duration_ms: int = 1500
+    duration_sigma: float = 1.0
+    flaky_rate: float = 0.0
+    fail_rate: float = 0.0
+    skip_rate: float = 0.0
+    packages: int = 20
+
+
+def _default_kono() -> SuiteSpec:
+    return SuiteSpec(
+        name="Kono", report_dir="kono-report", tests=1245, hosts=1,
+        workers_per_host=8, pools=2, worker_style="forkjoin",
+        median_duration_ms=700, duration_sigma=1.2,
+    )
+
+
+def _default_substantiate() -> SuiteSpec:
+    return SuiteSpec(
+        name="Substantiate", report_dir="substantiate-report", tests=256, hosts=1,
+        workers_per_host=8, pools=1, worker_style="playwright",
+        median_duration_ms=20000, duration_sigma=0.6, flaky_rate=0.004, skip_rate=0.02,
+    )
+
+
+@dataclass
+class SyntheticConfig:
+    seed: int = 0
+    start_epoch_s: float = 1771957264.907  # 2026-02-24T18:21:04.907Z
+    children: int = 2
+    resume_cycles: int = 2
+    concord_filler_lines: int = 5000
+    kono: SuiteSpec = field(default_factory=_default_kono)
+    substantiate: SuiteSpec = field(default_factory=_default_substantiate)
+    write_test_cases: bool = True
+    webapp_log_lines: int = 5000
+    dispatcher_jobs: int = 1
+    dispatcher_log_lines: int = 1200
+    metric_step_s: int = 30
+
+
+def _rng(config: SyntheticConfig, *parts) -> random.Random:
+    # String seeds are hashed with SHA-512, so this is stable across processes
+    return random.Random(":".join(str(p) for p in (config.seed, *parts)))
+
+
+def _hex(rng: random.Random, bits: int = 64) -> str:
+    return f"{rng.getrandbits(bits):0{bits // 4}x}"
+
+
+def _concord_ts(epoch_s: float) -> str:
+    dt = datetime.fromtimestamp(epoch_s, tz=timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}+0000"
+
+
+def _loki_ts(epoch_s: float) -> str:
+    dt = datetime.fromtimestamp(epoch_s, tz=timezone.utc)
+    return dt.strftime("%Y-%m-%d %H:%M:%S.") + f"{dt.microsecond // 1000:03d}"
+
+
+# --- Allure ---
+
+@dataclass
+class _Worker:
+    host: str
+    name: str
+    pool: int
+    index: int
+    tests: int
+
+
+def _worker_name(spec: SuiteSpec, host: str, pool: int, w: int) -> str:
+    if spec.worker_style == "forkjoin":
+        return f"3423@{host}.ForkJoinPool-{pool}-worker-{w}({20 + w * 7})"
+    return f"pid-{20 + pool}-worker-{w}"
+
+
+def _plan_workers(spec: SuiteSpec) -> list[_Worker]:
+    hosts = [f"agentpool-synth-{h:05d}" for h in range(spec.hosts)]
+    per_pool = [spec.tests // spec.pools + (1 if p < spec.tests % spec.pools else 0)
+                for p in range(spec.pools)]
+    workers: list[_Worker] = []
+    for p, pool_tests in enumerate(per_pool, 1):
+        slots = [(h, w) for h in hosts for w in range(1, spec.workers_per_host + 1)]
+        for i, (host, w) in enumerate(slots):
+            n = pool_tests // len(slots) + (1 if i < pool_tests % len(slots) else 0)
+            workers.append(_Worker(host, _worker_name(spec, host, p, w), p, w, n))
+    return workers
+
+
+@dataclass
+class _Attempt:
+    name: str
+    uid: str
+    history_id: str
+    package: str
+    status: str
+    start: int
+    stop: int
+    retry: bool
+    retries_count: int
+
+
+def _worker_attempts(
+    config: SyntheticConfig, spec: SuiteSpec, worker: _Worker, pool_start_ms: int
+) -> Iterator[_Attempt]:
+    rng = _rng(config, spec.name, worker.name)
+    t = pool_start_ms + rng.randint(0, 2000)
+    mu = math.log(spec.median_duration_ms)
+    for i in range(worker.tests):
+        package = f"{spec.name.lower()}.pkg{rng.randrange(spec.packages):03d}"
+        name = f"{spec.name} {worker.pool}.{worker.index}.{i}: verify {package} scenario"
+        history_id = f"{_hex(rng, 128)}:{_hex(rng, 128)}"
+        roll = rng.random()
+        flaky = roll < spec.flaky_rate
+        if flaky:
+            duration = max(1, int(rng.lognormvariate(mu, spec.duration_sigma)))
+            yield _Attempt(name, _hex(rng), history_id, package, "failed",
+                           t, t + duration, True, 0)
+            t += duration + rng.randint(5, 50)
+        if roll < spec.flaky_rate + spec.skip_rate and not flaky:
+            status, duration = "skipped", 0
+        elif roll < spec.flaky_rate + spec.skip_rate + spec.fail_rate and not flaky:
+            status = "failed"
+            duration = max(1, int(rng.lognormvariate(mu, spec.duration_sigma)))
+        else:
+            status = "passed"
+            duration = max(1, int(rng.lognormvariate(mu, spec.duration_sigma)))
+        yield _Attempt(name, _hex(rng), history_id, package, status,
+                       t, t + duration, False, 1 if flaky else 0)
+        t += duration + rng.randint(5, 50)
+
+
+def _pool_starts(config: SyntheticConfig, spec: SuiteSpec, workers: list[_Worker],
+                 start_ms: int) -> dict[int, int]:
+    """First pass: replay each worker's durations to find where pools start."""
+    starts: dict[int, int] = {}
+    t = start_ms
+    for p in range(1, spec.pools + 1):
+        starts[p] = t
+        end = t
+        for w in workers:
+            if w.pool == p:
+                for a in _worker_attempts(config, spec, w, t):
+                    end = max(end, a.stop)
+        t = end + 1000
+    return starts
+
+
+def _test_case(spec: SuiteSpec, worker: _Worker, a: _Attempt, prior_uid: str | None) -> dict:
+    retries = []
+    if prior_uid:
+        retries.append({"uid": prior_uid, "status": "failed", "statusDetails": "TimeoutError"})
+    return {
+        "uid": a.uid,
+        "name": a.name,
+        "fullName": f"{a.package.replace('.', '/')}.spec.ts:{int(a.uid[:4], 16) % 400 + 1}:5",
+        "historyId": a.history_id,
+        "time": {"start": a.start, "stop": a.stop, "duration": a.stop - a.start},
+        "status": a.status,
+        "flaky": False,
+        "retriesCount": a.retries_count,
+        "retriesStatusChange": a.retries_count > 0,
+        "labels": [
+            {"name": "package", "value": a.package},
+            {"name": "host", "value": worker.host},
+            {"name": "thread", "value": worker.name},
+            {"name": "suite", "value": a.package.split(".")[-1]},
+        ],
+        "retry": a.retry,
+        "extra": {"severity": "normal", "retries": retries, "categories": [], "tags": []},
+        "source": f"{a.uid}.json",
+    }
+
+
+def write_suite(config: SyntheticConfig, spec: SuiteSpec, run_dir: Path, start_ms: int) -> int:
+    """Write timeline.json (+ test-cases/) for one suite. Returns the suite end (ms)."""
+    data_dir = run_dir / spec.report_dir / "data"
+    cases_dir = data_dir / "test-cases"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    if config.write_test_cases:
+        cases_dir.mkdir(exist_ok=True)
+    workers = _plan_workers(spec)
+    pool_starts = _pool_starts(config, spec, workers, start_ms)
+    suite_end = start_ms
+
+    with open(data_dir / "timeline.json", "w") as f:
+        f.write(json.dumps({"uid": _hex(_rng(config, spec.name, "uid"), 128), "name": "timeline"})[:-1])
+        f.write(', "children": [')
+        hosts = list(dict.fromkeys(w.host for w in workers))
+        for hi, host in enumerate(hosts):
+            f.write(("," if hi else "") + json.dumps({"name": host})[:-1] + ', "children": [')
+            for wi, w in enumerate(x for x in workers if x.host == host):
+                f.write(("," if wi else "") + json.dumps({"name": w.name})[:-1] + ', "children": [')
+                prior_uid = None
+                for ai, a in enumerate(_worker_attempts(config, spec, w, pool_starts[w.pool])):
+                    record = {
+                        "name": a.name, "uid": a.uid, "status": a.status,
+                        "time": {"start": a.start, "stop": a.stop, "duration": a.stop - a.start},
+                        "flaky": False, "retriesCount": a.retries_count,
+                        "retriesStatusChange": a.retries_count > 0,
+                    }
+                    f.write(("," if ai else "") + json.dumps(record))
+                    if config.write_test_cases:
+                        with open(cases_dir / f"{a.uid}.json", "w") as cf:
+                            json.dump(_test_case(spec, w, a, prior_uid), cf)
+                    prior_uid = a.uid if a.retry else None
+                    suite_end = max(suite_end, a.stop)
+                f.write("]}")
+            f.write("]}")
+        f.write("]}")
+    return suite_end
+
+
+# --- Concord ---
+
+class _ConcordWriter:
+    def __init__(self, f: IO[str], t: float, rng: random.Random):
+        self.f = f
+        self.t = t
+        self.rng = rng
+
+    def line(self, msg: str, advance_s: float = 0.0) -> None:
+        self.t += advance_s
+        self.f.write(f"{_concord_ts(self.t)} [INFO ] {msg}\n")
+
+    def resume_prelude(self) -> None:
+        rng = self.rng
+        self.line("Storing policy '[default-policy]' data")
+        self.line("Acquired by: k8s-agent concord/agentpool-synth-00000 @ 10.0.0.1", rng.uniform(0.5, 16))
+        self.line("Exporting the repository data: https://github.com/example/ck8s-ext @ main:head, path: /", 0.4)
+        export_ms = rng.randint(600, 5500)
+        self.line(f"Repository data export took {export_ms}ms", export_ms / 1000)
+        self.line("Downloading the process state...", 0.013)
+        self.line(f"Process state download took {rng.randint(150, 250)}ms", 0.2)
+        self.line("Resolving process dependencies...", 0.3)
+        self.line("Checking the dependency policy...", rng.uniform(1.4, 2.6))
+        self.line("Process status: RUNNING", rng.uniform(1.4, 4.5))
+
+
+def _children(config: SyntheticConfig) -> list[str]:
+    rng = _rng(config, "concord-children")
+    return [
+        f"{_hex(rng, 32)}-{_hex(rng, 16)}-{_hex(rng, 16)}-{_hex(rng, 16)}-{_hex(rng, 48)}"
+        for _ in range(config.children)
+    ]
+
+
+def write_concord_deploy(config: SyntheticConfig, path: Path) -> dict[str, float]:
+    """Write the Concord log up to the first suspend; returns key epoch times."""
+    rng = _rng(config, "concord-deploy")
+    with open(path, "w") as f:
+        w = _ConcordWriter(f, config.start_epoch_s, rng)
+        w.resume_prelude()
+        w.line("Assuming role 'arn:aws:iam::000000000000:role/synth-role' with session 'concord'", 2.9)
+        w.line("Connecting to https://mica.infra.example.com", 2.9)
+        mica_s = w.t
+        step = 16.8 / max(1, config.concord_filler_lines)
+        for i in range(config.concord_filler_lines):
+            w.line(f"OUT:   config_key_{i}: value-{rng.randrange(1 << 30):x}", step)
+        w.line("OUT: INFO:root:Running helm upgrade/install of release 'aep' in namespace 'aep'",
+               max(0.0, mica_s + 16.8 - w.t))
+        w.line("OUT: Release \"aep\" has been upgraded. Happy Helming!", rng.uniform(55, 75))
+        w.line("OUT: STATUS: deployed")
+        w.line("OUT: INFO:root:Helm install/upgrade of release 'aep' in namespace 'aep' successful", 0.01)
+        helm_end_s = w.t
+        for child in _children(config):
+            w.line("Starting a child process (org=Example, project=dev1, repository=ck8s)", 0.5)
+            w.line(f"Started a process: <concord:instanceId>{child}</concord:instanceId>", 0.07)
+        w.line("Process status: SUSPENDED", 1.7)
+        return {"helm_end_s": helm_end_s, "suspend_s": w.t}
+
+
+def append_concord_resumes(
+    config: SyntheticConfig, path: Path, suspend_s: float, tests_end_s: float
+) -> float:
+    """Append the suspend/resume cycles; the last resume follows the tests. Returns end time."""
+    rng = _rng(config, "concord-resumes")
+    children = _children(config)
+    cycles = max(1, config.resume_cycles)
+    with open(path, "a") as f:
+        w = _ConcordWriter(f, suspend_s, rng)
+        for c in range(cycles):
+            if c == cycles - 1:
+                # Concord's polling interval leaves a gap after the last test
+                resume_at = tests_end_s + rng.uniform(45, 60)
+            else:
+                resume_at = suspend_s + (tests_end_s - suspend_s) * (c + 1) / cycles
+            w.t = max(w.t, resume_at)
+            w.resume_prelude()
+            w.line("State restored", 0.06)
+            child = children[min(c + 1, len(children) - 1)] if children else "none"
+            w.line(f"Waiting for <concord:instanceId>{child}</concord:instanceId>", 0.5)
+            w.line("Process finished with: 0", 1.0)
+            if c == cycles - 1:
+                w.line("Process status: FINISHED", 0.2)
+            else:
+                w.line("Process status: SUSPENDED", 0.4)
+        return w.t
+
+
+# --- Loki ---
+
+def _write_loki(path: Path, streams: list[tuple[dict, Iterator[tuple[int, str]]]]) -> None:
+    with open(path, "w") as f:
+        f.write('{"status": "success", "data": {"resultType": "streams", "result": [')
+        for si, (labels, values) in enumerate(streams):
+            f.write(("," if si else "") + '{"stream": ' + json.dumps(labels) + ', "values": [')
+            for vi, (ts_ns, msg) in enumerate(values):
+                f.write(("," if vi else "") + json.dumps([str(ts_ns), msg]))
+            f.write("]}")
+        f.write('], "stats": {}}}')
+
+
+def _webapp_values(config: SyntheticConfig, start_s: float, end_s: float) -> Iterator[tuple[int, str]]:
+    rng = _rng(config, "webapp")
+    n = config.webapp_log_lines
+    span = max(1.0, end_s - start_s)
+    # Loki returns newest first
+    for i in range(n - 1, -1, -1):
+        ts = start_s + span * i / max(1, n)
+        roll = rng.random()
+        stamp = _loki_ts(ts)
+        if roll < 0.0015:
+            msg = (f"{stamp} WARN  [EffectConsumer-main] c.a.a.c.c.b.d.EffectConsumer - "
+                   f"[JobEventPublished] {_hex(rng, 32)} - Handled in {rng.uniform(0.05, 2.5):.3f}s "
+                   f"- WARNING This message blocked the queue, should have been an actuator instead")
+        elif roll < 0.0045:
+            msg = (f"{stamp} WARN  [virtual-{rng.randrange(20000)}] c.a.a.w.c.OutputController - "
+                   f"Took {rng.randint(1, 20)} millis to check permission")
+        elif roll < 0.0075:
+            msg = (f"{stamp} ERROR [virtual-{rng.randrange(20000)}] [ANON|10.0.0.2] "
+                   f"c.a.a.f.h.e.ValidationExceptionHandler - ")
+        else:
+            msg = (f"{stamp} INFO  [EffectConsumer-main] c.a.a.c.c.b.d.EffectConsumer - "
+                   f"[JobProgressed] {_hex(rng, 32)} - Handled in {rng.uniform(0.005, 0.05):.3f} seconds")
+        yield int(ts * 1e9) + rng.randrange(1_000_000), msg
+
+
+def write_webapp_logs(config: SyntheticConfig, path: Path, start_s: float, end_s: float) -> None:
+    labels = {"app": "aep-helm-chart", "component": "webapp", "container": "webapp",
+              "namespace": "aep", "pod": "webapp-synth-00000", "stream": "stdout"}
+    _write_loki(path, [(labels, _webapp_values(config, start_s, end_s))])
+
+
+def dispatcher_job_windows(config: SyntheticConfig, start_s: float, end_s: float) -> list[tuple[str, float, float]]:
+    """(job_id, compute_start_s, compute_end_s) for each synthetic dispatcher job."""
+    rng = _rng(config, "dispatcher-jobs")
+    jobs = []
+    span = max(1.0, end_s - start_s)
+    for j in range(config.dispatcher_jobs):
+        begin = start_s + span * (j + rng.random()) / max(1, config.dispatcher_jobs)
+        jobs.append((str(236757 + j), begin, begin + rng.uniform(8, 30)))
+    return jobs
+
+
+def write_dispatcher_logs(config: SyntheticConfig, path: Path, start_s: float, end_s: float) -> None:
+    rng = _rng(config, "dispatcher")
+    streams = []
+    jobs = dispatcher_job_windows(config, start_s, end_s)
+    per_job = max(4, config.dispatcher_log_lines // max(1, len(jobs)))
+    for job_id, begin, finish in jobs:
+        pod = f"dispatcher-batch-job-{job_id}-{_hex(rng, 20)}"
+        labels = {"app": "dispatcher", "container": "main-container", "namespace": "aep", "pod": pod}
+
+        def stdout(job_id=job_id, begin=begin, finish=finish) -> Iterator[tuple[int, str]]:
+            values = [(begin, f"Running job {job_id}. Rerun: false")]
+            for i in range(per_job - 3):
+                ts = begin + (finish - begin) * (i + 1) / (per_job - 1)
+                values.append((ts, f"{_loki_ts(ts)} INFO  [main] c.a.a.e.c.s.JobDispatcher - step {i}"))
+            values.append((finish - 0.01, f"{_loki_ts(finish)} INFO  [main] c.a.a.e.c.s.JobDispatcher - Finished job {job_id}"))
+            values.append((finish, "Finished sending profiles to S3"))
+            for ts, msg in reversed(values):
+                yield int(ts * 1e9), msg
+
+        def stderr(begin=begin) -> Iterator[tuple[int, str]]:
+            yield int((begin - 0.01) * 1e9), "Operating System Metrics:"
+            yield int((begin - 1.3) * 1e9), "OpenJDK 64-Bit Server VM warning: Option FlightRecorder was deprecated"
+
+        streams.append((dict(labels, stream="stdout"), stdout()))
+        streams.append((dict(labels, stream="stderr"), stderr()))
+    _write_loki(path, streams)
+
+
+# --- Prometheus ---
+
+_METRIC_FILES = (
+    # (file name, __name__, container, baseline, noise, warmup peak)
+    ("webapp-cpu.json", "container_cpu_usage", "webapp", 0.3, 0.1, 2.09),
+    ("webapp-memory.json", "container_memory_working_set_bytes", "webapp", 1.6e9, 2e7, 1.7e9),
+    ("dispatcher-cpu.json", "container_cpu_usage", "dispatcher", 0.8, 0.3, 1.5),
+    ("dispatcher-memory.json", "container_memory_working_set_bytes", "dispatcher", 9e8, 5e7, 1e9),
+    ("hikaricp_connections_active_namespace__aep__pod__webapp_synth__.json",
+     "hikaricp_connections_active", "webapp", 1, 1, 4),
+    ("hikaricp_connections_pending_namespace__aep__pod__webapp_synth__.json",
+     "hikaricp_connections_pending", "webapp", 0, 0, 0),
+    ("jetty_threads_busy_namespace__aep__pod__webapp_synth__.json",
+     "jetty_threads_busy", "webapp", 4, 2, 12),
+    ("jvm_memory_used_bytes_namespace__aep__pod__webapp_synth__area__heap__.json",
+     "jvm_memory_used_bytes", "webapp", 6e8, 8e7, 9e8),
+    ("jvm_threads_current_namespace__aep__pod__webapp_synth__.json",
+     "jvm_threads_current", "webapp", 120, 5, 160),
+    ("rate_jvm_gc_collection_seconds_sum_namespace__aep__pod__webapp_synth_.json",
+     "jvm_gc_collection_seconds_sum", "webapp", 0.002, 0.001, 0.05),
+)
+
+
+def write_metrics(config: SyntheticConfig, metrics_dir: Path, start_s: float, end_s: float) -> None:
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+    first = int(start_s) // config.metric_step_s * config.metric_step_s
+    for fname, name, container, base, noise, peak in _METRIC_FILES:
+        rng = _rng(config, "metric", fname)
+        values = []
+        for i, ts in enumerate(range(first, int(end_s) + 1, config.metric_step_s)):
+            if i == 2:
+                v = peak
+            else:
+                v = max(0.0, base + rng.uniform(-noise, noise))
+            if name.startswith("hikaricp"):
+                v = round(min(v, peak))
+            values.append([ts, repr(float(v)) if not name.startswith("hikaricp") else str(int(v))])
+        data = {"status": "success", "data": {"resultType": "matrix", "result": [
+            {"metric": {"__name__": name, "container": container, "namespace": "aep"},
+             "values": values},
+        ]}}
+        with open(metrics_dir / fname, "w") as f:
+            json.dump(data, f)
+
+
+def scaled(factor: float, seed: int = 0) -> SyntheticConfig:
+    """Default (fixture-sized) config with every volume multiplied by ``factor``."""
+    config = SyntheticConfig(seed=seed)
+    for spec in (config.kono, config.substantiate):
+        spec.tests = max(1, int(spec.tests * factor))
+        # Grow the fleet with the suite so per-worker load stays realistic
+        spec.hosts = max(1, int(spec.hosts * math.sqrt(factor)))
+    config.concord_filler_lines = int(config.concord_filler_lines * factor)
+    config.webapp_log_lines = int(config.webapp_log_lines * factor)
+    config.dispatcher_jobs = max(1, int(config.dispatcher_jobs * factor))
+    config.dispatcher_log_lines = int(config.dispatcher_log_lines * factor)
+    return config
+
+
+def generate(config: SyntheticConfig, run_dir: str) -> Path:
+    """Write a complete synthetic run directory and return its path."""
+    out = Path(run_dir)
+    (out / "logs").mkdir(parents=True, exist_ok=True)
+    concord_log = out / "logs" / "concord-log.txt"
+
+    marks = write_concord_deploy(config, concord_log)
+    # Pods need about a minute after Helm before tests can start
+    tests_start_ms = int((marks["helm_end_s"] + 60.0) * 1000)
+    kono_end = write_suite(config, config.kono, out, tests_start_ms)
+    sub_end = write_suite(config, config.substantiate, out, tests_start_ms + 120_000)
+    tests_end_s = max(kono_end, sub_end) / 1000.0
+    end_s = append_concord_resumes(config, concord_log, marks["suspend_s"], tests_end_s)
+
+    write_webapp_logs(config, out / "logs" / "webapp-logs.json", marks["helm_end_s"], tests_end_s)
+    write_dispatcher_logs(
+        config, out / "logs" / "dispatcher-logs.json", tests_start_ms / 1000.0, tests_end_s
+    )
+    write_metrics(config, out / "metrics", config.start_epoch_s, end_s)
+    return out
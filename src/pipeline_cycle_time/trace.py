@@ -0,0 +1,158 @@
+"""Chrome / Perfetto trace of a whole run (Trace Event JSON format).
+
+Every ``events.EventTable`` row becomes a complete (``"X"``) event, or an
+instant (``"i"``) when it has no duration. Each source is a process and
+each track within it a thread: a test runs on its worker's track, a
+dispatcher event on its pod's, anything else on a track per event kind.
+Counters (``"C"``) show how many tests each suite was running and, given
+the metrics directory, every Prometheus series sample by sample.
+
+Events are written to disk one at a time as the table is walked, so memory
+stays flat however long the run; track ids are assigned on first use and
+announced with metadata events right before it. Timestamps are microseconds
+since the run's first event, whose epoch time is kept in ``otherData``.
+Open the file in https://ui.perfetto.dev or ``chrome://tracing``.
+"""
+from __future__ import annotations
+
+import json
+from array import array
+from pathlib import Path
+
+# Process order in the viewer; unknown sources follow in first-seen order
+SOURCES = ("concord", "dispatcher", "kono", "substantiate", "webapp", "prometheus")
+
+
+def _track(event) -> str:
+    if event.kind == "test":
+        return event.get("worker") or "tests"
+    if event.source == "dispatcher":
+        return event.entity if event.kind == "pod" else event.get("pod") or "compute"
+    if event.source == "concord":
+        return "resumes" if event.kind == "resume" else "orchestration"
+    if event.kind == "warning":
+        return f"warning: {event.entity}"
+    return event.kind
+
+
+def _args(attrs: dict | None) -> str:
+    if not attrs:
+        return ""
+    return ',"args":' + json.dumps(attrs, separators=(",", ":"), default=str)
+
+
+class _Writer:
+    def __init__(self, out, t0_ns: int):
+        self.out = out
+        self.t0 = t0_ns
+        self.count = 0
+        self.pids: dict[str, int] = {source: 0 for source in SOURCES}  # 0 = not announced
+        self.tids: dict[tuple[int, str], int] = {}
+        self.threads: dict[int, int] = {}  # pid -> tracks announced
+        self.counters: dict[tuple[str, str], str] = {}  # (source, name) -> event prefix
+
+    def raw(self, text: str) -> None:
+        self.out.write(",\n" if self.count else "\n")
+        self.out.write(text)
+        self.count += 1
+
+    def meta(self, name: str, pid: int, tid: int, args: dict) -> None:
+        self.raw(
+            f'{{"ph":"M","name":"{name}","pid":{pid},"tid":{tid},'
+            f'"args":{json.dumps(args, separators=(",", ":"))}}}'
+        )
+
+    def pid(self, source: str) -> int:
+        pid = self.pids.get(source)
+        if not pid:
+            known = source in SOURCES
+            pid = SOURCES.index(source) + 1 if known else len(self.pids) + 1
+            self.pids[source] = pid
+            self.meta("process_name", pid, 0, {"name": source})
+            self.meta("process_sort_index", pid, 0, {"sort_index": pid})
+        return pid
+
+    def tid(self, pid: int, track: str) -> int:
+        tid = self.tids.get((pid, track))
+        if tid is None:
+            tid = self.tids[(pid, track)] = self.threads[pid] = self.threads.get(pid, 0) + 1
+            self.meta("thread_name", pid, tid, {"name": track})
+            self.meta("thread_sort_index", pid, tid, {"sort_index": tid})
+        return tid
+
+    def ts(self, ns: int) -> str:
+        return f"{(ns - self.t0) / 1000:.3f}"
+
+    def span(self, event) -> None:
+        pid = self.pid(event.source)
+        tid = self.tid(pid, _track(event))
+        head = (
+            f'{{"name":{json.dumps(event.entity)},"cat":"{event.kind}",'
+            f'"pid":{pid},"tid":{tid},"ts":{self.ts(event.start_ns)}'
+        )
+        if event.end_ns > event.start_ns:
+            self.raw(f'{head},"ph":"X","dur":{(event.end_ns - event.start_ns) / 1000:.3f}'
+                     f'{_args(event.attrs)}}}')
+        else:
+            self.raw(f'{head},"ph":"i","s":"t"{_args(event.attrs)}}}')
+
+    def counter(self, source: str, name: str, ns: int, value: float) -> None:
+        prefix = self.counters.get((source, name))
+        if prefix is None:
+            prefix = self.counters[(source, name)] = (
+                f'{{"name":{json.dumps(name)},"ph":"C","pid":{self.pid(source)},"ts":'
+            )
+        self.raw(f'{prefix}{self.ts(ns)},"args":{{"value":{value:g}}}}}')
+
+
+def _running_tests(writer: _Writer, events, source: str) -> None:
+    """Counter of the tests ``source`` was running, stepping at every start and end."""
+    rows = events.indexes(source=source, kind="test")
+    column = events.start
+    starts = array("q", [column[i] for i in rows])  # already in time order
+    column = events.end
+    ends = array("q", sorted(column[i] for i in rows))
+    never = max(ends[-1], starts[-1]) + 1
+    running = i = j = 0
+    while i < len(starts) or j < len(ends):
+        t = min(starts[i] if i < len(starts) else never, ends[j] if j < len(ends) else never)
+        while j < len(ends) and ends[j] == t:
+            running -= 1
+            j += 1
+        while i < len(starts) and starts[i] == t:
+            running += 1
+            i += 1
+        writer.counter(source, "running tests", t, running)
+
+
+def _metric_counters(writer: _Writer, metrics_dir: str, offset_ns: int) -> None:
+    from .analyzers.metrics import SERIES, load_samples, series_paths
+    from .events import ns_from_s
+
+    for field_name, path in series_paths(metrics_dir).items():
+        _, label, unit = SERIES[field_name]
+        name = f"{label} ({unit})" if unit else label
+        for ts, value in load_samples(str(path)):
+            writer.counter("prometheus", name, ns_from_s(ts) - offset_ns, value)
+
+
+def write(events, path: str | Path, metrics_dir: str | None = None, skew=None) -> int:
+    """Write ``events`` (an ``events.EventTable``) as a trace file; returns the event count.
+
+    ``skew`` (a ``skew.ClockSkew``) moves metric samples onto the same clock
+    as ``events``, which the caller has already corrected with it.
+    """
+    t0 = events.start[0] if len(events) else 0
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as out:
+        out.write('{"displayTimeUnit":"ms","traceEvents":[')
+        writer = _Writer(out, t0)
+        for event in events:
+            writer.span(event)
+        for source in events.sources():
+            if events.first(source=source, kind="test") is not None:
+                _running_tests(writer, events, source)
+        if metrics_dir is not None:
+            offset = skew.offset_ns("prometheus") if skew is not None else 0
+            _metric_counters(writer, metrics_dir, offset)
+        out.write(f'\n],"otherData":{{"epoch_ns":{t0}}}}}\n')
+    return writer.count
@@ -127,6 +127,65 @@ class TestKonoReports:
         # Golden: 7.13x parallelism
         assert 6.5 < pool2.parallelism < 7.5
 
+    def test_pools_index_into_suite(self, fixtures_dir):
+        from pipeline_cycle_time.analyzers.test_reports import analyze_timeline
+        result = analyze_timeline(
+            os.path.join(fixtures_dir, "kono-report", "data", "timeline.json"), "Kono"
+        )
+        for pool in result.pools.values():
+            assert pool.suite_tests is result.tests
+            assert all(result.tests[i] == t for i, t in zip(pool.indexes, pool.tests))
+            assert all(t.pool == pool.name for t in pool.tests)
+            with pytest.raises(AttributeError):
+                pool.tests.append(pool.tests[0])  # a read-only view: add tests via the suite
+        assert sum(p.count for p in result.pools.values()) == len(result.tests)
+
+    def test_records_slotted_and_strings_interned(self, fixtures_dir):
+        from pipeline_cycle_time.analyzers.test_reports import analyze_timeline
+        result = analyze_timeline(
+            os.path.join(fixtures_dir, "kono-report", "data", "timeline.json"), "Kono"
+        )
+        assert not hasattr(result.tests[0], "__dict__")
+        assert len({id(t.status) for t in result.tests}) == len({t.status for t in result.tests})
+        assert len({id(t.worker) for t in result.tests}) == len({t.worker for t in result.tests})
+
+    def test_tests_stored_in_columns(self):
+        import tracemalloc
+
+        from pipeline_cycle_time.analyzers.test_reports import TestInfo, TestSuiteResult
+        n = 20_000
+        tracemalloc.start()
+        suite = TestSuiteResult(name="S")
+        for i in range(n):
+            start = 1_771_957_695_661 + i * 1000
+            suite.add_row("name", "uid", "passed", start, start + 5000 + i, 5000 + i,
+                          f"worker-{i % 40}", "Pool-1")
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert size / n < 80  # bytes per test besides its name and uid
+        row = suite.tests[-1]
+        assert row == TestInfo("name", "uid", "passed", row.start, row.stop, 5000 + n - 1,
+                               "worker-39", "Pool-1")
+        row.duration += 1  # rows write through to the columns
+        assert suite.tests.duration[-1] == 5000 + n
+
+    def test_tests_are_views_not_records(self):
+        from pipeline_cycle_time.analyzers.test_reports import TestInfo, TestRow, TestSuiteResult
+        info = TestInfo("a", "u1", "passed", 0, 10, 10, "w1", "Pool-1")
+        suite = TestSuiteResult(name="S", tests=[info])
+        assert not hasattr(suite.tests, "append")  # suite.add is the way in
+        row = suite.tests[0]
+        assert isinstance(row, TestRow) and not isinstance(row, TestInfo)
+        assert row == info and row is not suite.tests[0]
+        assert row.info() == info and isinstance(row.info(), TestInfo)
+        pool = suite.pools["Pool-1"]
+        assert isinstance(pool.tests, tuple) and pool.tests == (info,)
+        assert pool.tests[0] is not pool.tests[0]
+        suite.add(TestInfo("b", "u2", "failed", 10, 30, 20, "w1", "Pool-1"))
+        assert [t.name for t in pool.tests] == ["a", "b"]
+        # Library classes named Test* are not collected by pytest
+        assert TestRow.__test__ is False
+
 
 # --- Substantiate Test Reports ---
 
@@ -0,0 +1,64 @@
+"""Tests for fleet batch analysis."""
+import json
+from pathlib import Path
+
+import pytest
+
+FIXTURES_ROOT = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture
+def fixtures_root():
+    assert FIXTURES_ROOT.exists(), f"Fixtures not found at {FIXTURES_ROOT}"
+    return str(FIXTURES_ROOT)
+
+
+class TestDiscovery:
+    def test_finds_both_fixture_runs(self, fixtures_root):
+        from pipeline_cycle_time.batch import discover_runs
+        names = [p.name for p in discover_runs(fixtures_root)]
+        assert names == ["2026-02-24-aep", "2026-03-06-aep"]
+
+    def test_single_run_dir(self, fixtures_root):
+        from pipeline_cycle_time.batch import discover_runs
+        runs = discover_runs(str(Path(fixtures_root) / "2026-02-24-aep"))
+        assert len(runs) == 1
+
+
+class TestAggregate:
+    def test_phase_distribution_and_recurrence(self):
+        from pipeline_cycle_time.batch import aggregate
+        summaries = [
+            {
+                "end_to_end_s": e2e, "concord_s": 1000.0, "critical_resume_overhead_s": 9.0,
+                "phases": {"Helm": helm},
+                "suites": {"Kono": {"wall_clock_s": 280.0, "pools": {"Pool-1": 220.0}}},
+                "findings": [{"title": "A"}, {"title": "A"}] + ([{"title": "B"}] if b else []),
+            }
+            for e2e, helm, b in [(2000.0, 60.0, True), (2100.0, 70.0, False), (2200.0, 80.0, False)]
+        ]
+        agg = aggregate(summaries)
+        assert agg["runs"] == 3
+        assert agg["phases"]["Helm"]["p50"] == 70.0
+        assert agg["end_to_end_s"]["max"] == 2200.0
+        recurrence = {f["title"]: f["runs"] for f in agg["finding_recurrence"]}
+        # Duplicates within one run count once
+        assert recurrence == {"A": 3, "B": 1}
+
+
+class TestRunBatch:
+    def test_batch_is_resumable(self, fixtures_root, tmp_path):
+        from pipeline_cycle_time.batch import run_batch
+        first = run_batch(fixtures_root, str(tmp_path), jobs=2)
+        assert sorted(first.analyzed) == ["2026-02-24-aep", "2026-03-06-aep"]
+        assert (tmp_path / "2026-02-24-aep" / "ANALYSIS-REPORT.md").exists()
+        agg = json.loads((tmp_path / "aggregate.json").read_text())
+        assert agg["runs"] == 2
+        assert "Finding Recurrence" in (tmp_path / "AGGREGATE-REPORT.md").read_text()
+
+        # Simulate an interrupted batch: one run never finished
+        (tmp_path / "2026-03-06-aep" / "summary.json").unlink()
+        second = run_batch(fixtures_root, str(tmp_path), jobs=1)
+        assert second.analyzed == ["2026-03-06-aep"]
+        assert second.skipped == ["2026-02-24-aep"]
+        assert second.aggregate["runs"] == 2
@@ -0,0 +1,60 @@
+"""Tests for the benchmark harness and its regression gate."""
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "2026-02-24-aep"
+
+
+def _doc(**stages):
+    return {"results": {k: {"seconds": s, "peak_bytes": m} for k, (s, m) in stages.items()}}
+
+
+class TestBenchRun:
+    def test_every_stage_measured(self):
+        from pipeline_cycle_time.bench import bench_run
+        from pipeline_cycle_time.jsonio import available
+        results = bench_run(str(FIXTURES_DIR), repeat=1)
+        analyzers = [k for k in results if not k.startswith("json.")]
+        assert analyzers == [
+            "orchestration.analyze", "analyze_timeline.kono", "analyze_timeline.substantiate",
+            "analyze_test_cases", "analyze_webapp_logs", "analyze_dispatcher_logs",
+            "metrics.analyze", "skew.estimate", "correlate", "generate",
+        ]
+        for backend in available():
+            assert f"json.loki.webapp.{backend}" in results
+            assert f"json.test_cases.{backend}" in results
+        assert results["analyze_timeline.kono"].records == 1245
+        assert results["analyze_webapp_logs"].unit == "lines"
+        for r in results.values():
+            assert r.seconds > 0
+            assert r.records_per_s > 0
+            assert r.input_bytes > 0
+
+
+class TestCompare:
+    def test_slowdown_beyond_tolerance_flagged(self):
+        from pipeline_cycle_time.bench import compare
+        base = _doc(a=(0.100, 1000), b=(0.100, 1000))
+        cur = _doc(a=(0.130, 1000), b=(0.120, 1000))
+        regressions = compare(base, cur, tolerance=0.25)
+        assert [(r.key, r.metric) for r in regressions] == [("a", "seconds")]
+
+    def test_memory_growth_flagged(self):
+        from pipeline_cycle_time.bench import compare
+        regressions = compare(_doc(a=(0.1, 1000)), _doc(a=(0.1, 2000)), tolerance=0.25)
+        assert [r.metric for r in regressions] == ["peak_bytes"]
+
+    def test_tiny_absolute_slowdown_ignored(self):
+        from pipeline_cycle_time.bench import compare
+        assert compare(_doc(a=(0.001, 10)), _doc(a=(0.002, 10))) == []
+
+    def test_json_speedups(self):
+        from pipeline_cycle_time.bench import json_speedups
+        doc = _doc(**{"r/json.x.orjson": (0.1, 1), "r/json.x.stdlib": (0.3, 1),
+                      "r/json.y.stdlib": (0.2, 1)})
+        assert json_speedups(doc) == {"r/json.x": pytest.approx(3.0)}
+
+    def test_new_stage_not_a_regression(self):
+        from pipeline_cycle_time.bench import compare
+        assert compare(_doc(), _doc(a=(1.0, 10))) == []
@@ -0,0 +1,66 @@
+"""Tests for the input-fingerprinted analyzer result cache."""
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "2026-02-24-aep"
+
+
+@pytest.fixture
+def run_dir(tmp_path):
+    assert FIXTURES_DIR.exists(), f"Fixtures not found at {FIXTURES_DIR}"
+    dest = tmp_path / "run"
+    shutil.copytree(FIXTURES_DIR, dest, ignore=shutil.ignore_patterns("test-cases", "attachments"))
+    return str(dest)
+
+
+def _run(run_dir, cache_dir, **kw):
+    from pipeline_cycle_time import pipeline
+    from pipeline_cycle_time.cache import AnalysisCache
+    cache = AnalysisCache(cache_dir, **kw)
+    return pipeline.run(run_dir, cache=cache), cache.stats
+
+
+class TestAnalysisCache:
+    def test_second_run_is_all_hits(self, run_dir, tmp_path):
+        first, stats1 = _run(run_dir, str(tmp_path / "cache"))
+        assert stats1.hits == []
+        assert len(stats1.misses) == 6
+        second, stats2 = _run(run_dir, str(tmp_path / "cache"))
+        assert stats2.misses == []
+        assert len(stats2.hits) == 6
+        assert second.generate_report() == first.generate_report()
+
+    def test_only_changed_input_reruns(self, run_dir, tmp_path):
+        _run(run_dir, str(tmp_path / "cache"))
+        log = Path(run_dir) / "logs" / "dispatcher-logs.json"
+        st = log.stat()
+        os.utime(log, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        _, stats = _run(run_dir, str(tmp_path / "cache"))
+        assert stats.misses == ["dispatcher"]
+
+    def test_content_hash_ignores_touch(self, run_dir, tmp_path):
+        _run(run_dir, str(tmp_path / "cache"), content_hash=True)
+        metric = Path(run_dir) / "metrics" / "webapp-cpu.json"
+        st = metric.stat()
+        os.utime(metric, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        _, stats = _run(run_dir, str(tmp_path / "cache"), content_hash=True)
+        assert stats.misses == []
+
+    def test_analyzer_version_bump_invalidates(self, run_dir, tmp_path, monkeypatch):
+        from pipeline_cycle_time.analyzers import metrics
+        _run(run_dir, str(tmp_path / "cache"))
+        monkeypatch.setattr(metrics, "ANALYZER_VERSION", metrics.ANALYZER_VERSION + 1)
+        _, stats = _run(run_dir, str(tmp_path / "cache"))
+        assert stats.misses == ["metrics"]
+
+    def test_corrupt_entry_is_a_miss(self, run_dir, tmp_path):
+        cache_dir = tmp_path / "cache"
+        _run(run_dir, str(cache_dir))
+        for entry in (cache_dir / "orchestration").glob("*.bin"):
+            entry.write_bytes(b"not marshal")
+        analysis, stats = _run(run_dir, str(cache_dir))
+        assert stats.misses == ["orchestration"]
+        assert analysis.orchestration.resume_count == 2
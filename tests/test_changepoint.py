@@ -0,0 +1,137 @@
+"""Tests for change-point detection and the timeline phases built on it."""
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+class TestBinarySegmentation:
+    def test_finds_mean_shifts(self):
+        from pipeline_cycle_time.changepoint import NormalMeanCost, binary_segmentation
+        rng = random.Random(4)
+        values = [rng.gauss(mu, 1) for mu in [0] * 200 + [6] * 150 + [2] * 250]
+        cost = NormalMeanCost(values, [1.0] * len(values))
+        changes = binary_segmentation(cost, len(values), 20.0)
+        assert len(changes) == 2
+        assert abs(changes[0] - 200) <= 3 and abs(changes[1] - 350) <= 3
+
+    def test_flat_signal_has_no_changes(self):
+        from pipeline_cycle_time.changepoint import NormalMeanCost, bic_penalty, binary_segmentation
+        rng = random.Random(9)
+        values = [rng.gauss(3, 1) for _ in range(1_000)]
+        cost = NormalMeanCost(values, [1.0] * len(values))
+        assert binary_segmentation(cost, len(values), bic_penalty(len(values), 2, 3.0)) == []
+
+    def test_poisson_rate_change(self):
+        from pipeline_cycle_time.changepoint import PoissonRateCost, binary_segmentation
+        counts = [1 if i % 10 == 0 else 0 for i in range(500)] + [1] * 100
+        cost = PoissonRateCost(counts, [1.0] * len(counts))
+        assert binary_segmentation(cost, len(counts), 10.0, max_changes=1) == [500]
+
+    def test_admissible_vetoes_short_segments(self):
+        from pipeline_cycle_time.changepoint import NormalMeanCost, binary_segmentation
+        values = [0.0] * 100 + [9.0] * 3 + [0.0] * 100
+        cost = NormalMeanCost(values, [1.0] * len(values))
+        assert binary_segmentation(cost, len(values), 1.0) == [100, 103]
+        cuts = [0] + binary_segmentation(
+            cost, len(values), 1.0, lambda i, k, j: k - i >= 10 and j - k >= 10,
+        ) + [len(values)]
+        assert all(b - a >= 10 for a, b in zip(cuts, cuts[1:]))
+
+
+def _two_phase_suite(setup_workers, main_workers, setup_ms, total_ms, seed=0):
+    from pipeline_cycle_time.analyzers.test_reports import TestInfo, TestSuiteResult
+    rng = random.Random(seed)
+    suite = TestSuiteResult(name="Synthetic")
+    for t0, t1, workers in ((0, setup_ms, setup_workers), (setup_ms, total_ms, main_workers)):
+        for w in range(workers):
+            t = t0
+            while t < t1:
+                d = rng.randint(2_000, 20_000)
+                suite.add(TestInfo("t", f"{t0}-{w}-{t}", "passed", t, t + d, d, f"w{w}"))
+                t += d + rng.randint(0, 100)
+    return suite
+
+
+class TestTimelinePhases:
+    def test_detects_setup_boundary(self):
+        suite = _two_phase_suite(2, 12, 400_000, 1_200_000)
+        setup = suite.setup_phase_analysis()
+        assert setup["setup_duration_s"] == pytest.approx(400, abs=5)
+        assert setup["setup_workers"] == 2 and setup["all_workers"] == 12
+
+    def test_no_setup_when_concurrency_is_flat(self):
+        suite = _two_phase_suite(12, 12, 400_000, 1_200_000)
+        assert suite.setup_phase_analysis() == {}
+        # An explicit threshold still applies
+        assert suite.setup_phase_analysis(threshold_s=100.0)["setup_duration_s"] == 100.0
+
+    def test_detection_is_kept_until_the_next_add(self, monkeypatch):
+        from pipeline_cycle_time.analyzers.test_reports import TestInfo, TestSuiteResult
+        suite = _two_phase_suite(2, 12, 400_000, 1_200_000)
+        calls = []
+        phases = TestSuiteResult.timeline_phases
+        monkeypatch.setattr(
+            TestSuiteResult, "timeline_phases", lambda self: calls.append(1) or phases(self),
+        )
+        first = suite.setup_phase_analysis()
+        assert suite.setup_phase_analysis() == first and len(calls) == 1
+        # Callers get copies, so changing one leaves the kept result alone
+        first["setup_tests"] = -1
+        first["idle_worker_names"].append("x")
+        assert suite.setup_phase_analysis()["setup_tests"] != -1
+        assert "x" not in suite.setup_phase_analysis()["idle_worker_names"]
+        first = suite.setup_phase_analysis()
+        suite.add(TestInfo("t", "late", "passed", 1_200_000, 1_210_000, 10_000, "w0"))
+        assert suite.setup_phase_analysis()["main_tests"] == first["main_tests"] + 1
+        assert len(calls) == 2
+
+    def test_scales_to_100k_tests(self):
+        import time
+        suite = _two_phase_suite(4, 420, 300_000, 3_000_000, seed=1)
+        assert len(suite.tests) > 100_000
+        t = time.perf_counter()
+        phases = suite.timeline_phases()
+        assert time.perf_counter() - t < 20
+        assert phases[1]["start_s"] == pytest.approx(300, abs=5)
+
+    @pytest.mark.parametrize("run,boundary", [("2026-02-24-aep", 340.0), ("2026-03-06-aep", 312.9)])
+    def test_fixture_setup_chain(self, run, boundary):
+        from pipeline_cycle_time.analyzers.test_reports import analyze_timeline
+        suite = analyze_timeline(
+            str(FIXTURES / run / "substantiate-report" / "data" / "timeline.json"), "Substantiate",
+        )
+        setup = suite.setup_phase_analysis()
+        assert setup["setup_duration_s"] == pytest.approx(boundary, abs=0.5)
+        assert setup["setup_tests"] == 19
+        # Long-running (compute-wait) tests split from interactive ones at ~35s
+        assert 30 < suite.duration_cutoff_s() < 40
+
+
+def _duration_suite(durations_ms):
+    from pipeline_cycle_time.analyzers.test_reports import TestSuiteResult
+    suite = TestSuiteResult(name="Durations")
+    for i, d in enumerate(durations_ms):
+        suite.add_row("t", str(i), "passed", 0, d, d, "w0")
+    return suite
+
+
+class TestDurationCutoff:
+    def test_single_population_has_no_cutoff(self):
+        rng = random.Random(5)
+        suite = _duration_suite(
+            [int(math.exp(rng.gauss(math.log(8_000), 0.8))) for _ in range(2_000)]
+        )
+        assert suite.duration_cutoff_s() is None
+        # Callers fall back to the documented default
+        assert suite.polling_cutoff_s() == 16.0
+
+    def test_two_populations_split_between_them(self):
+        rng = random.Random(5)
+        short = [int(math.exp(rng.gauss(math.log(5_000), 0.4))) for _ in range(1_500)]
+        long = [int(math.exp(rng.gauss(math.log(120_000), 0.3))) for _ in range(500)]
+        cutoff = _duration_suite(short + long).duration_cutoff_s()
+        assert 15 < cutoff < 60
@@ -0,0 +1,81 @@
+"""Tests for the CLI entry point, including its import-time budget."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Cumulative microseconds allowed for `import pipeline_cycle_time.cli`, as
+# reported by `python -X importtime`. Generous enough for slow CI machines;
+# eagerly importing the analyzers, report or process pools blows well past it.
+CLI_IMPORT_BUDGET_US = 60_000
+
+# Nothing behind these should load just to parse arguments or print --help.
+HEAVY_MODULES = (
+    "pipeline_cycle_time.analyzers",
+    "pipeline_cycle_time.report",
+    "pipeline_cycle_time.pipeline",
+    "pipeline_cycle_time.fetchers",
+    "concurrent.futures.process",
+    "json",
+)
+
+
+def _env():
+    import pipeline_cycle_time
+    src = str(Path(pipeline_cycle_time.__file__).parent.parent)
+    return dict(os.environ, PYTHONPATH=src)
+
+
+def _importtime(module):
+    """Return {module: (self_us, cumulative_us)} for a fresh import of module."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=_env(), check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def _cli(*args):
+    return subprocess.run(
+        [sys.executable, "-m", "pipeline_cycle_time", *args],
+        capture_output=True, text=True, env=_env(),
+    )
+
+
+class TestImportBudget:
+    def test_cli_import_is_lightweight(self):
+        times = _importtime("pipeline_cycle_time.cli")
+        loaded = [m for m in times if m.startswith(HEAVY_MODULES)]
+        assert not loaded, f"CLI import eagerly loads {loaded}"
+
+    def test_cli_import_within_budget(self):
+        # Best of three to keep filesystem-cache noise out of the measurement
+        cumulative = min(
+            _importtime("pipeline_cycle_time.cli")["pipeline_cycle_time.cli"][1]
+            for _ in range(3)
+        )
+        assert cumulative < CLI_IMPORT_BUDGET_US, (
+            f"pipeline_cycle_time.cli import took {cumulative}us "
+            f"(budget {CLI_IMPORT_BUDGET_US}us); move new imports into the command handlers"
+        )
+
+
+class TestEntryPoint:
+    def test_help(self):
+        proc = _cli("--help")
+        assert proc.returncode == 0
+        assert "analyze" in proc.stdout
+
+    def test_no_command_exits_nonzero(self):
+        assert _cli().returncode == 1
+
+    def test_analyze_requires_source(self):
+        proc = _cli("analyze")
+        assert proc.returncode == 1
+        assert "--fixtures-dir" in proc.stderr
@@ -0,0 +1,113 @@
+"""Tests for the cross-source dependency graph and its critical path."""
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "2026-02-24-aep"
+S = 1_000_000_000
+
+
+def _diamond():
+    """a (0-10) feeds b (12-30) and c (10-15); both feed d (35-40)."""
+    from pipeline_cycle_time.analyzers.critical_path import DependencyGraph
+    g = DependencyGraph()
+    a = g.add_node("a", "task", 0, 10 * S)
+    b = g.add_node("b", "task", 12 * S, 30 * S)
+    c = g.add_node("c", "task", 10 * S, 15 * S)
+    d = g.add_node("d", "task", 35 * S, 40 * S)
+    g.add_edge(a, b)
+    g.add_edge(a, c)
+    g.add_edge(b, d)
+    g.add_edge(c, d, 0)
+    return g, (a, b, c, d)
+
+
+class TestSchedule:
+    def test_reproduces_observed_timeline(self):
+        g, (a, b, c, d) = _diamond()
+        s = g.schedule()
+        assert s.makespan_ns == 40 * S
+        assert list(s.earliest_start) == [0, 12 * S, 10 * S, 35 * S]
+        assert s.path == [a, b, d]
+
+    def test_slack(self):
+        g, (a, b, c, d) = _diamond()
+        s = g.schedule()
+        assert s.slack[a] == s.slack[b] == s.slack[d] == 0
+        # c could finish as late as b's end plus b's 5s wait before d
+        assert s.slack[c] == 20 * S
+
+    def test_what_if_reschedules(self):
+        g, (a, b, c, d) = _diamond()
+        # b's 18s vanish (d still waits 5s after it, c's branch ends sooner)
+        assert g.saving_ns(durations={b: 0}) == 18 * S
+        # With the wait gone as well, c's branch becomes the limit
+        assert g.saving_ns(durations={b: 0}, lags={g.edges(b, d)[0]: 0}) == 20 * S
+        assert g.saving_ns(durations={c: 0}) == 0
+        # Dropping the observed wait before b
+        assert g.saving_ns(lags={g.edges(a, b)[0]: 0}) == 2 * S
+        # Start-to-start via a negative lag: b starts together with a
+        assert g.saving_ns(lags={g.edges(a, b)[0]: -10 * S}) == 12 * S
+        assert g.schedule().makespan_ns == 40 * S  # base schedule untouched
+
+    def test_cycle_rejected(self):
+        g, (a, b, c, d) = _diamond()
+        g.add_edge(d, a, 0)
+        with pytest.raises(ValueError, match="cycle"):
+            g.schedule()
+
+    def test_linear_in_graph_size(self):
+        import time
+
+        from pipeline_cycle_time.analyzers.critical_path import DependencyGraph
+
+        def timed(n):
+            g = DependencyGraph()
+            for i in range(n):
+                g.add_node(f"n{i}", "task", i * 10, i * 10 + 5)
+                if i:
+                    g.add_edge(i - 1, i)
+                if i >= 7:
+                    g.add_edge(i - 7, i, 0)
+            t = time.perf_counter()
+            assert g.schedule().makespan_ns == n * 10 - 5
+            return time.perf_counter() - t
+
+        small, large = min(timed(5_000) for _ in range(2)), min(timed(40_000) for _ in range(2))
+        assert large < 20 * small
+
+
+@pytest.fixture(scope="module")
+def analysis():
+    from pipeline_cycle_time import pipeline
+    return pipeline.run(str(FIXTURES_DIR))
+
+
+class TestFixtureGraph:
+    def test_longest_path_is_the_run(self, analysis):
+        from pipeline_cycle_time.analyzers import critical_path
+        graph = critical_path.build(analysis.events(), {"substantiate": 340.0})
+        s = graph.schedule()
+        assert s.makespan_s == pytest.approx(analysis.orchestration.total_duration_s)
+        path = [graph.names[i] for i in s.path]
+        assert path[:2] == ["start", "phase:Init"]
+        assert "substantiate:main" in path and path[-2:] == ["resume:#2", "end"]
+
+    def test_nodes_cover_every_source(self, analysis):
+        from pipeline_cycle_time.analyzers import critical_path
+        graph = critical_path.build(analysis.events())
+        kinds = set(graph.kinds)
+        assert {"phase", "child", "pool", "pod", "job", "poll", "resume"} <= kinds
+        s = graph.schedule()
+        assert s.slack[graph.node("kono:Pool-2")] > 0
+        assert s.slack[graph.node("resume:#1")] > 0
+
+    def test_correlation_uses_the_graph(self, analysis):
+        corr = analysis.correlation
+        assert corr.end_to_end_s == pytest.approx(analysis.orchestration.total_duration_s)
+        assert corr.critical_path[-1] == "resume:#2"
+        by_title = {f.title: f for f in corr.findings}
+        assert by_title["Parallelize Substantiate Setup Chain"].estimated_savings_s == "131s"
+        # Kono finishes ~11 minutes before Substantiate: running its pools
+        # concurrently does not shorten the run
+        assert by_title["Run Kono ForkJoinPools Concurrently"].estimated_savings_s.startswith("0s")
@@ -0,0 +1,95 @@
+"""Tests for the run-to-run diff engine."""
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+RUN_A = FIXTURES / "2026-02-24-aep"
+RUN_B = FIXTURES / "2026-03-06-aep"
+
+
+@pytest.fixture(scope="module")
+def runs():
+    from pipeline_cycle_time import pipeline
+    return pipeline.run(str(RUN_A)), pipeline.run(str(RUN_B))
+
+
+def _suite(name, *tests):
+    from pipeline_cycle_time.analyzers.test_reports import TestInfo, TestSuiteResult
+    suite = TestSuiteResult(name=name)
+    for uid, test_name, duration in tests:
+        suite.add(TestInfo(test_name, uid, "passed", 0, duration, duration, "w"))
+    return suite
+
+
+class TestDiffTests:
+    def test_hash_join_by_name(self):
+        from pipeline_cycle_time.analyzers.diff import diff_tests
+        before = _suite("S", ("u1", "a", 1000), ("u2", "b", 2000), ("u3", "gone", 500))
+        after = _suite("S", ("v1", "a", 3000), ("v2", "b", 1000), ("v3", "new", 700))
+        matched, added, removed = diff_tests(before, after)
+        assert {t.name: t.delta_s for t in matched} == {"a": 2.0, "b": -1.0}
+        assert [t.name for t in added] == ["new"]
+        assert [t.name for t in removed] == ["gone"]
+
+    def test_retries_summed_under_one_key(self):
+        from pipeline_cycle_time.analyzers.diff import diff_tests
+        before = _suite("S", ("u1", "a", 1000))
+        after = _suite("S", ("v1", "a", 1000), ("v2", "a", 1500))
+        (t,), added, _ = diff_tests(before, after)
+        assert not added
+        assert t.after_s == 2.5
+        assert (t.before_attempts, t.after_attempts) == (1, 2)
+
+    def test_history_key_survives_renames(self):
+        from pipeline_cycle_time.analyzers.diff import diff_tests
+        before = _suite("S", ("u1", "p[obj@1a2b]", 1000))
+        after = _suite("S", ("v1", "p[obj@9f8e]", 4000))
+        matched, added, removed = diff_tests(
+            before, after, key="history", history_before={"u1": "h"}, history_after={"v1": "h"},
+        )
+        assert [t.delta_s for t in matched] == [3.0]
+        assert not added and not removed
+
+    def test_unknown_key(self):
+        from pipeline_cycle_time.analyzers.diff import diff_tests
+        with pytest.raises(ValueError):
+            diff_tests(_suite("S"), _suite("S"), key="fullName")
+
+
+class TestDiffRuns:
+    def test_fixture_runs(self, runs):
+        from pipeline_cycle_time.analyzers.diff import diff_runs
+        d = diff_runs(*runs)
+        assert [p.name for p in d.phases] == [
+            "Init", "Bootstrap", "AWS", "Config/Mica", "Helm", "Suspended",
+        ]
+        helm = next(p for p in d.phases if p.name == "Helm")
+        assert helm.delta_s < 0
+        assert [r.name for r in d.resumes] == ["#1", "#2"]
+        assert d.resumes[1].after_critical
+        pool1 = next(p for p in d.pools if p.suite == "Kono" and p.name == "Pool-1")
+        assert pool1.delta_s > 50
+        slowest = d.slowest_tests(5)
+        assert [t.delta_s for t in slowest] == sorted((t.delta_s for t in slowest), reverse=True)
+        assert all(t.before_s >= 1.0 for t in d.relative_tests(20))
+
+    def test_history_ids_match_more_tests_than_names(self, runs):
+        from pipeline_cycle_time import pipeline
+        from pipeline_cycle_time.analyzers.diff import diff_runs
+        by_name = diff_runs(*runs)
+        by_history = diff_runs(
+            *runs, key="history",
+            history_before=pipeline.history_ids(str(RUN_A)),
+            history_after=pipeline.history_ids(str(RUN_B)),
+        )
+        assert len(by_history.added) < len(by_name.added)
+        assert len(by_history.tests) > len(by_name.tests)
+
+    def test_render(self, runs):
+        from pipeline_cycle_time.analyzers.diff import diff_runs
+        from pipeline_cycle_time.report.diff import render
+        report = render(diff_runs(*runs), top=3)
+        assert report.startswith("# CI Pipeline Run Comparison")
+        assert "| Helm |" in report
+        assert "## Added and Removed Tests" in report
@@ -0,0 +1,116 @@
+"""Tests for the cross-source nanosecond event table."""
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "2026-02-24-aep"
+
+
+def _table():
+    from pipeline_cycle_time.events import EventTable
+    table = EventTable()
+    table.add("concord", "phase", "Helm", 100, 400)
+    table.add("kono", "test", "a", 150, 250, worker="w1")
+    table.add("kono", "test", "b", 50, 120, worker="w2")  # out of order
+    table.add("kono", "test", "c", 300, 350, worker="w1")
+    table.add("concord", "resume", "#1", 500, 520)
+    table.add("concord", "suspend", "concord", 450)
+    return table
+
+
+class TestConversions:
+    def test_datetime_exact(self):
+        from pipeline_cycle_time.events import ns_from_datetime
+        dt = datetime(2026, 2, 24, 18, 21, 4, 907000, tzinfo=timezone(timedelta(hours=1)))
+        assert ns_from_datetime(dt) == 1771953664907000000
+
+    def test_units_agree(self):
+        from pipeline_cycle_time.events import ns_from_ms, ns_from_s
+        assert ns_from_ms(1771953664907) == ns_from_s(1771953664.907) == 1771953664907000000
+
+
+class TestQueries:
+    def test_sorted_once_by_start(self):
+        table = _table()
+        assert list(table.start) == [50, 100, 150, 300, 450, 500]
+        assert [e.entity for e in table] == ["b", "Helm", "a", "c", "concord", "#1"]
+
+    def test_range_and_filters(self):
+        table = _table()
+        assert [e.entity for e in table.filter(start_ns=100, end_ns=300)] == ["Helm", "a"]
+        assert [e.entity for e in table.filter(source="kono")] == ["b", "a", "c"]
+        assert [e.entity for e in table.filter(source="kono", start_ns=140)] == ["a", "c"]
+        assert table.filter(source="nope") == []
+        assert table.first(kind="resume", start_ns=400).entity == "#1"
+        assert table.last(source="kono").entity == "c"
+        assert table.first(kind="resume", start_ns=600) is None
+
+    def test_overlapping(self):
+        table = _table()
+        # Helm (100-400) starts before the window but overlaps it
+        hits = table.filter(start_ns=200, end_ns=320, overlapping=True)
+        assert [e.entity for e in hits] == ["Helm", "a", "c"]
+        assert [e.entity for e in table.filter(kind="test", start_ns=200, end_ns=320,
+                                               overlapping=True)] == ["a", "c"]
+
+    def test_group_by_column_and_attribute(self):
+        table = _table()
+        assert {k: len(v) for k, v in table.group("source").items()} == {"kono": 3, "concord": 3}
+        by_worker = table.group("worker", kind="test")
+        assert [e.entity for e in by_worker["w1"]] == ["a", "c"]
+        assert table.span(kind="test") == (50, 350)
+
+    def test_adding_after_a_query_resorts(self):
+        table = _table()
+        assert table.first().entity == "b"
+        table.add("kono", "test", "z", 10, 20)
+        assert table.first().entity == "z"
+        assert [e.entity for e in table.filter(source="kono")] == ["z", "b", "a", "c"]
+
+    def test_extend_matches_add(self):
+        from pipeline_cycle_time.events import EventTable
+        bulk = EventTable()
+        bulk.extend("kono", "test", ["b", "a"], [50, 10], [60, 30], [{"w": 1}, None])
+        assert [(e.entity, e.start_ns, e.end_ns, e.attrs) for e in bulk] == [
+            ("a", 10, 30, None), ("b", 50, 60, {"w": 1}),
+        ]
+
+
+@pytest.fixture(scope="module")
+def analysis():
+    from pipeline_cycle_time import pipeline
+    return pipeline.run(str(FIXTURES_DIR))
+
+
+class TestFromAnalysis:
+    def test_every_source_emits(self, analysis):
+        table = analysis.events()
+        assert table.sources() == [
+            "concord", "dispatcher", "kono", "prometheus", "substantiate", "webapp",
+        ]
+        assert len(table.filter(source="kono", kind="test")) == analysis.kono.total_tests
+        phases = [e.entity for e in table.filter(source="concord", kind="phase")]
+        assert phases == [p.name for p in analysis.orchestration.phases]
+
+    def test_cross_source_query(self, analysis):
+        from pipeline_cycle_time.events import ns_from_ms
+        table = analysis.events()
+        last_test_end = table.span(kind="test")[1]
+        assert last_test_end == ns_from_ms(
+            max(t.stop for suite in (analysis.kono, analysis.substantiate) for t in suite.tests)
+        )
+        resume = table.first(source="concord", kind="resume", start_ns=last_test_end)
+        critical = [r for r in analysis.orchestration.resume_overheads if r.on_critical_path]
+        assert resume.start_ns / 1e9 == pytest.approx(critical[0].resume_time.timestamp())
+
+    def test_aligned_events_apply_the_clock_skew(self, analysis):
+        from dataclasses import replace
+        from pipeline_cycle_time.analyzers.skew import ClockOffset, ClockSkew
+        skew = ClockSkew({"kono": ClockOffset("kono", 5 * 10**9, None, None, 0)}, [])
+        shifted = replace(analysis, correlation=replace(analysis.correlation, clock_skew=skew))
+        raw = analysis.events().span(source="kono")
+        aligned = shifted.aligned_events().span(source="kono")
+        assert aligned == (raw[0] - 5 * 10**9, raw[1] - 5 * 10**9)
+        # Without a correlation (or a skew) the events stay as recorded
+        assert replace(analysis, correlation=None).aligned_events().span(source="kono") == raw
@@ -0,0 +1,165 @@
+"""Tests for the shared Grafana proxy request scheduler."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+URL = "https://grafana.example/api/datasources/proxy/uid/loki_logs/loki/api/v1/query_range"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, s):
+        self.sleeps.append(s)
+        self.now += s
+
+
+def _scripted(responses):
+    from pipeline_cycle_time.fetchers.scheduler import Response
+    calls = []
+
+    def transport(url, headers, timeout_s):
+        calls.append(url)
+        status, hdrs = responses.pop(0)
+        return Response(status, hdrs, b'{"status": "success"}')
+
+    return transport, calls
+
+
+class TestTokenBucket:
+    def test_burst_then_throttle(self):
+        from pipeline_cycle_time.fetchers.scheduler import TokenBucket
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, burst=3, clock=clock, sleep=clock.sleep)
+        for _ in range(3):
+            assert bucket.acquire() == 0.0
+        # Fourth token needs 0.5s of refill at 2 tokens/s
+        assert bucket.acquire() == pytest.approx(0.5)
+
+
+class TestRetryAfter:
+    def test_delta_seconds(self):
+        from pipeline_cycle_time.fetchers.scheduler import parse_retry_after
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        from pipeline_cycle_time.fetchers.scheduler import parse_retry_after
+        delay = parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now_epoch_s=1445412500.0)
+        assert delay == pytest.approx(10.0)
+
+    def test_garbage(self):
+        from pipeline_cycle_time.fetchers.scheduler import parse_retry_after
+        assert parse_retry_after("soon") is None
+
+
+class TestRequestScheduler:
+    def test_retries_honor_retry_after(self):
+        from pipeline_cycle_time.fetchers.scheduler import RequestScheduler
+        clock = FakeClock()
+        transport, calls = _scripted([(429, {"Retry-After": "12"}), (200, {})])
+        sched = RequestScheduler(transport=transport, clock=clock, sleep=clock.sleep, seed=1)
+        assert sched.get_json(URL) == {"status": "success"}
+        assert len(calls) == 2
+        assert sched.retries == 1
+        # Backoff delay is at least the server-requested 12s
+        assert max(clock.sleeps) >= 12.0
+
+    def test_non_retryable_status_raises(self):
+        from pipeline_cycle_time.fetchers.scheduler import RequestError, RequestScheduler
+        clock = FakeClock()
+        transport, calls = _scripted([(401, {})])
+        sched = RequestScheduler(transport=transport, clock=clock, sleep=clock.sleep)
+        with pytest.raises(RequestError) as exc:
+            sched.get(URL)
+        assert exc.value.status == 401
+        assert len(calls) == 1
+
+    def test_gives_up_after_max_attempts(self):
+        from pipeline_cycle_time.fetchers.scheduler import RequestError, RequestScheduler, RetryPolicy
+        clock = FakeClock()
+        transport, calls = _scripted([(503, {})] * 3)
+        sched = RequestScheduler(
+            retry=RetryPolicy(max_attempts=3), transport=transport,
+            clock=clock, sleep=clock.sleep, seed=0,
+        )
+        with pytest.raises(RequestError):
+            sched.get(URL)
+        assert len(calls) == 3
+
+    def test_latency_histogram_per_endpoint(self):
+        from pipeline_cycle_time.fetchers.scheduler import RequestScheduler
+        transport, _ = _scripted([(200, {})] * 4)
+        sched = RequestScheduler(transport=transport, rate_per_s=1000, burst=1000)
+        sched.map([URL, URL, URL + "?q=1", "https://grafana.example/api/health"])
+        summary = sched.latency_summary()
+        assert summary["/api/datasources/proxy/uid/loki_logs/loki/api/v1/query_range"]["count"] == 3
+        assert summary["/api/health"]["count"] == 1
+
+    def test_bounded_concurrency(self):
+        from pipeline_cycle_time.fetchers.scheduler import RequestScheduler, Response
+        lock = threading.Lock()
+        active = [0, 0]  # current, peak
+
+        def transport(url, headers, timeout_s):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return Response(200, {}, b"{}")
+
+        sched = RequestScheduler(
+            transport=transport, max_concurrency=2, rate_per_s=1000, burst=1000
+        )
+        # Many caller threads, but only two requests may be in flight at once
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(sched.get, [URL] * 16))
+        assert active[1] <= 2
+
+    def test_hedging_takes_faster_attempt(self):
+        from pipeline_cycle_time.fetchers.scheduler import RequestScheduler, Response
+        calls = []
+
+        def transport(url, headers, timeout_s):
+            calls.append(url)
+            if len(calls) == 1:
+                time.sleep(0.5)  # slow shard
+                return Response(200, {}, b'"slow"')
+            return Response(200, {}, b'"fast"')
+
+        sched = RequestScheduler(
+            transport=transport, hedge_after_s=0.05, rate_per_s=1000, burst=1000
+        )
+        try:
+            assert sched.get(URL).json() == "fast"
+            assert sched.hedges_issued == 1
+        finally:
+            sched.close()
+
+    def test_hedging_waits_past_a_retryable_status(self):
+        from pipeline_cycle_time.fetchers.scheduler import RequestScheduler, Response
+        calls = []
+
+        def transport(url, headers, timeout_s):
+            calls.append(url)
+            if len(calls) == 1:
+                time.sleep(0.3)  # slow shard that succeeds
+                return Response(200, {}, b'"slow"')
+            return Response(503, {}, b"")  # the hedge fails fast
+
+        sched = RequestScheduler(
+            transport=transport, hedge_after_s=0.05, rate_per_s=1000, burst=1000
+        )
+        try:
+            assert sched.get(URL).json() == "slow"
+            assert sched.hedges_issued == 1 and sched.retries == 0
+        finally:
+            sched.close()
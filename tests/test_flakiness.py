@@ -0,0 +1,87 @@
+"""Tests for cross-run flakiness and retry-waste accounting."""
+import json
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+RUN_A = FIXTURES / "2026-02-24-aep"
+
+
+def _write_run(root, name, flaky):
+    """A run with one stable test and one that flakes (1 retry) when ``flaky``."""
+    cases = root / name / "substantiate-report" / "data" / "test-cases"
+    cases.mkdir(parents=True)
+    (cases / "stable.json").write_text(json.dumps({
+        "uid": f"{name}-s", "historyId": "h-stable", "name": "stable", "status": "passed",
+        "time": {"start": 0, "stop": 1000, "duration": 1000}, "retriesCount": 0,
+    }))
+    final = {
+        "uid": f"{name}-f", "historyId": "h-flaky", "name": "flaky", "status": "passed",
+        "time": {"start": 40_000, "stop": 50_000, "duration": 10_000},
+        "retriesCount": 0, "extra": {"retries": []},
+    }
+    if flaky:
+        final["retriesCount"] = 1
+        final["retriesStatusChange"] = True
+        final["extra"]["retries"] = [{"uid": f"{name}-r", "status": "failed"}]
+        (cases / "attempt.json").write_text(json.dumps({
+            "uid": f"{name}-r", "historyId": "h-flaky", "name": "flaky", "status": "failed",
+            "retry": True, "time": {"start": 10_000, "stop": 40_000, "duration": 30_000},
+        }))
+    (cases / "flaky.json").write_text(json.dumps(final))
+    return str(root / name)
+
+
+class TestFlakiness:
+    def test_fixture_retry_counted(self):
+        from pipeline_cycle_time.analyzers.flakiness import analyze_runs
+        result = analyze_runs([str(RUN_A)])
+        (flaky,) = result.ranked()
+        assert flaky.suite == "Substantiate"
+        assert (flaky.runs, flaky.retried_runs, flaky.flaky_runs) == (1, 1, 1)
+        assert flaky.retry_s == pytest.approx(71.822)
+        assert flaky.attempts == 2
+        # The retried attempt is not counted as a test of its own
+        assert sum(t.runs for t in result.tests if t.suite == "Substantiate") == 255
+
+    def test_rates_and_waste_across_runs(self, tmp_path):
+        from pipeline_cycle_time.analyzers.flakiness import analyze_runs
+        runs = [_write_run(tmp_path, f"r{i}", flaky=i < 2) for i in range(4)]
+        result = analyze_runs(runs)
+        (flaky,) = result.ranked()
+        assert flaky.name == "flaky"
+        assert flaky.flake_rate == 0.5
+        lo, hi = flaky.flake_rate_ci
+        assert lo < 0.5 < hi
+        assert flaky.retry_s == 60.0
+        assert flaky.delay_s == 60.0
+        assert result.expected_waste_s(flaky) == 15.0
+        assert result.expected_waste_upper_s(flaky) > result.expected_waste_s(flaky)
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        from pipeline_cycle_time.analyzers.flakiness import analyze_runs
+        runs = [_write_run(tmp_path, f"r{i}", flaky=i % 2 == 0) for i in range(3)]
+        seq, par = analyze_runs(runs), analyze_runs(runs, jobs=2)
+        key = lambda r: sorted((t.history_id, t.runs, t.flaky_runs, t.retry_s) for t in r.tests)
+        assert key(seq) == key(par)
+        assert par.runs == runs
+
+    def test_unreadable_run_reported(self, tmp_path):
+        from pipeline_cycle_time.analyzers.flakiness import analyze_runs
+        good = _write_run(tmp_path, "good", flaky=False)
+        bad = _write_run(tmp_path, "bad", flaky=False)
+        (Path(bad) / "substantiate-report/data/test-cases/stable.json").write_text("{")
+        result = analyze_runs([good, bad])
+        assert result.runs == [good]
+        assert list(result.failed_runs) == [bad]
+
+
+class TestWilsonInterval:
+    def test_bounds(self):
+        from pipeline_cycle_time.stats import wilson_interval
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+        lo, hi = wilson_interval(0, 10)
+        assert lo == 0.0 and 0.2 < hi < 0.35
+        lo, hi = wilson_interval(50, 100)
+        assert lo == pytest.approx(0.404, abs=0.002) and hi == pytest.approx(0.596, abs=0.002)
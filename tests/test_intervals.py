@@ -0,0 +1,64 @@
+"""Tests for the interval index used to join log lines to running tests."""
+import random
+from array import array
+
+
+def _brute(starts, ends, points, values):
+    counts, worst = [], []
+    for s, e in zip(starts, ends):
+        inside = [v for p, v in zip(points, values) if s <= p <= e]
+        counts.append(len(inside))
+        worst.append(max(inside, default=0.0))
+    return counts, worst
+
+
+class TestIntervalIndex:
+    def test_closed_bounds(self):
+        from pipeline_cycle_time.intervals import IntervalIndex
+        index = IntervalIndex([10, 20, 40], [20, 30, 35])
+        points = array("q", [10, 20, 20, 30, 36])
+        assert list(index.count(points)) == [3, 3, 0]
+
+    def test_matches_brute_force(self):
+        from pipeline_cycle_time.intervals import IntervalIndex
+        rng = random.Random(7)
+        points = array("q", sorted(rng.randrange(10_000) for _ in range(3_000)))
+        values = array("d", [rng.random() for _ in points])
+        starts = [rng.randrange(10_000) for _ in range(400)]
+        ends = [s + rng.randrange(2_000) for s in starts]
+        index = IntervalIndex(starts, ends)
+        counts, worst = _brute(starts, ends, points, values)
+        assert list(index.count(points)) == counts
+        assert list(index.max(points, values)) == worst
+
+    def test_scales_to_millions_of_points(self):
+        import time
+
+        from pipeline_cycle_time.intervals import IntervalIndex
+        rng = random.Random(3)
+        points = array("q", sorted(rng.randrange(10**12) for _ in range(1_000_000)))
+        values = array("d", [rng.random() for _ in points])
+        starts = [rng.randrange(10**12) for _ in range(100_000)]
+        index = IntervalIndex(starts, [s + rng.randrange(10**10) for s in starts])
+        t = time.perf_counter()
+        counts = index.count(points)
+        index.max(points, values)
+        assert time.perf_counter() - t < 10
+        assert sum(counts) > 0
+
+
+class TestRangeMax:
+    def test_every_range(self):
+        from pipeline_cycle_time.intervals import RangeMax
+        rng = random.Random(1)
+        values = array("d", [rng.random() for _ in range(150)])
+        rmq = RangeMax(values)
+        for i in range(0, 150, 7):
+            for j in range(i, 151, 5):
+                assert rmq.query(i, j, -1.0) == max(values[i:j], default=-1.0)
+
+
+def test_merge_unions_overlaps():
+    from pipeline_cycle_time.intervals import merge
+    starts, ends = merge([5, 0, 12, 20, 21], [10, 6, 15, 30, 25])
+    assert list(zip(starts, ends)) == [(0, 10), (12, 15), (20, 30)]
@@ -0,0 +1,76 @@
+"""Tests for the pluggable JSON decoding layer."""
+import json
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "2026-02-24-aep"
+
+# Documents orjson rejects but the stdlib accepts; the fallback must make
+# both backends agree on them.
+STDLIB_ONLY = [
+    b'{"v": NaN}',
+    b'{"v": [Infinity, -Infinity, 1e400]}',
+    b'{"v": "\\ud800"}',
+]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request):
+    from pipeline_cycle_time import jsonio
+    if request.param not in jsonio.available():
+        pytest.skip(f"{request.param} not installed")
+    return request.param
+
+
+class TestLoads:
+    def test_bytes_and_str(self, backend):
+        from pipeline_cycle_time import jsonio
+        doc = {"a": [1, 2.5, None, True], "b": "é"}
+        raw = json.dumps(doc)
+        assert jsonio.loads(raw.encode(), backend) == doc
+        assert jsonio.loads(raw, backend) == doc
+
+    @pytest.mark.parametrize("raw", STDLIB_ONLY)
+    def test_matches_stdlib_where_orjson_is_stricter(self, backend, raw):
+        from pipeline_cycle_time import jsonio
+        assert repr(jsonio.loads(raw, backend)) == repr(json.loads(raw))
+
+    def test_malformed_raises_stdlib_error(self, backend):
+        from pipeline_cycle_time import jsonio
+        with pytest.raises(json.JSONDecodeError):
+            jsonio.loads(b'{"a": ', backend)
+
+    def test_unknown_backend(self):
+        from pipeline_cycle_time import jsonio
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            jsonio._select("simdjson")
+
+
+class TestFiles:
+    def test_iter_load_streams_in_order(self, backend, tmp_path):
+        from pipeline_cycle_time import jsonio
+        paths = []
+        for i in range(3):
+            paths.append(tmp_path / f"{i}.json")
+            paths[-1].write_bytes(json.dumps({"i": i}).encode())
+        assert [(p.name, d["i"]) for p, d in jsonio.iter_load(paths, backend)] == [
+            ("0.json", 0), ("1.json", 1), ("2.json", 2),
+        ]
+
+    def test_fixture_documents_identical_across_backends(self):
+        from pipeline_cycle_time import jsonio
+        paths = [p for p in FIXTURES_DIR.rglob("*.json")]
+        assert paths
+        for path in paths:
+            expected = repr(json.loads(path.read_text()))
+            for b in jsonio.available():
+                assert repr(jsonio.load(path, b)) == expected, (path, b)
+
+    def test_analysis_identical_across_backends(self, monkeypatch):
+        from pipeline_cycle_time import jsonio, pipeline
+        reports = set()
+        for b in jsonio.available():
+            monkeypatch.setattr(jsonio, "default_backend", b)
+            reports.add(pipeline.run(str(FIXTURES_DIR)).generate_report())
+        assert len(reports) == 1
@@ -0,0 +1,82 @@
+"""Tests for joining classified webapp log lines to running tests."""
+from array import array
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "2026-02-24-aep"
+MS = 1_000_000
+
+
+def _suite(name, spans):
+    from pipeline_cycle_time.analyzers.test_reports import TestInfo, TestSuiteResult
+    suite = TestSuiteResult(name=name)
+    for uid, (start, stop) in spans.items():
+        suite.add(TestInfo(uid, uid, "passed", start, stop, stop - start, "w1"))
+    return suite
+
+
+def _logs(rows):
+    """``(ms, kind, latency_s)`` rows as an ``AppLogsResult``."""
+    from pipeline_cycle_time.analyzers.app_logs import AppLogsResult
+    rows = sorted(rows)
+    return AppLogsResult(
+        line_ns=array("q", [ms * MS for ms, _, _ in rows]),
+        line_kind=array("B", [k for _, k, _ in rows]),
+        line_latency_s=array("d", [lat for _, _, lat in rows]),
+    )
+
+
+def test_classify():
+    from pipeline_cycle_time.analyzers.app_logs import EFFECT, ERROR, VALIDATION, classify
+    assert classify(
+        "WARN  [EffectConsumer-main] c.a.EffectConsumer - [CountMeasure] ab - Handled in 0.126 seconds"
+    ) == [(EFFECT, 0.126)]
+    assert classify("ERROR [v-1] c.a.a.f.h.e.ValidationExceptionHandler - ") == [
+        (ERROR, 0.0), (VALIDATION, 0.0),
+    ]
+    assert classify("INFO  [main] started") == []
+
+
+class TestAttribute:
+    def test_lines_charged_to_overlapping_tests(self):
+        from pipeline_cycle_time.analyzers.app_logs import EFFECT, ERROR
+        from pipeline_cycle_time.analyzers.log_attribution import attribute
+        suite = _suite("Kono", {"a": (0, 100), "b": (50, 150), "c": (300, 400)})
+        logs = _logs([
+            (10, ERROR, 0.0), (60, EFFECT, 2.5), (100, ERROR, 0.0), (200, ERROR, 0.0),
+            (310, EFFECT, 0.5),
+        ])
+        result = attribute(logs, [suite], {"a": "pkg.one", "b": "pkg.one", "c": "pkg.two"})
+        a, b, c = (result.tests[u] for u in "abc")
+        assert (a.errors, a.warnings, a.worst_latency_s) == (2, 1, 2.5)
+        assert (b.errors, b.warnings, b.worst_latency_s) == (1, 1, 2.5)
+        assert (c.errors, c.warnings, c.worst_latency_s) == (0, 1, 0.5)
+        # Lines overlapped by both a and b count once for their package
+        one = result.packages["pkg.one"]
+        assert (one.errors, one.warnings) == (2, 1)
+        assert (result.outside.errors, result.outside.warnings) == (1, 0)
+        assert [t.name for t in result.ranked()] == ["a", "b", "c"]
+
+    def test_clock_skew_moves_tests_onto_log_clock(self):
+        from pipeline_cycle_time.analyzers.app_logs import ERROR
+        from pipeline_cycle_time.analyzers.log_attribution import attribute
+        from pipeline_cycle_time.analyzers.skew import ClockOffset, ClockSkew
+        suite = _suite("Kono", {"a": (0, 100)})
+        logs = _logs([(150, ERROR, 0.0)])
+        assert attribute(logs, [suite]).tests == {}
+        # Kono's clock reads 100ms behind Concord, Loki's is in step
+        skew = ClockSkew({"kono": ClockOffset("kono", -100 * MS, None, None, 0)}, [], True)
+        assert attribute(logs, [suite], skew=skew).tests["a"].errors == 1
+
+    def test_fixture_attributes_validation_errors(self):
+        from pipeline_cycle_time import pipeline
+        run_dir = str(FIXTURES_DIR)
+        analysis = pipeline.run(run_dir)
+        result = analysis.log_attribution(pipeline.packages(run_dir))
+        assert result.total.errors == analysis.app_logs.error_count == 15
+        assert result.total.worst_latency_s == pytest.approx(0.234)
+        top = result.ranked("packages")[0]
+        assert top.name == "measures.common.measure-analyzer.spec.ts"
+        assert top.errors + result.outside.errors <= 15
+        assert result.outside.errors == 2
@@ -0,0 +1,63 @@
+"""Tests for the analyzer stage graph and compact result packing."""
+import os
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "2026-02-24-aep"
+
+
+@pytest.fixture
+def fixtures_dir():
+    assert FIXTURES_DIR.exists(), f"Fixtures not found at {FIXTURES_DIR}"
+    return str(FIXTURES_DIR)
+
+
+class TestPacking:
+    def test_roundtrip_every_result_type(self, fixtures_dir):
+        from pipeline_cycle_time import pipeline
+        from pipeline_cycle_time.packing import pack, unpack
+        analysis = pipeline.run(fixtures_dir)
+        for name in ("orchestration", "kono", "substantiate", "app_logs", "dispatcher", "metrics"):
+            original = getattr(analysis, name)
+            assert unpack(pack(original)) == original, f"{name} did not round-trip"
+
+    def test_roundtrip_keeps_pool_membership(self, fixtures_dir):
+        from pipeline_cycle_time.analyzers.test_reports import analyze_timeline
+        from pipeline_cycle_time.packing import pack, unpack
+        kono = analyze_timeline(
+            os.path.join(fixtures_dir, "kono-report", "data", "timeline.json"), "Kono"
+        )
+        restored = unpack(pack(kono))
+        assert list(restored.pools) == list(kono.pools)
+        assert restored.pools["Pool-2"].count == 1060
+
+    def test_packed_form_is_marshallable(self, fixtures_dir):
+        import marshal
+        from pipeline_cycle_time.analyzers.orchestration import analyze
+        from pipeline_cycle_time.packing import pack, unpack
+        orch = analyze(os.path.join(fixtures_dir, "logs", "concord-log.txt"))
+        assert unpack(marshal.loads(marshal.dumps(pack(orch)))) == orch
+
+    def test_unknown_type_rejected(self):
+        from pipeline_cycle_time.packing import pack
+        with pytest.raises(TypeError):
+            pack(object())
+
+
+class TestPipeline:
+    def test_parallel_matches_sequential(self, fixtures_dir):
+        from pipeline_cycle_time import pipeline
+        sequential = pipeline.run(fixtures_dir, jobs=1)
+        parallel = pipeline.run(fixtures_dir, jobs=3)
+        assert parallel.generate_report() == sequential.generate_report()
+        assert parallel.orchestration == sequential.orchestration
+
+    def test_stage_cycle_detected(self, fixtures_dir):
+        from pipeline_cycle_time import pipeline
+        stages = (
+            pipeline.Stage("a", "analyzers.metrics:analyze", (), deps=("b",)),
+            pipeline.Stage("b", "analyzers.metrics:analyze", (), deps=("a",)),
+        )
+        with pytest.raises(ValueError):
+            pipeline.run(fixtures_dir, stages=stages)
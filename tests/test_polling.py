@@ -0,0 +1,99 @@
+"""Tests for the dispatcher-job / Substantiate-test polling join."""
+import random
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+S = 1_000_000_000
+
+
+def _brute_containing(inner, outer):
+    out = []
+    for s, e in inner:
+        held = [j for j, (os, oe) in enumerate(outer) if os <= s and oe >= e]
+        out.append(max(held, key=lambda j: (outer[j][0], j)) if held else -1)
+    return out
+
+
+class TestContaining:
+    def test_matches_brute_force(self):
+        from pipeline_cycle_time.intervals import containing
+        rng = random.Random(5)
+        outer = [(s, s + rng.randrange(1, 500)) for s in (rng.randrange(10_000) for _ in range(300))]
+        inner = [(s, s + rng.randrange(1, 60)) for s in (rng.randrange(10_000) for _ in range(300))]
+        held = containing(*zip(*inner), *zip(*outer))
+        expected = _brute_containing(inner, outer)
+        # Ties on start may pick either interval; both must contain the job
+        for i, (got, want) in enumerate(zip(held, expected)):
+            assert (got < 0) == (want < 0)
+            if got >= 0:
+                assert outer[got][0] == outer[want][0]
+                assert outer[got][0] <= inner[i][0] and outer[got][1] >= inner[i][1]
+
+    def test_thousands_of_jobs_and_tests(self):
+        import time
+
+        from pipeline_cycle_time.intervals import containing
+        rng = random.Random(2)
+        tests = [(s, s + rng.randrange(10, 120) * S) for s in
+                 (rng.randrange(3_600) * S for _ in range(20_000))]
+        jobs = [(s + 2 * S, e - 3 * S) for s, e in rng.sample(tests, 5_000)]
+        t = time.perf_counter()
+        held = containing(*zip(*jobs), *zip(*tests))
+        assert time.perf_counter() - t < 5
+        assert all(j >= 0 for j in held)
+
+
+def _table(tests, jobs):
+    from pipeline_cycle_time.events import EventTable
+    table = EventTable()
+    for uid, (s, e) in tests.items():
+        table.add("substantiate", "test", f"test {uid}", s * S, e * S, uid=uid)
+    for job_id, (s, e) in jobs.items():
+        table.add("dispatcher", "compute", job_id, s * S, e * S)
+    return table
+
+
+class TestAnalyze:
+    def test_overshoot_per_test(self):
+        from pipeline_cycle_time.analyzers.polling import analyze
+        table = _table(
+            {"a": (0, 100), "b": (10, 60), "c": (200, 230)},
+            # j1 sits in both a and b: b started later, so b launched it
+            {"j1": (20, 45), "j2": (70, 80), "j3": (85, 90), "j4": (300, 310)},
+        )
+        result = analyze(table)
+        waits = {w.uid: w for w in result.waits}
+        assert waits["b"].overshoot_s == 15
+        # a waited on j2 and j3 and noticed the last one 10s late
+        assert (waits["a"].job_id, waits["a"].jobs, waits["a"].overshoot_s) == ("j3", 2, 10)
+        assert "c" not in waits
+        assert result.unmatched_jobs == ["j4"]
+        dist = result.distribution()
+        assert (dist["count"], dist["min"], dist["max"]) == (2, 10, 15)
+        assert result.total_overshoot_s == 25
+
+
+def test_dispatcher_logs_keep_every_job(tmp_path):
+    from pipeline_cycle_time.analyzers.app_logs import analyze_dispatcher_logs
+    from pipeline_cycle_time.synthetic import SyntheticConfig, generate
+    config = SyntheticConfig(seed=3, concord_filler_lines=100, webapp_log_lines=100,
+                             dispatcher_log_lines=60, dispatcher_jobs=4)
+    config.kono.tests = 40
+    config.substantiate.tests = 20
+    run = Path(generate(config, str(tmp_path / "run")))
+    timeline = analyze_dispatcher_logs(str(run / "logs" / "dispatcher-logs.json"))
+    assert [j.job_id for j in timeline.jobs] == [str(236757 + j) for j in range(4)]
+    assert timeline.jobs[0].job_id == timeline.job_id
+    assert all(j.compute_start_ns < j.compute_end_ns for j in timeline.jobs)
+
+
+@pytest.mark.parametrize("run,waits", [("2026-02-24-aep", 1), ("2026-03-06-aep", 0)])
+def test_fixture_overshoot(run, waits):
+    from pipeline_cycle_time import pipeline
+    corr = pipeline.run(str(FIXTURES / run)).correlation
+    overshoot = corr.polling_overshoot_s
+    assert overshoot.get("count", 0) == waits
+    if waits:
+        assert overshoot["p50"] == pytest.approx(4.13, abs=0.01)
@@ -0,0 +1,99 @@
+"""Tests for per-stage profiling of the analysis pipeline."""
+import json
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "2026-02-24-aep"
+
+
+def _profiled_run(**kw):
+    from pipeline_cycle_time import pipeline
+    from pipeline_cycle_time.profiling import Profiler
+    profiler = Profiler(**kw)
+    analysis = pipeline.run(str(FIXTURES_DIR), profiler=profiler)
+    return analysis, profiler
+
+
+class TestProfiler:
+    def test_every_stage_profiled(self):
+        _, profiler = _profiled_run(trace_memory=True)
+        by_name = {s.name: s for s in profiler.stages}
+        assert list(by_name) == [
+            "orchestration", "kono", "substantiate", "app_logs", "dispatcher", "metrics",
+            "correlation",
+        ]
+        kono = by_name["kono"]
+        assert kono.records == 1245 and kono.unit == "tests"
+        assert kono.input_bytes == (FIXTURES_DIR / "kono-report/data/timeline.json").stat().st_size
+        assert kono.wall_s > 0 and kono.cpu_s > 0
+        assert kono.peak_bytes > 0
+
+    def test_results_unchanged_by_profiling(self):
+        from pipeline_cycle_time import pipeline
+        plain = pipeline.run(str(FIXTURES_DIR)).generate_report()
+        profiled, _ = _profiled_run()
+        assert profiled.generate_report() == plain
+
+    def test_memory_tracing_is_opt_in(self):
+        from pipeline_cycle_time.profiling import Profiler
+        calls = []
+        profiler = Profiler()
+        profiler.measure("toy", [], lambda: calls.append(1))
+        assert calls == [1]  # each stage runs once
+        assert profiler.stages[0].peak_bytes is None
+
+    def test_pstats_dump_per_stage(self, tmp_path):
+        import pstats
+        _profiled_run(pstats_dir=str(tmp_path))
+        assert (tmp_path / "metrics.pstats").exists()
+        stats = pstats.Stats(str(tmp_path / "kono.pstats"))
+        assert any(func[2] == "analyze_timeline" for func in stats.stats)
+
+    def test_profile_and_trace_output(self, tmp_path):
+        _, profiler = _profiled_run()
+        profiler.write(str(tmp_path / "profile.json"))
+        profiler.write_trace(str(tmp_path / "trace.json"))
+        doc = json.loads((tmp_path / "profile.json").read_text())
+        assert doc["stages"][0]["name"] == "orchestration"
+        events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+        assert len(events) == 7
+        assert all(e["ph"] == "X" and e["dur"] > 0 for e in events)
+        starts = [e["ts"] for e in events]
+        assert starts == sorted(starts)
+
+    def test_tracers_stay_out_of_the_timed_run(self, tmp_path):
+        import tracemalloc
+
+        from pipeline_cycle_time.profiling import Profiler
+        calls = []
+
+        def stage():
+            calls.append(tracemalloc.is_tracing())
+            return "a\nb"
+
+        profiler = Profiler(trace_memory=True, pstats_dir=str(tmp_path))
+        assert profiler.measure("toy", [], stage) == "a\nb"
+        assert calls == [False, True, False]  # timed, tracemalloc, cProfile
+        prof = profiler.stages[0]
+        assert prof.records == 2 and prof.peak_bytes is not None
+        assert (tmp_path / "toy.pstats").exists()
+
+
+def test_cli_profiles_memory_only_when_asked(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    import pipeline_cycle_time
+    env = dict(os.environ, PYTHONPATH=str(Path(pipeline_cycle_time.__file__).parent.parent))
+    peaks = []
+    for extra in ([], ["--profile-memory"]):
+        path = tmp_path / "profile.json"
+        subprocess.run(
+            [sys.executable, "-m", "pipeline_cycle_time", "analyze", "--fixtures-dir",
+             str(FIXTURES_DIR), "--output", str(tmp_path / "report.md"), "--jobs", "1",
+             "--profile", str(path), *extra],
+            check=True, capture_output=True, env=env,
+        )
+        peaks.append({s["name"]: s["peak_bytes"] for s in json.loads(path.read_text())["stages"]})
+    assert all(p is None for p in peaks[0].values())
+    assert all(p > 0 for p in peaks[1].values())
@@ -0,0 +1,160 @@
+"""Tests for the rule-based findings engine."""
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "2026-02-24-aep"
+S = 1_000_000_000
+
+
+def _chain_graph():
+    """Three back-to-back 10s tasks: every shortening is on the critical path."""
+    from pipeline_cycle_time.analyzers.critical_path import DependencyGraph
+    g = DependencyGraph()
+    nodes = [g.add_node(name, "task", i * 10 * S, (i + 1) * 10 * S) for i, name in enumerate("abc")]
+    g.add_edge(nodes[0], nodes[1])
+    g.add_edge(nodes[1], nodes[2])
+    return g
+
+
+def _facts(calls):
+    from pipeline_cycle_time.analyzers.rules import FactsBase, shared
+
+    class Facts(FactsBase):
+        @shared
+        def graph(self):
+            calls.append("graph")
+            return _chain_graph()
+
+    return Facts(label="run", missing=None)
+
+
+def _rules(seen):
+    """Rule ``n`` shortens task ``a`` by ``n`` seconds; ``info`` has no what-if."""
+    from pipeline_cycle_time.analyzers.correlator import Finding
+    from pipeline_cycle_time.analyzers.rules import Rule
+
+    def make(name, cut_s):
+        def what_if(facts):
+            return {"durations": {facts.graph.node("a"): (10 - cut_s) * S}}
+
+        def finding(facts, saved_ns):
+            seen.append(name)
+            return Finding(0, name, "", "", f"{saved_ns // S}s", "Low", "P1")
+        return Rule(name, ("graph",), finding, what_if)
+
+    def info(facts, saved_ns):
+        seen.append("info")
+        return Finding(0, "info", "", "", "N/A", "N/A", "Informational")
+
+    return [
+        make("two", 2), make("five", 5), Rule("info", ("label",), info), make("one", 1),
+        Rule("needs-missing", ("missing",), info), make("eight", 8),
+    ]
+
+
+class TestEvaluate:
+    def test_ranked_by_saving_then_order(self):
+        from pipeline_cycle_time.analyzers.rules import evaluate
+        calls, seen = [], []
+        findings = evaluate(_facts(calls), _rules(seen))
+        assert [f.title for f in findings] == ["eight", "five", "two", "one", "info"]
+        assert [f.rank for f in findings] == [1, 2, 3, 4, 5]
+        assert findings[0].estimated_savings_s == "8s"
+        assert calls == ["graph"]  # shared once across rules
+
+    def test_top_skips_rules_that_cannot_place(self):
+        from pipeline_cycle_time.analyzers.rules import evaluate
+        seen = []
+        findings = evaluate(_facts([]), _rules(seen), top=2)
+        assert [f.title for f in findings] == ["eight", "five"]
+        # Only the top findings are written out
+        assert sorted(seen) == ["eight", "five"]
+
+    def test_top_skips_rules_that_find_nothing(self):
+        from pipeline_cycle_time.analyzers.correlator import Finding
+        from pipeline_cycle_time.analyzers.rules import Rule, evaluate
+        seen = []
+
+        def info(name, found):
+            def finding(facts, saved_ns):
+                seen.append(name)
+                return Finding(0, name, "", "", "N/A", "N/A", "Informational") if found else None
+            return Rule(name, ("label",), finding)
+
+        rules = [info("none", False), info("a", True), info("b", True), info("c", True)]
+        findings = evaluate(_facts([]), rules, top=2)
+        assert [f.title for f in findings] == ["a", "b"]
+        assert seen == ["none", "a", "b"]
+
+    def test_threads_give_the_same_ranking(self):
+        from pipeline_cycle_time.analyzers.rules import evaluate
+        serial = evaluate(_facts([]), _rules([]))
+        calls = []
+        threaded = evaluate(_facts(calls), _rules([]), jobs=4)
+        assert [f.title for f in threaded] == [f.title for f in serial]
+        assert calls == ["graph"]
+
+    def test_what_if_none_drops_the_rule(self):
+        from pipeline_cycle_time.analyzers.correlator import Finding
+        from pipeline_cycle_time.analyzers.rules import Rule, evaluate
+        rules = [Rule("never", (), lambda f, s: Finding(0, "x", "", "", "", "", ""), lambda f: None)]
+        assert evaluate(_facts([]), rules) == []
+
+    def test_duplicate_registration(self):
+        from pipeline_cycle_time.analyzers.rules import rule
+        with pytest.raises(ValueError):
+            rule("setup-chain")(lambda facts, saved_ns: None)
+
+    def test_needs_are_checked(self):
+        from pipeline_cycle_time.analyzers.correlator import Facts
+        from pipeline_cycle_time.analyzers.rules import RULES, Rule, evaluate, rule
+        with pytest.raises(ValueError, match="setup_chian"):
+            rule("typo", needs=("substantiate", "setup_chian"), facts=Facts)
+        # Neither an input nor a shared fact (a plain property)
+        with pytest.raises(ValueError, match="events"):
+            rule("property", needs=("events",), facts=Facts)
+        assert not any(r.name in ("typo", "property") for r in RULES)
+        with pytest.raises(ValueError, match="nonesuch"):
+            evaluate(_facts([]), [Rule("x", ("nonesuch",), lambda f, s: None)])
+        # A shared fact is available; an input given as None is not
+        facts = Facts(substantiate=None)
+        assert facts.has("setup_chain") and not facts.has("kono")
+
+
+@pytest.fixture(scope="module")
+def analysis():
+    from pipeline_cycle_time import pipeline
+    return pipeline.run(str(FIXTURES_DIR))
+
+
+def _correlate(analysis, **kwargs):
+    from pipeline_cycle_time.analyzers import correlator
+    a = analysis
+    return correlator.correlate(
+        a.orchestration, a.kono, a.substantiate, a.app_logs, a.dispatcher, a.metrics, **kwargs,
+    )
+
+
+class TestCorrelate:
+    def test_ranked_by_critical_path_saving(self, analysis):
+        titles = [f.title for f in analysis.correlation.findings]
+        assert titles[:3] == [
+            "Parallelize Substantiate Setup Chain",
+            "Reduce Concord Suspend Polling Delay",
+            "Reduce Concord Resume Overhead",
+        ]
+
+    def test_top_matches_the_full_ranking(self, analysis):
+        full = analysis.correlation.findings
+        top = _correlate(analysis, top=5, jobs=3).findings
+        assert [(f.rank, f.title, f.estimated_savings_s) for f in top] == [
+            (f.rank, f.title, f.estimated_savings_s) for f in full[:5]
+        ]
+
+    def test_rule_subset(self, analysis):
+        from pipeline_cycle_time.analyzers.rules import RULES
+        only = [r for r in RULES if r.name in ("resume-overhead", "flaky-test")]
+        findings = _correlate(analysis, rules=only).findings
+        assert [f.title for f in findings][0] == "Reduce Concord Resume Overhead"
+        assert len(findings) == 2
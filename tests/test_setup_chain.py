@@ -0,0 +1,146 @@
+"""Tests for the inferred Substantiate setup chain."""
+import random
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def _suite(rows, name="Substantiate"):
+    """``(name, start_s, stop_s, worker)`` rows as a ``TestSuiteResult``."""
+    from pipeline_cycle_time.analyzers.test_reports import TestInfo, TestSuiteResult
+    suite = TestSuiteResult(name=name)
+    for test, start, stop, worker in rows:
+        start, stop = int(start * 1000), int(stop * 1000)
+        suite.add(TestInfo(test, test, "passed", start, stop, stop - start, worker))
+    return suite
+
+
+SETUP = [
+    ("auth", 0, 10, "w0"),
+    ("a", 12, 20, "w1"),
+    ("b", 12, 30, "w2"),
+    ("c", 32, 40, "w0"),  # b ended 2s earlier; a ended too long ago
+    ("d", 31.5, 35, "w3"),
+    ("main", 60, 90, "w1"),
+]
+
+
+def _links(chain):
+    return {(link.before, link.after): link for link in chain.links}
+
+
+def test_candidate_links_match_brute_force():
+    from pipeline_cycle_time.analyzers.setup_chain import candidate_links
+    rng = random.Random(3)
+    suite = _suite([
+        (f"t{i}", s, s + rng.uniform(0.5, 20), "w0")
+        for i, s in enumerate(rng.uniform(0, 300) for _ in range(400))
+    ])
+    tests = suite.tests
+    expected = {
+        (a, b) for a in range(len(tests)) for b in range(len(tests))
+        if a != b and 0 <= tests[b].start - tests[a].stop <= 3000
+    }
+    assert set(candidate_links(tests, 3.0)) == expected
+
+
+def test_serial_links_and_critical_path():
+    from pipeline_cycle_time.analyzers.setup_chain import infer
+    chain = infer(_suite(SETUP), setup_s=50)
+    assert [t.name for t in chain.tests] == ["auth", "a", "b", "d", "c"]
+    links = _links(chain)
+    assert set(links) == {("auth", "a"), ("auth", "b"), ("b", "c"), ("b", "d")}
+    assert all(link.serial for link in links.values())
+    assert chain.critical_path == ["auth", "b", "c"]
+    assert chain.critical_path_s == pytest.approx(40)
+    assert [link.after for link in chain.path_links()] == ["b", "c"]
+
+
+def test_later_ending_predecessor_makes_an_artifact():
+    from pipeline_cycle_time.analyzers.setup_chain import infer
+    rows = SETUP + [("e", 30.5, 31, "w1")]  # ends after b, just before d and c
+    links = _links(infer(_suite(rows), setup_s=50))
+    assert links[("e", "c")].serial
+    assert not links[("b", "c")].serial
+    assert links[("b", "c")].reason == "a later-ending test held it back"
+
+
+def test_busy_workers_make_an_artifact():
+    from pipeline_cycle_time.analyzers.setup_chain import infer
+    rows = [("x", 0, 10, "w0"), ("y", 11, 20, "w0"), ("z", 0, 30, "w1")]
+    link = _links(infer(_suite(rows), setup_s=25))[("x", "y")]
+    assert link.idle_workers == 0
+    assert not link.serial
+    assert link.reason == "no idle worker: waited for a slot"
+
+
+def test_history_confirms_or_breaks_order():
+    from pipeline_cycle_time.analyzers.setup_chain import infer
+    same = _suite(SETUP)
+    swapped = _suite([row if row[0] != "c" else ("c", 25, 33, "w0") for row in SETUP])
+    chain = infer(_suite(SETUP), [same, swapped], setup_s=50)
+    links = _links(chain)
+    assert chain.history_runs == 2
+    assert (links[("auth", "b")].runs_seen, links[("auth", "b")].runs_ordered) == (3, 3)
+    assert links[("auth", "b")].serial
+    assert not links[("b", "c")].serial
+    assert links[("b", "c")].reason == "order differs in 1 of 3 runs"
+    # c no longer waits on anything observed, so it ends the chain on its own
+    assert chain.critical_path == ["c"]
+
+
+def test_no_setup_phase():
+    from pipeline_cycle_time.analyzers.setup_chain import infer
+    chain = infer(_suite([("a", 0, 10, "w0"), ("b", 0, 10, "w1")]))
+    assert chain.tests == [] and chain.critical_path == []
+
+
+@pytest.fixture(scope="module")
+def suites():
+    from pipeline_cycle_time.analyzers.test_reports import analyze_timeline
+    return [
+        analyze_timeline(str(FIXTURES / run / "substantiate-report/data/timeline.json"), "Substantiate")
+        for run in ("2026-02-24-aep", "2026-03-06-aep")
+    ]
+
+
+def test_fixture_chain(suites):
+    from pipeline_cycle_time.analyzers.setup_chain import infer
+    a, b = suites
+    chain = infer(a, [b])
+    assert len(chain.tests) == 19
+    assert chain.critical_path[:2] == ["authenticate", "Should create an empty project"]
+    assert len(chain.critical_path) == 9
+    assert len(chain.serial_links) == 17 and len(chain.artifacts) == 3
+    assert all(link.runs_seen == 2 for link in chain.links)
+
+
+def test_large_setup_phase_is_fast():
+    import time
+
+    from pipeline_cycle_time.analyzers.setup_chain import infer
+    rng = random.Random(8)
+    rows = []
+    for w in range(100):
+        t = rng.uniform(0, 5)
+        while t < 3_000:
+            d = rng.uniform(1, 30)
+            rows.append((f"w{w}-{len(rows)}", t, t + d, f"w{w}"))
+            t += d + rng.uniform(0.5, 4)
+    start = time.perf_counter()
+    chain = infer(_suite(rows), setup_s=3_000)
+    assert time.perf_counter() - start < 5
+    assert len(chain.tests) > 15_000
+    assert chain.links and chain.critical_path
+
+
+def test_report_renders(suites):
+    from pipeline_cycle_time.analyzers.setup_chain import infer
+    from pipeline_cycle_time.report.setup_chain import render
+    report = render(infer(suites[0]), "run-a", top=5)
+    assert "## Critical Chain" in report
+    assert "| 1 | authenticate |" in report
+    assert "17 serial dependencies, 3 scheduling artifacts" in report
+    report.encode("ascii")
@@ -0,0 +1,58 @@
+"""Tests for the KLL duration sketch."""
+import random
+
+import pytest
+
+
+def _sketch(values, k=128):
+    from pipeline_cycle_time.sketch import KLLSketch
+    s = KLLSketch(k)
+    for v in values:
+        s.update(v)
+    return s
+
+
+def _true_rank(sorted_values, x):
+    import bisect
+    return bisect.bisect_right(sorted_values, x) / len(sorted_values)
+
+
+class TestKLLSketch:
+    @pytest.mark.parametrize("q", [0.1, 0.5, 0.9, 0.95, 0.99])
+    def test_quantile_rank_error(self, q):
+        rng = random.Random(q)
+        values = [rng.lognormvariate(3, 0.6) for _ in range(50_000)]
+        s = _sketch(values)
+        assert abs(_true_rank(sorted(values), s.quantile(q)) - q) < 0.02
+
+    def test_exact_extremes(self):
+        s = _sketch([5.0, 1.0, 9.0])
+        assert (s.quantile(0), s.quantile(1)) == (1.0, 9.0)
+        assert len(s) == 3
+
+    def test_size_bounded_by_k(self):
+        small = _sketch(range(1_000))
+        big = _sketch(range(200_000))
+        assert len(big.to_bytes()) < 4096
+        assert len(big.to_bytes()) < 2 * len(small.to_bytes())
+
+    def test_merge_matches_single_stream(self):
+        rng = random.Random(1)
+        a_vals = [rng.gauss(100, 10) for _ in range(20_000)]
+        b_vals = [rng.gauss(130, 10) for _ in range(20_000)]
+        merged = _sketch(a_vals)
+        merged.merge(_sketch(b_vals))
+        everything = sorted(a_vals + b_vals)
+        assert merged.count == 40_000
+        for q in (0.25, 0.5, 0.75):
+            assert abs(_true_rank(everything, merged.quantile(q)) - q) < 0.02
+
+    def test_roundtrip(self):
+        from pipeline_cycle_time.sketch import KLLSketch
+        s = _sketch([random.Random(2).random() for _ in range(5_000)])
+        restored = KLLSketch.from_bytes(s.to_bytes())
+        assert restored.count == s.count
+        assert (restored.min, restored.max) == (s.min, s.max)
+        assert restored.quantile(0.9) == pytest.approx(s.quantile(0.9), rel=1e-6)
+        restored.update(0.5)
+        assert restored.count == s.count + 1
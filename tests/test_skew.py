@@ -0,0 +1,100 @@
+"""Tests for clock-skew estimation from causal anchors."""
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+S = 1_000_000_000
+
+
+def _skewed_table(kono_skew_s):
+    """Helm ends at 100s, Kono runs 110-200s, Concord resumes at 230s; Kono's clock is shifted."""
+    from pipeline_cycle_time.events import EventTable
+    table = EventTable()
+    table.add("concord", "phase", "Helm", 40 * S, 100 * S)
+    table.add("concord", "resume", "#1", 230 * S, 231 * S)
+    off = kono_skew_s * S
+    table.add("kono", "test", "a", 110 * S + off, 150 * S + off)
+    table.add("kono", "test", "b", 150 * S + off, 200 * S + off)
+    return table
+
+
+class TestSolve:
+    def test_prefers_zero_within_bounds(self):
+        from pipeline_cycle_time.analyzers.skew import estimate
+        skew = estimate(_skewed_table(0))
+        assert skew.consistent
+        kono = skew.offsets["kono"]
+        assert kono.offset_ns == 0
+        assert (kono.lower_ns, kono.upper_ns) == (-30 * S, 10 * S)
+
+    def test_recovers_forced_offset(self):
+        from pipeline_cycle_time.analyzers.skew import estimate
+        # Kono's clock runs 50s ahead: its first test "starts" 40s after the
+        # resume that followed its last test, so at least 20s must be removed
+        skew = estimate(_skewed_table(50))
+        kono = skew.offsets["kono"]
+        assert kono.lower_ns <= 50 * S <= kono.upper_ns
+        assert kono.offset_ns == kono.lower_ns == 20 * S
+
+    def test_apply_corrects_the_table(self):
+        from pipeline_cycle_time.analyzers.skew import estimate
+        table = _skewed_table(50)
+        estimate(table).apply(table)
+        helm_end = table.first(entity="Helm").end_ns
+        resume = table.first(kind="resume").start_ns
+        first, last = table.span(source="kono")
+        assert helm_end <= first and last <= resume
+
+    def test_polling_anchor_uses_the_given_cutoff(self):
+        from pipeline_cycle_time.analyzers.skew import estimate
+        from pipeline_cycle_time.events import EventTable
+        table = EventTable()
+        table.add("substantiate", "test", "ui", 0, 10 * S)
+        table.add("substantiate", "test", "poll", 10 * S, 22 * S)
+        table.add("dispatcher", "compute", "job", 12 * S, 20 * S)
+        without = estimate(table).offsets["loki"]
+        within = estimate(table, polling_cutoff_s=11.0).offsets["loki"]
+        assert within.anchors > without.anchors
+        # A cutoff above every test leaves no polling candidate
+        assert estimate(table, polling_cutoff_s=15.0).offsets["loki"].anchors == without.anchors
+
+    def test_contradictory_anchors_leave_offsets_at_zero(self):
+        from pipeline_cycle_time.analyzers.skew import Anchor, solve
+        skew = solve([
+            Anchor("a", "concord", "kono", -5 * S),
+            Anchor("b", "kono", "concord", -5 * S),
+        ])
+        assert not skew.consistent
+        assert skew.offsets["kono"].offset_ns == 0
+        assert skew.offsets["kono"].lower_ns is None
+
+    def test_unanchored_clock_is_unbounded(self):
+        from pipeline_cycle_time.analyzers.skew import solve
+        skew = solve([], clocks=["prometheus"])
+        o = skew.offsets["prometheus"]
+        assert (o.offset_ns, o.lower_ns, o.upper_ns, o.anchors) == (0, None, None, 0)
+
+    def test_choice_takes_interval_nearest_zero(self):
+        from pipeline_cycle_time.analyzers.skew import Anchor, solve
+        skew = solve(
+            [Anchor("sub before loki", "substantiate", "loki", 100 * S)],
+            [("job inside test", "substantiate", "loki",
+              [(-300 * S, -200 * S), (5 * S, 30 * S), (200 * S, 300 * S)])],
+        )
+        loki = skew.offsets["loki"]
+        # Relative to Substantiate (pinned at 0); neither is tied to Concord
+        assert loki.offset_ns == 5 * S
+        assert (loki.lower_ns, loki.upper_ns, loki.anchors) == (None, None, 3)
+
+
+@pytest.mark.parametrize("run", ["2026-02-24-aep", "2026-03-06-aep"])
+def test_fixture_clocks_agree(run):
+    from pipeline_cycle_time import pipeline
+    corr = pipeline.run(str(FIXTURES / run)).correlation
+    skew = corr.clock_skew
+    assert skew.consistent
+    assert all(o.offset_ns == 0 for o in skew.offsets.values())
+    sub = skew.offsets["substantiate"]
+    assert sub.lower_ns < 0 < sub.upper_ns
+    assert skew.offsets["prometheus"].lower_ns is None
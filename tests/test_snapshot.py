@@ -0,0 +1,116 @@
+"""Tests for the memory-mapped binary run snapshot."""
+import mmap
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+RUN_A = FIXTURES / "2026-02-24-aep"
+
+
+@pytest.fixture(scope="module")
+def analysis():
+    from pipeline_cycle_time import pipeline
+    return pipeline.run(str(RUN_A))
+
+
+@pytest.fixture(scope="module")
+def snap_path(analysis, tmp_path_factory):
+    from pipeline_cycle_time import pipeline, snapshot
+    path = tmp_path_factory.mktemp("snap") / "run.snap"
+    snapshot.write(analysis, str(path), history=pipeline.history_ids(str(RUN_A)))
+    return path
+
+
+class TestRoundTrip:
+    def test_analysis_identical(self, analysis, snap_path):
+        from pipeline_cycle_time import snapshot
+        loaded = snapshot.load(str(snap_path))
+        for attr in ("orchestration", "kono", "substantiate", "app_logs", "dispatcher",
+                     "metrics", "correlation"):
+            assert getattr(loaded, attr) == getattr(analysis, attr), attr
+        assert loaded.generate_report() == analysis.generate_report()
+
+    def test_pools_index_into_suite(self, snap_path):
+        from pipeline_cycle_time import snapshot
+        kono = snapshot.load(str(snap_path)).kono
+        assert all(p.suite_tests is kono.tests for p in kono.pools.values())
+        assert sorted(i for p in kono.pools.values() for i in p.indexes) == list(range(len(kono.tests)))
+
+    def test_history_ids(self, snap_path):
+        from pipeline_cycle_time import pipeline, snapshot
+        _, history = snapshot.load_with_history(str(snap_path))
+        assert history == pipeline.history_ids(str(RUN_A))
+
+    def test_written_without_history(self, analysis, tmp_path):
+        from pipeline_cycle_time import snapshot
+        path = tmp_path / "run.snap"
+        snapshot.write(analysis, str(path))
+        with snapshot.Snapshot(str(path)) as snap:
+            assert snap.history_ids() == {}
+
+
+class TestMappedAccess:
+    def test_columns_are_views_over_the_mapping(self, analysis, snap_path):
+        from pipeline_cycle_time import snapshot
+        with snapshot.Snapshot(str(snap_path)) as snap:
+            cols = snap.suite("kono")
+            assert len(cols) == len(analysis.kono.tests)
+            assert isinstance(cols.duration, memoryview)
+            assert cols.duration.format == "q"
+            assert isinstance(cols.duration.obj, mmap.mmap)
+            assert sum(cols.duration) == sum(t.duration for t in analysis.kono.tests)
+            assert cols.test_name(0) == analysis.kono.tests[0].name
+            del cols
+
+    def test_sections_are_aligned(self, snap_path):
+        from pipeline_cycle_time import snapshot
+        with snapshot.Snapshot(str(snap_path)) as snap:
+            assert all(off % 8 == 0 for _, off, _ in snap._sections.values())
+
+    def test_is_snapshot(self, snap_path):
+        from pipeline_cycle_time import snapshot
+        assert snapshot.is_snapshot(str(snap_path))
+        assert not snapshot.is_snapshot(str(RUN_A))
+        assert not snapshot.is_snapshot(str(RUN_A / "logs" / "concord-log.txt"))
+
+
+class TestValidation:
+    def test_bad_magic(self, tmp_path):
+        from pipeline_cycle_time import snapshot
+        path = tmp_path / "bad.snap"
+        path.write_bytes(b"NOTASNAP" + bytes(64))
+        with pytest.raises(ValueError, match="not a pipeline snapshot"):
+            snapshot.Snapshot(str(path))
+
+    def test_unsupported_version(self, snap_path, tmp_path):
+        from pipeline_cycle_time import snapshot
+        data = bytearray(snap_path.read_bytes())
+        data[8:10] = (snapshot.SNAPSHOT_VERSION + 1).to_bytes(2, "little")
+        path = tmp_path / "future.snap"
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match="Unsupported snapshot version"):
+            snapshot.Snapshot(str(path))
+
+
+class TestCli:
+    def test_snapshot_then_diff_and_report(self, snap_path, tmp_path):
+        import os
+        import subprocess
+        import sys
+
+        from pipeline_cycle_time import pipeline
+        env = dict(os.environ, PYTHONPATH=str(Path(pipeline.__file__).parent.parent))
+        out = tmp_path / "b.snap"
+
+        def cli(*args):
+            return subprocess.run(
+                [sys.executable, "-m", "pipeline_cycle_time", *args],
+                capture_output=True, text=True, env=env, check=True,
+            )
+
+        cli("snapshot", str(RUN_A), "-o", str(out))
+        diff = cli("diff", str(snap_path), str(out)).stdout
+        assert "0 added, 0 removed." in diff
+        report = cli("analyze", "--snapshot", str(out)).stdout
+        assert report.rstrip("\n") == pipeline.run(str(RUN_A)).generate_report().rstrip("\n")
@@ -0,0 +1,124 @@
+"""Tests for the SQLite historical run store."""
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+RUN_A = FIXTURES / "2026-02-24-aep"
+RUN_B = FIXTURES / "2026-03-06-aep"
+
+
+@pytest.fixture
+def db(tmp_path):
+    from pipeline_cycle_time.store import RunStore, ingest_run
+    store = RunStore(str(tmp_path / "runs.sqlite"))
+    ingest_run(store, str(RUN_A))
+    ingest_run(store, str(RUN_B))
+    yield store
+    store.close()
+
+
+class TestIngest:
+    def test_everything_stored(self, db):
+        count = lambda table: db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        assert db.run_count() == 2
+        assert count("phases") > 0
+        assert count("findings") > 0
+        assert count("resume_overheads") > 0
+        assert db.conn.execute(
+            "SELECT COUNT(*) FROM tests t JOIN runs r ON r.id = t.run_id"
+            " WHERE r.run_key = ? AND t.suite = 'Kono'", (RUN_A.name,)
+        ).fetchone()[0] == 1245
+
+    def test_reingest_replaces_run(self, db):
+        from pipeline_cycle_time.store import ingest_run
+        before = db.conn.execute("SELECT COUNT(*) FROM tests").fetchone()[0]
+        ingest_run(db, str(RUN_A))
+        assert db.run_count() == 2
+        assert db.conn.execute("SELECT COUNT(*) FROM tests").fetchone()[0] == before
+
+    def test_history_ids_attached_from_test_cases(self, db):
+        row = db.conn.execute(
+            "SELECT history_id FROM tests WHERE suite = 'Substantiate' AND history_id IS NOT NULL"
+        ).fetchone()
+        assert row is not None
+        history = db.test_history(row[0])
+        assert {run for run, *_ in history} <= {RUN_A.name, RUN_B.name}
+        assert history
+
+
+class TestQueries:
+    def test_metric_series_ordered_by_start(self, db):
+        points = db.metric_series("phase:Helm")
+        assert [p.run_key for p in points] == [RUN_A.name, RUN_B.name]
+        assert all(p.value > 0 for p in points)
+
+    def test_last_limits_to_newest(self, db):
+        assert [p.run_key for p in db.metric_series("suite:Kono", last=1)] == [RUN_B.name]
+
+    def test_pool_and_test_series(self, db):
+        assert len(db.metric_series("pool:Kono/Pool-1")) == 2
+        uid = db.conn.execute("SELECT uid FROM tests WHERE suite = 'Kono' LIMIT 1").fetchone()[0]
+        assert len(db.metric_series(f"test:{uid}")) >= 1
+
+    def test_trend_windows(self, db):
+        rows = db.trend("end_to_end", window=1)
+        assert [r["count"] for r in rows] == [1, 1]
+        rows = db.trend("concord", window=50)
+        assert rows[0]["count"] == 2
+        assert rows[0]["min"] <= rows[0]["p50"] <= rows[0]["max"]
+
+    def test_unknown_metric(self, db):
+        with pytest.raises(ValueError):
+            db.metric_series("bogus")
+
+
+class TestSketches:
+    @pytest.fixture
+    def history(self, tmp_path):
+        from pipeline_cycle_time import pipeline
+        from pipeline_cycle_time.store import RunStore
+        analysis = pipeline.run(str(RUN_A))
+        ids = pipeline.history_ids(str(RUN_A))
+        store = RunStore(str(tmp_path / "runs.sqlite"))
+        for i in range(10):
+            store.ingest(analysis, f"run-{i}", ids)
+        yield store, analysis, ids
+        store.close()
+
+    def test_sketches_fed_once_per_run(self, history):
+        store, analysis, ids = history
+        helm = store.sketch("phase", "", "Helm")
+        assert helm.count == 10
+        store.ingest(analysis, "run-0", ids)  # re-ingest doesn't double count
+        assert store.sketch("phase", "", "Helm").count == 10
+
+    def test_check_flags_only_slow_entries(self, history):
+        store, analysis, ids = history
+        assert store.check(analysis, ids) == []
+        slow = analysis.substantiate.tests[0]
+        slow.duration += 60_000
+        outliers = store.check(analysis, ids)
+        assert [(o.kind, o.scope, o.name) for o in outliers] == [("test", "Substantiate", slow.name)]
+        assert outliers[0].excess_s == pytest.approx(60.0, abs=1.0)
+        assert outliers[0].history == 10
+
+    def test_check_needs_history(self, history):
+        store, analysis, ids = history
+        analysis.substantiate.tests[0].duration += 60_000
+        assert store.check(analysis, ids, min_history=11) == []
+
+
+def test_end_to_end_agrees_with_the_report(db):
+    from pipeline_cycle_time import batch, pipeline
+    from pipeline_cycle_time.analyzers.diff import diff_runs
+    from pipeline_cycle_time.report.generator import _fmt_duration
+    a, b = pipeline.run(str(RUN_A)), pipeline.run(str(RUN_B))
+    e2e = a.correlation.end_to_end_s  # the dependency graph's makespan
+    assert e2e == pytest.approx(1225.5, abs=0.1)
+    assert f"**{_fmt_duration(e2e)} end-to-end**" in a.generate_report()
+    assert batch.summarize(a)["end_to_end_s"] == e2e
+    stored = [p.value for p in db.metric_series("end_to_end")]
+    assert stored == [e2e, b.correlation.end_to_end_s]
+    delta = diff_runs(a, b).end_to_end
+    assert (delta.before_s, delta.after_s) == (e2e, b.correlation.end_to_end_s)
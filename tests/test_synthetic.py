@@ -0,0 +1,94 @@
+"""Tests for the synthetic pipeline-run generator."""
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+
+def _small_config(seed=0, **overrides):
+    from pipeline_cycle_time.synthetic import SyntheticConfig
+    config = SyntheticConfig(seed=seed, concord_filler_lines=200, webapp_log_lines=300,
+                             dispatcher_log_lines=40)
+    config.kono.tests = 120
+    config.substantiate.tests = 40
+    config.substantiate.flaky_rate = 0.1
+    for k, v in overrides.items():
+        setattr(config, k, v)
+    return config
+
+
+def _tree_digest(root: Path) -> str:
+    h = hashlib.sha256()
+    for p in sorted(root.rglob("*")):
+        if p.is_file():
+            h.update(str(p.relative_to(root)).encode())
+            h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+@pytest.fixture
+def small_run(tmp_path):
+    from pipeline_cycle_time.synthetic import generate
+    return generate(_small_config(), str(tmp_path / "run"))
+
+
+class TestDeterminism:
+    def test_same_seed_same_bytes(self, tmp_path):
+        from pipeline_cycle_time.synthetic import generate
+        a = generate(_small_config(seed=7), str(tmp_path / "a"))
+        b = generate(_small_config(seed=7), str(tmp_path / "b"))
+        assert _tree_digest(a) == _tree_digest(b)
+
+    def test_different_seed_differs(self, tmp_path):
+        from pipeline_cycle_time.synthetic import generate
+        a = generate(_small_config(seed=1), str(tmp_path / "a"))
+        b = generate(_small_config(seed=2), str(tmp_path / "b"))
+        assert _tree_digest(a) != _tree_digest(b)
+
+
+class TestStructuralFidelity:
+    def test_analyzers_read_every_source(self, small_run):
+        from pipeline_cycle_time import pipeline
+        analysis = pipeline.run(str(small_run))
+        orch = analysis.orchestration
+        assert [p.name for p in orch.phases] == [
+            "Init", "Bootstrap", "AWS", "Config/Mica", "Helm", "Suspended",
+        ]
+        assert len(orch.children) == 2
+        assert orch.resume_count == 2
+        # Only the last resume (after tests) is on the critical path
+        assert [r.on_critical_path for r in orch.resume_overheads] == [False, True]
+        assert analysis.kono.total_tests == 120
+        assert set(analysis.kono.pools) == {"Pool-1", "Pool-2"}
+        pool1, pool2 = analysis.kono.pools["Pool-1"], analysis.kono.pools["Pool-2"]
+        assert pool2.start_ms > pool1.stop_ms
+        assert analysis.dispatcher.job_id
+        assert analysis.metrics.cpu is not None
+        assert analysis.app_logs.total_log_entries == 300
+
+    def test_resume_cycle_count_is_configurable(self, tmp_path):
+        from pipeline_cycle_time.analyzers.orchestration import analyze
+        from pipeline_cycle_time.synthetic import generate
+        run = generate(_small_config(resume_cycles=5), str(tmp_path / "run"))
+        assert analyze(str(run / "logs" / "concord-log.txt")).resume_count == 5
+
+    def test_flaky_tests_have_retry_records(self, small_run):
+        cases = [
+            json.loads(p.read_text())
+            for p in (small_run / "substantiate-report" / "data" / "test-cases").glob("*.json")
+        ]
+        retried = [c for c in cases if c["retriesCount"]]
+        assert retried, "expected some flaky tests at flaky_rate=0.1"
+        by_uid = {c["uid"]: c for c in cases}
+        for c in retried:
+            prior = by_uid[c["extra"]["retries"][0]["uid"]]
+            assert prior["retry"] is True
+            assert prior["historyId"] == c["historyId"]
+            assert prior["time"]["stop"] <= c["time"]["start"]
+
+    def test_scaled_config(self):
+        from pipeline_cycle_time.synthetic import scaled
+        config = scaled(10)
+        assert config.kono.tests == 12450
+        assert config.webapp_log_lines == 50000
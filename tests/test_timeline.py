@@ -0,0 +1,103 @@
+"""Tests for the proportional ASCII timeline and the SVG Gantt."""
+import random
+import time
+from array import array
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "2026-02-24-aep"
+S = 1_000_000_000
+
+
+def _big_table(workers=30, per_worker=3_400):
+    from pipeline_cycle_time.events import EventTable
+    rng = random.Random(7)
+    table = EventTable()
+    for w in range(workers):
+        starts, ends, t = [], [], 0
+        while len(starts) < per_worker:
+            d = rng.randrange(1, 600) * S // 100
+            starts.append(t)
+            ends.append(t + d)
+            t += d + S // 100
+        table.extend(
+            "substantiate", "test", [f"t{w}-{i}" for i in range(len(starts))], starts, ends,
+            [{"worker": f"w{w}"}] * len(starts),
+        )
+    table.sort()
+    return table
+
+
+class TestCoverage:
+    def test_matches_brute_force(self):
+        from pipeline_cycle_time.report.timeline import coverage
+        rng = random.Random(3)
+        starts = [rng.randrange(0, 1000) for _ in range(200)]
+        ends = [s + rng.randrange(0, 300) for s in starts]
+        cov = coverage(starts, ends, 100, 1100, 40)
+        for c in range(40):
+            lo, hi = 100 + c * 25, 100 + (c + 1) * 25
+            expected = sum(max(0, min(e, hi) - max(s, lo)) for s, e in zip(starts, ends)) / 25
+            assert cov[c] == pytest.approx(expected)
+
+    def test_proportional_columns(self):
+        from pipeline_cycle_time.report.timeline import Layer, Track, render_ascii
+        track = Track("X", [Layer(array("q", [25 * S]), array("q", [50 * S]))])
+        lines = render_ascii([track], 0, 100 * S, columns=20)
+        row = lines[-1][12:]
+        assert row == " " * 5 + "=" * 5  # seconds 25..50 of 100 are columns 5..9 of 20
+        assert lines[1][12:].startswith("|")
+
+    def test_short_event_in_front_stays_visible(self):
+        from pipeline_cycle_time.report.timeline import Layer, Track, render_ascii
+        track = Track("X", [
+            Layer(array("q", [0]), array("q", [100 * S]), "~"),
+            Layer(array("q", [40 * S]), array("q", [41 * S]), "#"),
+        ])
+        row = render_ascii([track], 0, 100 * S, columns=10)[-1][12:]
+        assert row == "~~~~#~~~~~"
+
+    def test_density_shading(self):
+        from pipeline_cycle_time.report.timeline import Layer, Track, render_ascii
+        # One of four workers busy in the first half, all four in the second
+        starts = array("q", [0, 50 * S, 50 * S, 50 * S, 50 * S])
+        ends = array("q", [50 * S, 100 * S, 100 * S, 100 * S, 100 * S])
+        track = Track("T", [Layer(starts, ends, capacity=4)])
+        assert render_ascii([track], 0, 100 * S, columns=4)[-1][12:] == "..##"
+
+
+def test_report_timeline_from_fixture():
+    from pipeline_cycle_time import pipeline
+    from pipeline_cycle_time.report import timeline
+    analysis = pipeline.run(str(FIXTURES_DIR))
+    events = analysis.aligned_events()
+    t0, t1 = timeline.bounds(events)
+    assert (t1 - t0) / S == pytest.approx(analysis.orchestration.total_duration_s, abs=1)
+    lines = timeline.render_ascii(timeline.report_tracks(events, 340), t0, t1, 50)
+    labels = [line.split()[0] for line in lines[3:] if line]
+    assert labels == [
+        "CONCORD", "K8S", "KONO", "Pool-1", "Pool-2", "SUBSTANTIATE", "Setup", "Main", "WEBAPP",
+    ]
+    assert all(len(line) <= 12 + 50 + 60 for line in lines)
+    concord = next(line for line in lines if line.startswith("CONCORD"))
+    assert "#" in concord[12:62] and concord[12] == "="
+    assert "(active 1m56s," in concord  # total minus suspended, as in the summary
+    # Split rows cover the phases, which add up to the suite's wall-clock
+    row = {line.split()[0]: line for line in lines if line}
+    assert row["Setup"].endswith("5m40s, 19 tests")
+    assert row["Main"].endswith("9m28s, 237 tests")
+
+
+def test_large_run_renders_quickly():
+    from pipeline_cycle_time.report import timeline
+    table = _big_table()
+    t0, t1 = timeline.bounds(table)
+    start = time.perf_counter()
+    lines = timeline.render_ascii(timeline.report_tracks(table), t0, t1, 80)
+    svg = timeline.render_svg(timeline.gantt_rows(table), t0, t1, width=1600)
+    assert time.perf_counter() - start < 10
+    assert "102,000 tests on 30 workers" in lines[-1]
+    rects = svg.count("<rect")
+    assert 30 <= rects <= 30 * 1600  # bars merged to at most about a pixel each
+    assert rects < 102_000 // 5
@@ -0,0 +1,97 @@
+"""Tests for the Chrome/Perfetto trace exporter."""
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "2026-02-24-aep"
+S = 1_000_000_000
+
+
+@pytest.fixture(scope="module")
+def fixture_trace(tmp_path_factory):
+    from pipeline_cycle_time import pipeline, trace
+    analysis = pipeline.run(str(FIXTURES_DIR))
+    events = analysis.events()
+    skew = analysis.correlation.clock_skew
+    skew.apply(events)
+    path = tmp_path_factory.mktemp("trace") / "run.json"
+    count = trace.write(events, path, str(FIXTURES_DIR / "metrics"), skew)
+    data = json.loads(path.read_text())
+    assert len(data["traceEvents"]) == count
+    return analysis, data
+
+
+def _names(data, ph, name):
+    return {e["pid"] if name == "process_name" else (e["pid"], e["tid"]): e["args"]["name"]
+            for e in data["traceEvents"] if e["ph"] == ph and e["name"] == name}
+
+
+def test_every_source_is_a_process(fixture_trace):
+    _, data = fixture_trace
+    processes = _names(data, "M", "process_name")
+    assert set(processes.values()) == {
+        "concord", "dispatcher", "kono", "substantiate", "webapp", "prometheus",
+    }
+    assert processes[1] == "concord"
+
+
+def test_each_test_on_its_worker_track(fixture_trace):
+    analysis, data = fixture_trace
+    pid = next(p for p, n in _names(data, "M", "process_name").items() if n == "substantiate")
+    threads = _names(data, "M", "thread_name")
+    tests = [e for e in data["traceEvents"] if e.get("cat") == "test" and e["pid"] == pid]
+    assert len(tests) == len(analysis.substantiate.tests)
+    for e in tests:
+        assert threads[(pid, e["tid"])] == e["args"]["worker"]
+    workers = {t.worker for t in analysis.substantiate.tests}
+    assert {threads[(pid, e["tid"])] for e in tests} == workers
+
+
+def test_phases_resumes_and_jobs(fixture_trace):
+    _, data = fixture_trace
+    spans = {(e["cat"], e["name"]) for e in data["traceEvents"] if e["ph"] == "X"}
+    assert ("phase", "Helm") in spans
+    assert ("resume", "#2") in spans
+    assert ("compute", "236757") in spans
+    assert all(e["ts"] >= 0 for e in data["traceEvents"] if "ts" in e)
+
+
+def test_counters(fixture_trace):
+    analysis, data = fixture_trace
+    counters = {}
+    for e in data["traceEvents"]:
+        if e["ph"] == "C":
+            counters.setdefault(e["name"], []).append(e["args"]["value"])
+    assert "CPU (cores)" in counters and "HikariCP Pending (connections)" in counters
+    assert max(counters["CPU (cores)"]) == pytest.approx(analysis.metrics.cpu.max_val)
+    running = counters["running tests"]
+    assert min(running) >= 0 and running[-1] == 0
+
+
+def test_large_trace_streams_quickly(tmp_path):
+    import time
+
+    from pipeline_cycle_time import trace
+    from pipeline_cycle_time.events import EventTable
+    rng = random.Random(4)
+    table = EventTable()
+    for w in range(30):
+        starts, ends, t = [], [], 0
+        while len(starts) < 3_400:
+            d = rng.randrange(1, 600) * S // 100
+            starts.append(t)
+            ends.append(t + d)
+            t += d + S // 100
+        table.extend(
+            "substantiate", "test", [f"t{w}-{i}" for i in range(len(starts))], starts, ends,
+            [{"worker": f"w{w}"}] * len(starts),
+        )
+    path = tmp_path / "big.json"
+    start = time.perf_counter()
+    trace.write(table, path)
+    assert time.perf_counter() - start < 5
+    data = json.loads(path.read_text())
+    assert sum(e.get("cat") == "test" for e in data["traceEvents"]) == 102_000
+    assert len(_names(data, "M", "thread_name")) == 30